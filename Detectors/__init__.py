@@ -10,22 +10,14 @@ BaseMotifDetector, CurvedDNADetector, ZDNADetector, APhilicDetector,
 SlippedDNADetector, CruciformDetector, RLoopDetector, TriplexDetector,
 GQuadruplexDetector, IMotifDetector
 
+Detector classes are resolved lazily through Detectors.registry: a
+submodule (and its pattern tables) is imported on first attribute access,
+so ``from Detectors import GQuadruplexDetector`` loads only that detector.
+
 Performance: 5K-280K bp/s | Memory: ~5 MB/100K sequences
 """
 
-# Import base detector
-from Detectors.base.base_detector import BaseMotifDetector
-
-# Import all detector classes from submodules
-from Detectors.curved.detector import CurvedDNADetector
-from Detectors.zdna.detector import ZDNADetector
-from Detectors.aphilic.detector import APhilicDetector
-from Detectors.slipped.detector import SlippedDNADetector
-from Detectors.cruciform.detector import CruciformDetector
-from Detectors.rloop.detector import RLoopDetector
-from Detectors.triplex.detector import TriplexDetector
-from Detectors.gquad.detector import GQuadruplexDetector
-from Detectors.imotif.detector import IMotifDetector
+from Detectors.registry import CLASS_NAME_TO_KEY, get_detector_class
 
 __all__ = [
     "BaseMotifDetector",
@@ -42,3 +34,16 @@ __all__ = [
 
 __version__ = "2024.1"
 __author__ = "Dr. Venkata Rajesh Yella"
+
+
+def __getattr__(name):
+    if name == "BaseMotifDetector":
+        from Detectors.base.base_detector import BaseMotifDetector
+        return BaseMotifDetector
+    if name in CLASS_NAME_TO_KEY:
+        return get_detector_class(name)
+    raise AttributeError(f"module 'Detectors' has no attribute '{name}'")
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -12,6 +12,7 @@ from Utilities.detectors_utils import (
     remove_overlaps_by_subclass,
     load_patterns_with_fallback
 )
+from Utilities.run_budget import checkpoint
 
 # TUNABLE PARAMETERS
 DEFAULT_MIN_SCORE_THRESHOLD = 0.5
@@ -105,6 +106,7 @@ class BaseMotifDetector(ABC):
         
         for pattern_group, compiled_patterns in self.compiled_patterns.items():
             for compiled_re, pattern_id, name, subclass, full_info in compiled_patterns:
+                checkpoint()
                 for match in compiled_re.finditer(sequence):
                     self.audit['seed_hits'] += 1
                     self.audit['candidates_seen'] += 1
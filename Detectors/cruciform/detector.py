@@ -7,6 +7,7 @@ from collections import defaultdict
 from ..base.base_detector import BaseMotifDetector
 from Utilities.detectors_utils import revcomp, calc_gc_content
 from Utilities.core.motif_normalizer import normalize_class_subclass
+from Utilities.run_budget import checkpoint
 
 try: from motif_patterns import CRUCIFORM_PATTERNS
 except ImportError: CRUCIFORM_PATTERNS = {}
@@ -150,6 +151,7 @@ class CruciformDetector(BaseMotifDetector):
         # Extend seeds into full inverted repeats
         seen_pairs: set = set()
         for i, j in valid_pairs:
+            checkpoint()  # long perfect repeats yield a seed pair at nearly every position
             pair_key = (i, j)
             if pair_key in seen_pairs:
                 continue
@@ -307,6 +309,7 @@ class CruciformDetector(BaseMotifDetector):
                                 key=lambda x: (-x['score'], -(x['right_end'] - x['left_start'])))
         non_overlapping = []
         for repeat in sorted_repeats:
+            checkpoint()
             overlaps = any(not (repeat['right_end'] <= sel['left_start']
                                 or repeat['left_start'] >= sel['right_end'])
                            for sel in non_overlapping)
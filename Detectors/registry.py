@@ -0,0 +1,105 @@
+"""
+Detector registry: resolves detector classes lazily by key or class name.
+
+Detector modules (and their pattern tables) are imported only when a
+detector is first requested, so importing the scanner stays cheap and a
+run restricted to a few motif classes never loads the others.
+
+    from Detectors.registry import get_detector_class, LazyDetectorMap
+
+    GQuadruplexDetector = get_detector_class('GQuadruplexDetector')   # or 'g_quadruplex'
+    detectors = LazyDetectorMap()          # {'curved_dna': <instance>, ...} on access
+"""
+
+import importlib
+import threading
+from collections.abc import Mapping
+from typing import Dict, Iterable, Iterator, Optional, Tuple
+
+# Detector key -> (module, class name), in the scanner's canonical run order
+DETECTOR_REGISTRY: Dict[str, Tuple[str, str]] = {
+    'curved_dna': ('Detectors.curved.detector', 'CurvedDNADetector'),
+    'slipped_dna': ('Detectors.slipped.detector', 'SlippedDNADetector'),
+    'cruciform': ('Detectors.cruciform.detector', 'CruciformDetector'),
+    'r_loop': ('Detectors.rloop.detector', 'RLoopDetector'),
+    'triplex': ('Detectors.triplex.detector', 'TriplexDetector'),
+    'g_quadruplex': ('Detectors.gquad.detector', 'GQuadruplexDetector'),
+    'i_motif': ('Detectors.imotif.detector', 'IMotifDetector'),
+    'z_dna': ('Detectors.zdna.detector', 'ZDNADetector'),
+    'a_philic': ('Detectors.aphilic.detector', 'APhilicDetector'),
+}
+
+CLASS_NAME_TO_KEY: Dict[str, str] = {cls: key for key, (_, cls) in DETECTOR_REGISTRY.items()}
+
+
+def get_detector_class(name: str) -> type:
+    """
+    Import and return a detector class.
+
+    Args:
+        name: Detector key ('g_quadruplex') or class name ('GQuadruplexDetector')
+
+    Raises:
+        KeyError: If *name* is not a registered detector
+    """
+    key = CLASS_NAME_TO_KEY.get(name, name)
+    try:
+        module_name, class_name = DETECTOR_REGISTRY[key]
+    except KeyError:
+        raise KeyError(f"Unknown detector '{name}'") from None
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+class LazyDetectorMap(Mapping):
+    """
+    Read-only mapping of detector key -> detector instance.
+
+    Keys are known up front; each detector is imported and instantiated on
+    first access (thread-safe) and reused afterwards.  Iterating keys does
+    not instantiate anything; ``items()``/``values()`` instantiate what
+    they yield.
+    """
+
+    def __init__(self, keys: Optional[Iterable[str]] = None):
+        self._keys = list(keys) if keys is not None else list(DETECTOR_REGISTRY)
+        unknown = [k for k in self._keys if k not in DETECTOR_REGISTRY]
+        if unknown:
+            raise KeyError(f"Unknown detector(s): {', '.join(unknown)}")
+        self._instances: Dict[str, object] = {}
+        self._lock = threading.Lock()
+
+    def __getitem__(self, key: str):
+        instance = self._instances.get(key)
+        if instance is None:
+            if key not in self._keys:
+                raise KeyError(key)
+            with self._lock:
+                instance = self._instances.get(key)
+                if instance is None:
+                    instance = self._instances[key] = get_detector_class(key)()
+        return instance
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._keys)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, key) -> bool:
+        return key in self._keys
+
+    def loaded(self) -> Dict[str, object]:
+        """Detectors instantiated so far."""
+        return dict(self._instances)
+
+    def __getstate__(self):
+        # Instances are rebuilt lazily in the receiving process
+        return {'_keys': self._keys}
+
+    def __setstate__(self, state):
+        self._keys = state['_keys']
+        self._instances = {}
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f"LazyDetectorMap({self._keys!r}, loaded={list(self._instances)!r})"
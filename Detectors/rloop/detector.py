@@ -5,6 +5,7 @@ from typing import List, Dict, Any, Tuple, Optional
 from ..base.base_detector import BaseMotifDetector
 from Utilities.detectors_utils import revcomp, calc_gc_content
 from Utilities.core.motif_normalizer import normalize_class_subclass
+from Utilities.stream_scan import compile_stream_database, stream_scan
 
 try:
     import hyperscan
@@ -108,23 +109,16 @@ class RLoopDetector(BaseMotifDetector):
     # Hyperscan Compilation
 
     def _compile_hyperscan_patterns(self):
-        try:
-            expressions = [
-                br"G{3,}[ATCG]{1,10}?G{3,}(?:[ATCG]{1,10}?G{3,}){1,}?",
-                br"G{4,}(?:[ATCG]{1,10}?G{4,}){1,}?"
-            ]
-            ids = [1, 2]
-            flags = [hyperscan.HS_FLAG_DOTALL] * 2
-
-            self.hs_db = hyperscan.Database()
-            self.hs_db.compile(expressions=expressions,
-                               ids=ids,
-                               flags=flags)
-
-            self.hs_id_to_model = {1: 'qmrlfs_model_1',
-                                   2: 'qmrlfs_model_2'}
-        except Exception:
-            self.hs_db = None
+        # Stream mode with start-of-match tracking: one stream per sequence,
+        # RIZ start offsets reported directly (block mode without SOM gives 0)
+        expressions = [
+            br"G{3,}[ATCG]{1,10}?G{3,}(?:[ATCG]{1,10}?G{3,}){1,}?",
+            br"G{4,}(?:[ATCG]{1,10}?G{4,}){1,}?"
+        ]
+        self.hs_db = compile_stream_database('rloop-riz', expressions, [1, 2],
+                                             flags=[hyperscan.HS_FLAG_DOTALL] * 2)
+        self.hs_id_to_model = {1: 'qmrlfs_model_1',
+                               2: 'qmrlfs_model_2'} if self.hs_db is not None else {}
 
     # RIZ Detection
 
@@ -134,9 +128,7 @@ class RLoopDetector(BaseMotifDetector):
 
         if HS_AVAILABLE and self.hs_db is not None:
 
-            seq_bytes = seq.encode()
-
-            def on_match(id, start, end, flags, context):
+            def on_match(start, end, id):
                 if self.hs_id_to_model.get(id) == model:
                     riz_seq = seq[start:end]
                     if self._percent_g(riz_seq) >= self.MIN_PERC_G_RIZ:
@@ -145,9 +137,8 @@ class RLoopDetector(BaseMotifDetector):
                             'end': end,
                             'sequence': riz_seq
                         })
-                return 0
 
-            self.hs_db.scan(seq_bytes, match_event_handler=on_match)
+            stream_scan(self.hs_db, seq, on_match=on_match)
 
         else:
             if model == 'qmrlfs_model_1':
@@ -6,6 +6,7 @@ from typing import List, Dict, Any, Tuple
 from ..base.base_detector import BaseMotifDetector
 from Utilities.core.motif_normalizer import normalize_class_subclass
 from Utilities.detectors_utils import calc_gc_content
+from Utilities.run_budget import checkpoint
 
 try:
     from numba import jit
@@ -192,6 +193,7 @@ class SlippedDNADetector(BaseMotifDetector):
         encoded = np.frombuffer(seq.encode('ascii'), dtype=np.uint8)
 
         for k in range(1, min(self.MAX_UNIT_SIZE + 1, n // 2)):
+            checkpoint()
             min_copies = max(2, math.ceil(self.MIN_TRACT_LENGTH / k))
             min_run = (min_copies - 1) * k  # consecutive match count needed
 
@@ -250,6 +252,7 @@ class SlippedDNADetector(BaseMotifDetector):
         candidates = []
 
         for k in range(1, min(self.MAX_UNIT_SIZE + 1, n // 2)):
+            checkpoint()
             min_copies = max(2, math.ceil(self.MIN_TRACT_LENGTH / k))
             key = (k, min_copies)
             if key not in _TR_PATTERN_CACHE:
@@ -280,6 +283,7 @@ class SlippedDNADetector(BaseMotifDetector):
         filtered = []
         
         for cand in candidates:
+            checkpoint()  # primitive-motif search is quadratic in the tract length
             sequence = cand['sequence']
             
             if cand['length'] < self.MIN_TRACT_LENGTH:
@@ -323,6 +327,7 @@ class SlippedDNADetector(BaseMotifDetector):
         used_intervals = []  # Track (start, end) of accepted calls
         
         for cand in sorted_cands:
+            checkpoint()
             start, end = cand['start'], cand['end']
             
             overlaps = False
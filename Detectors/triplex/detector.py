@@ -7,6 +7,7 @@ from collections import defaultdict
 from ..base.base_detector import BaseMotifDetector
 from Utilities.core.motif_normalizer import normalize_class_subclass
 from Utilities.detectors_utils import calc_gc_content
+from Utilities.run_budget import checkpoint
 
 try:
     from numba import jit
@@ -247,6 +248,7 @@ class TriplexDetector(BaseMotifDetector):
 
         seen_pairs: set = set()
         for i, j in valid_pairs:
+            checkpoint()  # long perfect repeats yield a seed pair at nearly every position
             pair_key = (i, j)
             if pair_key in seen_pairs:
                 continue
@@ -444,6 +446,7 @@ class TriplexDetector(BaseMotifDetector):
         mirrors = self._find_mirror_repeats(seq)
 
         for m in mirrors:
+            checkpoint()
             s = m["start"]
             e = m["end"]
 
@@ -10,8 +10,11 @@ Reference:
     Intel Hyperscan: https://www.hyperscan.io/
 """
 
+import hashlib
 import logging
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Tuple
+
+from Utilities import stream_scan
 
 logger = logging.getLogger(__name__)
 
@@ -48,7 +51,12 @@ except Exception as e:
 
 
 def hs_find_matches(seq: str, tenmer_score: Dict[str, float]) -> List[Tuple[int, str, float]]:
-    """Hyperscan-based matching with improved error handling.
+    """Hyperscan-based matching in streaming mode.
+    
+    The 10-mer table is compiled once per process into a stream-mode database
+    (no start-of-match tracking needed: start = end - 10), and the sequence is
+    fed through a single stream in consecutive blocks, so memory stays bounded
+    and no block boundary is scanned twice.
     
     Args:
         seq: DNA sequence to search (uppercase).
@@ -61,31 +69,11 @@ def hs_find_matches(seq: str, tenmer_score: Dict[str, float]) -> List[Tuple[int,
         Exception: If Hyperscan matching fails (to trigger fallback).
     """
     try:
-        expressions = []
-        ids = []
-        id_to_ten = {}
-        id_to_score = {}
-        for idx, (ten, score) in enumerate(tenmer_score.items()):
-            expressions.append(ten.encode())
-            ids.append(idx)
-            id_to_ten[idx] = ten
-            id_to_score[idx] = float(score)
-        
-        db = hyperscan.Database()
-        db.compile(expressions=expressions, ids=ids, elements=len(expressions))
-        logger.debug(f"Hyperscan database compiled successfully for Z-DNA ({len(expressions)} patterns)")
-        
-        matches: List[Tuple[int, str, float]] = []
-
-        def on_match(id, start, end, flags, context):
-            # Hyperscan 'end' parameter is the offset after the match
-            # Calculate actual start position: end - pattern_length
-            actual_start = end - 10
-            matches.append((actual_start, id_to_ten[id], id_to_score[id]))
-
-        db.scan(seq.encode(), match_event_handler=on_match)
-        matches.sort(key=lambda x: x[0])
-        logger.debug(f"Hyperscan scan completed: {len(matches)} Z-DNA 10-mer matches found")
+        key = "tenmer-" + _table_digest(tenmer_score)
+        if stream_scan.compile_stream_database(key, [t.encode() for t in tenmer_score], range(len(tenmer_score)), som=False) is None:
+            raise RuntimeError("stream-mode database unavailable")
+        matches = stream_scan.stream_find_literals(seq, tenmer_score, 10, _find_matches_block, key=key)
+        logger.debug(f"Hyperscan stream scan completed: {len(matches)} 10-mer matches found")
         return matches
         
     except Exception as e:
@@ -96,6 +84,10 @@ def hs_find_matches(seq: str, tenmer_score: Dict[str, float]) -> List[Tuple[int,
 def py_find_matches(seq: str, tenmer_score: Dict[str, float]) -> List[Tuple[int, str, float]]:
     """Pure-Python exact search (overlapping matches allowed).
     
+    Long sequences are processed in consecutive blocks, each extended by the
+    last 9 bases of the previous one, so every 10-mer window is visited
+    exactly once and working memory is bounded by the block size.
+    
     Args:
         seq: DNA sequence to search (uppercase).
         tenmer_score: Dictionary mapping 10-mer sequences to their scores.
@@ -103,6 +95,13 @@ def py_find_matches(seq: str, tenmer_score: Dict[str, float]) -> List[Tuple[int,
     Returns:
         List of (start, tenmer, score) tuples.
     """
+    if len(seq) <= stream_scan.STREAM_BLOCK_SIZE:
+        return _find_matches_block(seq, tenmer_score)
+    return stream_scan.stream_find_literals(seq, tenmer_score, 10, _find_matches_block)
+
+
+def _find_matches_block(seq: str, tenmer_score: Dict[str, float]) -> List[Tuple[int, str, float]]:
+    """Match one block: vectorized when NumPy is available, loop-based otherwise."""
     # Use vectorized version if NumPy is available, otherwise use loop-based version
     if _NUMPY_AVAILABLE:
         try:
@@ -152,10 +151,16 @@ _POWERS_OF_4: "np.ndarray" = (4 ** np.arange(10, dtype=np.int64)) if _NUMPY_AVAI
 # Size of the hash lookup table: 4^10 = 1,048,576 entries
 _HASH_TABLE_SIZE: int = 4 ** 10
 
-# Cached numpy lookup table: maps 10-mer hash → score (0.0 = not in table)
-# Built lazily on first call and reused for subsequent calls.
-_NUMPY_LOOKUP: "Optional[np.ndarray]" = None
-_NUMPY_LOOKUP_KEY: "Optional[int]" = None  # id() of the tenmer_score dict
+# Cached numpy lookup tables: content digest of the tenmer_score dict → array
+# mapping 10-mer hash → score (0.0 = not in table). One entry per table, so
+# Z-DNA and A-philic no longer evict each other on every alternating call.
+_NUMPY_LOOKUPS: "Dict[str, np.ndarray]" = {}
+
+
+def _table_digest(tenmer_score: Dict[str, float]) -> str:
+    """Content digest of a 10-mer table (id() can be reused once a table is garbage-collected)."""
+    content = '\n'.join(f"{tenmer}\t{score!r}" for tenmer, score in tenmer_score.items())
+    return hashlib.blake2b(content.encode(), digest_size=16).hexdigest()
 
 
 def _build_numpy_lookup(tenmer_score: Dict[str, float]) -> "np.ndarray":
@@ -175,6 +180,34 @@ def _build_numpy_lookup(tenmer_score: Dict[str, float]) -> "np.ndarray":
     return lookup
 
 
+def get_tenmer_lookup(tenmer_score: Dict[str, float]) -> "np.ndarray":
+    """Cached (4^10,) hash → score array for *tenmer_score* (built on first use)."""
+    key = _table_digest(tenmer_score)
+    lookup = _NUMPY_LOOKUPS.get(key)
+    if lookup is None:
+        lookup = _NUMPY_LOOKUPS[key] = _build_numpy_lookup(tenmer_score)
+    return lookup
+
+
+def tenmer_hashes(seq: str) -> "Tuple[np.ndarray, np.ndarray]":
+    """Polynomial hash of every 10-mer window of *seq* plus a mask of windows made only of A/C/G/T.
+
+    Windows containing other characters (N, IUPAC codes) get an arbitrary hash
+    and ``valid = False``; callers must ignore them.
+    """
+    encoded = _BASE_ENCODE[np.frombuffer(seq.encode('ascii'), dtype=np.uint8)]
+    num_windows = len(seq) - 9
+    if num_windows <= 0:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=bool)
+    invalid = np.concatenate(([0], np.cumsum(encoded == 255)))
+    valid = (invalid[10:] - invalid[:num_windows]) == 0
+    encoded = np.where(encoded == 255, 0, encoded)
+    hashes = np.zeros(num_windows, dtype=np.int64)
+    for k in range(10):
+        hashes += encoded[k : k + num_windows].astype(np.int64) * _POWERS_OF_4[k]
+    return hashes, valid
+
+
 def vectorized_find_matches(seq: str, tenmer_score: Dict[str, float]) -> List[Tuple[int, str, float]]:
     """True numpy-vectorized 10-mer matching — no Python inner loop over positions.
 
@@ -195,8 +228,7 @@ def vectorized_find_matches(seq: str, tenmer_score: Dict[str, float]) -> List[Tu
     Performance vs py_find_matches_loop:
         ~5–10x faster for sequences ≥ 10 KB (benchmark on random DNA).
 
-    The lookup table is cached at module level and rebuilt only when a
-    different *tenmer_score* dict is supplied.
+    The lookup table is cached at module level, one per distinct *tenmer_score* content.
 
     Args:
         seq: DNA sequence to search (uppercase, ACGT only).
@@ -208,8 +240,6 @@ def vectorized_find_matches(seq: str, tenmer_score: Dict[str, float]) -> List[Tu
     Raises:
         ImportError: If NumPy is not available (triggers fallback to loop-based).
     """
-    global _NUMPY_LOOKUP, _NUMPY_LOOKUP_KEY
-
     if not _NUMPY_AVAILABLE:
         raise ImportError("NumPy is required for vectorized 10-mer matching")
 
@@ -223,31 +253,18 @@ def vectorized_find_matches(seq: str, tenmer_score: Dict[str, float]) -> List[Tu
     if n < 500:
         return py_find_matches_loop(seq, tenmer_score)
 
-    # --- Build / retrieve cached lookup table ---
-    # Use id() for fast identity check — TENMER_SCORE is a module-level constant
-    # that never changes, so object identity is a safe and cheap cache key.
-    current_key = id(tenmer_score)
-    if _NUMPY_LOOKUP is None or _NUMPY_LOOKUP_KEY != current_key:
-        _NUMPY_LOOKUP = _build_numpy_lookup(tenmer_score)
-        _NUMPY_LOOKUP_KEY = current_key
-    lookup = _NUMPY_LOOKUP
+    # --- Build / retrieve cached lookup table (keyed by table content) ---
+    lookup = get_tenmer_lookup(tenmer_score)
 
-    # --- Step 1: Encode DNA sequence ---
-    seq_bytes = np.frombuffer(seq.encode('ascii'), dtype=np.uint8)
-    encoded = _BASE_ENCODE[seq_bytes]  # dtype uint8; 255 for invalid chars
+    # --- Steps 1-2: Encode DNA and hash every 10-mer window (tenmer_hashes) ---
+    # hash[i] = Σ encoded[i+k] * 4^k  for k in 0..9
+    # Computed with 10 numpy array additions (not n Python iterations)
+    hashes, valid = tenmer_hashes(seq)
 
     # Fall back if sequence contains non-ACGT characters
-    if np.any(encoded == 255):
+    if not valid.all():
         return py_find_matches_loop(seq, tenmer_score)
 
-    # --- Step 2: Compute polynomial hashes for all 10-mer windows ---
-    # hash[i] = Σ encoded[i+k] * 4^k  for k in 0..9
-    # Computed with 10 numpy array additions (not n Python iterations)
-    num_windows = n - 9
-    hashes = np.zeros(num_windows, dtype=np.int64)
-    for k in range(10):
-        hashes += encoded[k : k + num_windows].astype(np.int64) * _POWERS_OF_4[k]
-
     # --- Step 3: Vectorised score lookup ---
     scores = lookup[hashes]  # O(n) C-speed array indexing
 
@@ -25,6 +25,7 @@ except ImportError:
 # Import analysis function from nonbscanner
 from Utilities.nonbscanner import analyze_sequence
 from Utilities.utilities import get_basic_stats
+from Utilities.scan_summary import ScanSummary
 
 
 @st.cache_resource(show_spinner=False)
@@ -123,17 +124,23 @@ def cache_analysis_results(sequence_hash: str, sequence: str, name: str):
 
 
 @st.cache_data(show_spinner=False, max_entries=20, ttl=3600)
-def get_cached_stats(sequence: str, motifs_json: str):
+def get_cached_stats(result_set_id: str, _sequence: str, _summary: ScanSummary):
     """
     Cache statistics calculation for sequences.
     
+    The cache key is the summary's result_set_id; the sequence and the
+    summary itself are excluded from hashing (underscore prefix), so a large
+    result set costs nothing to look up.
+    
     Args:
-        sequence: DNA sequence
-        motifs_json: JSON string of motifs (for cache key)
+        result_set_id: ScanSummary.result_set_id of the result set (cache key)
+        _sequence: DNA sequence (base composition)
+        _summary: Finalized ScanSummary of the motifs
         
     Returns:
         Dictionary of sequence statistics
     """
-    import json
-    motifs = json.loads(motifs_json) if motifs_json else []
-    return get_basic_stats(sequence, motifs)
+    stats = get_basic_stats(_sequence)
+    if _summary is not None and _summary.total_count:
+        stats.update(_summary.motif_statistics())
+    return stats
@@ -10,12 +10,10 @@
 # ═══════════════════════════════════════════════════════════════════════════════
 import streamlit as st
 import pandas as pd
-import numpy as np
 import re
 import io
 import time
 import logging
-from collections import Counter
 from Utilities.config.text import UI_TEXT
 from Utilities.config.themes import TAB_THEMES
 from UI.css import load_css, get_page_colors
@@ -24,6 +22,7 @@ from UI.guards import generate_excel_bytes, generate_multifasta_excel_bytes
 from UI.storage_helpers import has_results, get_sequences_info, get_results
 from Utilities.utilities import export_to_csv, export_to_json, export_to_excel, export_to_pdf, export_to_bed
 from Utilities.export.export_validator import validate_export_data
+from Utilities.scan_summary import ScanSummary
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # TUNABLE PARAMETERS
@@ -33,66 +32,33 @@ _logger = logging.getLogger(__name__)
 # ═══════════════════════════════════════════════════════════════════════════════
 
 @st.cache_data(show_spinner=False)
-def generate_statistics(all_motifs, names, lengths, seq_count):
+def generate_statistics(result_set_ids, _summaries, names, lengths, seq_count):
     """
     Compute class- and subclass-level distribution statistics plus the combined
-    stats Excel workbook.  Decorated with @st.cache_data so that download-button
-    reruns never trigger a recomputation – the result is locked until the caller
-    passes different arguments (new upload or reset both call st.cache_data.clear).
+    stats Excel workbook from per-sequence ScanSummary objects.  Decorated with
+    @st.cache_data and keyed by the summaries' result_set_ids (the summaries
+    themselves are not hashed), so download-button reruns never trigger a
+    recomputation or re-hash the motif list.
     """
     dist_df = pd.DataFrame()
     sub_df = pd.DataFrame()
     stats_excel = b""
 
-    if all_motifs:
-        # Group motifs by sequence name once (O(n+m)) to avoid repeated O(n*m) filters
-        name_to_length = dict(zip(names, lengths))
-        motifs_by_name: dict = {name: [] for name in names}
-        for m in all_motifs:
-            seq_name = m.get('Sequence_Name')
-            if seq_name in motifs_by_name:
-                motifs_by_name[seq_name].append(m)
-
+    if any(s.total_count for s in _summaries):
         try:
             dist_data = []
-            for name in names:
-                slen = name_to_length.get(name, 0)
-                motifs = motifs_by_name[name]
-                cls_cnt = Counter(m.get('Class', 'Unknown') for m in motifs)
-                for cname, cnt in cls_cnt.items():
-                    cls_pos = set()
-                    for m in motifs:
-                        if m.get('Class') == cname:
-                            s = m.get('Start', 0) - 1
-                            e = m.get('End', 0)
-                            if e > s:
-                                cls_pos.update(range(s, e))
-                    cls_covered = len(cls_pos)
-                    gd = (cls_covered / slen * 100) if slen > 0 else 0
-                    mkb = (cnt / slen * 1000) if slen > 0 else 0
-                    avl = np.mean([m.get('Length', 0) for m in motifs if m.get('Class') == cname])
-                    dist_data.append({'Sequence Name': name, 'Motif Class': cname.replace('_', ' '), 'Count': cnt, 'Coverage (%)': f"{gd:.4f}", 'Motifs per kbp': f"{mkb:.2f}", 'Average Length (bp)': f"{avl:.1f}", 'Covered Bases (bp)': cls_covered})
-            dist_df = pd.DataFrame(dist_data)
-
             sub_data = []
-            for name in names:
-                slen = name_to_length.get(name, 0)
-                motifs = motifs_by_name[name]
-                sub_cnt = Counter(m.get('Subclass', 'Unknown') for m in motifs)
-                for sname, cnt in sub_cnt.items():
-                    pcls = next((m.get('Class') for m in motifs if m.get('Subclass') == sname), 'Unknown')
-                    sub_pos = set()
-                    for m in motifs:
-                        if m.get('Subclass') == sname:
-                            s = m.get('Start', 0) - 1
-                            e = m.get('End', 0)
-                            if e > s:
-                                sub_pos.update(range(s, e))
-                    sub_covered = len(sub_pos)
-                    gd = (sub_covered / slen * 100) if slen > 0 else 0
-                    mkb = (cnt / slen * 1000) if slen > 0 else 0
-                    avl = np.mean([m.get('Length', 0) for m in motifs if m.get('Subclass') == sname])
-                    sub_data.append({'Sequence Name': name, 'Motif Class': pcls.replace('_', ' '), 'Motif Subclass': sname.replace('_', ' '), 'Count': cnt, 'Coverage (%)': f"{gd:.4f}", 'Motifs per kbp': f"{mkb:.2f}", 'Average Length (bp)': f"{avl:.1f}", 'Covered Bases (bp)': sub_covered})
+            for name, summary in zip(names, _summaries):
+                slen = summary.sequence_length
+                for row in summary.class_rows():
+                    gd = (row['Covered_bp'] / slen * 100) if slen > 0 else 0
+                    mkb = (row['Count'] / slen * 1000) if slen > 0 else 0
+                    dist_data.append({'Sequence Name': name, 'Motif Class': row['Class'].replace('_', ' '), 'Count': row['Count'], 'Coverage (%)': f"{gd:.4f}", 'Motifs per kbp': f"{mkb:.2f}", 'Average Length (bp)': f"{row['Mean_Length']:.1f}", 'Covered Bases (bp)': row['Covered_bp']})
+                for row in summary.group_rows():
+                    gd = (row['Covered_bp'] / slen * 100) if slen > 0 else 0
+                    mkb = (row['Count'] / slen * 1000) if slen > 0 else 0
+                    sub_data.append({'Sequence Name': name, 'Motif Class': row['Class'].replace('_', ' '), 'Motif Subclass': row['Subclass'].replace('_', ' '), 'Count': row['Count'], 'Coverage (%)': f"{gd:.4f}", 'Motifs per kbp': f"{mkb:.2f}", 'Average Length (bp)': f"{row['Mean_Length']:.1f}", 'Covered Bases (bp)': row['Covered_bp']})
+            dist_df = pd.DataFrame(dist_data)
             sub_df = pd.DataFrame(sub_data)
         except Exception as exc:
             _logger.error("Statistics computation failed: %s", exc)
@@ -111,6 +77,20 @@ def generate_statistics(all_motifs, names, lengths, seq_count):
     return dist_df, sub_df, stats_excel
 
 
+def _scan_summaries(all_motifs, names, lengths, seq_count):
+    """Per-sequence ScanSummary objects: reuse those cached at analysis end, build the rest."""
+    cached = st.session_state.get('cached_visualizations', {})
+    summaries = [cached.get(f"seq_{i}", {}).get('scan_summary') for i in range(seq_count)]
+    missing = {names[i]: ScanSummary(names[i], lengths[i]) for i, s in enumerate(summaries) if s is None}
+    if missing:
+        for m in all_motifs:
+            summary = missing.get(m.get('Sequence_Name'))
+            if summary is not None:
+                summary.update((m,))
+        summaries = [s if s is not None else missing[names[i]].finalize() for i, s in enumerate(summaries)]
+    return summaries
+
+
 @st.cache_data(show_spinner=False)
 def generate_all_exports(all_motifs, names, lengths, seq_count):
     export_times = {}
@@ -256,7 +236,8 @@ def render():
     # button clicks never recompute statistics and never cause buttons to flicker.
     # ═══════════════════════════════════════════════════════════════════════════════
     st.markdown("---"); st.markdown("### Statistical Analysis Tables"); st.markdown(f"<div style='background:{c['light']};padding:0.4rem;border-radius:10px;margin-bottom:0.8rem;border:2px solid {c['primary']};box-shadow:0 2px 10px {c['shadow']};border-left:4px solid {c['accent']};'><p style='color:{c['text']};margin:0;font-size:0.95rem;'><strong>Advanced Analytics:</strong> Detailed distribution and density statistics</p></div>", unsafe_allow_html=True)
-    dist_df, sub_df, _stats_excel = generate_statistics(tuple(all_motifs), tuple(names), tuple(lengths), seq_count)
+    summaries = _scan_summaries(all_motifs, names, lengths, seq_count)
+    dist_df, sub_df, _stats_excel = generate_statistics(tuple(s.result_set_id for s in summaries), summaries, tuple(names), tuple(lengths), seq_count)
     st.markdown("#### Class-Level Distribution Statistics")
     if not dist_df.empty:
         st.dataframe(dist_df.head(10), use_container_width=True, height=300); st.caption(f"Showing first 10 of {len(dist_df)} records")
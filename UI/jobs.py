@@ -0,0 +1,128 @@
+"""
+┌──────────────────────────────────────────────────────────────────────────────┐
+│ Jobs Page - Queue Background Analyses and Poll Them by Job ID                │
+├──────────────────────────────────────────────────────────────────────────────┤
+│ Author: Dr. Venkata Rajesh Yella | License: MIT | Version: 2024.1            │
+└──────────────────────────────────────────────────────────────────────────────┘
+"""
+# ═══════════════════════════════════════════════════════════════════════════════
+# IMPORTS
+# ═══════════════════════════════════════════════════════════════════════════════
+import streamlit as st
+import pandas as pd
+import os
+import re
+import uuid
+import logging
+from datetime import datetime
+from Utilities.config.themes import TAB_THEMES
+from UI.css import load_css
+from UI.headers import render_section_heading
+from Utilities.job_manager import RESULTS_BASE_DIR, get_job_directory, get_job_summary, open_job_results
+from Utilities.job_queue import JobQueue
+from Utilities.nonbscanner import CLASS_TO_DETECTOR
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# TUNABLE PARAMETERS
+# ═══════════════════════════════════════════════════════════════════════════════
+POLL_SECONDS = 3                                 # refresh interval of the job status panel
+UPLOAD_DIR = os.path.join(RESULTS_BASE_DIR, "uploads")
+RECENT_JOBS = 50
+_logger = logging.getLogger(__name__)
+# ═══════════════════════════════════════════════════════════════════════════════
+
+# st.fragment(run_every=...) reruns only the status panel; older Streamlit falls back to a manual refresh button
+_fragment = getattr(st, "fragment", None)
+
+
+def _fmt_time(ts):
+    return datetime.fromtimestamp(ts).strftime("%Y-%m-%d %H:%M") if ts else ""
+
+
+def _save_upload(uploaded) -> str:
+    # Each upload gets its own directory, so a same-named upload never overwrites the input of a queued job
+    upload_dir = os.path.join(UPLOAD_DIR, uuid.uuid4().hex[:12])
+    os.makedirs(upload_dir, exist_ok=True)
+    path = os.path.join(upload_dir, re.sub(r'[^\w.\-]', '_', uploaded.name))
+    with open(path, "wb") as f:
+        f.write(uploaded.getbuffer())
+    return path
+
+
+def _render_submit(queue: JobQueue):
+    with st.form("job_submit"):
+        uploaded = st.file_uploader("FASTA files (plain, .gz or bgzip)", accept_multiple_files=True, key="job_upload")
+        paths = st.text_area("...or server-side paths, one per line", placeholder="/data/genomes/hg38.fa.gz")
+        classes = st.multiselect("Motif classes (empty = all)", list(CLASS_TO_DETECTOR))
+        if not st.form_submit_button("Queue jobs"):
+            return
+    inputs = [_save_upload(u) for u in (uploaded or [])] + [p.strip() for p in paths.splitlines() if p.strip()]
+    missing = [p for p in inputs if not os.path.exists(p)]
+    if missing: st.error(f"Not found: {', '.join(missing)}")
+    params = {"enabled_classes": classes or None}
+    job_ids = [queue.submit(p, params) for p in inputs if p not in missing]
+    if job_ids:
+        st.session_state.current_job_id = job_ids[-1]
+        st.success(f"Queued {len(job_ids)} job(s): {', '.join(job_ids)}. Results appear once a `nonbdna-worker` picks them up.")
+
+
+def _render_job_results(job_id: str):
+    entries = open_job_results(job_id)
+    if not entries: return
+    budget = (get_job_summary(job_id) or {}).get("budget") or {}
+    if budget.get("status") == "partial":
+        st.warning(f"Partial results: the job's run budget ran out ({budget.get('stop_reason') or 'chunk timeout'}). "
+                   f"{budget.get('skipped_bp', 0):,} bp skipped, {len(budget.get('truncated', []))} detector run(s) truncated; the motifs found so far are exported below.")
+    st.dataframe(pd.DataFrame([{"Sequence": e["name"], "Length (bp)": e["length"], "Motifs": e["motifs"], "Partial": e["partial"]} for e in entries]), use_container_width=True, hide_index=True)
+    csv_path = os.path.join(get_job_directory(job_id), "motifs.csv")
+    if st.button("Prepare CSV", key=f"csv_{job_id}"):
+        from Utilities.utilities import export_to_csv
+        try: export_to_csv((m for e in entries for m in e["storage"].iter_results()), filename=csv_path)
+        except Exception as e: st.error(f"CSV export failed: {e}")
+    if os.path.exists(csv_path):
+        with open(csv_path, "rb") as f:
+            st.download_button("Download CSV", f, file_name=f"nonbdna_{job_id}.csv", mime="text/csv", key=f"dl_{job_id}")
+
+
+def _render_status(queue: JobQueue, job_id: str):
+    job = queue.get(job_id)
+    if job is None:
+        summary = get_job_summary(job_id)  # results saved by an interactive run on the Upload page
+        if summary is None: st.warning(f"No job with id {job_id}"); return
+        st.markdown(f"**{job_id}** · saved {summary.get('timestamp', '')[:16].replace('T', ' ')} · {summary.get('total_motifs', 0):,} motifs")
+        _render_job_results(job_id); return
+    st.markdown(f"**{job_id}** · `{os.path.basename(job['input_path'])}` · **{job['status']}**")
+    st.progress(float(job["progress"]), text=job["message"] or job["status"])
+    if job["status"] == "failed": st.error(job["error"])
+    if job["status"] in ("queued", "running") and st.button("Cancel job", key=f"cancel_{job_id}"):
+        queue.cancel(job_id); st.rerun()
+    if job["status"] == "done": _render_job_results(job_id)
+
+
+def _render_recent(queue: JobQueue):
+    jobs = queue.list_jobs(limit=RECENT_JOBS)
+    if not jobs: st.caption("No jobs yet."); return
+    st.dataframe(pd.DataFrame([{"Job": j["job_id"], "Input": os.path.basename(j["input_path"]), "Status": j["status"], "Progress": f"{j['progress']:.0%}", "Message": j["message"], "Submitted": _fmt_time(j["created_at"]), "Finished": _fmt_time(j["finished_at"])} for j in jobs]), use_container_width=True, hide_index=True)
+
+
+def render():
+    load_css(TAB_THEMES['Jobs']); render_section_heading("Background Jobs", page="Upload & Analyze")
+    st.caption("Jobs run in detached `nonbdna-worker` processes (start them with `nonbdna-worker` or `python -m Utilities.job_worker`). "
+               "Closing this tab does not stop them; come back with the job id.")
+    queue = JobQueue()
+    _render_submit(queue)
+    job_id = st.text_input("Job id", value=st.query_params.get("job") or st.session_state.get("current_job_id") or "", max_chars=10).strip()
+    if job_id:
+        st.query_params["job"] = job_id
+        try: get_job_directory(job_id)
+        except ValueError as e: st.error(str(e)); job_id = ""
+    if _fragment is not None:
+        @_fragment(run_every=POLL_SECONDS)
+        def _live():
+            if job_id: _render_status(queue, job_id)
+            _render_recent(queue)
+        _live()
+    else:
+        if job_id: _render_status(queue, job_id)
+        _render_recent(queue)
+        st.button("Refresh")
@@ -30,7 +30,8 @@ from Utilities.utilities import (
     plot_motif_cooccurrence_matrix, plot_motif_length_kde, plot_score_distribution,
     plot_score_violin, plot_structural_heatmap, plot_motif_network,
     plot_chromosome_density, plot_spacer_loop_variation, plot_motif_clustering_distance,
-    plot_structural_competition_upset, compute_comprehensive_genome_stats
+    plot_structural_competition_upset, compute_comprehensive_genome_stats,
+    calculate_overlap_matrix, overlap_matrix_to_pairs
 )
 from Utilities.visualization import NATURE_MOTIF_COLORS
 from Utilities.multifasta_engine import MultiFastaEngine
@@ -80,14 +81,12 @@ def _render_analysis_summary_box(cov, den, cnt, slen):
     val_gradient = f"linear-gradient(135deg,{rc['primary']},{rc['secondary']})"
     st.markdown(f"<div style='display:flex;flex-wrap:wrap;gap:4px;padding:5px 10px;background:{rc['light']};border-radius:6px;border:2px solid {rc['primary']};box-shadow:0 2px 8px {rc['shadow']};margin-bottom:8px;justify-content:space-around;align-items:center;'><div style='display:flex;flex-direction:column;align-items:center;padding:1px 8px;'><span style='font-size:0.95rem;font-weight:800;background:{val_gradient};-webkit-background-clip:text;-webkit-text-fill-color:transparent;'>{cov:.2f}%</span><span style='font-size:0.6rem;color:#64748b;text-transform:uppercase;'>Coverage</span></div><div style='display:flex;flex-direction:column;align-items:center;padding:1px 8px;'><span style='font-size:0.95rem;font-weight:800;background:{val_gradient};-webkit-background-clip:text;-webkit-text-fill-color:transparent;'>{den:.2f}</span><span style='font-size:0.6rem;color:#64748b;text-transform:uppercase;'>Motifs/kb</span></div><div style='display:flex;flex-direction:column;align-items:center;padding:1px 8px;'><span style='font-size:0.95rem;font-weight:800;background:{val_gradient};-webkit-background-clip:text;-webkit-text-fill-color:transparent;'>{cnt:,}</span><span style='font-size:0.6rem;color:#64748b;text-transform:uppercase;'>Motifs</span></div><div style='display:flex;flex-direction:column;align-items:center;padding:1px 8px;'><span style='font-size:0.95rem;font-weight:800;background:{val_gradient};-webkit-background-clip:text;-webkit-text-fill-color:transparent;'>{slen:,}</span><span style='font-size:0.6rem;color:#64748b;text-transform:uppercase;'>bp</span></div></div>", unsafe_allow_html=True)
 
-def _calculate_overlaps(motifs, by='Class'):
-    overlaps = {}; sorted_m = sorted(motifs, key=lambda m: m.get('Start', 0))
-    for i, m1 in enumerate(sorted_m):
-        for m2 in sorted_m[i+1:]:
-            if m2.get('Start', 0) >= m1.get('End', 0): break
-            k1, k2 = m1.get(by, 'Unknown'), m2.get(by, 'Unknown')
-            if k1 != k2: pair = tuple(sorted([k1, k2])); overlaps[pair] = overlaps.get(pair, 0) + 1
-    return overlaps
+def _calculate_overlaps(motifs, by='Class', seq_idx=None):
+    """Pairwise overlap counts {(a, b): n}; matrix is computed once per result set and kept in cached_visualizations."""
+    cv = st.session_state.setdefault('cached_visualizations', {}).setdefault(f"seq_{seq_idx}", {}) if seq_idx is not None else {}
+    ovl = cv.setdefault('overlaps', {})
+    if by not in ovl: ovl[by] = calculate_overlap_matrix(motifs, by=by)
+    return overlap_matrix_to_pairs(*ovl[by])
 
 def _render_overlap_matrix(overlaps, title):
     if not overlaps: return
@@ -298,9 +297,13 @@ def render():
     df = pd.DataFrame(motifs) if motifs else pd.DataFrame()
     if len(df) > 1000: df = optimize_dataframe_memory(df)
     
-    # Get sequence for stats calculation
-    # For disk storage mode, we need to load sequence for stats
-    if st.session_state.get('use_disk_storage') and st.session_state.get('seq_ids'):
+    # Coverage/density come from the scan summary built at analysis end; the
+    # sequence is only loaded when no summary is cached
+    scan_summary = st.session_state.get('cached_visualizations', {}).get(f"seq_{seq_idx}", {}).get('scan_summary')
+    if scan_summary is not None:
+        ms = scan_summary.motif_statistics()
+        _render_analysis_summary_box(ms['Coverage%'], ms['Density'], len(motifs), slen)
+    elif st.session_state.get('use_disk_storage') and st.session_state.get('seq_ids'):
         seq_id = st.session_state.seq_ids[seq_idx]
         # For large sequences, calculate stats from metadata instead of loading full sequence
         if slen > 10_000_000:  # 10MB threshold
@@ -560,7 +563,7 @@ def render():
         _render_section_divider("Structural Competition (UpSet)")
         _show_fig('upset_fig', lambda: plot_structural_competition_upset(motifs, title="Structural Competition"), "UpSet error")
         
-        _render_section_divider("Overlaps Summary"); co, so = _calculate_overlaps(motifs, by='Class'), _calculate_overlaps(motifs, by='Subclass'); c1, c2 = st.columns(2)
+        _render_section_divider("Overlaps Summary"); co, so = _calculate_overlaps(motifs, by='Class', seq_idx=seq_idx), _calculate_overlaps(motifs, by='Subclass', seq_idx=seq_idx); c1, c2 = st.columns(2)
         with c1:
             if co: _render_overlap_matrix(co, "Class Overlaps")
             else: st.markdown('<div style="color:#64748b;font-size:0.8rem;">No class overlaps</div>', unsafe_allow_html=True)
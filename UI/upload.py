@@ -43,8 +43,7 @@ from Utilities.utilities import (
     trigger_garbage_collection,
     parse_fasta,
     get_memory_usage_mb,
-    calculate_genomic_density,
-    calculate_positional_density,
+    calculate_overlap_matrix,
     _NON_IUPAC_RE,
     plot_motif_distribution,
     plot_linear_motif_track,
@@ -64,7 +63,8 @@ from Utilities.utilities import (
 )
 from Utilities.nonbscanner import analyze_sequence
 from Utilities.job_manager import save_job_results, generate_job_id
-from Utilities.disk_storage import UniversalSequenceStorage, UniversalResultsStorage
+from Utilities.disk_storage import UniversalSequenceStorage, create_results_storage
+from Utilities.scan_summary import ScanSummary
 from Utilities.chunk_analyzer import ChunkAnalyzer
 from Utilities.detectors_utils import calc_gc_content, _count_bases
 from Utilities.multifasta_engine import analyze_sequences_parallel
@@ -1484,8 +1484,7 @@ def render():
                             seq_ids=st.session_state.seq_ids,
                             names=st.session_state.names,
                             seq_storage=st.session_state.seq_storage,
-                            enabled_classes=list(analysis_classes) if analysis_classes else None,
-                            chunk_threshold=CHUNK_ANALYSIS_THRESHOLD_BP
+                            enabled_classes=list(analysis_classes) if analysis_classes else None
                         )
                     else:
                         sequences_data, analysis_params = prepare_parallel_analysis(
@@ -1493,8 +1492,7 @@ def render():
                             use_disk_storage=False,
                             seqs=st.session_state.seqs,
                             names=st.session_state.names,
-                            enabled_classes=list(analysis_classes) if analysis_classes else None,
-                            chunk_threshold=CHUNK_ANALYSIS_THRESHOLD_BP
+                            enabled_classes=list(analysis_classes) if analysis_classes else None
                         )
                     
                     # Progress tracking
@@ -1517,8 +1515,7 @@ def render():
                             sequences_data=sequences_data,
                             analysis_params=analysis_params,
                             max_workers=get_optimal_workers(num_sequences),
-                            progress_callback=parallel_progress_callback,
-                            use_processes=False  # Use threads for I/O-bound operations
+                            progress_callback=parallel_progress_callback
                         )
                         
                         parallel_status.update(label="✅ Parallel analysis complete", state="complete")
@@ -1676,7 +1673,7 @@ def render():
                                 analysis_elapsed = time.time() - analysis_start
                                 
                                 # Create results storage and save
-                                results_storage = UniversalResultsStorage(
+                                results_storage = create_results_storage(
                                     base_dir=str(st.session_state.seq_storage.base_dir / "results"),
                                     seq_id=seq_id
                                 )
@@ -2023,33 +2020,29 @@ def render():
                     viz_cache_key = f"seq_{seq_idx}"
                     st.session_state.cached_visualizations[viz_cache_key] = {}
                     
-                    # Pre-calculate all density metrics (class and subclass level) - optimized batch calculation
+                    # Summarize the result set once; densities and counts are read from it
                     try:
-                        # Calculate all densities in one pass to avoid redundant iterations
-                        genomic_density_class = calculate_genomic_density(filtered_motifs, sequence_length, by_class=True)
-                        positional_density_class = calculate_positional_density(filtered_motifs, sequence_length, unit='kbp', by_class=True)
-                        
-                        genomic_density_subclass = calculate_genomic_density(filtered_motifs, sequence_length, 
-                                                                            by_class=False, by_subclass=True)
-                        positional_density_subclass = calculate_positional_density(filtered_motifs, sequence_length, 
-                                                                                  unit='kbp', by_class=False, by_subclass=True)
+                        scan_summary = ScanSummary.from_motifs(filtered_motifs, sequence_length, name)
+                        st.session_state.cached_visualizations[viz_cache_key]['scan_summary'] = scan_summary
                         
                         # Store density metrics
                         st.session_state.cached_visualizations[viz_cache_key]['densities'] = {
-                            'class_genomic': genomic_density_class,
-                            'class_positional': positional_density_class,
-                            'subclass_genomic': genomic_density_subclass,
-                            'subclass_positional': positional_density_subclass
+                            'class_genomic': scan_summary.genomic_density(by_class=True),
+                            'class_positional': scan_summary.positional_density(unit='kbp', by_class=True),
+                            'subclass_genomic': scan_summary.genomic_density(by_class=False, by_subclass=True),
+                            'subclass_positional': scan_summary.positional_density(unit='kbp', by_class=False, by_subclass=True)
                         }
                         
-                        # Count unique classes and subclasses (cached for later use)
-                        unique_classes = len(set(m.get('Class', 'Unknown') for m in filtered_motifs))
-                        unique_subclasses = len(set(m.get('Subclass', 'Unknown') for m in filtered_motifs))
-                        
                         st.session_state.cached_visualizations[viz_cache_key]['summary'] = {
-                            'unique_classes': unique_classes,
-                            'unique_subclasses': unique_subclasses,
-                            'total_motifs': len(filtered_motifs)
+                            'unique_classes': len(scan_summary.class_names),
+                            'unique_subclasses': len({sub for _, sub in scan_summary.groups}),
+                            'total_motifs': scan_summary.total_count
+                        }
+                        
+                        # Class/subclass overlap matrices for the results page
+                        st.session_state.cached_visualizations[viz_cache_key]['overlaps'] = {
+                            'Class': calculate_overlap_matrix(filtered_motifs, by='Class'),
+                            'Subclass': calculate_overlap_matrix(filtered_motifs, by='Subclass')
                         }
                         
                         total_viz_count += 4  # Count density calculations
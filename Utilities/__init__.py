@@ -8,13 +8,13 @@ Contains utility modules for:
 - Visualization (visualization/)
 - Main scanner API (nonbscanner.py)
 - Detector utilities (detectors_utils.py)
-- Job management (job_manager.py)
+- Job management (job_manager.py, job_queue.py, job_worker.py)
 - Scanner agent (scanner_agent.py)
 - General utilities (utilities.py)
 
 Production-grade adaptive chunking architecture:
 - SystemResourceInspector  – RAM / CPU / disk availability
-- AdaptiveChunkPlanner     – Dynamic chunk-size and worker selection
+- AdaptiveChunkPlanner     – Chunk-size, overlap and worker selection (RAM tiers or calibrated cost model)
 - ChunkGenerator           – Overlapping genome segment iterator (2 000 bp overlap)
 - OverlapDeduplicator      – Remove duplicate motifs at chunk boundaries
 - DetectorRunner           – Run detectors on a chunk, write results to disk
@@ -9,10 +9,9 @@ DESCRIPTION:
     Decides chunk size, overlap, worker count, and execution mode dynamically
     based on genome length, available RAM, and CPU core count.
 
-    The overlap is fixed at 2 000 bp to ensure motifs at chunk boundaries
-    (longest known Non-B motif is ~2 000 bp) are always detected fully.
-
-    Execution modes:
+    plan() - RAM tiers only. The overlap is fixed at 2 000 bp to ensure
+    motifs at chunk boundaries (longest known Non-B motif is ~2 000 bp) are
+    always detected fully.
 
         "disk_stream"  – Sequential chunk processing, one chunk at a time.
                          Used when RAM is scarce (< 4 GB) or small genomes
@@ -21,6 +20,40 @@ DESCRIPTION:
         "hybrid"       – Parallel chunk processing with up to 4 workers.
                          RAM budget must be ≥ 4 GB.
 
+    plan_for_sequence() - cost model ("cost_model" mode). Chunk size,
+    overlap and worker count are chosen to minimise the expected wall time
+    under the memory budget:
+
+        * DetectorCostModel holds per-detector seconds/bp, the scaling
+          exponent of that cost with chunk length, and bytes/bp. It is
+          measured once by calibrate_cost_model() on synthetic sequences
+          (random, AT-rich, GC-rich, repeat-dense) and cached on disk as
+          JSON, keyed by the detector fingerprint (Utilities.chunk_cache),
+          so editing a detector triggers a re-calibration.
+        * sequence_features() samples FEATURE_WINDOWS windows of the input
+          for GC fraction and repeat density (share of repeated 10-mers per
+          window). Costs are interpolated between the calibration anchors.
+        * Candidate chunk sizes come from CHUNK_SIZE_LADDER. Total work uses
+          the mean repeat density. The tail task and per-worker memory use
+          the densest sampled window, so superlinear detectors (slipped,
+          cruciform, triplex on repeats) pull the chunk size down. Cheap,
+          linear detectors on unique sequence push it up.
+        * Overlap is the longest reach of the enabled detectors, doubled
+          (incremental_scan.DETECTOR_CONTEXT_BP). It is capped at OVERLAP, and
+          set to OVERLAP itself for repeat-dense input.
+
+    analyze_sequence() uses plan_for_sequence() only when NONBDNA_ADAPTIVE_CHUNKS
+    is true (CHUNKING_CONFIG['enable_adaptive'], off by default) and no
+    chunk_size is given. The plan depends on the calibration, i.e. on the
+    timings of the machine, so chunk boundaries, and with them the motifs
+    that straddle a boundary, can differ between machines and from the fixed
+    50 kb / 2 kb tiling. Pass chunk_size explicitly or leave the planner off
+    for reproducible output.
+
+CONFIGURATION (environment):
+    NONBDNA_ADAPTIVE_CHUNKS  'true' enables the cost-model plan in analyze_sequence (default: false)
+    NONBDNA_COST_MODEL       Cost model cache file (default: ~/.cache/nonbdna/cost_model.json)
+
 USAGE::
 
     from Utilities.system_resource_inspector import SystemResourceInspector
@@ -34,15 +67,291 @@ USAGE::
         cpu_count     = resources.get_cpu_count(),
     )
     # plan["chunk_size"], plan["overlap"], plan["workers"], plan["mode"]
+
+    plan = planner.plan_for_sequence(sequence, enabled_classes=["G-Quadruplex"])
+    # plus plan["expected_wall_s"], plan["expected_peak_bytes"], plan["features"]
 """
 
 from __future__ import annotations
 
+import json
 import logging
-from typing import Any, Dict
+import math
+import os
+import random
+import tempfile
+import threading
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
+COST_MODEL_PATH = os.environ.get(
+    'NONBDNA_COST_MODEL', os.path.join(os.path.expanduser('~'), '.cache', 'nonbdna', 'cost_model.json')
+)
+COST_MODEL_VERSION = 1
+
+# Calibration: each synthetic sequence is timed at both lengths to fit the scaling exponent
+CALIBRATION_LENGTHS = (10_000, 40_000)
+CALIBRATION_SEED = 20240101
+
+CHUNK_SIZE_LADDER = (25_000, 50_000, 100_000, 200_000, 500_000, 1_000_000)
+FEATURE_WINDOWS = 32
+FEATURE_WINDOW_BP = 2_000
+REPEAT_DENSE = 0.10              # mean repeated-10-mer share above which the full overlap is kept
+
+TASK_OVERHEAD_S = 0.003          # pickling + queue round trip per (chunk, detector) task
+WORKER_BASE_BYTES = 200 * 1024 * 1024   # interpreter + imported detectors per pool worker
+TEXT_BYTES_PER_BP = 16           # chunk text copies (parent window, task payload, upper-cased) per bp
+
+_COST_MODEL: Optional['DetectorCostModel'] = None
+_COST_MODEL_LOCK = threading.Lock()
+
+
+# =============================================================================
+# SEQUENCE FEATURES
+# =============================================================================
+
+def sequence_features(sequence, windows: int = FEATURE_WINDOWS, window: int = FEATURE_WINDOW_BP) -> Dict[str, float]:
+    """
+    GC fraction and repeat density from evenly spaced sample windows.
+
+    Args:
+        sequence: str or FastaRecord (only the sampled windows are read)
+        windows: Number of sample windows
+        window: Window length in bp
+
+    Returns:
+        {'gc', 'repeat', 'repeat_max', 'sampled_bp'}. ``repeat`` is the mean
+        share of repeated 10-mers per window (about 0 for unique sequence,
+        close to 1 for tandem repeats). ``repeat_max`` is the densest window.
+    """
+    from Detectors.zdna.hyperscan_backend import tenmer_hashes
+
+    n = len(sequence)
+    if n <= windows * window:
+        starts: Iterable[int] = range(0, max(n - window, 0) + 1, window)
+    else:
+        starts = np.linspace(0, n - window, windows).astype(np.int64).tolist()
+    gc = acgt = sampled = 0
+    densities: List[float] = []
+    for start in starts:
+        text = str(sequence[start:start + window]).upper()
+        sampled += len(text)
+        g, c = text.count('G'), text.count('C')
+        gc += g + c
+        acgt += g + c + text.count('A') + text.count('T')
+        hashes, valid = tenmer_hashes(text.encode('ascii', 'replace').decode('ascii'))
+        kmers = hashes[valid]
+        if len(kmers) >= 100:
+            densities.append(1.0 - len(np.unique(kmers)) / len(kmers))
+    return {
+        'gc': gc / acgt if acgt else 0.5,
+        'repeat': float(np.mean(densities)) if densities else 0.0,
+        'repeat_max': float(np.max(densities)) if densities else 0.0,
+        'sampled_bp': sampled,
+    }
+
+
+# =============================================================================
+# COST MODEL
+# =============================================================================
+
+def _synthetic_sequence(kind: str, length: int, seed: int = CALIBRATION_SEED) -> str:
+    """Deterministic calibration input: 'random', 'at_rich', 'gc_rich' or 'repeat' (STRs, inverted/mirror repeats, G4s)."""
+    rng = random.Random(f"{seed}:{kind}")
+    if kind != 'repeat':
+        weights = {'random': (1, 1, 1, 1), 'at_rich': (7, 3, 3, 7), 'gc_rich': (3, 7, 7, 3)}[kind]
+        return ''.join(rng.choices('ACGT', weights=weights, k=length))
+    complement = str.maketrans('ACGT', 'TGCA')
+    parts: List[str] = []
+    total = 0
+    while total < length:
+        roll = rng.random()
+        if roll < 0.25:      # short tandem repeat
+            unit = ''.join(rng.choices('ACGT', k=rng.randint(1, 6)))
+            part = unit * rng.randint(5, 30)
+        elif roll < 0.45:    # inverted repeat (cruciform)
+            arm = ''.join(rng.choices('ACGT', k=rng.randint(10, 30)))
+            part = arm + ''.join(rng.choices('ACGT', k=rng.randint(3, 8))) + arm.translate(complement)[::-1]
+        elif roll < 0.60:    # homopurine mirror repeat (triplex)
+            arm = ''.join(rng.choices('AG', k=rng.randint(12, 30)))
+            part = arm + 'TTT' + arm[::-1]
+        elif roll < 0.70:    # G4
+            part = 'GGG' + ''.join(rng.choices('ACT', k=3)) + 'GGGTTAGGGTAGGG'
+        else:
+            part = ''.join(rng.choices('ACGT', k=rng.randint(20, 120)))
+        parts.append(part)
+        total += len(part)
+    return ''.join(parts)[:length]
+
+
+def calibrate_cost_model(detectors: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Measure per-detector cost coefficients on synthetic sequences.
+
+    Every detector is timed on each synthetic kind at both
+    CALIBRATION_LENGTHS (best of two differently seeded sequences, so
+    detector-side caches never see the same input twice). Its allocation
+    peak is measured with tracemalloc on a third sequence at the longer
+    length.
+
+    Args:
+        detectors: detector name -> instance (default: the cached scanner's detectors)
+
+    Returns:
+        Cost model dict (see DetectorCostModel)
+    """
+    from Utilities.chunk_cache import detector_fingerprint
+    from Utilities.nonbscanner import _get_cached_scanner
+
+    scanner = _get_cached_scanner()
+    detectors = detectors if detectors is not None else {name: scanner.detectors[name] for name in scanner.detectors}
+    short, long_ = CALIBRATION_LENGTHS
+    started = time.time()
+    kinds = ('random', 'at_rich', 'gc_rich', 'repeat')
+    sequences = {kind: {length: [_synthetic_sequence(kind, length, CALIBRATION_SEED + i) for i in range(3)] for length in CALIBRATION_LENGTHS} for kind in kinds}
+    warmup = _synthetic_sequence('repeat', 2_000, CALIBRATION_SEED - 1)
+    for detector in detectors.values():          # lazy imports, compiled patterns
+        detector.detect_motifs(warmup, 'calibration')
+
+    def best_time(fn, inputs) -> float:
+        best = float('inf')
+        for arg in inputs:
+            t0 = time.perf_counter(); fn(arg); best = min(best, time.perf_counter() - t0)
+        return max(best, 1e-6)
+
+    model: Dict[str, Any] = {
+        'version': COST_MODEL_VERSION, 'fingerprint': detector_fingerprint(), 'created': datetime.now().isoformat(timespec='seconds'),
+        'calibration_lengths': list(CALIBRATION_LENGTHS),
+        'anchors': {kind: sequence_features(sequences[kind][long_][0]) for kind in kinds},
+        'detectors': {},
+    }
+    raw_motifs: List[Dict[str, Any]] = []
+    for name, detector in detectors.items():
+        entry: Dict[str, Dict[str, float]] = {'s_per_bp': {}, 'exponent': {}, 'bytes_per_bp': {}}
+        for kind in kinds:
+            t_short = best_time(lambda seq: detector.detect_motifs(seq, 'calibration'), sequences[kind][short][:2])
+            t_long = best_time(lambda seq: detector.detect_motifs(seq, 'calibration'), sequences[kind][long_][:2])
+            entry['s_per_bp'][kind] = t_long / long_
+            entry['exponent'][kind] = min(2.0, max(1.0, math.log(t_long / t_short) / math.log(long_ / short)))
+            tracemalloc.start()
+            try:
+                motifs = detector.detect_motifs(sequences[kind][long_][2], 'calibration')
+                entry['bytes_per_bp'][kind] = tracemalloc.get_traced_memory()[1] / long_
+            finally:
+                tracemalloc.stop()
+            if kind == 'repeat':
+                raw_motifs.extend(motifs)
+        model['detectors'][name] = entry
+    # Parent-side merge (overlaps, hybrids, clusters) and per-chunk fixed costs
+    repeat_long = sequences['repeat'][long_][2]
+    model['postprocess_s_per_bp'] = best_time(lambda motifs: scanner._postprocess(list(motifs), repeat_long), [raw_motifs] * 2) / long_
+    model['chunk_overhead_s'] = best_time(lambda seq: scanner.analyze_sequence(seq[:1_000], 'calibration', use_parallel_detectors=False), sequences['random'][short][:2])
+    model['calibration_s'] = round(time.time() - started, 2)
+    logger.info(f"Cost model calibrated for {len(detectors)} detectors in {model['calibration_s']:.1f}s")
+    return model
+
+
+class DetectorCostModel:
+    """
+    Per-detector cost coefficients interpolated over (GC fraction, repeat density).
+
+    Model dict layout::
+
+        anchors:   kind -> sequence_features() of the calibration sequence
+        detectors: name -> {'s_per_bp': {kind: float}, 'exponent': {kind: float},
+                            'bytes_per_bp': {kind: float}}
+        postprocess_s_per_bp, chunk_overhead_s, calibration_lengths
+
+    Seconds per bp at chunk length L scale as (L / calibration length) ** (exponent - 1).
+    """
+
+    def __init__(self, model: Dict[str, Any]):
+        self.model = model
+        self.reference_bp = model['calibration_lengths'][-1]
+        anchors = model['anchors']
+        self._gc_mid = anchors['random']['gc']
+        self._repeat_lo = anchors['random']['repeat']
+        self._repeat_hi = max(anchors['repeat']['repeat'], self._repeat_lo + 1e-3)
+
+    @property
+    def detectors(self) -> List[str]:
+        return list(self.model['detectors'])
+
+    def _weights(self, gc: float, repeat: float):
+        anchors = self.model['anchors']
+        gc_kind = 'gc_rich' if gc >= self._gc_mid else 'at_rich'
+        gc_span = abs(anchors[gc_kind]['gc'] - self._gc_mid) or 1.0
+        gc_w = min(2.0, abs(gc - self._gc_mid) / gc_span)
+        repeat_w = min(2.0, max(0.0, (repeat - self._repeat_lo) / (self._repeat_hi - self._repeat_lo)))
+        return gc_kind, gc_w, repeat_w
+
+    def _interpolate(self, table: Dict[str, float], gc: float, repeat: float) -> float:
+        gc_kind, gc_w, repeat_w = self._weights(gc, repeat)
+        base = table['random']
+        value = base + (table[gc_kind] - base) * gc_w + (table['repeat'] - base) * repeat_w
+        return max(value, 0.25 * base)
+
+    def seconds_per_bp(self, detector: str, chunk_bp: int, gc: float = 0.5, repeat: float = 0.0) -> float:
+        """Expected detector cost per bp on a chunk of ``chunk_bp`` with the given features."""
+        entry = self.model['detectors'][detector]
+        rate = self._interpolate(entry['s_per_bp'], gc, repeat)
+        exponent = self._interpolate(entry['exponent'], gc, repeat)
+        return rate * (max(chunk_bp, 1) / self.reference_bp) ** (exponent - 1.0)
+
+    def bytes_per_bp(self, detector: str, gc: float = 0.5, repeat: float = 0.0) -> float:
+        return self._interpolate(self.model['detectors'][detector]['bytes_per_bp'], gc, repeat)
+
+    @property
+    def postprocess_s_per_bp(self) -> float:
+        return self.model.get('postprocess_s_per_bp', 0.0)
+
+    @property
+    def chunk_overhead_s(self) -> float:
+        return self.model.get('chunk_overhead_s', 0.0)
+
+
+def get_cost_model(path: Optional[str] = None, recalibrate: bool = False) -> DetectorCostModel:
+    """
+    Process-wide cost model. It is loaded from ``path`` (default
+    COST_MODEL_PATH) when the file matches the current detector
+    fingerprint; otherwise it is calibrated and written back.
+    """
+    global _COST_MODEL
+    from Utilities.chunk_cache import detector_fingerprint
+
+    path = path or COST_MODEL_PATH
+    with _COST_MODEL_LOCK:
+        if _COST_MODEL is not None and not recalibrate:
+            return _COST_MODEL
+        model = None
+        if not recalibrate:
+            try:
+                with open(path) as fh:
+                    model = json.load(fh)
+                if model.get('version') != COST_MODEL_VERSION or model.get('fingerprint') != detector_fingerprint():
+                    logger.info("Cost model is stale (detectors changed); recalibrating")
+                    model = None
+            except (OSError, ValueError):
+                model = None
+        if model is None:
+            model = calibrate_cost_model()
+            try:
+                os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+                fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), suffix='.tmp')
+                with os.fdopen(fd, 'w') as fh:
+                    json.dump(model, fh, indent=1)
+                os.replace(tmp_path, path)
+            except OSError as e:
+                logger.warning(f"Could not cache cost model at {path} ({e}); keeping it in memory")
+        _COST_MODEL = DetectorCostModel(model)
+        return _COST_MODEL
+
 
 class AdaptiveChunkPlanner:
     """
@@ -114,3 +423,81 @@ class AdaptiveChunkPlanner:
             f"chunk_size={chunk_size:,}, workers={workers}, mode={mode}"
         )
         return plan
+
+    def plan_for_sequence(
+        self,
+        sequence,
+        enabled_classes: Optional[List[str]] = None,
+        ram_budget: Optional[int] = None,
+        cpu_count: Optional[int] = None,
+        cost_model: Optional[DetectorCostModel] = None,
+    ) -> Dict[str, Any]:
+        """
+        Cost-model plan for one sequence (see module docstring).
+
+        Args:
+            sequence:        str or FastaRecord (only sample windows are read)
+            enabled_classes: Motif classes to detect (None = all)
+            ram_budget:      Bytes (default: SystemResourceInspector().get_memory_budget())
+            cpu_count:       Max workers (default: detector pool size)
+            cost_model:      Default: get_cost_model()
+
+        Returns:
+            Dict with ``chunk_size``, ``overlap``, ``workers``, ``mode``
+            ("cost_model"), ``expected_wall_s``, ``expected_peak_bytes``, ``features``
+        """
+        from Utilities.detector_scheduler import DETECTOR_WORKERS
+        from Utilities.incremental_scan import DETECTOR_CONTEXT_BP
+        from Utilities.nonbscanner import CLASS_TO_DETECTOR
+        from Utilities.system_resource_inspector import SystemResourceInspector
+
+        model = cost_model or get_cost_model()
+        if ram_budget is None:
+            ram_budget = SystemResourceInspector().get_memory_budget()
+        cpu_count = max(1, min(cpu_count or DETECTOR_WORKERS, DETECTOR_WORKERS))
+        detectors = [CLASS_TO_DETECTOR[c] for c in enabled_classes if c in CLASS_TO_DETECTOR] if enabled_classes else list(CLASS_TO_DETECTOR.values())
+        detectors = [d for d in detectors if d in model.model['detectors']] or model.detectors
+        features = sequence_features(sequence)
+        genome_length = len(sequence)
+
+        reach = max((DETECTOR_CONTEXT_BP.get(d, self.OVERLAP) for d in detectors), default=self.OVERLAP)
+        overlap = self.OVERLAP if features['repeat'] >= REPEAT_DENSE else min(self.OVERLAP, int(math.ceil(2 * reach / 100.0)) * 100)
+
+        best = None
+        sizes = sorted({min(c, genome_length) for c in CHUNK_SIZE_LADDER if c > overlap})
+        for chunk_size in sizes:
+            n_chunks = 1 if chunk_size >= genome_length else math.ceil((genome_length - overlap) / (chunk_size - overlap))
+            scanned = n_chunks * chunk_size if n_chunks > 1 else genome_length
+            mean = {d: model.seconds_per_bp(d, chunk_size, features['gc'], features['repeat']) for d in detectors}
+            worst = {d: model.seconds_per_bp(d, chunk_size, features['gc'], features['repeat_max']) for d in detectors}
+            work = scanned * (sum(mean.values()) + model.postprocess_s_per_bp) + n_chunks * model.chunk_overhead_s
+            longest_task = max(worst.values()) * chunk_size
+            worker_bytes = chunk_size * (max(model.bytes_per_bp(d, features['gc'], features['repeat_max']) for d in detectors) + TEXT_BYTES_PER_BP)
+            for workers in range(1, min(cpu_count, n_chunks * len(detectors)) + 1):
+                if workers == 1:
+                    wall = work
+                    peak = worker_bytes
+                else:
+                    # List-scheduling bound: even share of the work plus one straggler task
+                    wall = (work + n_chunks * len(detectors) * TASK_OVERHEAD_S) / workers + (1 - 1 / workers) * longest_task
+                    peak = workers * (WORKER_BASE_BYTES + worker_bytes) + 2 * workers * chunk_size * TEXT_BYTES_PER_BP
+                if peak > ram_budget and not (best is None and workers == 1 and chunk_size == sizes[0]):
+                    continue
+                if best is None or wall < best['expected_wall_s'] * 0.98:
+                    best = {'chunk_size': chunk_size, 'workers': workers, 'expected_wall_s': wall, 'expected_peak_bytes': int(peak)}
+
+        plan: Dict[str, Any] = {
+            "chunk_size": best['chunk_size'],
+            "overlap": overlap,
+            "workers": best['workers'],
+            "mode": "cost_model",
+            "expected_wall_s": round(best['expected_wall_s'], 3),
+            "expected_peak_bytes": best['expected_peak_bytes'],
+            "features": {k: round(v, 4) if isinstance(v, float) else v for k, v in features.items()},
+        }
+        logger.info(
+            f"AdaptiveChunkPlanner (cost model): genome={genome_length:,} bp, GC={features['gc']:.2f}, "
+            f"repeat={features['repeat']:.3f} (max {features['repeat_max']:.3f}) → chunk_size={plan['chunk_size']:,}, "
+            f"overlap={overlap:,}, workers={plan['workers']}, expected {plan['expected_wall_s']:.1f}s"
+        )
+        return plan
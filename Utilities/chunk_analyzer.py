@@ -277,7 +277,7 @@ class ChunkAnalyzer:
             return adaptive_analyzer.analyze(seq_id, progress_callback, enabled_classes)
         
         # Original single-tier chunking logic
-        from Utilities.disk_storage import UniversalResultsStorage
+        from Utilities.disk_storage import create_results_storage
         from Utilities.nonbscanner import analyze_sequence
         
         # Get sequence metadata
@@ -288,7 +288,7 @@ class ChunkAnalyzer:
         logger.info(f"Starting chunk analysis for {seq_name} (length: {seq_length:,} bp)")
         
         # Initialize results storage
-        results_storage = UniversalResultsStorage(
+        results_storage = create_results_storage(
             base_dir=str(self.sequence_storage.base_dir / "results"),
             seq_id=seq_id
         )
@@ -0,0 +1,318 @@
+"""
+┌──────────────────────────────────────────────────────────────────────────────┐
+│ Chunk Result Cache - Content-Addressed, Resumable Chunk Scans                │
+├──────────────────────────────────────────────────────────────────────────────┤
+│ Author: Dr. Venkata Rajesh Yella | License: MIT | Version: 2024.1            │
+└──────────────────────────────────────────────────────────────────────────────┘
+
+DESCRIPTION:
+    On-disk cache of per-chunk detector output, keyed by content rather than
+    by position:
+
+        key = sha256(chunk bases) + enabled classes + scanner variant
+              + detector fingerprint (package version + detector sources)
+
+    Chunk scanners consult the cache before running the detectors and store
+    the result afterwards, so a crashed or refreshed genome run resumes at
+    the first uncached chunk, and identical sequence (assembly versions,
+    alt haplotypes, segmental duplications) is only scanned once.
+
+    Entries hold chunk-local coordinates with the sequence name factored out,
+    so a hit can be reused under any sequence name and at any offset.  They
+    are stored in the binary spill format of
+    :mod:`Utilities.disk_chunk_manager` (lossless).
+
+    Size is bounded by an LRU cap: hits refresh the entry's mtime and the
+    oldest entries are evicted once the directory exceeds ``max_bytes``.
+
+CONFIGURATION (environment):
+    NONBDNA_CHUNK_CACHE            'true' to enable (default: disabled)
+    NONBDNA_CHUNK_CACHE_DIR        Cache directory (default: ~/.cache/nonbdna/chunks)
+    NONBDNA_CHUNK_CACHE_MAX_MB     LRU size cap in MB (default: 2048)
+
+USAGE:
+    from Utilities.chunk_cache import get_chunk_cache
+
+    cache = get_chunk_cache()            # None when disabled
+    motifs = cache.get_or_compute(
+        chunk_seq, seq_name, enabled_classes,
+        lambda: scanner.analyze_sequence(chunk_seq, seq_name),
+    )
+"""
+
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from Utilities.disk_chunk_manager import decode_chunk_records, encode_chunk_records
+
+logger = logging.getLogger(__name__)
+
+CHUNK_CACHE_ENABLED = os.environ.get('NONBDNA_CHUNK_CACHE', 'false').lower() == 'true'
+CHUNK_CACHE_DIR = os.environ.get(
+    'NONBDNA_CHUNK_CACHE_DIR', os.path.join(os.path.expanduser('~'), '.cache', 'nonbdna', 'chunks')
+)
+CHUNK_CACHE_MAX_BYTES = int(float(os.environ.get('NONBDNA_CHUNK_CACHE_MAX_MB', '2048')) * 1024 * 1024)
+
+# Enforce the size cap after roughly this fraction of the cap has been written
+_EVICTION_CHECK_FRACTION = 0.05
+_ENTRY_SUFFIX = '.nbck'
+_NAME_TOKEN = '\x00'
+
+_PACKAGE_ROOT = Path(__file__).resolve().parent.parent
+# Sources whose edits change detector output and must invalidate the cache
+_FINGERPRINT_SOURCES = (
+    'Detectors',
+    'Utilities/config',
+    'Utilities/nonbscanner.py',
+    'Utilities/nonbscanner_optimized.py',
+    'Utilities/detectors_utils.py',
+)
+
+
+@lru_cache(maxsize=1)
+def detector_fingerprint() -> str:
+    """
+    Version tag for detector output: package version, optimized-scanner
+    toggle and a hash of the detector/parameter sources.
+    """
+    from Utilities.nonbscanner import __version__
+
+    digest = hashlib.sha256(__version__.encode('utf-8'))
+    digest.update(os.environ.get('NONBDNA_OPTIMIZED', 'true').lower().encode('utf-8'))
+    for source in _FINGERPRINT_SOURCES:
+        path = _PACKAGE_ROOT / source
+        files = sorted(path.rglob('*.py')) if path.is_dir() else [path]
+        for file in files:
+            if file.exists():
+                digest.update(str(file.relative_to(_PACKAGE_ROOT)).encode('utf-8'))
+                digest.update(file.read_bytes())
+    return digest.hexdigest()[:16]
+
+
+class ChunkResultCache:
+    """
+    Content-addressed on-disk cache of chunk scan results with an LRU cap.
+
+    Safe to share between processes: entries are written to a temporary
+    file and atomically renamed into place, and a vanished entry (evicted
+    by another process) is simply a miss.
+    """
+
+    def __init__(self, cache_dir: str = CHUNK_CACHE_DIR, max_bytes: int = CHUNK_CACHE_MAX_BYTES):
+        """
+        Args:
+            cache_dir: Directory holding cache entries (created if missing)
+            max_bytes: LRU size cap for the whole directory
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._bytes_since_check = 0
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # KEYS
+    # ------------------------------------------------------------------
+
+    def make_key(self, sequence: str, enabled_classes: Optional[List[str]] = None, variant: str = '') -> str:
+        """
+        Build the cache key for a chunk.
+
+        Args:
+            sequence: Chunk bases (case-insensitive)
+            enabled_classes: Motif classes scanned (None = all)
+            variant: Extra discriminator, e.g. the scanner class name
+        """
+        digest = hashlib.sha256(sequence.upper().encode('ascii', 'replace'))
+        classes = ','.join(sorted(enabled_classes)) if enabled_classes is not None else '*'
+        digest.update(f'|{classes}|{variant}|{detector_fingerprint()}'.encode('utf-8'))
+        return digest.hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f'{key}{_ENTRY_SUFFIX}'
+
+    # ------------------------------------------------------------------
+    # GET / PUT
+    # ------------------------------------------------------------------
+
+    def get(self, key: str, sequence_name: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        Look up a chunk; returns fresh motif dicts (chunk-local coordinates)
+        named for *sequence_name*, or None on a miss.
+        """
+        path = self._entry_path(key)
+        try:
+            buffer = path.read_bytes()
+            os.utime(path)
+            motifs = decode_chunk_records(buffer)
+        except (FileNotFoundError, ValueError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return [_restore_name(motif, sequence_name) for motif in motifs]
+
+    def put(self, key: str, sequence_name: str, motifs: List[Dict[str, Any]]) -> None:
+        """Store chunk-local *motifs* produced for *sequence_name* under *key*."""
+        path = self._entry_path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        blob = encode_chunk_records([_strip_name(motif, sequence_name) for motif in motifs])
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as fh:
+                fh.write(blob)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Chunk cache write failed ({e})")
+            Path(tmp_path).unlink(missing_ok=True)
+            return
+
+        with self._lock:
+            self._bytes_since_check += len(blob)
+            check = self._bytes_since_check >= self.max_bytes * _EVICTION_CHECK_FRACTION
+            if check:
+                self._bytes_since_check = 0
+        if check:
+            self.enforce_size_cap()
+
+    def get_or_compute(
+        self,
+        sequence: str,
+        sequence_name: str,
+        enabled_classes: Optional[List[str]],
+        compute: Callable[[], List[Dict[str, Any]]],
+        variant: str = '',
+    ) -> List[Dict[str, Any]]:
+        """
+        Return cached motifs for *sequence* or run *compute* and cache its result.
+
+        Args:
+            sequence: Chunk bases
+            sequence_name: Name the motifs are (or should be) labelled with
+            enabled_classes: Motif classes scanned (None = all)
+            compute: Zero-argument callable returning chunk-local motifs
+            variant: Extra key discriminator (e.g. scanner class name)
+
+        Returns:
+            Motif dicts in chunk-local coordinates; callers may mutate them.
+        """
+        key = self.make_key(sequence, enabled_classes, variant)
+        motifs = self.get(key, sequence_name)
+        if motifs is not None:
+            return motifs
+        motifs = compute()
+        self.put(key, sequence_name, motifs)
+        return motifs
+
+    # ------------------------------------------------------------------
+    # MAINTENANCE
+    # ------------------------------------------------------------------
+
+    def enforce_size_cap(self) -> int:
+        """Evict least-recently-used entries until under ``max_bytes``; returns bytes freed."""
+        entries = []
+        total = 0
+        for path in self.cache_dir.glob(f'*/*{_ENTRY_SUFFIX}'):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+        if total <= self.max_bytes:
+            return 0
+
+        freed = 0
+        for _, size, path in sorted(entries):
+            if total - freed <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            freed += size
+        logger.info(f"Chunk cache: evicted {freed / 1024 / 1024:.1f} MB (cap {self.max_bytes / 1024 / 1024:.0f} MB)")
+        return freed
+
+    def clear(self) -> None:
+        """Delete every cache entry."""
+        for path in self.cache_dir.glob(f'*/*{_ENTRY_SUFFIX}'):
+            path.unlink(missing_ok=True)
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters for this process."""
+        total = self.hits + self.misses
+        return {'hits': self.hits, 'misses': self.misses, 'hit_rate': self.hits / total if total else 0.0}
+
+
+def _strip_name(motif: Dict[str, Any], sequence_name: str) -> Dict[str, Any]:
+    """Factor the sequence name out of Sequence_Name / ID so entries are name-independent."""
+    motif = dict(motif)
+    if motif.get('Sequence_Name') == sequence_name:
+        motif['Sequence_Name'] = _NAME_TOKEN
+    motif_id = motif.get('ID')
+    if isinstance(motif_id, str) and motif_id.startswith(sequence_name + '_'):
+        motif['ID'] = _NAME_TOKEN + motif_id[len(sequence_name):]
+    return motif
+
+
+def _restore_name(motif: Dict[str, Any], sequence_name: str) -> Dict[str, Any]:
+    if motif.get('Sequence_Name') == _NAME_TOKEN:
+        motif['Sequence_Name'] = sequence_name
+    motif_id = motif.get('ID')
+    if isinstance(motif_id, str) and motif_id.startswith(_NAME_TOKEN):
+        motif['ID'] = sequence_name + motif_id[len(_NAME_TOKEN):]
+    return motif
+
+
+_CHUNK_CACHE: Optional[ChunkResultCache] = None
+_CHUNK_CACHE_LOCK = threading.Lock()
+
+
+def get_chunk_cache() -> Optional[ChunkResultCache]:
+    """
+    Process-wide cache instance configured from the environment, or None
+    when ``NONBDNA_CHUNK_CACHE`` is not enabled (or the directory is unusable).
+    """
+    global _CHUNK_CACHE
+    if not CHUNK_CACHE_ENABLED:
+        return None
+    if _CHUNK_CACHE is None:
+        with _CHUNK_CACHE_LOCK:
+            if _CHUNK_CACHE is None:
+                try:
+                    _CHUNK_CACHE = ChunkResultCache()
+                    logger.info(f"Chunk result cache enabled at {CHUNK_CACHE_DIR}")
+                except OSError as e:
+                    logger.warning(f"Chunk result cache disabled ({e})")
+                    return None
+    return _CHUNK_CACHE
+
+
+def scan_chunk_cached(
+    sequence: str,
+    sequence_name: str,
+    enabled_classes: Optional[List[str]],
+    compute: Callable[[], List[Dict[str, Any]]],
+    variant: str = '',
+) -> List[Dict[str, Any]]:
+    """Run *compute* through the process-wide chunk cache when it is enabled (results truncated by a RunBudget are not stored)."""
+    from Utilities.run_budget import current_budget
+    cache = get_chunk_cache()
+    if cache is None:
+        return compute()
+    budget = current_budget()
+    if budget is None:
+        return cache.get_or_compute(sequence, sequence_name, enabled_classes, compute, variant)
+    key = cache.make_key(sequence, enabled_classes, variant)
+    motifs = cache.get(key, sequence_name)
+    if motifs is None:
+        truncated = len(budget.truncated)
+        motifs = compute()
+        if len(budget.truncated) == truncated:
+            cache.put(key, sequence_name, motifs)
+    return motifs
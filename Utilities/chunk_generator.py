@@ -6,7 +6,9 @@
 └──────────────────────────────────────────────────────────────────────────────┘
 
 DESCRIPTION:
-    Yields overlapping genome segments from a raw sequence string.
+    Yields overlapping genome segments from a raw sequence string or a lazy
+    ``FastaRecord`` view (``IndexedFasta.sequence(name)``), in which case each
+    chunk is fetched from disk only when it is yielded.
 
     The overlap ensures that motifs spanning chunk boundaries are detected
     fully in at least one chunk.  The ``core_end`` field marks the position
@@ -22,6 +24,16 @@ DESCRIPTION:
         ...
         Last chunk: core_end = end (full chunk is authoritative)
 
+N-GAP AWARE PLANNING:
+    Assembly gaps and hard-masked runs (``N`` stretches of at least
+    ``N_GAP_MIN_LENGTH`` bp) are located once with a vectorized scan over the
+    encoded sequence.  Chunks are then tiled independently inside each
+    non-N island (same overlap/core_end rules, per island), islands shorter
+    than ``MIN_ISLAND_LENGTH`` are skipped, and all coordinates remain
+    chromosome-global, so downstream offset mapping is unchanged.  Gaps
+    shorter than ``N_GAP_MIN_LENGTH`` (the default chunk overlap) stay inside
+    chunks: motifs that long are not guaranteed by chunking anyway.
+
 USAGE::
 
     gen = ChunkGenerator(sequence="ACGT...", chunk_size=50_000, overlap=2_000)
@@ -33,10 +45,126 @@ USAGE::
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict, Generator
+from typing import TYPE_CHECKING, Any, Dict, Generator, List, Tuple, Union
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from Utilities.indexed_fasta import FastaRecord
 
 logger = logging.getLogger(__name__)
 
+# N runs at least this long split the sequence into separately tiled islands
+N_GAP_MIN_LENGTH = 2_000
+# Islands shorter than this cannot hold a motif and are skipped
+MIN_ISLAND_LENGTH = 10
+# Bases encoded per vectorized N-run scan block
+_N_SCAN_BLOCK = 16 * 1024 * 1024
+_N_BYTE = ord('N')
+
+
+def find_n_runs(
+    sequence: Union[str, bytes, "FastaRecord"],
+    min_length: int = N_GAP_MIN_LENGTH,
+) -> List[Tuple[int, int]]:
+    """
+    Locate runs of ``N``/``n`` of at least *min_length* bp.
+
+    The sequence is encoded in blocks and scanned with NumPy (mask, diff,
+    flatnonzero); runs crossing block boundaries are merged.
+
+    Args:
+        sequence:   DNA sequence (str, bytes or ``FastaRecord`` view).
+        min_length: Minimum run length to report.
+
+    Returns:
+        List of ``(start, end)`` runs, 0-based, end-exclusive.
+    """
+    runs: List[Tuple[int, int]] = []
+    length = len(sequence)
+    for block_start in range(0, length, _N_SCAN_BLOCK):
+        block = sequence[block_start:block_start + _N_SCAN_BLOCK]
+        if isinstance(block, str):
+            block = block.encode("ascii", "replace")
+        is_n = (np.frombuffer(block, dtype=np.uint8) & 0xDF) == _N_BYTE
+        if not is_n.any():
+            continue
+        edges = np.diff(is_n.astype(np.int8), prepend=0, append=0)
+        starts = np.flatnonzero(edges == 1) + block_start
+        ends = np.flatnonzero(edges == -1) + block_start
+        for start, end in zip(starts.tolist(), ends.tolist()):
+            if runs and runs[-1][1] == start:
+                runs[-1] = (runs[-1][0], end)
+            else:
+                runs.append((start, end))
+    return [(start, end) for start, end in runs if end - start >= min_length]
+
+
+def plan_islands(
+    length: int,
+    n_runs: List[Tuple[int, int]],
+    min_island: int = MIN_ISLAND_LENGTH,
+) -> List[Tuple[int, int]]:
+    """
+    Return the non-N islands between *n_runs*, dropping islands shorter
+    than *min_island*.
+    """
+    islands: List[Tuple[int, int]] = []
+    pos = 0
+    for gap_start, gap_end in n_runs + [(length, length)]:
+        if gap_start - pos >= min_island:
+            islands.append((pos, gap_start))
+        pos = gap_end
+    return islands
+
+
+def plan_chunks(
+    sequence: Union[str, bytes, "FastaRecord"],
+    chunk_size: int,
+    overlap: int,
+    skip_n_gaps: bool = True,
+    min_gap: int = N_GAP_MIN_LENGTH,
+    min_island: int = MIN_ISLAND_LENGTH,
+) -> List[Tuple[int, int, int]]:
+    """
+    Plan overlapping chunks, tiled per non-N island when *skip_n_gaps*.
+
+    Args:
+        sequence:    DNA sequence (str, bytes or ``FastaRecord`` view).
+        chunk_size:  Target chunk length in bp.
+        overlap:     Overlap between consecutive chunks in bp.
+        skip_n_gaps: Split at N runs of at least *min_gap* bp and skip them.
+        min_gap:     Minimum N-run length treated as a gap.
+        min_island:  Minimum island length worth scanning.
+
+    Returns:
+        List of ``(start, end, core_end)`` in chromosome coordinates.
+    """
+    length = len(sequence)
+    if skip_n_gaps:
+        n_runs = find_n_runs(sequence, min_gap)
+        islands = plan_islands(length, n_runs, min_island)
+        if n_runs:
+            skipped = length - sum(end - start for start, end in islands)
+            logger.info(
+                f"N-gap planning: {len(n_runs)} gap(s), {len(islands)} island(s), "
+                f"{skipped:,} of {length:,} bp skipped"
+            )
+    else:
+        islands = [(0, length)] if length else []
+
+    chunks: List[Tuple[int, int, int]] = []
+    for island_start, island_end in islands:
+        start = island_start
+        while start < island_end:
+            end = min(start + chunk_size, island_end)
+            is_last = end >= island_end
+            chunks.append((start, end, end if is_last else end - overlap))
+            if is_last:
+                break
+            start = end - overlap
+    return chunks
+
 
 class ChunkGenerator:
     """
@@ -44,7 +172,8 @@ class ChunkGenerator:
 
     Each yielded dict contains:
 
-    * ``sequence``  – str, the raw DNA subsequence for this chunk
+    * ``sequence``  – str, the raw DNA subsequence for this chunk (uppercase
+                     when read from a ``FastaRecord``)
     * ``start``     – int, genome-global start position (0-based, inclusive)
     * ``end``       – int, genome-global end position (exclusive)
     * ``core_end``  – int, the exclusive boundary of the authoritative region;
@@ -59,13 +188,24 @@ class ChunkGenerator:
             process(chunk["sequence"], chunk["start"], chunk["core_end"])
     """
 
-    def __init__(self, genome_sequence: str, chunk_size: int, overlap: int):
+    def __init__(
+        self,
+        genome_sequence: Union[str, "FastaRecord"],
+        chunk_size: int,
+        overlap: int,
+        skip_n_gaps: bool = True,
+        min_gap: int = N_GAP_MIN_LENGTH,
+    ):
         """
         Args:
-            genome_sequence: Full DNA sequence string (uppercase, no whitespace).
+            genome_sequence: Full DNA sequence string (uppercase, no whitespace),
+                             or a ``FastaRecord`` view for lazy, indexed access.
             chunk_size:      Target chunk length in bp.
             overlap:         Overlap between consecutive chunks in bp.
                              Must be < chunk_size.
+            skip_n_gaps:     Tile only the non-N islands between N runs of at
+                             least *min_gap* bp (see module docstring).
+            min_gap:         Minimum N-run length treated as a gap.
 
         Raises:
             ValueError: If overlap ≥ chunk_size.
@@ -77,6 +217,8 @@ class ChunkGenerator:
         self.seq = genome_sequence
         self.chunk_size = chunk_size
         self.overlap = overlap
+        self.skip_n_gaps = skip_n_gaps
+        self.min_gap = min_gap
 
     def generate(self) -> Generator[Dict[str, Any], None, None]:
         """
@@ -86,17 +228,13 @@ class ChunkGenerator:
             Dict with keys ``sequence``, ``start``, ``end``, ``core_end``.
         """
         genome_length = len(self.seq)
-        start = 0
         chunk_num = 0
 
-        while start < genome_length:
-            end = min(start + self.chunk_size, genome_length)
-            is_last = end >= genome_length
-
+        for start, end, core_end in plan_chunks(
+            self.seq, self.chunk_size, self.overlap, self.skip_n_gaps, self.min_gap
+        ):
             # core_end: motifs from [start, core_end) are authoritative.
-            # For the last chunk the entire chunk is authoritative.
-            core_end = end if is_last else end - self.overlap
-
+            # For the last chunk of an island the entire chunk is authoritative.
             chunk_num += 1
             logger.debug(
                 f"ChunkGenerator: chunk {chunk_num} "
@@ -110,12 +248,6 @@ class ChunkGenerator:
                 "core_end": core_end,
             }
 
-            if is_last:
-                break
-
-            # Advance by (chunk_size – overlap) so next chunk overlaps by `overlap` bp
-            start = end - self.overlap
-
         logger.info(
             f"ChunkGenerator: yielded {chunk_num} chunk(s) "
             f"for sequence length {genome_length:,}"
@@ -11,25 +11,23 @@ This module contains analysis parameters:
 
 IMPORTANT THRESHOLDS DISTINCTION
 --------------------------------
-TWO DIFFERENT thresholds control TWO DIFFERENT features:
+Detector parallelism and sequence chunking are controlled separately:
 
 1. DETECTOR PARALLELIZATION THRESHOLD (in nonbscanner.py):
    - CHUNK_THRESHOLD = 50,000 bp (50KB)
    - Triggers parallel detector execution for sequences > 50KB
-   - Runs 9 detectors in parallel using ThreadPoolExecutor
+   - Runs the 9 detectors as tasks on the shared detector process pool (Utilities.detector_scheduler)
    - Added in PR#5 for 1.5-2x speedup
 
-2. SEQUENCE CHUNKING THRESHOLD (in this config):
-   - chunk_threshold = 1,000,000 bp (1MB)  
-   - Triggers sequence splitting for sequences > 1MB
-   - Splits into 50KB chunks using ProcessPoolExecutor
-   - Updated to 1MB in PR#7 (was 50KB)
+2. SEQUENCE CHUNKING (Utilities.record_scheduler for multi-FASTA input):
+   - Records longer than the chunk size (default_chunk_size, 50KB) are split
+     into 50KB chunks with 2KB overlap
+   - Shorter records are batched together; there is no separate threshold
 
 PERFORMANCE BEHAVIOR
 --------------------
-- < 50KB: Sequential detectors, no chunking
-- 50KB - 1MB: Parallel detectors (1.5-2x), no chunking
-- > 1MB: Parallel detectors + chunking (4-12x speedup)
+- <= 50KB: No chunking; short records are batched together
+- > 50KB: 50KB chunks, each chunk's detectors run in parallel
 
 OTHER PARAMETERS
 ----------------
@@ -41,8 +39,7 @@ MAX_OVERLAP_DISPLAY = 10
 # ==================== ANALYSIS PARAMETERS ====================
 # Control sequence processing and analysis behavior
 ANALYSIS_CONFIG = {
-    # Sequence processing thresholds
-    'chunk_threshold': 1_000_000,     # Sequences > this size use chunking (bp) - Changed from 50KB to 1MB
+    # Sequence processing
     'default_chunk_size': 50_000,     # Default chunk size for large sequences (bp) - ALWAYS use 50Kbp chunks
     'default_chunk_overlap': 2_000,   # 2Kbp (2,000bp) overlap ensures motifs at boundaries are captured (balanced for performance/accuracy)
     
@@ -91,7 +88,7 @@ CHUNKING_CONFIG = {
     'detectors_per_chunk_parallel': True,    # Parallel per-chunk execution
     
     # Performance tuning
-    'enable_adaptive': False,         # Disable adaptive strategy selection - use simple chunking from 1MB
+    'enable_adaptive': False,         # Opt-in cost-model chunk size / overlap / workers when chunk_size is not given (NONBDNA_ADAPTIVE_CHUNKS=true); results then depend on the machine's calibration
     'max_workers': None,              # None = auto-detect CPU count
 }
 
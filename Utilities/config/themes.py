@@ -15,4 +15,4 @@ COLOR_THEMES = {
     'clinical_teal': {'primary': VISUALIZATION_COLORS['primary'], 'secondary': VISUALIZATION_COLORS['secondary'], 'accent': VISUALIZATION_COLORS['accent'], 'bg_light': VISUALIZATION_COLORS['lighter'], 'bg_card': VISUALIZATION_COLORS['light'], 'bg_medium': VISUALIZATION_COLORS['medium'], 'text': VISUALIZATION_COLORS['text'], 'tab_bg': GLOBAL_COLORS['neutral_100'], 'tab_active': VISUALIZATION_COLORS['primary'], 'shadow': 'rgba(22, 101, 52, 0.35)', 'border': VISUALIZATION_COLORS['border']},
     'midnight': {'primary': DOCUMENTATION_COLORS['primary'], 'secondary': DOCUMENTATION_COLORS['secondary'], 'accent': DOCUMENTATION_COLORS['accent'], 'bg_light': DOCUMENTATION_COLORS['lighter'], 'bg_card': DOCUMENTATION_COLORS['light'], 'bg_medium': DOCUMENTATION_COLORS['medium'], 'text': DOCUMENTATION_COLORS['text'], 'tab_bg': GLOBAL_COLORS['neutral_100'], 'tab_active': DOCUMENTATION_COLORS['primary'], 'shadow': 'rgba(14, 165, 233, 0.35)', 'border': DOCUMENTATION_COLORS['border']},
 }
-TAB_THEMES = {'Home': 'red_home', 'Upload & Analyze': 'purple_upload', 'Results': 'green_results', 'Download': 'mustard_download', 'Documentation': 'orchid_docs'}
+TAB_THEMES = {'Home': 'red_home', 'Upload & Analyze': 'purple_upload', 'Jobs': 'purple_upload', 'Results': 'green_results', 'Download': 'mustard_download', 'Documentation': 'orchid_docs'}
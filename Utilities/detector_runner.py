@@ -10,8 +10,8 @@ DESCRIPTION:
 
     DetectorRunner
         Runs all Non-B DNA motif detectors on a single sequence chunk.
-        Writes results to a CSV file on disk and returns only lightweight
-        metadata (file path, chunk bounds, motif count).
+        Appends results to a binary spill file on disk and returns only
+        lightweight metadata (file path, offset, chunk bounds, motif count).
         Workers never return large objects across process boundaries.
 
     ParallelChunkExecutor
@@ -37,13 +37,13 @@ USAGE::
     gen = ChunkGenerator(sequence, chunk_size=50_000, overlap=2_000)
     for result_meta in executor.execute(gen.generate()):
         # result_meta: {"file", "chunk_start", "core_end", "chunk_index", ...}
-        motifs = read_chunk_csv(result_meta["file"])
+        motifs = read_chunk_records(result_meta["file"], result_meta["offset"],
+                                    result_meta["nbytes"])
         ...
 """
 
 from __future__ import annotations
 
-import csv
 import gc
 import logging
 import os
@@ -57,8 +57,6 @@ logger = logging.getLogger(__name__)
 # Hard ceiling on worker count to protect Streamlit Community Cloud
 MAX_WORKERS: int = min(2, os.cpu_count() or 1)
 
-# Fieldnames for per-chunk CSV files
-_CSV_FIELDS = ["Class", "Subclass", "Start", "End", "Length", "Score", "ID", "Strand"]
 
 
 # ──────────────────────────────────────────────────────────────────────────────
@@ -86,9 +84,12 @@ def _worker_run_chunk(args: tuple) -> Dict[str, Any]:
                 "chunk_end"   : int,
                 "core_end"    : int,
                 "file"        : str,
+                "offset"      : int,
+                "nbytes"      : int,
                 "motif_count" : int,
             }
     """
+    from Utilities.disk_chunk_manager import SPILL_FILE_NAME, spill_chunk_records
     from Utilities.nonbscanner import analyze_sequence
 
     (
@@ -124,12 +125,8 @@ def _worker_run_chunk(args: tuple) -> Dict[str, Any]:
         adjusted.append(m)
 
     # Write to disk; return only metadata (no large objects across process boundary)
-    file_path = Path(tmp_dir) / f"chunk_{chunk_index:04d}.csv"
-    with open(file_path, "w", newline="") as fh:
-        writer = csv.DictWriter(fh, fieldnames=_CSV_FIELDS, extrasaction="ignore")
-        writer.writeheader()
-        for m in adjusted:
-            writer.writerow(m)
+    file_path = Path(tmp_dir) / SPILL_FILE_NAME
+    offset, nbytes = spill_chunk_records(str(file_path), adjusted)
 
     return {
         "chunk_index": chunk_index,
@@ -137,6 +134,8 @@ def _worker_run_chunk(args: tuple) -> Dict[str, Any]:
         "chunk_end": chunk_end,
         "core_end": core_end,
         "file": str(file_path),
+        "offset": offset,
+        "nbytes": nbytes,
         "motif_count": len(adjusted),
     }
 
@@ -149,7 +148,7 @@ class DetectorRunner:
     """
     Run all Non-B DNA motif detectors on a single sequence chunk.
 
-    Writes chunk results to a CSV file on disk and returns lightweight
+    Appends chunk results to a binary spill file and returns lightweight
     metadata.  Designed to be called from within a worker process so that
     no large objects need to cross the process boundary.
 
@@ -157,7 +156,7 @@ class DetectorRunner:
 
         runner = DetectorRunner(tmp_dir="/tmp/nbdna_run")
         meta   = runner.run(chunk_data, chunk_index=0)
-        # meta["file"] → path to CSV; meta["core_end"] → dedup boundary
+        # meta["file"], meta["offset"], meta["nbytes"] → spill record; meta["core_end"] → dedup boundary
     """
 
     def __init__(
@@ -168,7 +167,7 @@ class DetectorRunner:
     ):
         """
         Args:
-            tmp_dir:         Directory for temporary CSV files.
+            tmp_dir:         Directory for the chunk spill file.
                              Created automatically if ``None``.
             enabled_classes: Motif classes to analyse (``None`` = all).
             seq_name:        Base name used in motif IDs.
@@ -206,7 +205,9 @@ class DetectorRunner:
                     "chunk_start" : int,
                     "chunk_end"   : int,
                     "core_end"    : int,
-                    "file"        : str,   # path to CSV file
+                    "file"        : str,   # path to spill file
+                    "offset"      : int,
+                    "nbytes"      : int,
                     "motif_count" : int,
                 }
         """
@@ -248,7 +249,7 @@ class ParallelChunkExecutor:
         executor = ParallelChunkExecutor(detector_runner=runner, workers=2)
 
         for result_meta in executor.execute(chunk_generator.generate()):
-            # result_meta["file"] – path to per-chunk CSV
+            # result_meta["file"] / ["offset"] / ["nbytes"] – spill record
             # result_meta["core_end"] – dedup boundary
             ...
     """
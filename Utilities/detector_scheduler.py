@@ -0,0 +1,526 @@
+"""
+┌──────────────────────────────────────────────────────────────────────────────┐
+│ Detector Scheduler - (Chunk, Detector) Tasks on One Long-Lived Process Pool  │
+├──────────────────────────────────────────────────────────────────────────────┤
+│ Author: Dr. Venkata Rajesh Yella | License: MIT | Version: 2024.1            │
+└──────────────────────────────────────────────────────────────────────────────┘
+
+DESCRIPTION:
+    The unit of work is one detector on one chunk, not a whole chunk:
+
+    1. Chunks are pulled lazily from the caller's iterator, upper-cased,
+       validated, looked up in the chunk cache (NONBDNA_CHUNK_CACHE) and
+       prefiltered (Utilities.prefilter). Each remaining detector becomes a
+       task. Heavy detectors (HEAVY_DETECTORS: slipped_dna, cruciform,
+       triplex) are queued first within each chunk, so the slowest tasks
+       start early and the last chunk does not leave a long tail.
+    2. Tasks run on a single process pool that is created once per process
+       and reused by every scan. Workers build their detectors once
+       (nonbscanner._get_cached_scanner) and receive only the chunk text.
+       At most ``max_workers`` tasks are in flight, so the pool queue stays
+       in priority order and nothing is oversubscribed.
+    3. As soon as every detector of a chunk has returned, the chunk is merged
+       in the parent: overlap removal, hybrids and clusters, exactly as in
+       NonBScanner.analyze_sequence. It is then cached and yielded. Chunks are
+       yielded in input order (or as they finish, with ordered=False), and
+       only a bounded window of chunks is held in memory.
+    4. scan_tasks() also accepts batches: many short sequences (contigs,
+       scaffolds) that share one task per detector. One pickled payload and
+       one queue round trip then cover the whole batch. Each member is still
+       cleaned, cached, prefiltered and merged on its own.
+
+    Detectors therefore use every core even for one long chromosome, and
+    regex/Python-loop detectors run in separate processes instead of
+    contending for the GIL in threads.
+
+    Under a RunBudget (Utilities.run_budget), every chunk gets a deadline
+    when its first detector is submitted. Detectors run under that deadline
+    and stop at their next checkpoint() once it passes. A pool task that
+    overruns it by ABANDON_GRACE_S is abandoned, and the pool is restarted
+    after the scan. Once the job-wide wall time or RSS limit trips, no
+    further chunks are pulled. Cancelled detectors are recorded as truncated,
+    and their chunk is merged from the detectors that did finish (and is not
+    cached).
+
+    Detectors run inline (sequentially, in this process) when only one worker
+    is available, when the caller is itself a pool worker (no nested pools),
+    or when the scanner carries custom detector instances that workers could
+    not rebuild. A broken pool also falls back to inline execution, and the
+    remaining tasks still complete.
+
+CONFIGURATION (environment):
+    NONBDNA_DETECTOR_WORKERS   Pool size (default: os.cpu_count())
+
+USAGE:
+    from Utilities.detector_scheduler import DetectorScheduler
+
+    scheduler = DetectorScheduler()
+    chunks = ((start, sequence[start:end]) for start, end in offsets)
+    for chunk_start, motifs in scheduler.scan_chunks(chunks, "chr1"):
+        ...   # chunk-local coordinates, same result as analyze_sequence(chunk)
+"""
+
+import atexit
+import logging
+import multiprocessing
+import os
+import threading
+import time
+import warnings
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Hashable, Iterable, Iterator, List, Optional, Tuple
+
+from Utilities import stage_profiler
+from Utilities.chunk_cache import get_chunk_cache
+from Utilities.run_budget import ABANDON_GRACE_S, CANCELLED, DetectorCancelled, RunBudget, current_budget, deadline_scope
+
+logger = logging.getLogger(__name__)
+
+DETECTOR_WORKERS = int(os.environ.get('NONBDNA_DETECTOR_WORKERS', 0)) or (os.cpu_count() or 1)
+HEAVY_DETECTORS = ('slipped_dna', 'cruciform', 'triplex')   # slowest on repetitive DNA; queued first
+CHUNKS_PER_WORKER = 2        # chunks held in memory per in-flight task slot
+BUDGET_POLL_S = 1.0          # wait() timeout while a wall-time / RSS limit is in force
+
+_POOL: Optional[ProcessPoolExecutor] = None
+_POOL_LOCK = threading.Lock()
+
+
+# =============================================================================
+# SHARED POOL
+# =============================================================================
+
+def in_worker_process() -> bool:
+    """True inside any multiprocessing child (pool workers never start pools of their own)."""
+    return multiprocessing.parent_process() is not None
+
+
+def get_detector_pool() -> ProcessPoolExecutor:
+    """The process-wide detector pool (DETECTOR_WORKERS processes), created on first use."""
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is None:
+            _POOL = ProcessPoolExecutor(max_workers=DETECTOR_WORKERS)
+            logger.info(f"Detector pool started with {DETECTOR_WORKERS} workers")
+        return _POOL
+
+
+def shutdown_detector_pool(wait_for_tasks: bool = True, terminate: bool = False) -> None:
+    """Stop the shared pool; the next scan starts a fresh one. ``terminate`` also kills workers stuck in a task."""
+    global _POOL
+    with _POOL_LOCK:
+        pool, _POOL = _POOL, None
+    if pool is not None:
+        # shutdown() never interrupts a running task, so abandoned ones are killed first
+        processes = list((getattr(pool, '_processes', None) or {}).values()) if terminate else []
+        for process in processes:
+            process.terminate()
+        pool.shutdown(wait=wait_for_tasks and not terminate, cancel_futures=True)
+
+
+atexit.register(shutdown_detector_pool, False)
+
+
+def order_detectors(names: Iterable[str]) -> List[str]:
+    """Detector names with HEAVY_DETECTORS first (in that order), the rest in their given order."""
+    names = list(names)
+    return [n for n in HEAVY_DETECTORS if n in names] + [n for n in names if n not in HEAVY_DETECTORS]
+
+
+def _sync_profiling(profile_dir: Optional[str]) -> None:
+    # Pool workers outlive enable_profiling()/disable_profiling() calls in the parent
+    if profile_dir and not stage_profiler.is_enabled():
+        stage_profiler.enable_profiling(profile_dir)
+    elif not profile_dir and stage_profiler.is_enabled():
+        stage_profiler.disable_profiling()
+
+
+def _detector_task(chunk_seq: str, detector_name: str, sequence_name: str, chunk_label: Optional[str], profile_dir: Optional[str], deadline: Optional[float] = None) -> Tuple[List[Dict[str, Any]], float, Optional[str]]:
+    """
+    Pool task: run one detector on one (upper-case, validated) chunk.
+
+    Returns:
+        (motifs in chunk-local coordinates, elapsed seconds, CANCELLED if the deadline stopped the detector, else error message or None)
+    """
+    from Utilities.nonbscanner import _get_cached_scanner
+    _sync_profiling(profile_dir)
+    result = _run_detector(_get_cached_scanner().detectors[detector_name], chunk_seq, detector_name, sequence_name, chunk_label, deadline)
+    if profile_dir:
+        stage_profiler.flush()
+    return result
+
+
+def _run_detector(detector: Any, chunk_seq: str, detector_name: str, sequence_name: str, chunk_label: Optional[str], deadline: Optional[float] = None) -> Tuple[List[Dict[str, Any]], float, Optional[str]]:
+    start = time.time()
+    try:
+        with deadline_scope(deadline), stage_profiler.stage('detector', detector=detector_name, chunk=chunk_label, bp=len(chunk_seq)) as event:
+            motifs = detector.detect_motifs(chunk_seq, sequence_name)
+            event['candidates_out'] = len(motifs)
+    except DetectorCancelled:
+        return [], time.time() - start, CANCELLED
+    except Exception as e:
+        return [], time.time() - start, str(e)
+    return motifs, time.time() - start, None
+
+
+# =============================================================================
+# SCHEDULER
+# =============================================================================
+
+def _detector_batch_task(members: Tuple[Tuple[str, str], ...], detector_name: str, chunk_label: Optional[str], profile_dir: Optional[str], deadline: Optional[float] = None) -> Tuple[List[List[Dict[str, Any]]], float, Optional[str]]:
+    """
+    Pool task: run one detector on a batch of (sequence name, upper-case sequence) members.
+
+    Returns:
+        (motifs per member, elapsed seconds, CANCELLED if the deadline cut the batch short, else first error message or None)
+    """
+    from Utilities.nonbscanner import _get_cached_scanner
+    _sync_profiling(profile_dir)
+    result = _run_detector_batch(_get_cached_scanner().detectors[detector_name], members, detector_name, chunk_label, deadline)
+    if profile_dir:
+        stage_profiler.flush()
+    return result
+
+
+def _run_detector_batch(detector: Any, members: Iterable[Tuple[str, str]], detector_name: str, chunk_label: Optional[str], deadline: Optional[float] = None) -> Tuple[List[List[Dict[str, Any]]], float, Optional[str]]:
+    start = time.time()
+    results = []
+    first_error = None
+    cancelled = False
+    for name, sequence in members:
+        motifs, _, error = _run_detector(detector, sequence, detector_name, name, chunk_label, deadline)
+        results.append(motifs)
+        cancelled = cancelled or error == CANCELLED
+        first_error = first_error or (error and error != CANCELLED and f"{name}: {error}")
+    return results, time.time() - start, CANCELLED if cancelled else first_error
+
+
+class _ChunkState:
+    """
+    One scheduling unit: a chunk, or a batch of short sequences (``members``
+    is then a list of [name, sequence, detector names, result] and
+    ``parts[detector]`` holds one motif list per member that needs it).
+    """
+    __slots__ = ('key', 'sequence', 'label', 'names', 'parts', 'result', 'started', 'sequence_name', 'members', 'deadline', 'truncated')
+
+    def __init__(self, key: Hashable, sequence: str, label: Optional[str], names: List[str], sequence_name: str = '', members: Optional[List[list]] = None):
+        self.key = key
+        self.sequence = sequence
+        self.label = label
+        self.names = names
+        self.parts: Dict[str, Any] = {}
+        self.result: Optional[List[Any]] = None
+        self.started = time.time()
+        self.sequence_name = sequence_name
+        self.members = members
+        self.deadline: Optional[float] = None      # set (under a budget) when the first detector is submitted
+        self.truncated: List[str] = []             # detectors cancelled by the budget
+
+    @property
+    def raw(self) -> List[Dict[str, Any]]:
+        # Detector order, not completion order, so merging is deterministic
+        return [m for name in self.names for m in self.parts.get(name, ())]
+
+    def batch_members(self, detector_name: str) -> List[int]:
+        """Indexes of the batch members that ``detector_name`` must scan."""
+        return [i for i, member in enumerate(self.members) if member[3] is None and detector_name in member[2]]
+
+    def member_raw(self, index: int) -> List[Dict[str, Any]]:
+        return [m for name in self.names for m in self.parts.get(name, {}).get(index, ())]
+
+
+class DetectorScheduler:
+    """
+    Runs (chunk, detector) tasks on the shared detector pool and merges each
+    chunk as soon as its last detector returns.
+
+    Args:
+        scanner: NonBScanner whose detectors, prefilter and post-processing
+                 are used (default: nonbscanner._get_cached_scanner())
+        max_workers: Cap on in-flight tasks (default and maximum: DETECTOR_WORKERS)
+        budget: RunBudget enforced on the scan (default: the enclosing
+                run_budget.budget_scope, if any)
+    """
+
+    def __init__(self, scanner: Any = None, max_workers: Optional[int] = None, budget: Optional[RunBudget] = None):
+        from Detectors.registry import LazyDetectorMap
+        from Utilities.nonbscanner import _get_cached_scanner
+        self.scanner = scanner if scanner is not None else _get_cached_scanner()
+        self.max_workers = max(1, min(max_workers or DETECTOR_WORKERS, DETECTOR_WORKERS))
+        # Workers rebuild detectors from the registry, so custom instances must run here
+        self.parallel = self.max_workers > 1 and not in_worker_process() and isinstance(self.scanner.detectors, LazyDetectorMap)
+        self.budget = budget if budget is not None else current_budget()
+        self.truncated_keys: set = set()           # keys of chunks/batches merged with a detector missing
+
+    # ------------------------------------------------------------------
+    # PUBLIC
+    # ------------------------------------------------------------------
+
+    def scan_chunks(self, chunks: Iterable[Tuple[Hashable, str]], sequence_name: str, enabled_classes: Optional[List[str]] = None) -> Iterator[Tuple[Hashable, List[Dict[str, Any]]]]:
+        """
+        Scan chunks with (chunk, detector) parallelism.
+
+        Args:
+            chunks: Iterable of (key, chunk sequence); consumed lazily. The key
+                    labels profiler events as '<sequence_name>:<key>'
+                    (use the chunk start).
+            sequence_name: Name recorded on every motif
+            enabled_classes: Motif classes to detect (None = all)
+
+        Yields:
+            (key, motifs) in input order. Motifs are in chunk-local coordinates
+            and equal scanner.analyze_sequence(chunk) for that chunk.
+        """
+        tasks = ((key, [(sequence_name, chunk_seq)]) for key, chunk_seq in chunks)
+        for key, results in self.scan_tasks(tasks, enabled_classes, ordered=True):
+            yield key, results[0]
+
+    def scan_tasks(self, tasks: Iterable[Tuple[Hashable, List[Tuple[str, str]]]], enabled_classes: Optional[List[str]] = None, ordered: bool = False,
+                   on_invalid: Optional[Callable[[Hashable, int, ValueError], None]] = None) -> Iterator[Tuple[Hashable, List[List[Dict[str, Any]]]]]:
+        """
+        Scan tasks that are either one chunk or a batch of short sequences.
+
+        Args:
+            tasks: Iterable of (key, [(sequence name, sequence), ...]); consumed lazily.
+                   A single member is scheduled as (chunk, detector) tasks. Several
+                   members share one task per detector (batch).
+            enabled_classes: Motif classes to detect (None = all)
+            ordered: Yield in input order (True) or as tasks finish (False)
+            on_invalid: Called as (key, member index, error) for a member that fails
+                        validation; that member yields no motifs. Without it the
+                        ValueError propagates.
+
+        Yields:
+            (key, motifs per member), each list equal to scanner.analyze_sequence(member)
+        """
+        cache = get_chunk_cache()
+        variant = type(self.scanner).__name__
+        detectors_to_run = self.scanner._select_detectors(enabled_classes)
+
+        def prepare_member(key: Hashable, index: int, name: str, chunk_seq: str, label: str) -> list:
+            # [name, sequence, detector names, ready result or None]
+            try:
+                return prepare_valid(name, chunk_seq, label)
+            except ValueError as e:
+                if on_invalid is None:
+                    raise
+                on_invalid(key, index, e)
+                return [name, chunk_seq, [], []]
+
+        def prepare_valid(name: str, chunk_seq: str, label: str) -> list:
+            cached = cache.get(cache.make_key(chunk_seq, enabled_classes, variant), name) if cache is not None else None
+            if cached is not None:
+                return [name, chunk_seq, [], cached]
+            sequence = self.scanner._clean_sequence(chunk_seq, name)
+            if sequence is None:
+                return [name, chunk_seq, [], []]
+            with stage_profiler.chunk_scope(label):
+                skipped = self.scanner._prefilter_skipped(sequence, detectors_to_run)
+            names = [n for n in detectors_to_run if n not in skipped]
+            return [name, sequence, names, None if names else []]
+
+        def prepare():
+            for key, members in tasks:
+                if len(members) == 1:
+                    name, chunk_seq = members[0]
+                    label = f"{name}:{key}"
+                    name, sequence, names, result = prepare_member(key, 0, name, chunk_seq, label)
+                    state = _ChunkState(key, sequence, label, names, name)
+                    if result is not None:
+                        state.result = [result]
+                else:
+                    label = f"{members[0][0]}+{len(members) - 1}:{key}"
+                    prepared = [prepare_member(key, i, name, chunk_seq, f"{name}:0") for i, (name, chunk_seq) in enumerate(members)]
+                    union = {n for member in prepared for n in member[2]}
+                    state = _ChunkState(key, '', label, [n for n in detectors_to_run if n in union], members[0][0], prepared)
+                    if not union:
+                        state.result = [member[3] for member in prepared]
+                yield state
+
+        def merge_one(name: str, sequence: str, raw: List[Dict[str, Any]], label: str, started: float, complete: bool = True) -> List[Dict[str, Any]]:
+            with stage_profiler.chunk_scope(label):
+                motifs = self.scanner._postprocess(raw, sequence)
+            if cache is not None and complete:
+                cache.put(cache.make_key(sequence, enabled_classes, variant), name, motifs)
+            if stage_profiler.is_enabled():
+                # Chunk latency (load to merge); detector CPU is in the workers' 'detector' events
+                stage_profiler.record_event({'stage': 'chunk', 'detector': None, 'chunk': label, 'bp': len(sequence), 'candidates_in': len(raw),
+                                             'candidates_out': len(motifs), 'pid': os.getpid(), 'wall_s': time.time() - started, 'cpu_s': 0.0})
+            return motifs
+
+        def merge(state: _ChunkState) -> List[List[Dict[str, Any]]]:
+            complete = not state.truncated
+            if state.members is None:
+                return [merge_one(state.sequence_name, state.sequence, state.raw, state.label, state.started, complete)]
+            return [member[3] if member[3] is not None else merge_one(member[0], member[1], state.member_raw(i), f"{member[0]}:0", state.started, complete)
+                    for i, member in enumerate(state.members)]
+
+        for key, results in self._schedule(prepare(), merge, ordered=ordered):
+            yield key, results
+        if stage_profiler.is_enabled():
+            stage_profiler.flush()
+
+    def run_detectors(self, sequence: str, sequence_name: str, detector_names: Iterable[str], on_detector: Optional[Callable[[str, float, int, Optional[str]], None]] = None) -> List[Dict[str, Any]]:
+        """
+        Raw (unmerged) motifs of ``detector_names`` on one upper-case, validated sequence.
+
+        Args:
+            on_detector: Called in this process as (detector_name, elapsed, motif_count, error) after each detector
+        """
+        state = _ChunkState(0, sequence, stage_profiler.current_chunk(), list(detector_names), sequence_name)
+        if not state.names:
+            return []
+        for _, raw in self._schedule(iter([state]), lambda state: state.raw, on_detector=on_detector):
+            return raw
+        return []
+
+    # ------------------------------------------------------------------
+    # CORE LOOP
+    # ------------------------------------------------------------------
+
+    def _submit(self, state: _ChunkState, detector_name: str) -> Future:
+        if self.budget is not None and state.deadline is None:
+            state.deadline = self.budget.task_deadline()
+        if self.parallel:
+            try:
+                profile_dir = stage_profiler.PROFILE_DIR if stage_profiler.is_enabled() else None
+                if state.members is not None:
+                    members = tuple((state.members[i][0], state.members[i][1]) for i in state.batch_members(detector_name))
+                    return get_detector_pool().submit(_detector_batch_task, members, detector_name, state.label, profile_dir, state.deadline)
+                return get_detector_pool().submit(_detector_task, state.sequence, detector_name, state.sequence_name, state.label, profile_dir, state.deadline)
+            except (RuntimeError, OSError, BrokenProcessPool) as e:
+                self._fall_back(e)
+        future: Future = Future()
+        future.set_result(self._run_inline(state, detector_name))
+        return future
+
+    def _run_inline(self, state: _ChunkState, detector_name: str) -> tuple:
+        detector = self.scanner.detectors[detector_name]
+        if state.members is not None:
+            members = [(state.members[i][0], state.members[i][1]) for i in state.batch_members(detector_name)]
+            return _run_detector_batch(detector, members, detector_name, state.label, state.deadline)
+        return _run_detector(detector, state.sequence, detector_name, state.sequence_name, state.label, state.deadline)
+
+    def _truncate(self, state: _ChunkState, detector_name: str, reason: Optional[str] = None) -> None:
+        # The detector contributes nothing to this chunk; the budget report says so
+        state.truncated.append(detector_name)
+        self.truncated_keys.add(state.key)
+        state.parts[detector_name] = {} if state.members is not None else []
+        if self.budget is not None:
+            self.budget.record_truncated(state.label or state.sequence_name, detector_name, reason)
+
+    def _fall_back(self, error: BaseException) -> None:
+        if self.parallel:
+            logger.warning(f"Detector pool failed ({error}), running detectors inline")
+            self.parallel = False
+            shutdown_detector_pool(wait_for_tasks=False)
+
+    def _schedule(self, jobs: Iterator[_ChunkState], merge: Callable[[_ChunkState], Any], on_detector: Optional[Callable] = None, ordered: bool = True) -> Iterator[Tuple[Hashable, Any]]:
+        """
+        jobs yields _ChunkState objects (``result`` already set for cache hits / empty chunks).
+        Yields (key, merged result) in job order, or in completion order when not ``ordered``.
+        Under a budget, no job is pulled after it trips; chunks already pulled are merged from
+        the detectors that ran (the rest are truncated), and overdue pool tasks are abandoned.
+        """
+        window = self.max_workers * CHUNKS_PER_WORKER if self.parallel else 1
+        states: deque = deque()                     # unfinished (or, if ordered, unyielded) chunks, oldest first
+        ready: deque = deque()                      # (state, detector) not yet submitted
+        pending: Dict[Future, Tuple[_ChunkState, str]] = {}
+        exhausted = False
+        orphaned = False
+        budget = self.budget
+
+        def finish(state: _ChunkState, name: str, elapsed: float, motif_count: int, error: Optional[str]) -> None:
+            if on_detector is not None:
+                on_detector(name, elapsed, motif_count, error)
+            if len(state.parts) == len(state.names):
+                state.result = merge(state)
+
+        def abandon(future: Future, reason: Optional[str] = None) -> bool:
+            # A task that never reached a checkpoint; its worker keeps running until the pool is restarted
+            state, name = pending.pop(future)
+            self._truncate(state, name, reason)
+            finish(state, name, 0.0, 0, CANCELLED)
+            return not future.cancel()
+
+        try:
+            while True:
+                stop = budget.check() if budget is not None else None
+                if stop is not None:
+                    exhausted = True
+                    while ready:
+                        state, name = ready.popleft()
+                        self._truncate(state, name, stop)
+                        finish(state, name, 0.0, 0, CANCELLED)
+                    if stop == 'rss':               # memory must come down now, not at the next checkpoint
+                        for future in list(pending):
+                            orphaned = abandon(future, stop) or orphaned
+                while not exhausted and len(states) < window and len(ready) < self.max_workers:
+                    state = next(jobs, None)
+                    if state is None:
+                        exhausted = True
+                        break
+                    if state.result is None and not state.names:
+                        state.result = merge(state)
+                    elif state.result is None:
+                        ready.extend((state, name) for name in order_detectors(state.names))
+                    states.append(state)
+                while ready and len(pending) < self.max_workers:
+                    state, name = ready.popleft()
+                    pending[self._submit(state, name)] = (state, name)
+                if ordered:
+                    while states and states[0].result is not None:
+                        state = states.popleft()
+                        yield state.key, state.result
+                elif any(state.result is not None for state in states):
+                    finished = [state for state in states if state.result is not None]
+                    states = deque(state for state in states if state.result is None)
+                    for state in finished:
+                        yield state.key, state.result
+                if not pending:
+                    if exhausted and not states and not ready:
+                        return
+                    continue
+                done, _ = wait(pending, timeout=self._watchdog_timeout(pending), return_when=FIRST_COMPLETED)
+                for future in done:
+                    state, name = pending.pop(future)
+                    try:
+                        motifs, elapsed, error = future.result()
+                    except (BrokenProcessPool, OSError, RuntimeError) as e:
+                        self._fall_back(e)
+                        motifs, elapsed, error = self._run_inline(state, name)
+                    if error == CANCELLED:
+                        self._truncate(state, name)
+                        finish(state, name, elapsed, 0, error)
+                        continue
+                    if error is not None:
+                        warnings.warn(f"Error in {name} detector: {error}")
+                    if state.members is not None:
+                        motifs = dict(zip(state.batch_members(name), motifs))
+                    state.parts[name] = motifs
+                    finish(state, name, elapsed, len(motifs), error)
+                now = time.time()
+                for future, (state, name) in list(pending.items()):
+                    if state.deadline is not None and now > state.deadline + ABANDON_GRACE_S:
+                        orphaned = abandon(future) or orphaned
+        finally:
+            # A consumer that stops early (or an exception in a callback) must not leave this
+            # scan's queued tasks on the shared pool, where they would hold workers for the next scan
+            for future in pending:
+                future.cancel()
+            pending.clear()
+            ready.clear()
+            if orphaned:
+                logger.warning("Abandoned detector tasks that ignored their deadline; restarting the detector pool")
+                shutdown_detector_pool(wait_for_tasks=False, terminate=True)
+
+    def _watchdog_timeout(self, pending: Dict[Future, Tuple[_ChunkState, str]]) -> Optional[float]:
+        # Wake up for the earliest abandon time, and periodically to re-check job-wide limits
+        if self.budget is None:
+            return None
+        deadlines = [state.deadline for state, _ in pending.values() if state.deadline is not None]
+        timeout = max(0.0, min(deadlines) + ABANDON_GRACE_S - time.time()) if deadlines else None
+        if self.budget.max_wall_s or self.budget.max_rss_mb:
+            timeout = BUDGET_POLL_S if timeout is None else min(timeout, BUDGET_POLL_S)
+        return timeout
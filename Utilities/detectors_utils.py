@@ -1,6 +1,8 @@
 """Shared utility functions for Non-B DNA motif detectors."""
 # IMPORTS
-from typing import List, Dict, Any, Callable, Optional
+from typing import List, Dict, Any, Callable, Optional, Union
+
+import numpy as np
 
 # TUNABLE PARAMETERS
 DEFAULT_UNKNOWN_SUBCLASS = 'unknown'
@@ -21,6 +23,11 @@ def _count_bases(seq: str) -> tuple:
     return a_count, t_count, g_count, c_count
 
 
+def byte_composition(seq: Union[bytes, bytearray, memoryview]) -> np.ndarray:
+    """Return a 256-bin histogram of byte values from a single np.bincount pass."""
+    return np.bincount(np.frombuffer(seq, dtype=np.uint8), minlength=256)
+
+
 def calc_gc_content(seq: str) -> float:
     """Return GC content as percentage (0-100), excluding ambiguous bases."""
     if not seq:
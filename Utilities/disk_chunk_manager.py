@@ -10,50 +10,229 @@ DESCRIPTION:
 
     Instead of returning full motif tables from parallel workers, workers:
       1. Process a sequence chunk
-      2. Write results to a temporary CSV file
-      3. Return only lightweight metadata (file path, motif count)
+      2. Append results as one binary record to a shared spill file
+      3. Return only lightweight metadata (offset, size, motif count)
 
     The main process then:
-      - Streams chunk files via an iterator
+      - Streams chunk records via an iterator (one seek + read per chunk)
       - Aggregates only summary statistics
-      - Deletes each chunk file after it has been merged
+      - Deletes the spill file once all chunks have been merged
 
     This keeps RAM bounded regardless of genome size.
 
+SPILL FORMAT:
+    A single append-only file ``chunks.bin``; each chunk is one record:
+        header   magic b'NBCK', version, motif count, section sizes
+        strings  JSON string table (Class, Subclass, Strand, ID, ...)
+        columns  fixed-width NumPy structured array (coordinates, score,
+                 string-table codes, presence bits)
+        extras   JSON list with every other motif field (None if absent)
+    The offset index (chunk_index -> offset, nbytes) lives in the in-memory
+    chunk registry of the manager that owns the spill file.  Records round
+    trip losslessly: fields that do not fit their typed column are kept in
+    the extras section.
+
 TEMPORARY FILE STRUCTURE:
     /tmp/nonbdna_<session>/
-        chunk_000.csv
-        chunk_001.csv
-        ...
+        chunks.bin
 
 MEMORY GUARANTEES:
     - Workers never accumulate large DataFrames in memory
-    - Each chunk CSV is deleted immediately after aggregation
+    - Only one chunk record is decoded at a time
     - Peak RAM usage scales with chunk_size, not total genome size
 """
 
-import csv
-import gc
 import json
 import logging
 import os
 import shutil
+import struct
 import tempfile
 from pathlib import Path
 from typing import Any, Dict, Iterator, List, Optional, Tuple
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
-# Fieldnames written to each chunk CSV
-_CSV_FIELDS = ["Class", "Subclass", "Start", "End", "Length", "Score", "ID", "Strand"]
+SPILL_FILE_NAME = "chunks.bin"
+
+# Record header: magic, version, motif count, strings/columns/extras sizes
+_SPILL_MAGIC = b"NBCK"
+_SPILL_VERSION = 1
+_SPILL_HEADER = struct.Struct("<4sHIIQQ")
+
+# Typed columns; anything else (or a value of the wrong type) goes to extras
+_INT_FIELDS = ("Start", "End", "Length")
+_FLOAT_FIELDS = ("Score",)
+_STR_FIELDS = ("Class", "Subclass", "Strand", "Method", "Sequence_Name", "ID", "Sequence")
+_COLUMN_FIELDS = _INT_FIELDS + _FLOAT_FIELDS + _STR_FIELDS
+_SPILL_DTYPE = np.dtype(
+    [(f, "<i8") for f in _INT_FIELDS]
+    + [(f, "<f8") for f in _FLOAT_FIELDS]
+    + [(f, "<u4") for f in _STR_FIELDS]
+    + [("_present", "<u2")]
+)
+_PRESENT_BIT = {field: 1 << i for i, field in enumerate(_COLUMN_FIELDS)}
+
+
+def _column_value(field: str, value: Any) -> Tuple[bool, Any]:
+    """Return (fits, normalised value) for storing *value* in typed column *field*."""
+    if field in _INT_FIELDS:
+        if isinstance(value, (int, np.integer)) and not isinstance(value, (bool, np.bool_)):
+            return -(2 ** 63) <= value < 2 ** 63, int(value)
+        return False, value
+    if field in _FLOAT_FIELDS:
+        if isinstance(value, (float, np.floating)):
+            return True, float(value)
+        return False, value
+    return isinstance(value, str), value
+
+
+def encode_chunk_records(motifs: List[Dict[str, Any]]) -> bytes:
+    """
+    Encode motifs as one binary spill record.
+
+    Args:
+        motifs: Motif dicts (any fields).
+
+    Returns:
+        Bytes ready to be appended to a spill file.
+    """
+    records = np.zeros(len(motifs), dtype=_SPILL_DTYPE)
+    columns: Dict[str, List[Any]] = {f: [0] * len(motifs) for f in _COLUMN_FIELDS}
+    present = [0] * len(motifs)
+    strings: Dict[str, int] = {}
+    extras: List[Optional[Dict[str, Any]]] = []
+    has_extras = False
+
+    for i, motif in enumerate(motifs):
+        extra = None
+        bits = 0
+        for key, value in motif.items():
+            if key in _PRESENT_BIT:
+                fits, value = _column_value(key, value)
+                if fits:
+                    if key in _STR_FIELDS:
+                        value = strings.setdefault(value, len(strings))
+                    columns[key][i] = value
+                    bits |= _PRESENT_BIT[key]
+                    continue
+            if extra is None:
+                extra = {}
+            extra[key] = value
+        present[i] = bits
+        extras.append(extra)
+        has_extras = has_extras or extra is not None
+
+    for field in _COLUMN_FIELDS:
+        records[field] = columns[field]
+    records["_present"] = present
+
+    strings_blob = json.dumps(list(strings)).encode("utf-8")
+    columns_blob = records.tobytes()
+    extras_blob = json.dumps(extras, default=str).encode("utf-8") if has_extras else b""
+    header = _SPILL_HEADER.pack(
+        _SPILL_MAGIC, _SPILL_VERSION, len(motifs),
+        len(strings_blob), len(columns_blob), len(extras_blob),
+    )
+    return b"".join((header, strings_blob, columns_blob, extras_blob))
+
+
+def decode_chunk_records(buffer: bytes) -> List[Dict[str, Any]]:
+    """
+    Decode a binary spill record produced by :func:`encode_chunk_records`.
+
+    Args:
+        buffer: Record bytes.
+
+    Returns:
+        List of motif dicts equal to the encoded ones.
+    """
+    view = memoryview(buffer)
+    magic, version, count, n_strings, n_columns, n_extras = _SPILL_HEADER.unpack_from(view, 0)
+    if magic != _SPILL_MAGIC or version != _SPILL_VERSION:
+        raise ValueError(f"Not a NonBDNA chunk spill record (magic={magic!r}, version={version})")
+
+    pos = _SPILL_HEADER.size
+    strings = json.loads(bytes(view[pos:pos + n_strings]).decode("utf-8"))
+    pos += n_strings
+    records = np.frombuffer(view[pos:pos + n_columns], dtype=_SPILL_DTYPE, count=count)
+    pos += n_columns
+    extras = json.loads(bytes(view[pos:pos + n_extras]).decode("utf-8")) if n_extras else [None] * count
+
+    columns = [(field, _PRESENT_BIT[field], records[field].tolist(), field in _STR_FIELDS)
+               for field in _COLUMN_FIELDS]
+    present = records["_present"].tolist()
+
+    motifs: List[Dict[str, Any]] = []
+    for i in range(count):
+        bits = present[i]
+        motif = {}
+        for field, bit, values, is_str in columns:
+            if bits & bit:
+                motif[field] = strings[values[i]] if is_str else values[i]
+        if extras[i]:
+            motif.update(extras[i])
+        motifs.append(motif)
+    return motifs
+
+
+def spill_chunk_records(spill_path: str, motifs: List[Dict[str, Any]]) -> Tuple[int, int]:
+    """
+    Append one chunk record to a spill file.
+
+    The file is opened with ``O_APPEND`` and the record is written with a
+    single ``write`` call, so several worker processes can share one spill
+    file; each gets back the offset of its own record.
+
+    Args:
+        spill_path: Path of the append-only spill file.
+        motifs:     Motif dicts for the chunk.
+
+    Returns:
+        ``(offset, nbytes)`` locating the record in the spill file.
+    """
+    blob = encode_chunk_records(motifs)
+    fd = os.open(spill_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_BINARY", 0), 0o644)
+    try:
+        written = 0
+        view = memoryview(blob)
+        while written < len(blob):
+            written += os.write(fd, view[written:])
+        end = os.lseek(fd, 0, os.SEEK_CUR)
+    finally:
+        os.close(fd)
+    return end - len(blob), len(blob)
+
+
+def read_chunk_records(spill_path: str, offset: int, nbytes: int) -> List[Dict[str, Any]]:
+    """
+    Read and decode one chunk record from a spill file.
+
+    Args:
+        spill_path: Path of the spill file.
+        offset:     Record offset returned by :func:`spill_chunk_records`.
+        nbytes:     Record size returned by :func:`spill_chunk_records`.
+
+    Returns:
+        List of motif dicts.
+    """
+    with open(spill_path, "rb") as fh:
+        fh.seek(offset)
+        buffer = fh.read(nbytes)
+    if len(buffer) != nbytes:
+        raise ValueError(f"Truncated chunk record at offset {offset} in {spill_path}")
+    return decode_chunk_records(buffer)
 
 
 class DiskChunkManager:
     """
     Disk-backed chunk manager for memory-bounded genome analysis.
 
-    Workers write results to per-chunk CSV files; the manager streams
-    and aggregates those files without loading the full dataset into RAM.
+    Chunk results are appended as binary records to a single spill file;
+    the manager streams and aggregates them by offset without loading the
+    full dataset into RAM.
 
     Usage::
 
@@ -78,7 +257,8 @@ class DiskChunkManager:
         self.base_dir = Path(
             tempfile.mkdtemp(prefix="nonbdna_chunks_", dir=base_dir)
         )
-        # Map chunk_index -> metadata dict
+        self.spill_path = self.base_dir / SPILL_FILE_NAME
+        # Offset index: chunk_index -> metadata dict
         self._chunk_registry: Dict[int, Dict[str, Any]] = {}
         logger.info(f"DiskChunkManager initialised at {self.base_dir}")
 
@@ -90,7 +270,7 @@ class DiskChunkManager:
         self, chunk_index: int, motifs: List[Dict[str, Any]]
     ) -> Dict[str, Any]:
         """
-        Write motif results for one chunk to a CSV file.
+        Append motif results for one chunk to the spill file.
 
         Args:
             chunk_index: Zero-based index of the chunk.
@@ -102,30 +282,39 @@ class DiskChunkManager:
                 {
                     "chunk_index": int,
                     "file_path":   str,
+                    "offset":      int,
+                    "nbytes":      int,
                     "motif_count": int,
                 }
         """
-        file_path = self.base_dir / f"chunk_{chunk_index:04d}.csv"
-
-        with open(file_path, "w", newline="") as fh:
-            writer = csv.DictWriter(
-                fh, fieldnames=_CSV_FIELDS, extrasaction="ignore"
-            )
-            writer.writeheader()
-            for motif in motifs:
-                writer.writerow(motif)
-
+        offset, nbytes = spill_chunk_records(str(self.spill_path), motifs)
         meta = {
             "chunk_index": chunk_index,
-            "file_path": str(file_path),
+            "file_path": str(self.spill_path),
+            "offset": offset,
+            "nbytes": nbytes,
             "motif_count": len(motifs),
         }
-        self._chunk_registry[chunk_index] = meta
+        self.register_chunk(meta)
         logger.debug(
-            f"Chunk {chunk_index}: wrote {len(motifs)} motifs to {file_path}"
+            f"Chunk {chunk_index}: spilled {len(motifs)} motifs "
+            f"({nbytes:,} bytes at offset {offset:,})"
         )
         return meta
 
+    def register_chunk(self, meta: Dict[str, Any]) -> None:
+        """
+        Add a chunk record written elsewhere (e.g. by a worker process
+        calling :func:`spill_chunk_records` on :attr:`spill_path`) to the
+        offset index.
+
+        Args:
+            meta: Metadata dict with ``chunk_index``, ``offset``, ``nbytes``
+                  and ``motif_count``.
+        """
+        meta.setdefault("file_path", str(self.spill_path))
+        self._chunk_registry[meta["chunk_index"]] = meta
+
     # ------------------------------------------------------------------
     # READING / STREAMING
     # ------------------------------------------------------------------
@@ -136,50 +325,35 @@ class DiskChunkManager:
         """
         Iterate over chunk results in index order, streaming from disk.
 
-        Each chunk file is read, yielded, and (optionally) deleted to keep
-        disk usage bounded.
+        Each chunk record is read with a single seek + read and decoded;
+        only one chunk is held in memory at a time.
 
         Args:
-            delete_after_read: Remove the CSV file after yielding its rows.
+            delete_after_read: Remove the spill file once every chunk has
+                               been yielded.
 
         Yields:
             Tuple of (motifs, metadata) for each recorded chunk.
         """
-        for chunk_index in sorted(self._chunk_registry.keys()):
-            meta = self._chunk_registry[chunk_index]
-            file_path = Path(meta["file_path"])
-
-            if not file_path.exists():
-                logger.warning(
-                    f"Chunk {chunk_index} file missing: {file_path}"
-                )
-                continue
-
-            motifs: List[Dict[str, Any]] = []
-            with open(file_path, newline="") as fh:
-                reader = csv.DictReader(fh)
-                for row in reader:
-                    # Convert numeric fields back from strings
-                    for int_field in ("Start", "End", "Length"):
-                        if row.get(int_field):
-                            try:
-                                row[int_field] = int(row[int_field])
-                            except ValueError:
-                                pass
-                    if row.get("Score"):
-                        try:
-                            row["Score"] = float(row["Score"])
-                        except ValueError:
-                            pass
-                    motifs.append(dict(row))
-
-            yield motifs, meta
-
-            if delete_after_read:
-                file_path.unlink(missing_ok=True)
-                logger.debug(f"Chunk {chunk_index}: deleted {file_path}")
-
-            gc.collect()
+        if not self._chunk_registry:
+            return
+        if not self.spill_path.exists():
+            logger.warning(f"Chunk spill file missing: {self.spill_path}")
+            return
+
+        with open(self.spill_path, "rb") as fh:
+            for chunk_index in sorted(self._chunk_registry.keys()):
+                meta = self._chunk_registry[chunk_index]
+                fh.seek(meta["offset"])
+                buffer = fh.read(meta["nbytes"])
+                if len(buffer) != meta["nbytes"]:
+                    logger.warning(f"Chunk {chunk_index} record truncated in {self.spill_path}")
+                    continue
+                yield decode_chunk_records(buffer), meta
+
+        if delete_after_read:
+            self.spill_path.unlink(missing_ok=True)
+            logger.debug(f"DiskChunkManager: deleted {self.spill_path}")
 
     def get_chunk_metadata(self) -> List[Dict[str, Any]]:
         """
@@ -202,7 +376,7 @@ class DiskChunkManager:
     # ------------------------------------------------------------------
 
     def cleanup(self):
-        """Remove the entire temporary directory and all chunk files."""
+        """Remove the entire temporary directory and the spill file."""
         if self.base_dir.exists():
             shutil.rmtree(self.base_dir, ignore_errors=True)
             logger.info(f"DiskChunkManager: cleaned up {self.base_dir}")
@@ -13,6 +13,9 @@ DESCRIPTION:
 ARCHITECTURE:
     - UniversalSequenceStorage: Saves sequences to disk, provides chunk-based iteration
     - UniversalResultsStorage: Streams results to disk in JSONL format, supports pagination
+    - ParquetResultsStorage: Columnar (Parquet) results backend with Start-sorted
+      row groups, statistics-pruned region queries and metadata-only counts
+    - create_results_storage(): Picks the backend (NONBDNA_RESULTS_BACKEND env var)
     
 MEMORY GUARANTEES:
     - Sequence storage: Never loads full sequence into memory
@@ -27,7 +30,10 @@ import json
 import tempfile
 import shutil
 import logging
-from typing import Dict, Any, List, Optional, Iterator, Tuple
+import heapq
+import numbers
+from itertools import islice
+from typing import Dict, Any, List, Optional, Iterable, Iterator, Tuple
 from pathlib import Path
 import hashlib
 from datetime import datetime
@@ -35,6 +41,18 @@ from Utilities.detectors_utils import calc_gc_content, _count_bases
 
 logger = logging.getLogger(__name__)
 
+# Optional columnar backend
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# Results backend used by create_results_storage(): 'jsonl' (default) or 'parquet'
+DEFAULT_RESULTS_BACKEND = os.environ.get('NONBDNA_RESULTS_BACKEND', 'jsonl').lower()
+
 
 class UniversalSequenceStorage:
     """
@@ -493,6 +511,48 @@ class UniversalResultsStorage:
         
         return stats
     
+    def query(
+        self,
+        start: Optional[int] = None,
+        end: Optional[int] = None,
+        classes: Optional[Iterable[str]] = None,
+        min_score: Optional[float] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over motifs overlapping ``[start, end]`` (1-based, inclusive).
+        
+        Args:
+            start: Region start (None = unbounded)
+            end: Region end (None = unbounded)
+            classes: Only return motifs of these classes (None = all)
+            min_score: Only return motifs with Score >= min_score (None = all)
+            
+        Yields:
+            Matching motif dictionaries (full scan of the JSONL file)
+        """
+        class_set = set(classes) if classes is not None else None
+        for motif in self.iter_results():
+            if _motif_matches(motif, start, end, class_set, min_score):
+                yield motif
+    
+    def count_by_class(self) -> Dict[str, int]:
+        """Return motif counts per class."""
+        return dict(self.get_summary_stats()['class_distribution'])
+    
+    def get_page(self, page: int, page_size: int = 100) -> List[Dict[str, Any]]:
+        """
+        Return one page of results (0-based page index).
+        
+        Args:
+            page: Page index (0 = first page)
+            page_size: Number of motifs per page
+            
+        Returns:
+            List of up to ``page_size`` motif dictionaries
+        """
+        offset = max(0, page) * page_size
+        return list(islice(self.iter_results(), offset, offset + page_size))
+    
     def to_dataframe(self, limit: Optional[int] = None):
         """
         Convert results to pandas DataFrame.
@@ -519,3 +579,428 @@ class UniversalResultsStorage:
         if self.stats_file.exists():
             self.stats_file.unlink()
         logger.info(f"Deleted results for {self.seq_id}")
+
+
+def _motif_matches(
+    motif: Dict[str, Any],
+    start: Optional[int],
+    end: Optional[int],
+    classes: Optional[set],
+    min_score: Optional[float]
+) -> bool:
+    """Row-level predicate shared by the results backends' ``query`` methods."""
+    if start is not None and motif.get('End', 0) < start:
+        return False
+    if end is not None and motif.get('Start', 0) > end:
+        return False
+    if classes is not None and motif.get('Class') not in classes:
+        return False
+    if min_score is not None and motif.get('Score', 0.0) < min_score:
+        return False
+    return True
+
+
+# Typed columns of the Parquet backend; any other motif field goes to the
+# JSON-encoded 'Extra' column so the round trip is lossless.
+_PARQUET_INT_FIELDS = ('Start', 'End', 'Length')
+_PARQUET_FLOAT_FIELDS = ('Score',)
+_PARQUET_STR_FIELDS = ('Sequence_Name', 'Class', 'Subclass', 'Strand', 'ID', 'Method', 'Sequence')
+_PARQUET_DICT_FIELDS = ['Sequence_Name', 'Class', 'Subclass', 'Strand', 'Method']
+_PARQUET_STATS_KEY = b'nonbdna_stats'
+
+
+class ParquetResultsStorage:
+    """
+    Columnar results storage backed by Parquet part files.
+    
+    Drop-in alternative to :class:`UniversalResultsStorage` for multi-million
+    motif jobs.  Appended motifs are buffered and written as part files whose
+    row groups are sorted by ``Start``; categorical columns (Class, Subclass,
+    Strand, ...) are dictionary-encoded.  Each part is sorted only within
+    itself: ``iter_results()`` merges the parts into one Start-ordered stream,
+    while ``query()`` and ``get_page()`` return rows part by part (globally
+    ordered only when motifs were appended in Start order).  Each part file carries its summary
+    statistics (counts per class/subclass, coverage, score range) in the
+    footer key-value metadata, so counts never touch row data.
+    
+    Features:
+        - Region queries pruned by row-group Start/End/Score/Class statistics
+        - ``count_by_class()`` and ``get_summary_stats()`` from metadata only
+        - Page reads that open only the row groups covering the page
+        - Lossless round trip (non-core fields kept in a JSON 'Extra' column)
+        
+    Usage:
+        results = ParquetResultsStorage("results_dir", "seq1")
+        results.append_batch(motifs)
+        
+        for motif in results.query(start=1_000_000, end=2_000_000,
+                                   classes=['G-Quadruplex'], min_score=2.0):
+            print(motif['Start'], motif['Score'])
+        
+        page = results.get_page(3, page_size=100)
+        counts = results.count_by_class()
+    """
+    
+    def __init__(self, base_dir: str, seq_id: str, row_group_size: int = 50_000):
+        """
+        Initialize Parquet results storage for a sequence.
+        
+        Args:
+            base_dir: Base directory for results storage
+            seq_id: Sequence identifier
+            row_group_size: Motifs buffered per flush / rows per row group
+        """
+        if not PYARROW_AVAILABLE:
+            raise ImportError("pyarrow is required for ParquetResultsStorage. Install with: pip install pyarrow")
+        
+        self.base_dir = Path(base_dir)
+        self.base_dir.mkdir(parents=True, exist_ok=True)
+        
+        self.seq_id = seq_id
+        self.row_group_size = row_group_size
+        self.results_dir = self.base_dir / f"{seq_id}_results.parquet"
+        self.results_dir.mkdir(parents=True, exist_ok=True)
+        
+        self._buffer: List[Dict[str, Any]] = []
+        self._parts: List[Path] = sorted(self.results_dir.glob("part-*.parquet"))
+        self._part_stats: Dict[str, Dict[str, Any]] = {}
+        self._motif_count = sum(self._read_part_stats(p)['total_count'] for p in self._parts)
+        
+        logger.info(f"ParquetResultsStorage initialized for {seq_id} ({self._motif_count:,} motifs on disk)")
+    
+    # ------------------------------------------------------------------
+    # WRITING
+    # ------------------------------------------------------------------
+    
+    def append(self, motif: Dict[str, Any]):
+        """Append a single motif (buffered until ``row_group_size`` motifs)."""
+        self._buffer.append(motif)
+        self._motif_count += 1
+        if len(self._buffer) >= self.row_group_size:
+            self.flush()
+    
+    def append_batch(self, motifs: List[Dict[str, Any]]):
+        """Append multiple motifs (buffered until ``row_group_size`` motifs)."""
+        self._buffer.extend(motifs)
+        self._motif_count += len(motifs)
+        if len(self._buffer) >= self.row_group_size:
+            self.flush()
+    
+    def flush(self):
+        """Write buffered motifs to a new Start-sorted part file."""
+        if not self._buffer:
+            return
+        motifs = sorted(self._buffer, key=_start_sort_key)
+        self._buffer = []
+        
+        columns: Dict[str, List[Any]] = {f: [] for f in _PARQUET_INT_FIELDS + _PARQUET_FLOAT_FIELDS + _PARQUET_STR_FIELDS}
+        columns['Extra'] = []
+        for motif in motifs:
+            extra = {}
+            for key, value in motif.items():
+                if key in columns and key != 'Extra' and _column_value(key, value) is not None:
+                    continue
+                extra[key] = value
+            for field in _PARQUET_INT_FIELDS + _PARQUET_FLOAT_FIELDS + _PARQUET_STR_FIELDS:
+                columns[field].append(_column_value(field, motif.get(field)))
+            columns['Extra'].append(json.dumps(extra, default=str) if extra else None)
+        
+        table = pa.Table.from_pydict(columns, schema=_parquet_schema())
+        stats = _part_summary(motifs)
+        table = table.replace_schema_metadata({_PARQUET_STATS_KEY: json.dumps(stats).encode('utf-8')})
+        
+        part_path = self.results_dir / f"part-{len(self._parts):05d}.parquet"
+        pq.write_table(table, part_path, row_group_size=self.row_group_size,
+                       use_dictionary=_PARQUET_DICT_FIELDS, compression='zstd')
+        self._parts.append(part_path)
+        self._part_stats[str(part_path)] = stats
+        logger.debug(f"ParquetResultsStorage: wrote {len(motifs)} motifs to {part_path}")
+    
+    def close(self):
+        """Flush any buffered motifs (alias kept for writer-style call sites)."""
+        self.flush()
+    
+    # ------------------------------------------------------------------
+    # READING
+    # ------------------------------------------------------------------
+    
+    def iter_results(self, limit: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over results in Start order.
+        
+        Part files are each Start-sorted, so they are k-way merged while
+        streaming (one row group per part in memory).
+        
+        Args:
+            limit: Maximum number of results to return (None = all)
+            
+        Yields:
+            Motif dictionaries
+        """
+        self.flush()
+        results = heapq.merge(*(_iter_part_motifs(part) for part in self._parts), key=_start_sort_key)
+        yield from (islice(results, limit) if limit is not None else results)
+    
+    def query(
+        self,
+        start: Optional[int] = None,
+        end: Optional[int] = None,
+        classes: Optional[Iterable[str]] = None,
+        min_score: Optional[float] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over motifs overlapping ``[start, end]`` (1-based, inclusive).
+        
+        Row groups whose Start/End/Score/Class statistics rule out any match
+        are skipped without being read; surviving row groups are filtered
+        with vectorized Arrow kernels.
+        
+        Args:
+            start: Region start (None = unbounded)
+            end: Region end (None = unbounded)
+            classes: Only return motifs of these classes (None = all)
+            min_score: Only return motifs with Score >= min_score (None = all)
+            
+        Yields:
+            Matching motif dictionaries
+        """
+        self.flush()
+        class_list = sorted(set(classes)) if classes is not None else None
+        for part in self._parts:
+            pf = pq.ParquetFile(part)
+            names = pf.schema_arrow.names
+            for rg_idx in range(pf.metadata.num_row_groups):
+                rg = pf.metadata.row_group(rg_idx)
+                if not _row_group_may_match(rg, names, start, end, class_list, min_score):
+                    continue
+                table = pf.read_row_group(rg_idx)
+                mask = None
+                if start is not None:
+                    mask = _and_mask(mask, pc.greater_equal(table['End'], start))
+                if end is not None:
+                    mask = _and_mask(mask, pc.less_equal(table['Start'], end))
+                if class_list is not None:
+                    mask = _and_mask(mask, pc.is_in(table['Class'], value_set=pa.array(class_list, pa.string())))
+                if min_score is not None:
+                    mask = _and_mask(mask, pc.greater_equal(table['Score'], min_score))
+                if mask is not None:
+                    table = table.filter(mask)
+                yield from _table_to_motifs(table)
+    
+    def get_page(self, page: int, page_size: int = 100) -> List[Dict[str, Any]]:
+        """
+        Return one page of results (0-based page index).
+        
+        Row-group row counts from the footers locate the page, so only the
+        row groups overlapping it are read.
+        """
+        self.flush()
+        offset = max(0, page) * page_size
+        remaining = page_size
+        page_motifs: List[Dict[str, Any]] = []
+        for part in self._parts:
+            pf = pq.ParquetFile(part)
+            for rg_idx in range(pf.metadata.num_row_groups):
+                num_rows = pf.metadata.row_group(rg_idx).num_rows
+                if offset >= num_rows:
+                    offset -= num_rows
+                    continue
+                table = pf.read_row_group(rg_idx).slice(offset, remaining)
+                offset = 0
+                page_motifs.extend(_table_to_motifs(table))
+                remaining = page_size - len(page_motifs)
+                if remaining <= 0:
+                    return page_motifs
+        return page_motifs
+    
+    def count_by_class(self) -> Dict[str, int]:
+        """Return motif counts per class from part metadata (no row reads)."""
+        return dict(self.get_summary_stats()['class_distribution'])
+    
+    def get_summary_stats(self) -> Dict[str, Any]:
+        """
+        Get summary statistics aggregated from part-file metadata.
+        
+        Returns:
+            Same keys as :meth:`UniversalResultsStorage.get_summary_stats`.
+        """
+        self.flush()
+        stats = {'total_count': 0, 'class_distribution': {}, 'subclass_distribution': {},
+                 'coverage_bp': 0, 'positions': []}
+        score_sum = 0.0
+        min_score, max_score = float('inf'), float('-inf')
+        for part in self._parts:
+            part_stats = self._read_part_stats(part)
+            stats['total_count'] += part_stats['total_count']
+            stats['coverage_bp'] += part_stats['coverage_bp']
+            for key in ('class_distribution', 'subclass_distribution'):
+                for name, count in part_stats[key].items():
+                    stats[key][name] = stats[key].get(name, 0) + count
+            score_sum += part_stats['score_sum']
+            min_score = min(min_score, part_stats['min_score'])
+            max_score = max(max_score, part_stats['max_score'])
+        
+        if stats['total_count'] > 0:
+            stats['avg_score'] = score_sum / stats['total_count']
+            stats['score_range'] = (min_score, max_score)
+        else:
+            stats['avg_score'] = 0.0
+            stats['score_range'] = (0.0, 0.0)
+        return stats
+    
+    def to_dataframe(self, limit: Optional[int] = None):
+        """
+        Convert results to pandas DataFrame.
+        
+        Args:
+            limit: Maximum number of results to load (None = all)
+            
+        Returns:
+            pandas DataFrame with motif data
+        """
+        import pandas as pd
+        
+        return pd.DataFrame(list(self.iter_results(limit=limit)))
+    
+    def get_results_file_path(self) -> str:
+        """Get path to the Parquet part-file directory (readable as a dataset)."""
+        self.flush()
+        return str(self.results_dir)
+    
+    def cleanup(self):
+        """Delete results files."""
+        self._buffer = []
+        if self.results_dir.exists():
+            shutil.rmtree(self.results_dir)
+        self._parts = []
+        self._part_stats = {}
+        self._motif_count = 0
+        logger.info(f"Deleted results for {self.seq_id}")
+    
+    def _read_part_stats(self, part: Path) -> Dict[str, Any]:
+        key = str(part)
+        if key not in self._part_stats:
+            metadata = pq.read_schema(part).metadata or {}
+            self._part_stats[key] = json.loads(metadata[_PARQUET_STATS_KEY].decode('utf-8'))
+        return self._part_stats[key]
+
+
+def create_results_storage(base_dir: str, seq_id: str, backend: Optional[str] = None):
+    """
+    Create a results storage using the configured backend.
+    
+    Args:
+        base_dir: Base directory for results storage
+        seq_id: Sequence identifier
+        backend: 'jsonl' or 'parquet' (None = ``NONBDNA_RESULTS_BACKEND`` env var, default 'jsonl')
+        
+    Returns:
+        ``UniversalResultsStorage`` or ``ParquetResultsStorage`` instance. Falls back
+        to JSONL when pyarrow is not installed.
+    """
+    backend = (backend or DEFAULT_RESULTS_BACKEND).lower()
+    if backend == 'parquet':
+        if PYARROW_AVAILABLE:
+            return ParquetResultsStorage(base_dir, seq_id)
+        logger.warning("pyarrow not available - falling back to JSONL results storage")
+    elif backend != 'jsonl':
+        raise ValueError(f"Unknown results backend '{backend}'. Use 'jsonl' or 'parquet'")
+    return UniversalResultsStorage(base_dir, seq_id)
+
+
+def _start_sort_key(motif: Dict[str, Any]) -> int:
+    start = _column_value('Start', motif.get('Start'))
+    return start if start is not None else 0
+
+
+def _column_value(key: str, value: Any) -> Any:
+    """
+    Value to store in the typed column *key*, or None when *value* must go to 'Extra'.
+    
+    Any real number (numpy scalars included, bool excluded) is coerced to the
+    column type; integer columns only take values that are whole numbers.
+    """
+    if value is None or isinstance(value, bool):
+        return None
+    if key in _PARQUET_INT_FIELDS:
+        if isinstance(value, numbers.Integral):
+            return int(value)
+        if isinstance(value, numbers.Real) and float(value).is_integer():
+            return int(value)
+        return None
+    if key in _PARQUET_FLOAT_FIELDS:
+        return float(value) if isinstance(value, numbers.Real) else None
+    return value if isinstance(value, str) else None
+
+
+def _parquet_schema():
+    fields = [pa.field(f, pa.int64()) for f in _PARQUET_INT_FIELDS]
+    fields += [pa.field(f, pa.float64()) for f in _PARQUET_FLOAT_FIELDS]
+    fields += [pa.field(f, pa.string()) for f in _PARQUET_STR_FIELDS]
+    fields.append(pa.field('Extra', pa.string()))
+    return pa.schema(fields)
+
+
+def _part_summary(motifs: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Summary statistics stored in each part file's footer metadata."""
+    stats = {'total_count': len(motifs), 'class_distribution': {}, 'subclass_distribution': {},
+             'coverage_bp': 0, 'score_sum': 0.0, 'min_score': float('inf'), 'max_score': float('-inf')}
+    for motif in motifs:
+        motif_class = motif.get('Class', 'Unknown')
+        stats['class_distribution'][motif_class] = stats['class_distribution'].get(motif_class, 0) + 1
+        motif_subclass = motif.get('Subclass', 'Unknown')
+        stats['subclass_distribution'][motif_subclass] = stats['subclass_distribution'].get(motif_subclass, 0) + 1
+        # int()/float() so numpy scalars (detector or DataFrame output) stay JSON-serialisable
+        stats['coverage_bp'] += int(motif.get('Length', motif.get('End', 0) - motif.get('Start', 0)))
+        score = float(motif.get('Score', 0.0))
+        stats['score_sum'] += score
+        stats['min_score'] = min(stats['min_score'], score)
+        stats['max_score'] = max(stats['max_score'], score)
+    return stats
+
+
+def _row_group_may_match(rg, names: List[str], start, end, classes, min_score) -> bool:
+    """Use row-group column statistics to rule out row groups without reading them."""
+    def min_max(name):
+        stats = rg.column(names.index(name)).statistics
+        if stats is None or not stats.has_min_max:
+            return None
+        return stats.min, stats.max
+    
+    if start is not None:
+        bounds = min_max('End')
+        if bounds is not None and bounds[1] < start:
+            return False
+    if end is not None:
+        bounds = min_max('Start')
+        if bounds is not None and bounds[0] > end:
+            return False
+    if min_score is not None:
+        bounds = min_max('Score')
+        if bounds is not None and bounds[1] < min_score:
+            return False
+    if classes is not None:
+        bounds = min_max('Class')
+        if bounds is not None and not any(bounds[0] <= c <= bounds[1] for c in classes):
+            return False
+    return True
+
+
+def _and_mask(mask, condition):
+    return condition if mask is None else pc.and_(mask, condition)
+
+
+def _table_to_motifs(table) -> Iterator[Dict[str, Any]]:
+    """Rebuild motif dicts from an Arrow table (nulls dropped, Extra merged)."""
+    for row in table.to_pylist():
+        extra = row.pop('Extra', None)
+        motif = {key: value for key, value in row.items() if value is not None}
+        if extra:
+            motif.update(json.loads(extra))
+        yield motif
+
+
+def _iter_part_motifs(part: Path) -> Iterator[Dict[str, Any]]:
+    pf = pq.ParquetFile(part)
+    for rg_idx in range(pf.metadata.num_row_groups):
+        yield from _table_to_motifs(pf.read_row_group(rg_idx))
@@ -4,6 +4,7 @@ from .export_validator import (
     ExportValidationError,
     validate_single_motif,
     validate_export_data,
+    iter_validated_motifs,
     get_export_summary,
     check_class_completeness,
 )
@@ -12,6 +13,7 @@ __all__ = [
     'ExportValidationError',
     'validate_single_motif',
     'validate_export_data',
+    'iter_validated_motifs',
     'get_export_summary',
     'check_class_completeness',
 ]
@@ -26,7 +26,7 @@ USAGE:
     >>> safe_to_export = True
 """
 
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Tuple, Iterable, Iterator
 import warnings
 
 from Utilities.config.motif_taxonomy import VALID_CLASSES, VALID_SUBCLASSES, is_valid_pairing
@@ -167,6 +167,52 @@ def validate_export_data(
     return validated_motifs
 
 
+def iter_validated_motifs(
+    motifs: Iterable[Dict[str, Any]],
+    auto_normalize: bool = True,
+    strict: bool = True
+) -> Iterator[Dict[str, Any]]:
+    """
+    Streaming counterpart of :func:`validate_export_data`.
+
+    Validates motifs one at a time so that exporters can consume generators
+    (e.g. ``UniversalResultsStorage.iter_results``) without materialising the
+    full motif list.
+
+    Args:
+        motifs: Any iterable of motif dictionaries
+        auto_normalize: If True, attempt to normalize invalid motifs before failing
+        strict: If True, raise on the first invalid motif. If False, warn and skip it.
+
+    Yields:
+        Validated (and possibly normalized) motif dictionaries
+
+    Raises:
+        ExportValidationError: If a motif fails validation and strict=True
+    """
+    skipped = 0
+    for i, motif in enumerate(motifs):
+        if auto_normalize:
+            try:
+                motif = normalize_motif_dict(motif, strict=False, auto_correct=True)
+            except Exception as e:
+                if strict:
+                    raise ExportValidationError(f"Failed to normalize motif at index {i}: {e}")
+                warnings.warn(f"Failed to normalize motif at index {i}: {e}")
+        
+        is_valid, error_msg = validate_single_motif(motif, i, strict=strict)
+        if is_valid:
+            yield motif
+        elif strict:
+            raise ExportValidationError(f"Export validation failed: {error_msg}")
+        else:
+            skipped += 1
+            warnings.warn(error_msg)
+    
+    if skipped:
+        warnings.warn(f"Filtered out {skipped} invalid motif(s) during export validation")
+
+
 def get_export_summary(motifs: List[Dict[str, Any]]) -> Dict[str, Any]:
     """
     Get summary statistics for export data.
@@ -250,6 +296,7 @@ __all__ = [
     'ExportValidationError',
     'validate_single_motif',
     'validate_export_data',
+    'iter_validated_motifs',
     'get_export_summary',
     'check_class_completeness',
 ]
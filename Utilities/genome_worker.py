@@ -11,6 +11,10 @@ Each worker:
   • For large chromosomes (> LARGE_CHR_THRESHOLD) splits into overlapping chunks,
     processes them, then deduplicates boundary motifs.
   • Writes per-chromosome results to a Parquet file (pyarrow engine).
+  • Honours an optional RunBudget (Utilities.run_budget): chunks are not
+    started once the wall-time / RSS limit trips, detectors stop at the
+    per-chunk deadline, and what was found is still written. The budget
+    report goes to a ``<name>.budget.json`` sidecar next to the Parquet file.
   • Returns a lightweight summary tuple – no large objects are passed back
     between processes.
 
@@ -20,6 +24,7 @@ on all platforms.
 """
 from __future__ import annotations
 
+import json
 import os
 import time
 import warnings
@@ -58,17 +63,10 @@ def _chunk_sequence(
     chunk_size: int,
     overlap: int,
 ) -> List[Tuple[int, int]]:
-    """Return (start, end) pairs that tile *seq* with the given overlap."""
-    positions: List[Tuple[int, int]] = []
-    start = 0
-    n = len(seq)
-    while start < n:
-        end = min(start + chunk_size, n)
-        positions.append((start, end))
-        if end == n:
-            break
-        start += chunk_size - overlap
-    return positions
+    """Return (start, end) pairs that tile the non-N islands of *seq* with the given overlap."""
+    from Utilities.chunk_generator import plan_chunks
+
+    return [(start, end) for start, end, _ in plan_chunks(seq, chunk_size, overlap)]
 
 
 def _dedup_boundary(motifs: List[Dict], chunk_starts: List[int], overlap: int) -> List[Dict]:
@@ -94,17 +92,23 @@ def _run_detectors_locally(
     """Initialise a fresh NonBScanner and scan *seq*.
 
     Detectors are created inside this call so no state is shared between
-    worker processes.
+    worker processes.  Results go through the content-addressed chunk cache
+    (``NONBDNA_CHUNK_CACHE``), so a restarted run skips chunks it has
+    already scanned.
     """
-    from Utilities.nonbscanner import NonBScanner, CLASS_TO_DETECTOR
+    from Utilities.chunk_cache import scan_chunk_cached
+    from Utilities.nonbscanner import NonBScanner
 
-    scanner = NonBScanner(enable_all_detectors=True)
-    return scanner.analyze_sequence(
-        seq,
-        seq_name,
-        enabled_classes=enabled_classes,
-        use_parallel_detectors=True,
-    )
+    def _scan() -> List[Dict]:
+        scanner = NonBScanner(enable_all_detectors=True)
+        return scanner.analyze_sequence(
+            seq,
+            seq_name,
+            enabled_classes=enabled_classes,
+            use_parallel_detectors=True,
+        )
+
+    return scan_chunk_cached(seq, seq_name, enabled_classes, _scan, variant="NonBScanner")
 
 
 def process_chromosome(
@@ -119,7 +123,12 @@ def process_chromosome(
 
             (seq_name, seq, source_file, file_type,
              large_chr_threshold, genome_chunk_size, genome_chunk_overlap,
-             enabled_classes, parquet_dir, chunk_size, chunk_overlap)
+             enabled_classes, parquet_dir, chunk_size, chunk_overlap[, budget])
+
+        *budget* is a ``RunBudget`` (start it in the parent for one wall
+        clock across all chromosomes) or a limits dict. Without it the
+        NONBDNA_MAX_WALL_S / NONBDNA_MAX_RSS_MB / NONBDNA_CHUNK_TIMEOUT_S
+        defaults apply per chromosome.
 
     Returns
     -------
@@ -138,31 +147,47 @@ def process_chromosome(
         parquet_dir,
         chunk_size,
         chunk_overlap,
-    ) = args
+    ) = args[:11]
 
+    from Utilities.run_budget import RunBudget, budget_scope
+
+    budget = RunBudget.coerce(args[11] if len(args) > 11 else None)
     t0 = time.perf_counter()
     seq_len = len(seq)
 
     if seq_len < 10:
         return seq_name, None, 0, 0.0
 
-    # ── Split large chromosomes into sub-chunks processed sequentially ─────────
-    if seq_len > large_chr_threshold:
-        tile_positions = _chunk_sequence(seq, genome_chunk_size, genome_chunk_overlap)
-        all_motifs: List[Dict] = []
-        chunk_starts: List[int] = [s for s, _ in tile_positions]
-        for c_start, c_end in tile_positions:
-            chunk_seq = seq[c_start:c_end]
-            chunk_motifs = _run_detectors_locally(chunk_seq, seq_name, enabled_classes)
-            for m in chunk_motifs:
-                m["Start"] += c_start
-                m["End"] += c_start
-            all_motifs.extend(chunk_motifs)
-        motifs = _dedup_boundary(all_motifs, chunk_starts, genome_chunk_overlap)
-    else:
-        motifs = _run_detectors_locally(seq, seq_name, enabled_classes)
+    with budget_scope(budget):
+        # ── Split large chromosomes into sub-chunks processed sequentially ─────
+        if seq_len > large_chr_threshold:
+            tile_positions = _chunk_sequence(seq, genome_chunk_size, genome_chunk_overlap)
+            all_motifs: List[Dict] = []
+            chunk_starts: List[int] = [s for s, _ in tile_positions]
+            for c_start, c_end in tile_positions:
+                if budget is not None and budget.check():
+                    budget.record_skipped(seq_name, c_start, seq_len)
+                    break
+                chunk_seq = seq[c_start:c_end]
+                chunk_motifs = _run_detectors_locally(chunk_seq, seq_name, enabled_classes)
+                for m in chunk_motifs:
+                    m["Start"] += c_start
+                    m["End"] += c_start
+                all_motifs.extend(chunk_motifs)
+            motifs = _dedup_boundary(all_motifs, chunk_starts, genome_chunk_overlap)
+        elif budget is not None and budget.check():
+            budget.record_skipped(seq_name, 0, seq_len)
+            motifs = []
+        else:
+            motifs = _run_detectors_locally(seq, seq_name, enabled_classes)
 
     elapsed = time.perf_counter() - t0
+    safe_name = seq_name.replace("/", "_").replace("\\", "_")[:80]
+
+    if budget is not None:
+        # Sidecar so partial chromosomes are visible after the Parquet files are merged
+        with open(os.path.join(parquet_dir, f"{safe_name}.budget.json"), "w") as fh:
+            json.dump(dict(budget.report(), sequence=seq_name), fh, indent=2)
 
     if not motifs:
         return seq_name, None, 0, elapsed
@@ -192,7 +217,6 @@ def process_chromosome(
     df = pd.DataFrame.from_records(records, columns=_OUTPUT_COLS)
 
     # ── Write to Parquet ───────────────────────────────────────────────────────
-    safe_name = seq_name.replace("/", "_").replace("\\", "_")[:80]
     parquet_path = os.path.join(parquet_dir, f"{safe_name}.parquet")
 
     if _HAS_PYARROW:
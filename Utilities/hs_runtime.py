@@ -0,0 +1,121 @@
+"""
+┌──────────────────────────────────────────────────────────────────────────────┐
+│ Hyperscan Runtime - Shared Databases and Per-Thread Scratch                  │
+├──────────────────────────────────────────────────────────────────────────────┤
+│ Author: Dr. Venkata Rajesh Yella | License: MIT | Version: 2024.1            │
+└──────────────────────────────────────────────────────────────────────────────┘
+
+DESCRIPTION:
+    Hyperscan splits matching state into an immutable database, which can be
+    shared by any number of threads, and a mutable scratch region, which
+    only one scan may use at a time. Scans can run concurrently in several
+    threads (e.g. a Streamlit rerun next to a running analysis), so each
+    thread needs its own scratch. Allocating a fresh database or scratch on
+    every call costs about as much as scanning a small chunk.
+
+    * get_database(): compile once per (pattern-set key, mode, som) per process.
+      Compilation is double-checked under a lock, so concurrent first calls
+      compile only once.
+    * thread_scratch(): the calling thread's scratch for a database. It is
+      cloned from a never-used prototype the first time a thread asks and
+      kept in threading.local afterwards. Scans never lock and never
+      reallocate.
+    * scan(): block-mode scan with the thread's scratch.
+
+    Stream-mode scans (Utilities.stream_scan) use the same databases and
+    scratch.
+
+USAGE:
+    from Utilities import hs_runtime
+
+    db = hs_runtime.get_database('zdna-tenmers', expressions, ids, mode='stream')
+    hs_runtime.scan(db, data, on_match)          # block databases
+"""
+
+import logging
+import threading
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    hyperscan = None
+    HYPERSCAN_AVAILABLE = False
+
+_DATABASES: Dict[Tuple[str, str, bool], Any] = {}
+_PROTOTYPE_SCRATCH: Dict[int, Any] = {}   # id(db) -> scratch used only as a clone source
+_COMPILE_LOCK = threading.Lock()
+_GENERATION = 0                            # bumped by clear(); invalidates every thread's scratch
+_local = threading.local()
+
+
+def get_database(key: str, expressions: Sequence[bytes], ids: Sequence[int], flags: Optional[Sequence[int]] = None, mode: str = 'block', som: bool = False) -> Optional[Any]:
+    """
+    Compiled database for a pattern set, built once per (key, mode, som).
+
+    Args:
+        key: Pattern-set identifier (same key -> same patterns)
+        expressions: Pattern bytes
+        ids: Pattern ids reported to the match handler
+        flags: Per-pattern compile flags (default: none)
+        mode: 'block' or 'stream'
+        som: Track start of match (HS_FLAG_SOM_LEFTMOST); stream mode only
+
+    Returns:
+        hyperscan.Database, or None when Hyperscan is unavailable or compilation fails (cached too)
+    """
+    if not HYPERSCAN_AVAILABLE:
+        return None
+    cache_key = (key, mode, bool(som) and mode == 'stream')   # som only changes stream-mode compilation
+    db = _DATABASES.get(cache_key)
+    if db is not None or cache_key in _DATABASES:
+        return db
+    with _COMPILE_LOCK:
+        if cache_key in _DATABASES:
+            return _DATABASES[cache_key]
+        flags = list(flags) if flags is not None else [0] * len(expressions)
+        hs_mode = hyperscan.HS_MODE_STREAM if mode == 'stream' else hyperscan.HS_MODE_BLOCK
+        if som and mode == 'stream':
+            flags = [f | hyperscan.HS_FLAG_SOM_LEFTMOST for f in flags]
+            hs_mode |= hyperscan.HS_MODE_SOM_HORIZON_LARGE
+        try:
+            db = hyperscan.Database(mode=hs_mode)
+            db.compile(expressions=list(expressions), ids=list(ids), elements=len(expressions), flags=flags)
+            _PROTOTYPE_SCRATCH[id(db)] = hyperscan.Scratch(db)
+            logger.debug(f"Compiled {mode}-mode Hyperscan database '{key}' ({len(expressions)} patterns)")
+        except Exception as e:
+            logger.warning(f"Hyperscan compilation failed for '{key}' ({mode} mode): {e}")
+            db = None
+        _DATABASES[cache_key] = db
+    return db
+
+
+def thread_scratch(db: Any) -> Any:
+    """Scratch owned by the calling thread for ``db`` (cloned from the prototype on first use)."""
+    scratches = getattr(_local, 'scratches', None)
+    if scratches is None or _local.generation != _GENERATION:
+        scratches = _local.scratches = {}
+        _local.generation = _GENERATION
+    entry = scratches.get(id(db))
+    if entry is None:
+        prototype = _PROTOTYPE_SCRATCH.get(id(db))
+        scratch = prototype.clone() if prototype is not None else hyperscan.Scratch(db)
+        entry = scratches[id(db)] = (db, scratch)  # holding db keeps its id from being reused
+    return entry[1]
+
+
+def scan(db: Any, data: bytes, on_match: Callable[[int, int, int, int, Any], Optional[int]]) -> None:
+    """Block-mode scan of ``data`` using the calling thread's scratch."""
+    db.scan(data, match_event_handler=on_match, scratch=thread_scratch(db))
+
+
+def clear() -> None:
+    """Drop all cached databases and prototype scratch (tests / pattern reloads)."""
+    global _GENERATION
+    with _COMPILE_LOCK:
+        _DATABASES.clear()
+        _PROTOTYPE_SCRATCH.clear()
+        _GENERATION += 1
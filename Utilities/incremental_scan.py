@@ -0,0 +1,328 @@
+"""
+┌──────────────────────────────────────────────────────────────────────────────┐
+│ Incremental Scan - Re-analysis of Edited Sequences                           │
+├──────────────────────────────────────────────────────────────────────────────┤
+│ Author: Dr. Venkata Rajesh Yella | License: MIT | Version: 2024.1            │
+└──────────────────────────────────────────────────────────────────────────────┘
+
+DESCRIPTION:
+    Updates a previous result set for a sequence that differs from the
+    scanned one in a few places (assembly corrections, inserted constructs,
+    variant haplotypes of the same locus) instead of rescanning everything.
+
+    1. The old and new sequences are diffed into edits (old span -> new
+       span): common prefix/suffix trimming, a vectorized mismatch scan when
+       the remaining spans have equal length (substitutions), and otherwise
+       recursive splitting at an anchor k-mer shared by both sequences.
+       Every base outside the edits is identical in both sequences.
+    2. Each edit is padded by a context margin -- the largest reach of any
+       enabled detector plus the cluster window -- to a "core" span; cores
+       that overlap are merged and grown to cover old (non-Hybrid/Cluster)
+       motifs reaching into them, so long tracts touched by an edit are
+       re-detected whole.
+    3. Each core plus another margin of flank is scanned with the standard
+       pipeline (overlap removal, hybrids and clusters run on the window
+       only); new calls overlapping the core replace old calls overlapping
+       it, and old calls elsewhere are kept and shifted by the indel offset.
+    4. Where a rescanned call overlaps a kept call of the same class and
+       subclass at a window edge, overlap removal keeps the better one.
+
+    Results match a full rescan except where a full scan would resolve an
+    overlap or cluster across a span longer than the margin, the same
+    approximation chunked scanning already makes.
+
+USAGE:
+    from Utilities.nonbscanner import analyze_sequence, analyze_sequence_incremental
+
+    ref_motifs = analyze_sequence(ref_seq, "locus")
+    for hap_name, hap_seq in haplotypes.items():
+        motifs = analyze_sequence_incremental(hap_seq, ref_seq, ref_motifs, hap_name)
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Farthest a detector's call can reach from a changed base (bp): longest
+# motif the detector reports in practice, rounded up
+DETECTOR_CONTEXT_BP = {
+    'curved_dna': 300,      # phased A-tract arrays
+    'slipped_dna': 500,     # direct repeats (unit <= 50) and long STR tracts
+    'cruciform': 120,       # 2 x 50 nt arms + 12 nt loop
+    'r_loop': 2100,         # RIZ + REZ (<= 2000 nt)
+    'triplex': 300,         # 2 x 100 nt mirror arms, Sticky DNA expansions
+    'g_quadruplex': 300,    # G-wire / stacked G4 arrays
+    'i_motif': 150,
+    'z_dna': 300,           # merged 10-mer runs
+    'a_philic': 300,        # merged 10-mer runs
+}
+
+# Composite classes; may legitimately overlap each other
+DERIVED_CLASSES = ('Hybrid', 'Non-B_DNA_Clusters')
+
+ANCHOR_LENGTH = 32
+# Mismatches closer than this are reported as one edit
+SUBSTITUTION_MERGE_GAP = 32
+# Equal-length spans with more mismatches than this fraction are treated as indels
+MAX_SUBSTITUTION_FRACTION = 0.25
+_PREFIX_BLOCK = 1 << 16
+
+
+@dataclass(frozen=True)
+class SequenceEdit:
+    """Replacement of old[old_start:old_end] by new[new_start:new_end] (0-based, end-exclusive)."""
+    old_start: int
+    old_end: int
+    new_start: int
+    new_end: int
+
+    @property
+    def delta(self) -> int:
+        return (self.new_end - self.new_start) - (self.old_end - self.old_start)
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# SEQUENCE DIFF
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def _common_prefix(a: str, b: str, i: int, j: int, limit: int) -> int:
+    """Length of the common prefix of a[i:i+limit] and b[j:j+limit] (block compares, then bisection)."""
+    n = 0
+    block = _PREFIX_BLOCK
+    while n < limit:
+        step = min(block, limit - n)
+        if a[i + n:i + n + step] == b[j + n:j + n + step]:
+            n += step
+            continue
+        lo, hi = 0, step
+        while lo < hi:
+            mid = (lo + hi + 1) // 2
+            if a[i + n:i + n + mid] == b[j + n:j + n + mid]:
+                lo = mid
+            else:
+                hi = mid - 1
+        return n + lo
+    return n
+
+
+def _common_suffix(a: str, b: str, i_end: int, j_end: int, limit: int) -> int:
+    """Length of the common suffix of a[:i_end] and b[:j_end], at most *limit*."""
+    n = 0
+    block = _PREFIX_BLOCK
+    while n < limit:
+        step = min(block, limit - n)
+        if a[i_end - n - step:i_end - n] == b[j_end - n - step:j_end - n]:
+            n += step
+            continue
+        lo, hi = 0, step
+        while lo < hi:
+            mid = (lo + hi + 1) // 2
+            if a[i_end - n - mid:i_end - n] == b[j_end - n - mid:j_end - n]:
+                lo = mid
+            else:
+                hi = mid - 1
+        return n + lo
+    return n
+
+
+def _substitution_edits(old: str, new: str, o0: int, n0: int, length: int) -> Optional[List[SequenceEdit]]:
+    """Edits for equal-length spans differing by substitutions; None when they look shifted."""
+    a = np.frombuffer(old[o0:o0 + length].encode('ascii', 'replace'), dtype=np.uint8)
+    b = np.frombuffer(new[n0:n0 + length].encode('ascii', 'replace'), dtype=np.uint8)
+    diff = np.flatnonzero(a != b)
+    if diff.size > MAX_SUBSTITUTION_FRACTION * length:
+        return None
+    breaks = np.flatnonzero(np.diff(diff) > SUBSTITUTION_MERGE_GAP)
+    firsts = np.concatenate(([diff[0]], diff[breaks + 1]))
+    lasts = np.concatenate((diff[breaks], [diff[-1]]))
+    return [SequenceEdit(o0 + int(f), o0 + int(l) + 1, n0 + int(f), n0 + int(l) + 1) for f, l in zip(firsts, lasts)]
+
+
+def _find_anchor(old: str, new: str, o0: int, o1: int, n0: int, n1: int) -> Optional[Tuple[int, int]]:
+    """A k-mer of old[o0:o1] also present in new[n0:n1], near its proportional position."""
+    lo, ln = o1 - o0, n1 - n0
+    slack = abs(ln - lo) + ANCHOR_LENGTH
+    for fraction in (0.5, 0.25, 0.75, 0.125, 0.875):
+        a = o0 + int((lo - ANCHOR_LENGTH) * fraction)
+        kmer = old[a:a + ANCHOR_LENGTH]
+        expected = n0 + int((ln - ANCHOR_LENGTH) * fraction)
+        q = new.find(kmer, max(n0, expected - slack), n1)
+        if q < 0:
+            q = new.find(kmer, n0, n1)
+        if q >= 0:
+            return a, q
+    return None
+
+
+def diff_sequences(old: str, new: str) -> List[SequenceEdit]:
+    """
+    Edits turning *old* into *new*, sorted by position.
+
+    Not a minimal edit script; the guarantee is that everything outside the
+    edits is identical (same bases, same order) in both sequences.
+    """
+    edits: List[SequenceEdit] = []
+    stack = [(0, len(old), 0, len(new))]
+    while stack:
+        o0, o1, n0, n1 = stack.pop()
+        p = _common_prefix(old, new, o0, n0, min(o1 - o0, n1 - n0))
+        o0, n0 = o0 + p, n0 + p
+        s = _common_suffix(old, new, o1, n1, min(o1 - o0, n1 - n0))
+        o1, n1 = o1 - s, n1 - s
+        if o0 == o1 and n0 == n1:
+            continue
+        if o1 - o0 == n1 - n0:
+            subs = _substitution_edits(old, new, o0, n0, o1 - o0)
+            if subs is not None:
+                edits.extend(subs)
+                continue
+        anchor = None
+        if min(o1 - o0, n1 - n0) >= 2 * ANCHOR_LENGTH:
+            anchor = _find_anchor(old, new, o0, o1, n0, n1)
+        if anchor is None:
+            edits.append(SequenceEdit(o0, o1, n0, n1))
+            continue
+        a, q = anchor
+        # Right half pushed first so the left half is processed (and emitted) first
+        stack.append((a + ANCHOR_LENGTH, o1, q + ANCHOR_LENGTH, n1))
+        stack.append((o0, a, n0, q))
+    edits.sort(key=lambda e: e.old_start)
+    return edits
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# SPLICING
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def context_margin(enabled_classes: Optional[List[str]] = None) -> int:
+    """Context margin (bp) for the enabled classes: widest detector reach plus the cluster window."""
+    from Utilities.nonbscanner import CLASS_TO_DETECTOR, CLUSTER_WINDOW_SIZE
+    keys = [CLASS_TO_DETECTOR[c] for c in enabled_classes if c in CLASS_TO_DETECTOR] if enabled_classes else list(DETECTOR_CONTEXT_BP)
+    return max((DETECTOR_CONTEXT_BP[k] for k in keys), default=0) + CLUSTER_WINDOW_SIZE
+
+
+def _plan_cores(edits: List[SequenceEdit], old_motifs: List[Dict[str, Any]], margin: int,
+                old_len: int, new_len: int) -> List[List[int]]:
+    """Merged core spans [old_start, old_end, new_start, new_end] around the edits, grown to cover touched old motifs."""
+    cores: List[List[int]] = []
+    for e in edits:
+        left = min(margin, e.old_start, e.new_start)
+        right = min(margin, old_len - e.old_end, new_len - e.new_end)
+        core = [e.old_start - left, e.old_end + right, e.new_start - left, e.new_end + right]
+        if cores and core[0] <= cores[-1][1]:
+            # Unchanged gap between the two edits: old and new extents move together
+            prev = cores[-1]
+            prev[1], prev[3] = core[1], core[3]
+        else:
+            cores.append(core)
+
+    # Hybrid/Cluster calls are bounded by the margin and recomputed anyway; only
+    # primary calls (whose tracts can be arbitrarily long) grow the cores
+    spans = sorted((m.get('Start', 0) - 1, m.get('End', 0)) for m in old_motifs if m.get('Class') not in DERIVED_CLASSES)
+    starts = np.fromiter((s for s, _ in spans), dtype=np.int64, count=len(spans))
+    reach = np.maximum.accumulate(np.fromiter((e for _, e in spans), dtype=np.int64, count=len(spans))) if spans else starts
+    changed = True
+    while changed:
+        changed = False
+        for core in cores:
+            # Old motifs overlapping the core: start < core end and end > core start
+            hi = int(np.searchsorted(starts, core[1], side='left'))
+            if hi == 0:
+                continue
+            inside = [(s, e) for s, e in spans[int(np.searchsorted(reach[:hi], core[0], side='right')):hi] if e > core[0]]
+            if not inside:
+                continue
+            grow_left = max(0, core[0] - min(s for s, _ in inside))
+            grow_right = max(0, max(e for _, e in inside) - core[1])
+            if grow_left or grow_right:
+                core[0] -= grow_left; core[2] -= grow_left
+                core[1] += grow_right; core[3] += grow_right
+                changed = True
+        merged: List[List[int]] = []
+        for core in cores:
+            if merged and core[0] <= merged[-1][1]:
+                merged[-1][1] = max(merged[-1][1], core[1]); merged[-1][3] = max(merged[-1][3], core[3])
+                changed = True
+            else:
+                merged.append(core)
+        cores = merged
+    return cores
+
+
+def rescan_edited(new_sequence: str, old_sequence: str, old_motifs: List[Dict[str, Any]],
+                  sequence_name: str = "sequence", enabled_classes: Optional[List[str]] = None,
+                  margin: Optional[int] = None,
+                  max_rescan_fraction: float = 1.0) -> Tuple[Optional[List[Dict[str, Any]]], Dict[str, Any]]:
+    """
+    Update *old_motifs* (the result for *old_sequence*) to *new_sequence*.
+
+    Args:
+        new_sequence: Edited sequence
+        old_sequence: Sequence *old_motifs* were called on
+        old_motifs: Previous result set (not modified)
+        sequence_name: Name stored in the new calls
+        enabled_classes: Classes the previous result was restricted to (None = all)
+        margin: Context margin in bp (default: ``context_margin(enabled_classes)``)
+        max_rescan_fraction: Give up (motifs None) when the windows would
+                             cover more than this fraction of *new_sequence*
+
+    Returns:
+        (motifs, info) where info has the edit count, rescanned bp and windows
+    """
+    from Utilities.nonbscanner import _get_cached_scanner, _scan_chunk
+
+    new_sequence, old_sequence = new_sequence.upper(), old_sequence.upper()
+    margin = context_margin(enabled_classes) if margin is None else margin
+    edits = diff_sequences(old_sequence, new_sequence)
+    info: Dict[str, Any] = {'edits': len(edits), 'windows': [], 'rescanned_bp': 0, 'margin': margin}
+    if not edits:
+        return [dict(m, Sequence_Name=sequence_name) for m in old_motifs], info
+
+    old_len, new_len = len(old_sequence), len(new_sequence)
+    cores = _plan_cores(edits, old_motifs, margin, old_len, new_len)
+    windows = [(max(0, c[2] - margin), min(new_len, c[3] + margin)) for c in cores]
+    info['windows'] = windows; info['rescanned_bp'] = sum(e - s for s, e in windows)
+    if info['rescanned_bp'] > max_rescan_fraction * new_len:
+        return None, info
+    # Cumulative indel offset for old coordinates after each core
+    offsets = np.cumsum([(c[3] - c[2]) - (c[1] - c[0]) for c in cores])
+    core_old_starts = np.array([c[0] for c in cores], dtype=np.int64)
+    core_old_ends = np.array([c[1] for c in cores], dtype=np.int64)
+
+    motifs: List[Dict[str, Any]] = []
+    for m in old_motifs:
+        s0, e = m.get('Start', 0) - 1, m.get('End', 0)
+        k = int(np.searchsorted(core_old_starts, e, side='left'))   # cores starting before the motif ends
+        if k and core_old_ends[k - 1] > s0:
+            continue    # overlaps a core: superseded by the rescan
+        shift = int(offsets[k - 1]) if k else 0
+        kept = dict(m, Sequence_Name=sequence_name)
+        if shift:
+            kept['Start'] += shift; kept['End'] += shift
+        motifs.append(kept)
+
+    scanner = _get_cached_scanner()
+    for (_, _, core_start, core_end), (win_start, win_end) in zip(cores, windows):
+        window = new_sequence[win_start:win_end]
+        for m in _scan_chunk(scanner, window, sequence_name, enabled_classes, None, win_start):
+            m['Start'] += win_start; m['End'] += win_start
+            if m['Start'] - 1 < core_end and m['End'] > core_start:
+                motifs.append(m)
+
+    # Window edges: same-class calls may not overlap (as after overlap removal);
+    # Hybrid/Cluster calls may, so only exact repeats of those are dropped
+    derived, seen = [], set()
+    for m in motifs:
+        if m.get('Class') in DERIVED_CLASSES:
+            k = (m.get('Class'), m.get('Subclass'), m.get('Start'), m.get('End'))
+            if k not in seen:
+                seen.add(k); derived.append(m)
+    motifs = scanner._remove_overlaps([m for m in motifs if m.get('Class') not in DERIVED_CLASSES]) + derived
+    motifs.sort(key=lambda x: x.get('Start', 0))
+    logger.info(f"Incremental scan of {sequence_name}: {len(edits)} edit(s), {len(cores)} window(s), "
+                f"{info['rescanned_bp']:,}/{new_len:,} bp rescanned")
+    return motifs, info
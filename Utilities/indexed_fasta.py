@@ -0,0 +1,510 @@
+"""
+┌──────────────────────────────────────────────────────────────────────────────┐
+│ Indexed FASTA - Random Access via .fai / .gzi (samtools compatible)          │
+├──────────────────────────────────────────────────────────────────────────────┤
+│ Author: Dr. Venkata Rajesh Yella | License: MIT | Version: 2024.1            │
+└──────────────────────────────────────────────────────────────────────────────┘
+
+DESCRIPTION:
+    Random-access FASTA reader that never materialises a whole record.
+
+    A samtools-compatible ``.fai`` index (name, length, offset, linebases,
+    linewidth) is reused when present and built otherwise; for bgzip
+    compressed files the ``.gzi`` block index is reused or built as well.
+    ``fetch(name, start, end)`` turns coordinates into byte offsets with line
+    arithmetic, reads only that byte range (decompressing only the BGZF
+    blocks that cover it) and strips line breaks with ``bytes.translate``.
+
+    ``IndexedFasta.sequence(name)`` returns a :class:`FastaRecord` view that
+    supports ``len()`` and slicing, so :class:`~Utilities.chunk_generator.ChunkGenerator`
+    and ``analyze_sequence`` (chunked path) pull chunk slices lazily.  Views
+    are cheap to pickle (path + index entry), so process-pool workers fetch
+    their own chunks instead of receiving the full sequence.
+
+    Names are the first whitespace-delimited word of each header line, as
+    in samtools.  Coordinates are 0-based, end-exclusive.  Plain (non-BGZF)
+    gzip cannot be accessed randomly and is rejected with a hint to bgzip.
+
+USAGE:
+    fasta = IndexedFasta("genome.fa.gz")           # builds .fai/.gzi if missing
+    seq = fasta.fetch("chr7", 0, 5_000_000)        # bytes, no line breaks
+    record = fasta.sequence("chr7")                # lazy view
+    for chunk in ChunkGenerator(record, 50_000, 2_000).generate():
+        ...
+    motifs = analyze_sequence(fasta.sequence("chr7", 0, 5_000_000), "chr7")
+"""
+
+import bisect
+import logging
+import os
+import re
+import struct
+import zlib
+from dataclasses import dataclass
+from typing import BinaryIO, Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+_NEWLINES = b'\r\n'
+_GZIP_MAGIC = b'\x1f\x8b'
+_BGZF_HEADER = struct.Struct('<4BI2BH')   # ID1 ID2 CM FLG MTIME XFL OS XLEN
+_REGION_RE = re.compile(r'^(?P<name>.+?)(?::(?P<start>[\d,]+)(?:-(?P<end>[\d,]+))?)?$')
+
+
+@dataclass(frozen=True)
+class FaiEntry:
+    """One line of a samtools ``.fai`` index."""
+    name: str
+    length: int
+    offset: int
+    linebases: int
+    linewidth: int
+
+    def byte_offset(self, pos: int) -> int:
+        """Uncompressed file offset of 0-based sequence position *pos*."""
+        if self.linebases == 0:
+            return self.offset
+        return self.offset + (pos // self.linebases) * self.linewidth + pos % self.linebases
+
+
+def parse_region(region: str) -> Tuple[str, Optional[int], Optional[int]]:
+    """
+    Parse a samtools-style region string.
+
+    Args:
+        region: ``"chr7"``, ``"chr7:1000"`` or ``"chr7:1-5,000,000"`` (1-based, inclusive)
+
+    Returns:
+        Tuple of (name, start, end) with 0-based, end-exclusive coordinates;
+        start/end are None when not given.
+    """
+    match = _REGION_RE.match(region.strip())
+    if not match:
+        raise ValueError(f"Invalid region '{region}'")
+    start = match.group('start')
+    end = match.group('end')
+    start0 = int(start.replace(',', '')) - 1 if start else None
+    end0 = int(end.replace(',', '')) if end else None
+    if start0 is not None and start0 < 0:
+        raise ValueError(f"Region start must be >= 1 in '{region}'")
+    return match.group('name'), start0, end0
+
+
+# =============================================================================
+# BGZF RANDOM ACCESS
+# =============================================================================
+
+class _BgzfRandomReader:
+    """Read uncompressed byte ranges from a BGZF file using a ``.gzi`` block index."""
+
+    def __init__(self, path: str, gzi_path: str):
+        self.path = path
+        if os.path.exists(gzi_path) and os.path.getmtime(gzi_path) >= os.path.getmtime(path):
+            blocks = _read_gzi(gzi_path)
+        else:
+            blocks = _scan_bgzf_blocks(path)
+            _write_index_file(gzi_path, _gzi_bytes(blocks), 'gzi')
+        self._compressed = [c for c, _ in blocks]
+        self._uncompressed = [u for _, u in blocks]
+        self._fh: Optional[BinaryIO] = None
+        self._cached_block: Tuple[int, bytes] = (-1, b'')
+
+    def read(self, start: int, end: int) -> bytes:
+        """Return uncompressed bytes ``[start, end)``."""
+        if end <= start:
+            return b''
+        if self._fh is None:
+            self._fh = open(self.path, 'rb')
+        idx = bisect.bisect_right(self._uncompressed, start) - 1
+        parts: List[bytes] = []
+        pos = self._uncompressed[idx]
+        while pos < end and idx < len(self._compressed):
+            data = self._block(idx)
+            if not data:
+                break
+            lo = max(start - pos, 0)
+            hi = min(end - pos, len(data))
+            parts.append(data[lo:hi])
+            pos += len(data)
+            idx += 1
+        return b''.join(parts)
+
+    def _block(self, idx: int) -> bytes:
+        if self._cached_block[0] == idx:
+            return self._cached_block[1]
+        self._fh.seek(self._compressed[idx])
+        data = _read_bgzf_block(self._fh)
+        self._cached_block = (idx, data)
+        return data
+
+    def close(self):
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_fh'] = None
+        state['_cached_block'] = (-1, b'')
+        return state
+
+
+def _bgzf_block_size(header: bytes, extra: bytes) -> Optional[int]:
+    """Return BSIZE+1 from a BGZF block header, or None if not a BGZF block."""
+    id1, id2, cm, flg, _, _, _, _ = _BGZF_HEADER.unpack(header)
+    if (id1, id2, cm) != (0x1f, 0x8b, 8) or not flg & 4:
+        return None
+    pos = 0
+    while pos + 4 <= len(extra):
+        si1, si2, slen = extra[pos], extra[pos + 1], struct.unpack_from('<H', extra, pos + 2)[0]
+        if si1 == 66 and si2 == 67 and slen == 2:
+            return struct.unpack_from('<H', extra, pos + 4)[0] + 1
+        pos += 4 + slen
+    return None
+
+
+def _read_bgzf_block(fh: BinaryIO) -> bytes:
+    """Decompress the BGZF block at the current file position (b'' at EOF)."""
+    header = fh.read(_BGZF_HEADER.size)
+    if len(header) < _BGZF_HEADER.size:
+        return b''
+    xlen = _BGZF_HEADER.unpack(header)[-1]
+    extra = fh.read(xlen)
+    block_size = _bgzf_block_size(header, extra)
+    if block_size is None:
+        raise ValueError("Corrupt or non-BGZF block encountered")
+    payload = fh.read(block_size - _BGZF_HEADER.size - xlen)
+    return zlib.decompress(payload[:-8], -15)
+
+
+def _scan_bgzf_blocks(path: str) -> List[Tuple[int, int]]:
+    """Walk BGZF block headers; returns (compressed, uncompressed) offsets of each block."""
+    blocks: List[Tuple[int, int]] = []
+    compressed = uncompressed = 0
+    with open(path, 'rb') as fh:
+        while True:
+            header = fh.read(_BGZF_HEADER.size)
+            if len(header) < _BGZF_HEADER.size:
+                break
+            xlen = _BGZF_HEADER.unpack(header)[-1]
+            block_size = _bgzf_block_size(header, fh.read(xlen))
+            if block_size is None:
+                raise ValueError(
+                    f"{path} is gzip but not BGZF compressed; recompress with 'bgzip' "
+                    "for random access"
+                )
+            fh.seek(compressed + block_size - 4)
+            isize = struct.unpack('<I', fh.read(4))[0]
+            blocks.append((compressed, uncompressed))
+            compressed += block_size
+            uncompressed += isize
+    return blocks
+
+
+def _read_gzi(path: str) -> List[Tuple[int, int]]:
+    with open(path, 'rb') as fh:
+        data = fh.read()
+    count = struct.unpack_from('<Q', data, 0)[0]
+    pairs = struct.unpack_from(f'<{2 * count}Q', data, 8)
+    return [(0, 0)] + list(zip(pairs[0::2], pairs[1::2]))
+
+
+def _gzi_bytes(blocks: List[Tuple[int, int]]) -> bytes:
+    """htslib .gzi layout: entry count, then (compressed, uncompressed) pairs without the first block."""
+    entries = [b for b in blocks if b != (0, 0)]
+    flat = [value for pair in entries for value in pair]
+    return struct.pack(f'<Q{len(flat)}Q', len(entries), *flat)
+
+
+def _write_index_file(path: str, data: bytes, label: str):
+    try:
+        with open(path, 'wb') as fh:
+            fh.write(data)
+        logger.info(f"Wrote {label} index {path}")
+    except OSError as e:
+        logger.warning(f"Could not write {label} index {path} ({e}); keeping it in memory")
+
+
+# =============================================================================
+# FAI INDEX
+# =============================================================================
+
+def _build_fai(lines: Iterator[bytes], path: str) -> List[FaiEntry]:
+    """Build .fai entries from an iterator of raw (newline-terminated) lines."""
+    entries: List[FaiEntry] = []
+    pos = 0
+    name = None
+    offset = length = linebases = linewidth = 0
+    short_line = blank_line = False
+
+    def finish():
+        if name is not None:
+            entries.append(FaiEntry(name, length, offset, linebases, linewidth))
+
+    for line in lines:
+        line_len = len(line)
+        if line[:1] == b'>':
+            finish()
+            header = line[1:].split(None, 1)
+            name = header[0].decode('utf-8', 'replace') if header else f"sequence_{len(entries) + 1}"
+            offset = pos + line_len
+            length = linebases = linewidth = 0
+            short_line = blank_line = False
+        elif name is not None:
+            bases = len(line.rstrip(_NEWLINES))
+            if bases == 0:
+                blank_line = True
+            else:
+                if short_line or blank_line:
+                    raise ValueError(
+                        f"Different line length in sequence '{name}' of {path}; "
+                        "reformat with uniform line widths (e.g. 'seqkit seq -w 60') to index it"
+                    )
+                if linebases == 0:
+                    linebases, linewidth = bases, line_len
+                elif bases > linebases:
+                    raise ValueError(f"Different line length in sequence '{name}' of {path}")
+                elif bases < linebases or line_len != linewidth:
+                    short_line = True
+                length += bases
+        pos += line_len
+    finish()
+    return entries
+
+
+def _read_fai(path: str) -> List[FaiEntry]:
+    entries = []
+    with open(path) as fh:
+        for line in fh:
+            fields = line.rstrip('\n').split('\t')
+            if len(fields) >= 5:
+                entries.append(FaiEntry(fields[0], int(fields[1]), int(fields[2]), int(fields[3]), int(fields[4])))
+    return entries
+
+
+def _fai_bytes(entries: List[FaiEntry]) -> bytes:
+    return ''.join(
+        f"{e.name}\t{e.length}\t{e.offset}\t{e.linebases}\t{e.linewidth}\n" for e in entries
+    ).encode('utf-8')
+
+
+# =============================================================================
+# PUBLIC API
+# =============================================================================
+
+class IndexedFasta:
+    """
+    Random-access FASTA (plain or bgzip) backed by a samtools ``.fai`` index.
+
+    Usage:
+        fasta = IndexedFasta("genome.fa")
+        fasta.references          # ['chr1', 'chr2', ...]
+        fasta.get_length('chr1')
+        fasta.fetch('chr1', 1_000, 2_000)        # b'ACGT...'
+    """
+
+    def __init__(self, path: str, fai_path: Optional[str] = None, gzi_path: Optional[str] = None):
+        """
+        Open *path*, reusing ``<path>.fai`` (and ``<path>.gzi`` for bgzip)
+        when they are newer than the FASTA, building them otherwise.
+
+        Args:
+            path: FASTA file (plain or bgzip compressed)
+            fai_path: Override for the .fai location
+            gzi_path: Override for the .gzi location
+
+        Raises:
+            ValueError: If the file is plain gzip or has ragged line lengths
+        """
+        self.path = os.fspath(path)
+        self.fai_path = fai_path or self.path + '.fai'
+        self.gzi_path = gzi_path or self.path + '.gzi'
+        self._open_data()
+
+        if os.path.exists(self.fai_path) and os.path.getmtime(self.fai_path) >= os.path.getmtime(self.path):
+            entries = _read_fai(self.fai_path)
+        else:
+            entries = self._build_index()
+            _write_index_file(self.fai_path, _fai_bytes(entries), 'fai')
+        self._entries: Dict[str, FaiEntry] = {e.name: e for e in entries}
+
+    @classmethod
+    def _with_entries(cls, path: str, entries: List[FaiEntry], gzi_path: str) -> 'IndexedFasta':
+        """Reopen *path* with known index entries (no .fai lookup)."""
+        fasta = cls.__new__(cls)
+        fasta.path = path
+        fasta.fai_path = path + '.fai'
+        fasta.gzi_path = gzi_path
+        fasta._open_data()
+        fasta._entries = {e.name: e for e in entries}
+        return fasta
+
+    def _open_data(self):
+        with open(self.path, 'rb') as fh:
+            self.compressed = fh.read(2) == _GZIP_MAGIC
+        self._bgzf = _BgzfRandomReader(self.path, self.gzi_path) if self.compressed else None
+        self._fh: Optional[BinaryIO] = None
+
+    def _build_index(self) -> List[FaiEntry]:
+        logger.info(f"Indexing {self.path}")
+        if self.compressed:
+            import gzip
+            with gzip.open(self.path, 'rb') as fh:
+                return _build_fai(iter(fh), self.path)
+        with open(self.path, 'rb') as fh:
+            return _build_fai(iter(fh), self.path)
+
+    # ------------------------------------------------------------------
+    # METADATA
+    # ------------------------------------------------------------------
+
+    @property
+    def references(self) -> List[str]:
+        """Record names in file order."""
+        return list(self._entries)
+
+    @property
+    def lengths(self) -> List[int]:
+        """Record lengths in file order."""
+        return [e.length for e in self._entries.values()]
+
+    def get_length(self, name: str) -> int:
+        """Length of record *name* in bp."""
+        return self._entry(name).length
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _entry(self, name: str) -> FaiEntry:
+        try:
+            return self._entries[name]
+        except KeyError:
+            raise KeyError(f"Sequence '{name}' not found in {self.path}") from None
+
+    # ------------------------------------------------------------------
+    # ACCESS
+    # ------------------------------------------------------------------
+
+    def fetch(self, name: str, start: Optional[int] = None, end: Optional[int] = None) -> bytes:
+        """
+        Return bases ``[start, end)`` of record *name* without line breaks.
+
+        Args:
+            name: Record name
+            start: 0-based start (default 0; clipped to the record)
+            end: 0-based exclusive end (default record length; clipped)
+
+        Returns:
+            Raw bases as bytes (case preserved)
+        """
+        entry = self._entry(name)
+        start = 0 if start is None else max(0, start)
+        end = entry.length if end is None else min(end, entry.length)
+        if end <= start:
+            return b''
+        byte_start = entry.byte_offset(start)
+        byte_end = entry.byte_offset(end - 1) + 1
+        return self._read(byte_start, byte_end).translate(None, _NEWLINES)
+
+    def fetch_region(self, region: str) -> bytes:
+        """Fetch a samtools-style region string (``"chr7:1-5,000,000"``, 1-based inclusive)."""
+        name, start, end = parse_region(region)
+        return self.fetch(name, start, end)
+
+    def sequence(self, name: str, start: int = 0, end: Optional[int] = None) -> 'FastaRecord':
+        """Lazy, sliceable view of record *name* (optionally restricted to ``[start, end)``)."""
+        entry = self._entry(name)
+        end = entry.length if end is None else min(end, entry.length)
+        return FastaRecord(self.path, entry, max(0, start), end, self.gzi_path)
+
+    def iter_records(self) -> Iterator['FastaRecord']:
+        """Lazy views of every record in file order."""
+        for name in self._entries:
+            yield self.sequence(name)
+
+    def _read(self, start: int, end: int) -> bytes:
+        if self._bgzf is not None:
+            return self._bgzf.read(start, end)
+        if self._fh is None:
+            self._fh = open(self.path, 'rb')
+        self._fh.seek(start)
+        return self._fh.read(end - start)
+
+    def close(self):
+        """Close open file handles."""
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+        if self._bgzf is not None:
+            self._bgzf.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_fh'] = None
+        return state
+
+
+class FastaRecord:
+    """
+    Lazy view of one FASTA record (or a sub-range of it).
+
+    Behaves like a read-only uppercase ``str`` for ``len()`` and slicing;
+    slices are fetched from disk on demand.  Pickles as (path, index entry,
+    range), so worker processes reopen the file themselves.
+    """
+
+    def __init__(self, path: str, entry: FaiEntry, start: int, end: int, gzi_path: Optional[str] = None):
+        self.path = path
+        self.entry = entry
+        self.start = start
+        self.end = max(start, end)
+        self.gzi_path = gzi_path or path + '.gzi'
+        self._fasta: Optional[IndexedFasta] = None
+
+    @property
+    def name(self) -> str:
+        return self.entry.name
+
+    def __len__(self) -> int:
+        return self.end - self.start
+
+    def __bool__(self) -> bool:
+        return self.end > self.start
+
+    def __getitem__(self, key) -> str:
+        if isinstance(key, int):
+            key = slice(key, key + 1 if key != -1 else None)
+        start, stop, step = key.indices(len(self))
+        if step != 1:
+            return self[start:stop][::step]
+        return self.fetch_bytes(start, stop).decode('ascii', 'replace').upper()
+
+    def fetch_bytes(self, start: int = 0, end: Optional[int] = None) -> bytes:
+        """Raw bytes of view positions ``[start, end)`` (case preserved)."""
+        end = len(self) if end is None else min(end, len(self))
+        return self._reader().fetch(self.entry.name, self.start + start, self.start + end)
+
+    def __str__(self) -> str:
+        return self[:]
+
+    def __repr__(self) -> str:
+        return f"FastaRecord({self.path!r}, {self.entry.name!r}, {self.start}, {self.end})"
+
+    def _reader(self) -> IndexedFasta:
+        if self._fasta is None:
+            self._fasta = IndexedFasta._with_entries(self.path, [self.entry], self.gzi_path)
+        return self._fasta
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_fasta'] = None
+        return state
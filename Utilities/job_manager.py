@@ -9,13 +9,31 @@ Features:
 - Disk-based result persistence under results/<job_id>/
 - Job metadata storage (timestamp, sequence info)
 - Job lookup and retrieval
+- Columnar result stores written by queued jobs (job_queue / job_worker)
+
+Job directory layout (results/<job_id>/):
+- <seq_id>_results.parquet/   Compressed columnar motifs per sequence
+                              (ParquetResultsStorage; JSONL without pyarrow)
+- sequences.fa.gz (+.fai/.gzi) BGZF-packed input sequences, random access
+                              through IndexedFasta (plain FASTA without Biopython)
+- metadata.json               Job metadata plus a per-sequence manifest
+
+Jobs are also recorded in a small SQLite index (results/job_index.sqlite),
+so listing jobs is one query and never opens per-job files. Summary stats
+and result pages are read from the columnar stores without loading all
+motifs. Directories written by older versions (results.json /
+sequences.json) can still be loaded.
 """
 
 import os
+import re
 import json
 import uuid
+import shutil
+import sqlite3
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
@@ -23,6 +41,17 @@ logger = logging.getLogger(__name__)
 # Base directory for all job results
 RESULTS_BASE_DIR = "results"
 
+# SQLite index of saved jobs (one row per job)
+JOB_INDEX_PATH = os.path.join(RESULTS_BASE_DIR, "job_index.sqlite")
+
+# Packed sequence file and metadata inside each job directory
+SEQUENCES_FILE = "sequences.fa.gz"
+METADATA_FILE = "metadata.json"
+
+# Reserved metadata keys (set by the system, never by callers)
+_RESERVED_KEYS = {'job_id', 'timestamp', 'num_sequences', 'sequence_names', 'total_bp', 'total_motifs',
+                  'sequences', 'results_backend', 'sequences_file'}
+
 
 def generate_job_id() -> str:
     """
@@ -82,6 +111,155 @@ def ensure_job_directory(job_id: str) -> str:
     return job_dir
 
 
+
+
+def job_seq_id(index: int, name: str) -> str:
+    """
+    File-system safe, unique store id for the *index*-th sequence of a job.
+    
+    Args:
+        index: Position of the sequence in the job
+        name: Sequence name (may repeat or contain any characters)
+        
+    Returns:
+        str: e.g. '0003_chr3'
+    """
+    return f"{index:04d}_{re.sub(r'[^A-Za-z0-9_.-]', '_', name)[:60]}"
+
+
+def job_results_backend() -> str:
+    """Results backend for new jobs: 'parquet' when pyarrow is installed, else 'jsonl'."""
+    from Utilities.disk_storage import PYARROW_AVAILABLE
+    return 'parquet' if PYARROW_AVAILABLE else 'jsonl'
+
+
+def clear_job_results(job_dir: str) -> None:
+    """
+    Remove per-sequence result stores from a job directory (before a rewrite).
+    
+    Args:
+        job_dir: Job directory
+    """
+    if not os.path.isdir(job_dir):
+        return
+    for entry in os.listdir(job_dir):
+        if '_results.' in entry or entry.endswith('_stats.json'):
+            path = os.path.join(job_dir, entry)
+            shutil.rmtree(path) if os.path.isdir(path) else os.remove(path)
+
+
+def write_packed_sequences(job_dir: str, sequences: List[str], sequence_names: List[str]) -> str:
+    """
+    Write sequences as a BGZF-compressed, indexed FASTA.
+    
+    The .fai/.gzi indexes are built immediately, so single sequences (or
+    sub-ranges) can later be fetched through IndexedFasta without
+    decompressing the rest. Without Biopython the file is written as plain
+    FASTA, which is indexed the same way.
+    
+    Args:
+        job_dir: Job directory
+        sequences: DNA sequences
+        sequence_names: Sequence names (same order)
+        
+    Returns:
+        str: File name written inside *job_dir*
+    """
+    from Utilities.indexed_fasta import IndexedFasta
+    
+    path = os.path.join(job_dir, SEQUENCES_FILE)
+    try:
+        from Bio import bgzf
+        handle = bgzf.BgzfWriter(path, 'wb')
+    except ImportError:
+        path = path[:-len('.gz')]
+        handle = open(path, 'wb')
+    with handle:
+        for name, seq in zip(sequence_names, sequences):
+            seq = str(seq)
+            handle.write(f">{name}\n".encode('utf-8'))
+            for i in range(0, len(seq), 60 * 4096):  # 4096 lines per write
+                block = seq[i:i + 60 * 4096]
+                handle.write(('\n'.join(block[j:j + 60] for j in range(0, len(block), 60)) + '\n').encode('ascii', errors='replace'))
+    for stale in (path + '.fai', path + '.gzi'):
+        if os.path.exists(stale):
+            os.remove(stale)
+    IndexedFasta(path).close()  # builds .fai (and .gzi for BGZF)
+    return os.path.basename(path)
+
+
+@contextmanager
+def _job_index() -> Iterator[sqlite3.Connection]:
+    """
+    Connection to the job index.
+    
+    The index is created on first use and immediately back-filled from the
+    job directories already on disk (e.g. results saved by older versions),
+    so the first register_job() never hides earlier jobs.
+    """
+    os.makedirs(os.path.dirname(JOB_INDEX_PATH) or '.', exist_ok=True)
+    conn = sqlite3.connect(JOB_INDEX_PATH, timeout=30.0)
+    try:
+        created = conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'jobs'").fetchone() is None
+        conn.execute("CREATE TABLE IF NOT EXISTS jobs (job_id TEXT PRIMARY KEY, timestamp TEXT NOT NULL, metadata TEXT NOT NULL)")
+        if created:
+            _index_job_directories(conn)
+        yield conn
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def _insert_job(conn: sqlite3.Connection, metadata: Dict) -> None:
+    conn.execute("INSERT OR REPLACE INTO jobs (job_id, timestamp, metadata) VALUES (?, ?, ?)",
+                 (metadata['job_id'], metadata.get('timestamp', ''), json.dumps(metadata, separators=(',', ':'), default=str)))
+
+
+def _index_job_directories(conn: sqlite3.Connection, skip: Optional[set] = None) -> int:
+    """Index every job directory under RESULTS_BASE_DIR with a metadata file, except the ids in ``skip``."""
+    count = 0
+    if not os.path.isdir(RESULTS_BASE_DIR):
+        return count
+    for job_id in os.listdir(RESULTS_BASE_DIR):
+        if skip and job_id in skip:
+            continue
+        metadata_path = os.path.join(RESULTS_BASE_DIR, job_id, METADATA_FILE)
+        if not os.path.exists(metadata_path):
+            continue
+        try:
+            with open(metadata_path, 'r') as f:
+                metadata = json.load(f)
+            metadata.setdefault('job_id', job_id)
+            _insert_job(conn, metadata)
+            count += 1
+        except Exception as e:
+            logger.warning(f"Failed to index job {job_id}: {e}")
+    return count
+
+
+def register_job(metadata: Dict) -> None:
+    """
+    Add or update a job in the job index.
+    
+    Args:
+        metadata: Job metadata (must contain 'job_id' and 'timestamp')
+    """
+    with _job_index() as conn:
+        _insert_job(conn, metadata)
+
+
+def rebuild_job_index() -> int:
+    """
+    Re-create the job index from the metadata files under RESULTS_BASE_DIR.
+    
+    Returns:
+        int: Number of jobs indexed
+    """
+    with _job_index() as conn:
+        conn.execute("DELETE FROM jobs")
+        return _index_job_directories(conn)
+
+
 def save_job_results(
     job_id: str,
     results: List[List[Dict]],
@@ -92,10 +270,12 @@ def save_job_results(
     """
     Save analysis results to disk under the job ID.
     
-    Creates the following files in results/<job_id>/:
-    - results.json: All motif detection results
-    - metadata.json: Job metadata (timestamp, sequence info)
-    - sequences.json: Original sequences (for re-analysis if needed)
+    Creates the following in results/<job_id>/:
+    - <seq_id>_results.parquet/: Compressed columnar motifs, one store per sequence
+    - sequences.fa.gz (+ .fai/.gzi): Packed original sequences (for re-analysis if needed)
+    - metadata.json: Job metadata (timestamp, sequence info, per-sequence manifest)
+    
+    and records the job in the job index.
     
     Args:
         job_id: The job identifier
@@ -108,45 +288,50 @@ def save_job_results(
         bool: True if save succeeded, False otherwise
     """
     try:
+        from Utilities.disk_storage import create_results_storage
+        
         job_dir = ensure_job_directory(job_id)
+        backend = job_results_backend()
+        clear_job_results(job_dir)
         
         # Save results
-        results_path = os.path.join(job_dir, "results.json")
-        with open(results_path, 'w') as f:
-            json.dump(results, f, indent=2)
+        manifest = []
+        for index, (name, motifs, seq) in enumerate(zip(sequence_names, results, sequences)):
+            seq_id = job_seq_id(index, name)
+            storage = create_results_storage(job_dir, seq_id, backend=backend)
+            storage.append_batch(list(motifs))
+            if hasattr(storage, 'close'):
+                storage.close()
+            manifest.append({'name': name, 'seq_id': seq_id, 'length': len(seq), 'motifs': len(motifs)})
         
         # Save sequences
-        sequences_path = os.path.join(job_dir, "sequences.json")
-        sequences_data = {
-            "sequences": sequences,
-            "names": sequence_names
-        }
-        with open(sequences_path, 'w') as f:
-            json.dump(sequences_data, f, indent=2)
+        sequences_file = write_packed_sequences(job_dir, sequences, sequence_names)
         
         # Save metadata
-        metadata_path = os.path.join(job_dir, "metadata.json")
         job_metadata = {
             "job_id": job_id,
             "timestamp": datetime.now().isoformat(),
             "num_sequences": len(sequences),
             "sequence_names": sequence_names,
             "total_bp": sum(len(seq) for seq in sequences),
-            "total_motifs": sum(len(motif_list) for motif_list in results)
+            "total_motifs": sum(len(motif_list) for motif_list in results),
+            "results_backend": backend,
+            "sequences_file": sequences_file,
+            "sequences": manifest
         }
         
         # Add any additional metadata provided (user metadata in separate namespace)
         if metadata:
             # Prevent overwriting critical system fields
-            reserved_keys = {'job_id', 'timestamp', 'num_sequences', 'sequence_names', 'total_bp', 'total_motifs'}
             for key, value in metadata.items():
-                if key not in reserved_keys:
+                if key not in _RESERVED_KEYS:
                     job_metadata[key] = value
                 else:
                     logger.warning(f"Ignoring metadata key '{key}' - reserved for system use")
         
-        with open(metadata_path, 'w') as f:
-            json.dump(job_metadata, f, indent=2)
+        with open(os.path.join(job_dir, METADATA_FILE), 'w') as f:
+            json.dump(job_metadata, f, separators=(',', ':'), default=str)
+        register_job(job_metadata)
         
         logger.info(f"Job {job_id} saved successfully to {job_dir}")
         return True
@@ -156,10 +341,22 @@ def save_job_results(
         return False
 
 
+def _load_legacy_job(job_dir: str) -> Tuple[List[List[Dict]], List[str], List[str]]:
+    """Read results.json / sequences.json written by older versions."""
+    with open(os.path.join(job_dir, "results.json"), 'r') as f:
+        results = json.load(f)
+    with open(os.path.join(job_dir, "sequences.json"), 'r') as f:
+        sequences_data = json.load(f)
+    return results, sequences_data.get("sequences", []), sequences_data.get("names", [])
+
+
 def load_job_results(job_id: str) -> Optional[Tuple[List[List[Dict]], List[str], List[str], Dict]]:
     """
     Load analysis results from disk for a given job ID.
     
+    Materialises every motif and sequence; prefer get_job_summary(),
+    load_job_stats() or load_job_page() when only part of a job is needed.
+    
     Args:
         job_id: The job identifier
         
@@ -174,34 +371,18 @@ def load_job_results(job_id: str) -> Optional[Tuple[List[List[Dict]], List[str],
             logger.warning(f"Job {job_id} not found at {job_dir}")
             return None
         
-        # Load results
-        results_path = os.path.join(job_dir, "results.json")
-        if not os.path.exists(results_path):
-            logger.error(f"Results file missing for job {job_id}")
-            return None
-        
-        with open(results_path, 'r') as f:
-            results = json.load(f)
-        
-        # Load sequences
-        sequences_path = os.path.join(job_dir, "sequences.json")
-        if not os.path.exists(sequences_path):
-            logger.error(f"Sequences file missing for job {job_id}")
+        metadata = get_job_summary(job_id) or {}
+        if 'sequences' in metadata:
+            results = [list(entry['storage'].iter_results()) for entry in open_job_results(job_id)]
+            fasta = open_job_sequences(job_id)
+            sequence_names = [entry['name'] for entry in metadata['sequences']]
+            sequences = [str(record) for record in fasta.iter_records()] if fasta is not None else []
+        elif os.path.exists(os.path.join(job_dir, "results.json")):
+            results, sequences, sequence_names = _load_legacy_job(job_dir)
+        else:
+            logger.error(f"Results missing for job {job_id}")
             return None
         
-        with open(sequences_path, 'r') as f:
-            sequences_data = json.load(f)
-        
-        sequences = sequences_data.get("sequences", [])
-        sequence_names = sequences_data.get("names", [])
-        
-        # Load metadata
-        metadata_path = os.path.join(job_dir, "metadata.json")
-        metadata = {}
-        if os.path.exists(metadata_path):
-            with open(metadata_path, 'r') as f:
-                metadata = json.load(f)
-        
         logger.info(f"Job {job_id} loaded successfully from {job_dir}")
         return results, sequences, sequence_names, metadata
         
@@ -210,6 +391,64 @@ def load_job_results(job_id: str) -> Optional[Tuple[List[List[Dict]], List[str],
         return None
 
 
+def open_job_sequences(job_id: str):
+    """
+    Random-access view of a job's packed input sequences.
+    
+    Args:
+        job_id: The job identifier
+        
+    Returns:
+        IndexedFasta over the job's sequence file (or the input file of a
+        queued job), or None if unavailable
+    """
+    from Utilities.indexed_fasta import IndexedFasta
+    
+    summary = get_job_summary(job_id) or {}
+    name = summary.get('sequences_file')
+    # Queued jobs (job_worker) keep no copy; their input file is the sequence source
+    path = os.path.join(get_job_directory(job_id), name) if name else summary.get('input_path')
+    if not path or not os.path.exists(path):
+        return None
+    try:
+        return IndexedFasta(path)
+    except ValueError as e:
+        logger.warning(f"Sequences of job {job_id} are not indexable: {e}")
+        return None
+
+
+def load_job_stats(job_id: str, seq_index: int = 0) -> Optional[Dict]:
+    """
+    Summary statistics of one sequence's results, read from store metadata only.
+    
+    Args:
+        job_id: The job identifier
+        seq_index: Sequence position within the job
+        
+    Returns:
+        Dict with total_count, class_distribution, ... or None if not found
+    """
+    entries = open_job_results(job_id)
+    return entries[seq_index]['storage'].get_summary_stats() if 0 <= seq_index < len(entries) else None
+
+
+def load_job_page(job_id: str, seq_index: int = 0, page: int = 0, page_size: int = 100) -> List[Dict]:
+    """
+    One page of one sequence's motifs (only the covering row groups are read).
+    
+    Args:
+        job_id: The job identifier
+        seq_index: Sequence position within the job
+        page: Page index (0-based)
+        page_size: Motifs per page
+        
+    Returns:
+        List of up to page_size motif dictionaries
+    """
+    entries = open_job_results(job_id)
+    return entries[seq_index]['storage'].get_page(page, page_size) if 0 <= seq_index < len(entries) else []
+
+
 def job_exists(job_id: str) -> bool:
     """
     Check if a job exists on disk.
@@ -221,45 +460,34 @@ def job_exists(job_id: str) -> bool:
         bool: True if job directory and results exist
     """
     job_dir = get_job_directory(job_id)
-    results_path = os.path.join(job_dir, "results.json")
-    return os.path.exists(job_dir) and os.path.exists(results_path)
+    if os.path.exists(os.path.join(job_dir, "results.json")):
+        return True
+    return 'sequences' in (get_job_summary(job_id) or {})
 
 
 def list_all_jobs() -> List[Dict]:
     """
     List all available jobs with their metadata.
     
+    Reads the job index. Job directories that are on disk but missing from
+    the index (e.g. results written by older versions, or copied in by hand)
+    are indexed first; only their ids are compared, so this stays cheap.
+    
     Returns:
         List of job metadata dictionaries, sorted by timestamp (newest first)
     """
-    jobs = []
-    
-    if not os.path.exists(RESULTS_BASE_DIR):
-        return jobs
-    
     try:
-        for job_id in os.listdir(RESULTS_BASE_DIR):
-            job_dir = os.path.join(RESULTS_BASE_DIR, job_id)
-            
-            if not os.path.isdir(job_dir):
-                continue
-            
-            metadata_path = os.path.join(job_dir, "metadata.json")
-            if os.path.exists(metadata_path):
-                try:
-                    with open(metadata_path, 'r') as f:
-                        metadata = json.load(f)
-                        jobs.append(metadata)
-                except Exception as e:
-                    logger.warning(f"Failed to load metadata for job {job_id}: {e}")
-        
-        # Sort by timestamp, newest first
-        jobs.sort(key=lambda x: x.get('timestamp', ''), reverse=True)
-        
+        if not os.path.isdir(RESULTS_BASE_DIR):
+            return []
+        with _job_index() as conn:
+            indexed = {row[0] for row in conn.execute("SELECT job_id FROM jobs")}
+            if any(job_id not in indexed for job_id in os.listdir(RESULTS_BASE_DIR) if os.path.exists(os.path.join(RESULTS_BASE_DIR, job_id, METADATA_FILE))):
+                _index_job_directories(conn, skip=indexed)
+            rows = conn.execute("SELECT metadata FROM jobs ORDER BY timestamp DESC").fetchall()
+        return [json.loads(row[0]) for row in rows]
     except Exception as e:
         logger.error(f"Failed to list jobs: {e}")
-    
-    return jobs
+        return []
 
 
 def get_job_summary(job_id: str) -> Optional[Dict]:
@@ -274,8 +502,13 @@ def get_job_summary(job_id: str) -> Optional[Dict]:
     """
     try:
         job_dir = get_job_directory(job_id)
-        metadata_path = os.path.join(job_dir, "metadata.json")
+        if os.path.exists(JOB_INDEX_PATH):
+            with _job_index() as conn:
+                row = conn.execute("SELECT metadata FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+            if row is not None:
+                return json.loads(row[0])
         
+        metadata_path = os.path.join(job_dir, METADATA_FILE)
         if not os.path.exists(metadata_path):
             return None
         
@@ -285,3 +518,30 @@ def get_job_summary(job_id: str) -> Optional[Dict]:
     except Exception as e:
         logger.error(f"Failed to get summary for job {job_id}: {e}")
         return None
+
+
+def open_job_results(job_id: str) -> List[Dict]:
+    """
+    Open the per-sequence result stores of a job.
+    
+    Args:
+        job_id: The job identifier
+        
+    Returns:
+        List of dicts with 'name', 'length', 'motifs' (count), 'partial' (cut short by the
+        job's run budget) and 'storage' (ParquetResultsStorage / UniversalResultsStorage),
+        in input order.
+        Empty if the job has no manifest (not finished, or an older layout).
+    """
+    from Utilities.disk_storage import create_results_storage
+    
+    summary = get_job_summary(job_id)
+    if not summary or 'sequences' not in summary:
+        return []
+    job_dir = get_job_directory(job_id)
+    backend = summary.get('results_backend', 'jsonl')
+    return [
+        {'name': entry['name'], 'length': entry['length'], 'motifs': entry['motifs'], 'partial': entry.get('partial', False),
+         'storage': create_results_storage(job_dir, entry['seq_id'], backend=backend)}
+        for entry in summary['sequences']
+    ]
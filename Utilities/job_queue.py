@@ -0,0 +1,215 @@
+"""
+┌──────────────────────────────────────────────────────────────────────────────┐
+│ Job Queue - SQLite-Backed Queue for Detached Analysis Workers                │
+├──────────────────────────────────────────────────────────────────────────────┤
+│ Author: Dr. Venkata Rajesh Yella | License: MIT | Version: 2024.1            │
+└──────────────────────────────────────────────────────────────────────────────┘
+
+DESCRIPTION:
+    Analyses started from the Streamlit UI run in the request thread and die
+    with the browser session. This module stores jobs in a local SQLite
+    database instead. `nonbdna-worker` processes (Utilities.job_worker) claim
+    queued jobs, write motifs to the columnar results store under
+    results/<job_id>/, and report progress. The UI only needs the job id to
+    poll.
+
+    jobs table:
+        job_id       10-char hex id (job_manager.generate_job_id)
+        input_path   FASTA / FASTA.gz / BGZF path readable by the worker
+        params       JSON (enabled_classes, chunk_size, chunk_overlap, ...)
+        status       queued | running | done | failed | cancelled
+        progress     0.0 - 1.0, message: short human-readable stage text
+        result_path  results/<job_id> once the worker has started writing
+        worker, heartbeat_at   claiming worker id and last progress write
+        created_at, started_at, finished_at, error
+
+    Claims are atomic (BEGIN IMMEDIATE), so any number of workers can share
+    one database file. If a worker dies, its running jobs stop getting
+    heartbeats, and requeue_stale() puts them back in the queue.
+
+CONFIGURATION (environment):
+    NONBDNA_JOB_DB   SQLite path (default: results/jobs.sqlite)
+
+USAGE:
+    from Utilities.job_queue import JobQueue
+
+    queue = JobQueue()
+    job_id = queue.submit('/data/genomes/hg38.fa.gz', {'enabled_classes': ['G-Quadruplex']})
+    queue.get(job_id)['progress']
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+from Utilities.job_manager import RESULTS_BASE_DIR, generate_job_id, get_job_directory
+
+logger = logging.getLogger(__name__)
+
+JOB_DB_PATH = os.environ.get('NONBDNA_JOB_DB', os.path.join(RESULTS_BASE_DIR, 'jobs.sqlite'))
+
+JOB_STATUSES = ('queued', 'running', 'done', 'failed', 'cancelled')
+FINISHED_STATUSES = ('done', 'failed', 'cancelled')
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id       TEXT PRIMARY KEY,
+    input_path   TEXT NOT NULL,
+    params       TEXT NOT NULL DEFAULT '{}',
+    status       TEXT NOT NULL DEFAULT 'queued',
+    progress     REAL NOT NULL DEFAULT 0.0,
+    message      TEXT NOT NULL DEFAULT '',
+    result_path  TEXT,
+    error        TEXT,
+    worker       TEXT,
+    created_at   REAL NOT NULL,
+    started_at   REAL,
+    finished_at  REAL,
+    heartbeat_at REAL
+);
+CREATE INDEX IF NOT EXISTS jobs_status_created ON jobs (status, created_at);
+"""
+
+
+class JobCancelled(Exception):
+    """Raised inside a worker when its job was cancelled from the UI."""
+
+
+class JobQueue:
+    """
+    Thin wrapper around the jobs table. Every call opens a short-lived
+    connection, so instances are cheap and safe to share across threads
+    (Streamlit reruns) and processes (workers).
+    """
+
+    def __init__(self, db_path: Optional[str] = None):
+        self.db_path = db_path or JOB_DB_PATH
+        os.makedirs(os.path.dirname(os.path.abspath(self.db_path)), exist_ok=True)
+        with self._connect() as conn:
+            conn.executescript(_SCHEMA)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(self.db_path, timeout=30.0, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        try:
+            conn.execute('PRAGMA journal_mode=WAL')   # readers (UI polling) never block the writer
+            yield conn
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _row_to_job(row: Optional[sqlite3.Row]) -> Optional[Dict[str, Any]]:
+        if row is None:
+            return None
+        job = dict(row)
+        job['params'] = json.loads(job['params'] or '{}')
+        return job
+
+    # ------------------------------------------------------------------ #
+    # Submission / lookup (UI side)
+    # ------------------------------------------------------------------ #
+
+    def submit(self, input_path: str, params: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Queue a FASTA file for analysis.
+
+        Args:
+            input_path: Path readable by the worker processes
+            params: Analysis parameters (JSON-serialisable)
+
+        Returns:
+            New job id
+        """
+        job_id = generate_job_id()
+        with self._connect() as conn:
+            conn.execute('INSERT INTO jobs (job_id, input_path, params, created_at) VALUES (?, ?, ?, ?)',
+                         (job_id, os.path.abspath(input_path), json.dumps(params or {}), time.time()))
+        logger.info(f"Queued job {job_id} for {input_path}")
+        return job_id
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Job row as a dict (params decoded), or None."""
+        with self._connect() as conn:
+            return self._row_to_job(conn.execute('SELECT * FROM jobs WHERE job_id = ?', (job_id,)).fetchone())
+
+    def list_jobs(self, status: Optional[str] = None, limit: int = 200) -> List[Dict[str, Any]]:
+        """Most recent jobs first, optionally filtered by status."""
+        with self._connect() as conn:
+            if status:
+                rows = conn.execute('SELECT * FROM jobs WHERE status = ? ORDER BY created_at DESC LIMIT ?', (status, limit)).fetchall()
+            else:
+                rows = conn.execute('SELECT * FROM jobs ORDER BY created_at DESC LIMIT ?', (limit,)).fetchall()
+        return [self._row_to_job(r) for r in rows]
+
+    def cancel(self, job_id: str) -> bool:
+        """Cancel a queued or running job (a running worker stops at its next progress update)."""
+        with self._connect() as conn:
+            cur = conn.execute("UPDATE jobs SET status = 'cancelled', finished_at = ? WHERE job_id = ? AND status IN ('queued', 'running')",
+                               (time.time(), job_id))
+        return cur.rowcount > 0
+
+    # ------------------------------------------------------------------ #
+    # Worker side
+    # ------------------------------------------------------------------ #
+
+    def claim(self, worker_id: str) -> Optional[Dict[str, Any]]:
+        """Atomically move the oldest queued job to 'running' for ``worker_id``; None if the queue is empty."""
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute('BEGIN IMMEDIATE')
+            try:
+                row = conn.execute("SELECT job_id FROM jobs WHERE status = 'queued' ORDER BY created_at LIMIT 1").fetchone()
+                if row is None:
+                    conn.execute('COMMIT')
+                    return None
+                job_id = row['job_id']
+                conn.execute("UPDATE jobs SET status = 'running', worker = ?, started_at = ?, heartbeat_at = ?, progress = 0.0, "
+                             "message = 'starting', error = NULL, result_path = ? WHERE job_id = ?",
+                             (worker_id, now, now, get_job_directory(job_id), job_id))
+                conn.execute('COMMIT')
+            except Exception:
+                conn.execute('ROLLBACK')
+                raise
+            return self._row_to_job(conn.execute('SELECT * FROM jobs WHERE job_id = ?', (job_id,)).fetchone())
+
+    def update_progress(self, job_id: str, progress: float, message: str = '') -> None:
+        """
+        Record progress and heartbeat for a running job.
+
+        Raises:
+            JobCancelled: If the job is no longer 'running' (cancelled from the UI or requeued)
+        """
+        with self._connect() as conn:
+            cur = conn.execute("UPDATE jobs SET progress = ?, message = ?, heartbeat_at = ? WHERE job_id = ? AND status = 'running'",
+                               (max(0.0, min(1.0, float(progress))), message, time.time(), job_id))
+        if cur.rowcount == 0:
+            raise JobCancelled(job_id)
+
+    def complete(self, job_id: str, result_path: str, message: str = 'done') -> None:
+        with self._connect() as conn:
+            conn.execute("UPDATE jobs SET status = 'done', progress = 1.0, message = ?, result_path = ?, finished_at = ? WHERE job_id = ? AND status = 'running'",
+                         (message, result_path, time.time(), job_id))
+
+    def fail(self, job_id: str, error: str) -> None:
+        with self._connect() as conn:
+            conn.execute("UPDATE jobs SET status = 'failed', error = ?, finished_at = ? WHERE job_id = ? AND status = 'running'",
+                         (error, time.time(), job_id))
+
+    def requeue(self, job_id: str) -> None:
+        """Put a running job back in the queue (worker shutting down before finishing it)."""
+        with self._connect() as conn:
+            conn.execute("UPDATE jobs SET status = 'queued', worker = NULL, progress = 0.0, message = 'requeued' WHERE job_id = ? AND status = 'running'", (job_id,))
+
+    def requeue_stale(self, timeout: float) -> int:
+        """Requeue running jobs whose worker has not written a heartbeat for ``timeout`` seconds; returns the count."""
+        with self._connect() as conn:
+            cur = conn.execute("UPDATE jobs SET status = 'queued', worker = NULL, progress = 0.0, message = 'requeued (worker lost)' "
+                               "WHERE status = 'running' AND heartbeat_at < ?", (time.time() - timeout,))
+        if cur.rowcount:
+            logger.warning(f"Requeued {cur.rowcount} stale job(s)")
+        return cur.rowcount
@@ -0,0 +1,219 @@
+"""
+┌──────────────────────────────────────────────────────────────────────────────┐
+│ Job Worker - Detached `nonbdna-worker` Process for the SQLite Job Queue      │
+├──────────────────────────────────────────────────────────────────────────────┤
+│ Author: Dr. Venkata Rajesh Yella | License: MIT | Version: 2024.1            │
+└──────────────────────────────────────────────────────────────────────────────┘
+
+DESCRIPTION:
+    Claims jobs from Utilities.job_queue and runs them with nothing attached:
+    no browser session, no Streamlit thread. Start one or more workers and
+    leave them running overnight:
+
+        nonbdna-worker                      # poll forever
+        nonbdna-worker --once               # drain the queue, then exit
+        python -m Utilities.job_worker      # same, without installing
+
+    For each job the input FASTA is opened through IndexedFasta, so records
+    stream from disk. All records of the file share one RecordScheduler
+    (Utilities.record_scheduler): long records are chunked, short contigs
+    are batched, and every task runs on the shared detector pool. Each
+    record's motifs are written to the columnar results store
+    (ParquetResultsStorage; JSONL if pyarrow is missing) under
+    results/<job_id>/ as soon as the record completes. Progress (bp
+    processed / total bp) goes back to the queue after every task, and
+    doubles as the worker's heartbeat.
+
+    A job cancelled from the UI stops at the next progress update: its
+    queued detector tasks are cancelled and the tasks already running on
+    the detector pool are terminated, so the worker's cores are free for
+    the next job at once. On SIGTERM/SIGINT the running job is requeued,
+    not failed.
+
+    Each job runs under a RunBudget (Utilities.run_budget). The limits come
+    from the job params max_wall_s / max_rss_mb / chunk_timeout_s, or else
+    from the NONBDNA_MAX_WALL_S / NONBDNA_MAX_RSS_MB / NONBDNA_CHUNK_TIMEOUT_S
+    environment of the worker. A job that runs out of budget still finishes
+    as done, with the motifs found so far. Its metadata carries the budget
+    report, and its records are flagged ``partial``.
+
+LAYOUT (results/<job_id>/):
+    <seq_id>_results.parquet/part-*.parquet   one store per record
+    metadata.json                             job_manager summary + per-record manifest + budget report (also in the job index)
+"""
+
+import argparse
+import json
+import logging
+import os
+import signal
+import socket
+import sys
+import time
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from Utilities.disk_storage import create_results_storage
+from Utilities.job_manager import METADATA_FILE, clear_job_results, ensure_job_directory, get_job_directory, job_results_backend, job_seq_id, register_job
+from Utilities.job_queue import JobCancelled, JobQueue
+
+logger = logging.getLogger(__name__)
+
+POLL_INTERVAL = 5.0          # seconds between queue polls when idle
+STALE_TIMEOUT = 3600.0       # requeue running jobs without a heartbeat for this long
+
+# Parameters forwarded from the job row to RecordScheduler (use_parallel_chunks=False runs detectors inline)
+_ANALYSIS_PARAMS = ('enabled_classes', 'chunk_size', 'chunk_overlap')
+_BUDGET_PARAMS = ('max_wall_s', 'max_rss_mb', 'chunk_timeout_s')
+
+
+class _Shutdown(Exception):
+    """Raised from the signal handler to unwind the running job."""
+
+
+def _iter_input_records(path: str) -> Tuple[List[Tuple[str, int]], Iterator[Tuple[str, Any]]]:
+    """
+    (name, length) for every record plus an iterator of (name, sequence).
+
+    IndexedFasta (plain or bgzip) yields lazy FastaRecord views. Plain gzip
+    cannot be indexed, so it is parsed into memory instead.
+    """
+    from Utilities.indexed_fasta import IndexedFasta
+    try:
+        fasta = IndexedFasta(path)
+        records = list(fasta.iter_records())
+        return [(r.name, len(r)) for r in records], ((r.name, r) for r in records)
+    except ValueError as e:
+        from Utilities.utilities import parse_fasta_chunked_compressed
+        logger.warning(f"{path} is not indexable ({e}); loading records into memory")
+        sequences = list(parse_fasta_chunked_compressed(path))
+        return [(name, len(seq)) for name, seq in sequences], iter(sequences)
+
+
+def run_job(queue: JobQueue, job: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Analyze every record of ``job['input_path']`` and write results to the job directory.
+
+    Returns:
+        job_manager-style metadata dict (also written to metadata.json)
+
+    Raises:
+        JobCancelled: If the job was cancelled while running
+    """
+    from Utilities.record_scheduler import RecordScheduler
+
+    job_id = job['job_id']; params = job['params']
+    job_dir = ensure_job_directory(job_id)
+    clear_job_results(job_dir)  # partial stores from an earlier, interrupted attempt
+    lengths, records = _iter_input_records(job['input_path'])
+    records = list(records)
+    total_bp = max(1, sum(length for _, length in lengths))
+    kwargs = {k: params[k] for k in _ANALYSIS_PARAMS if params.get(k) is not None}
+    if params.get('use_parallel_chunks') is False: kwargs['max_workers'] = 1
+    limits = {k: params[k] for k in _BUDGET_PARAMS if params.get(k)}
+    kwargs['budget'] = limits or None
+    backend = job_results_backend()
+    queue.update_progress(job_id, 0.0, f"{len(lengths)} record(s), {total_bp:,} bp")
+
+    manifest: List[Dict[str, Any]] = []; done_records = 0; start = time.time()
+    scheduler = RecordScheduler(**kwargs)
+    on_task = lambda bp_done, bp_total: queue.update_progress(job_id, bp_done / max(1, bp_total), f"{done_records}/{len(records)} record(s) done")
+    for index, motifs in scheduler.run(records, progress_callback=on_task):
+        if index in scheduler.errors:
+            raise ValueError(f"{records[index][0]}: {scheduler.errors[index]}")
+        name, sequence = records[index]
+        seq_id = job_seq_id(index, name)
+        storage = create_results_storage(job_dir, seq_id, backend=backend)
+        storage.append_batch(motifs)
+        if hasattr(storage, 'close'): storage.close()
+        manifest.append({'name': name, 'seq_id': seq_id, 'length': len(sequence), 'motifs': len(motifs), 'index': index, 'partial': index in scheduler.partial})
+        done_records += 1
+    manifest.sort(key=lambda m: m.pop('index'))
+    done_bp = sum(m['length'] for m in manifest)
+
+    metadata = {
+        'job_id': job_id,
+        'timestamp': datetime.now().isoformat(),
+        'num_sequences': len(manifest),
+        'sequence_names': [m['name'] for m in manifest],
+        'total_bp': done_bp,
+        'total_motifs': sum(m['motifs'] for m in manifest),
+        'input_path': job['input_path'],
+        'params': params,
+        'results_backend': backend,
+        'sequences': manifest,
+        'elapsed_seconds': round(time.time() - start, 2),
+        'budget': scheduler.budget.report() if scheduler.budget is not None else None,
+    }
+    with open(os.path.join(job_dir, METADATA_FILE), 'w') as f:
+        json.dump(metadata, f, separators=(',', ':'), default=str)
+    register_job(metadata)
+    return metadata
+
+
+def work(queue: JobQueue, worker_id: str, once: bool = False, poll_interval: float = POLL_INTERVAL, stale_timeout: float = STALE_TIMEOUT) -> int:
+    """
+    Claim and run jobs until the queue is empty (``once``) or a shutdown signal arrives.
+
+    Returns:
+        Number of jobs finished (done or failed)
+    """
+    finished = 0
+    while True:
+        queue.requeue_stale(stale_timeout)
+        job = queue.claim(worker_id)
+        if job is None:
+            if once:
+                return finished
+            time.sleep(poll_interval)
+            continue
+        job_id = job['job_id']
+        logger.info(f"[{worker_id}] running job {job_id} ({job['input_path']})")
+        try:
+            metadata = run_job(queue, job)
+            budget = metadata['budget'] or {}
+            note = f" (partial: {budget['stop_reason'] or 'chunk_timeout'})" if budget.get('status') == 'partial' else ''
+            queue.complete(job_id, get_job_directory(job_id), f"{metadata['total_motifs']:,} motifs in {metadata['num_sequences']} record(s){note}")
+            logger.info(f"[{worker_id}] job {job_id} done ({metadata['total_motifs']} motifs)")
+        except JobCancelled:
+            # Queued tasks were cancelled as the scheduler unwound; running ones would finish otherwise
+            from Utilities.detector_scheduler import shutdown_detector_pool
+            shutdown_detector_pool(wait_for_tasks=False, terminate=True)
+            logger.info(f"[{worker_id}] job {job_id} cancelled")
+        except (_Shutdown, KeyboardInterrupt):
+            queue.requeue(job_id)
+            logger.info(f"[{worker_id}] shutting down; job {job_id} requeued")
+            raise
+        except Exception as e:
+            logger.exception(f"[{worker_id}] job {job_id} failed")
+            queue.fail(job_id, f"{type(e).__name__}: {e}")
+        finished += 1
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Entry point for the ``nonbdna-worker`` console script."""
+    parser = argparse.ArgumentParser(prog='nonbdna-worker', description='Run queued NonBDNAFinder analysis jobs.')
+    parser.add_argument('--db', default=None, help='Job database (default: NONBDNA_JOB_DB or results/jobs.sqlite)')
+    parser.add_argument('--once', action='store_true', help='Exit when the queue is empty instead of polling')
+    parser.add_argument('--poll-interval', type=float, default=POLL_INTERVAL, help='Seconds between polls when idle')
+    parser.add_argument('--stale-timeout', type=float, default=STALE_TIMEOUT, help='Requeue running jobs without a heartbeat for this many seconds')
+    parser.add_argument('--log-level', default='INFO')
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=args.log_level.upper(), format='%(asctime)s %(levelname)s %(name)s: %(message)s')
+
+    def on_signal(signum, frame):
+        raise _Shutdown(signal.Signals(signum).name)
+    signal.signal(signal.SIGTERM, on_signal)
+
+    worker_id = f"{socket.gethostname()}:{os.getpid()}"
+    queue = JobQueue(args.db)
+    logger.info(f"Worker {worker_id} polling {queue.db_path}")
+    try:
+        work(queue, worker_id, once=args.once, poll_interval=args.poll_interval, stale_timeout=args.stale_timeout)
+    except (_Shutdown, KeyboardInterrupt):
+        pass
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -39,9 +39,6 @@ from typing import Dict, List, Any, Optional, Callable
 from collections import defaultdict
 import math
 import logging
-from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
-import multiprocessing
-import os
 
 logger = logging.getLogger(__name__)
 
@@ -168,128 +165,19 @@ class MultiFastaEngine:
 # PARALLEL PROCESSING FUNCTIONS FOR MULTI-FASTA ANALYSIS
 # =============================================================================
 
-def _analyze_single_sequence_worker(args):
-    """
-    Worker function for parallel sequence analysis.
-    This function is called by ProcessPoolExecutor/ThreadPoolExecutor.
-    
-    Args:
-        args: Tuple of (seq_or_seq_id, name, index, analysis_params)
-            - seq_or_seq_id: Either the sequence string or sequence ID for disk storage
-            - name: Sequence name
-            - index: Sequence index
-            - analysis_params: Dict with analysis configuration
-    
-    Returns:
-        Dict with analysis results and metadata
-    """
-    from Utilities.nonbscanner import analyze_sequence
-    from Utilities.chunk_analyzer import ChunkAnalyzer
-    from Utilities.disk_storage import UniversalResultsStorage
-    import time
-    
-    seq_or_seq_id, name, index, analysis_params = args
-    
-    try:
-        start_time = time.time()
-        
-        # Extract parameters
-        use_disk_storage = analysis_params.get('use_disk_storage', False)
-        seq_storage = analysis_params.get('seq_storage')
-        enabled_classes = analysis_params.get('enabled_classes')
-        chunk_threshold = analysis_params.get('chunk_threshold', 1_000_000)
-        
-        if use_disk_storage:
-            # Disk storage mode
-            seq_id = seq_or_seq_id
-            metadata = seq_storage.get_metadata(seq_id)
-            seq_length = metadata['length']
-            
-            # Determine whether to use chunking
-            if seq_length > chunk_threshold:
-                # Use chunk analyzer
-                # NOTE: use_parallel=False to avoid nested parallelism since we're already
-                # in a parallel worker. The sequence-level parallelism is sufficient.
-                analyzer = ChunkAnalyzer(
-                    seq_storage,
-                    use_parallel=False,  # Disable nested parallelism
-                    max_workers=None,
-                    use_adaptive=False
-                )
-                
-                results_storage = analyzer.analyze(
-                    seq_id=seq_id,
-                    progress_callback=None,  # No callback in parallel mode
-                    enabled_classes=enabled_classes
-                )
-                
-                # Get results
-                results = list(results_storage.iter_results())
-                total_motifs = results_storage.get_summary_stats()['total_count']
-            else:
-                # Standard analysis
-                seq = seq_storage.get_sequence_chunk(seq_id, 0, seq_length)
-                results = analyze_sequence(seq, name, enabled_classes=enabled_classes)
-                
-                # Create results storage and save results
-                # NOTE: This path handles non-chunked disk storage scenarios
-                # Test coverage: Requires test with disk storage + sequence < chunk_threshold
-                results_storage = UniversalResultsStorage(
-                    base_dir=str(seq_storage.base_dir / "results"),
-                    seq_id=seq_id
-                )
-                results_storage.append_batch(results)
-            
-            elapsed = time.time() - start_time
-            
-            return {
-                'success': True,
-                'index': index,
-                'name': name,
-                'seq_id': seq_id,
-                'seq_length': seq_length,
-                'results': results,
-                'results_storage': results_storage,
-                'elapsed': elapsed,
-                'use_disk_storage': True
-            }
-        else:
-            # Legacy in-memory mode
-            seq = seq_or_seq_id
-            seq_length = len(seq)
-            
-            results = analyze_sequence(seq, name, enabled_classes=enabled_classes)
-            elapsed = time.time() - start_time
-            
-            return {
-                'success': True,
-                'index': index,
-                'name': name,
-                'seq_length': seq_length,
-                'results': results,
-                'elapsed': elapsed,
-                'use_disk_storage': False
-            }
-            
-    except Exception as e:
-        logger.error(f"Error analyzing sequence {name}: {e}")
-        return {
-            'success': False,
-            'index': index,
-            'name': name,
-            'error': str(e)
-        }
-
-
 def analyze_sequences_parallel(
     sequences_data: List[tuple],
     analysis_params: Dict[str, Any],
     max_workers: Optional[int] = None,
     progress_callback: Optional[Callable[[int, int, str], None]] = None,
-    use_processes: bool = False
+    use_processes: Optional[bool] = None
 ) -> List[Dict[str, Any]]:
     """
-    Analyze multiple sequences in parallel using ThreadPoolExecutor or ProcessPoolExecutor.
+    Analyze multiple sequences on one global task scheduler (Utilities.record_scheduler).
+    
+    Long records are split into chunk tasks and short records are batched
+    together. All tasks share the detector process pool, and each record is
+    reassembled as soon as its last chunk completes.
     
     Args:
         sequences_data: List of tuples (seq_or_seq_id, name, index)
@@ -299,73 +187,79 @@ def analyze_sequences_parallel(
             - use_disk_storage: bool
             - seq_storage: UniversalSequenceStorage (if use_disk_storage=True)
             - enabled_classes: List of class names to analyze
-            - chunk_threshold: Threshold for chunking (default: 1MB)
-        max_workers: Maximum number of worker threads/processes (default: CPU count)
+            - chunk_size / chunk_overlap: Optional chunking override
+            - budget: Optional RunBudget / limits dict for the whole batch (Utilities.run_budget)
+        max_workers: Cap on in-flight detector tasks (default: DETECTOR_WORKERS)
         progress_callback: Optional callback function(completed, total, seq_name)
-        use_processes: If True, use ProcessPoolExecutor; if False, use ThreadPoolExecutor
-            Default is False (threads) because most detectors are I/O bound
+        use_processes: Deprecated and ignored (a warning is logged); detectors always run
+            on the shared detector process pool
     
     Returns:
         List of result dictionaries, ordered by sequence index
     """
+    from Utilities.record_scheduler import RecordScheduler, StoredSequence
+    from Utilities.disk_storage import create_results_storage
+    
+    if use_processes is not None:
+        logger.warning("analyze_sequences_parallel: use_processes is deprecated and ignored; "
+                       "detectors always run on the shared detector process pool")
     if not sequences_data:
         return []
     
-    # Determine number of workers
-    if max_workers is None:
-        max_workers = min(len(sequences_data), os.cpu_count() or 4)
-    
-    # Prepare arguments for workers
-    worker_args = [
-        (seq_or_seq_id, name, idx, analysis_params)
-        for seq_or_seq_id, name, idx in sequences_data
+    use_disk_storage = analysis_params.get('use_disk_storage', False)
+    seq_storage = analysis_params.get('seq_storage')
+    records = [
+        (name, StoredSequence(seq_storage, seq_or_seq_id) if use_disk_storage else seq_or_seq_id)
+        for seq_or_seq_id, name, _ in sequences_data
     ]
-    
-    # Choose executor based on use_processes flag
-    ExecutorClass = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+    scheduler = RecordScheduler(
+        enabled_classes=analysis_params.get('enabled_classes'),
+        chunk_size=analysis_params.get('chunk_size'),
+        chunk_overlap=analysis_params.get('chunk_overlap'),
+        max_workers=max_workers,
+        budget=analysis_params.get('budget')
+    )
     
     results_dict = {}
-    completed_count = 0
-    total_count = len(worker_args)
+    total_count = len(records)
+    logger.info(f"Starting scheduled analysis of {total_count} sequences")
     
-    logger.info(f"Starting parallel analysis of {total_count} sequences with {max_workers} workers")
-    
-    try:
-        with ExecutorClass(max_workers=max_workers) as executor:
-            # Submit all tasks
-            future_to_args = {
-                executor.submit(_analyze_single_sequence_worker, args): args
-                for args in worker_args
+    for position, results in scheduler.run(records):
+        seq_or_seq_id, name, index = sequences_data[position]
+        seq_length = len(records[position][1])
+        elapsed = scheduler.finished[position] - scheduler.started[position]
+        if position in scheduler.errors:
+            result = {'success': False, 'index': index, 'name': name, 'error': scheduler.errors[position]}
+            logger.error(f"Failed {len(results_dict) + 1}/{total_count}: {name} - {result['error']}")
+        else:
+            result = {
+                'success': True,
+                'index': index,
+                'name': name,
+                'seq_length': seq_length,
+                'results': results,
+                'elapsed': elapsed,
+                'use_disk_storage': use_disk_storage,
+                'partial': position in scheduler.partial
             }
-            
-            # Process completed tasks as they finish
-            for future in as_completed(future_to_args):
-                try:
-                    result = future.result()
-                    results_dict[result['index']] = result
-                    completed_count += 1
-                    
-                    # Call progress callback if provided
-                    if progress_callback:
-                        progress_callback(completed_count, total_count, result['name'])
-                    
-                    if result['success']:
-                        logger.info(f"Completed {completed_count}/{total_count}: {result['name']} "
-                                  f"({result['seq_length']:,} bp, {len(result.get('results', [])):,} motifs, "
-                                  f"{result['elapsed']:.2f}s)")
-                    else:
-                        logger.error(f"Failed {completed_count}/{total_count}: {result['name']} - {result.get('error')}")
-                
-                except Exception as e:
-                    logger.error(f"Error processing future: {e}")
-                    completed_count += 1
-    
-    except Exception as e:
-        logger.error(f"Error in parallel execution: {e}")
-        raise
+            if use_disk_storage:
+                results_storage = create_results_storage(
+                    base_dir=str(seq_storage.base_dir / "results"),
+                    seq_id=seq_or_seq_id
+                )
+                results_storage.append_batch(results)
+                result.update(seq_id=seq_or_seq_id, results_storage=results_storage)
+            logger.info(f"Completed {len(results_dict) + 1}/{total_count}: {name} "
+                        f"({seq_length:,} bp, {len(results):,} motifs, {elapsed:.2f}s)")
+        results_dict[index] = result
+        
+        if progress_callback:
+            progress_callback(len(results_dict), total_count, name)
     
     # Return results in original order
     ordered_results = [results_dict[i] for i in sorted(results_dict.keys())]
     
-    logger.info(f"Parallel analysis complete: {total_count} sequences processed")
+    logger.info(f"Scheduled analysis complete: {total_count} sequences processed")
+    if scheduler.budget is not None and scheduler.budget.partial:
+        logger.warning(f"Scheduled analysis is {scheduler.budget.summary()}")
     return ordered_results
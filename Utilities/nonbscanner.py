@@ -15,18 +15,28 @@ import threading
 import logging
 import bisect
 import multiprocessing
-import pandas as pd
-from typing import List, Dict, Any, Optional, Union, Tuple, Callable, overload, Literal
+from typing import TYPE_CHECKING, List, Dict, Any, Optional, Union, Tuple, Callable, Iterable, overload, Literal
 from collections import defaultdict
-from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from concurrent.futures.process import BrokenProcessPool
 
+if TYPE_CHECKING:
+    import pandas as pd   # imported lazily at runtime (keeps `import nonbscanner` cheap)
+
 warnings.filterwarnings("ignore")
 logger = logging.getLogger(__name__)
 
 # Detector imports
-from Detectors import CurvedDNADetector, SlippedDNADetector, CruciformDetector, RLoopDetector, TriplexDetector, GQuadruplexDetector, IMotifDetector, ZDNADetector, APhilicDetector
-from Utilities.utilities import parse_fasta, read_fasta_file, validate_sequence, export_to_csv, export_to_bed, export_to_json, export_to_excel, calculate_motif_statistics, normalize_motif_scores
+# Detector modules are imported on first use through the registry (keeps `import nonbscanner` and spawned workers cheap)
+from Detectors.registry import LazyDetectorMap
+from Utilities.chunk_cache import scan_chunk_cached
+from Utilities.chunk_generator import plan_chunks
+from Utilities.config.analysis import CHUNKING_CONFIG
+from Utilities.detector_scheduler import DETECTOR_WORKERS, DetectorScheduler
+from Utilities.indexed_fasta import FastaRecord, IndexedFasta
+from Utilities import stage_profiler
+from Utilities.prefilter import PREFILTER_ENABLED, prefilter_sequence
+from Utilities.run_budget import DetectorCancelled, RunBudget, budget_scope, current_budget, deadline_scope
+from Utilities.utilities import parse_fasta, read_fasta_file, validate_sequence, export_to_csv, export_to_bed, export_to_json, export_to_excel, export_to_gff3, calculate_motif_statistics, normalize_motif_scores
 
 # Optional progress tracking support (for Streamlit UI integration)
 try:
@@ -42,7 +52,7 @@ __version__ = "2024.2"; __author__ = "Dr. Venkata Rajesh Yella"
 
 # === DETECTOR PARALLELIZATION THRESHOLD (PR#5) ===
 # CHUNK_THRESHOLD = 50KB triggers parallel detector execution (NOT sequence chunking!)
-# For sequences > 50KB, runs 9 detectors in parallel using ThreadPoolExecutor (1.5-2x speedup)
+# For sequences > 50KB, runs the 9 detectors as tasks on the shared detector process pool (Utilities.detector_scheduler)
 # This is SEPARATE from sequence chunking threshold (1MB in config/UI)
 CHUNK_THRESHOLD = 50000; DEFAULT_CHUNK_SIZE = 50000; DEFAULT_CHUNK_OVERLAP = 2000
 
@@ -50,10 +60,14 @@ CHUNK_THRESHOLD = 50000; DEFAULT_CHUNK_SIZE = 50000; DEFAULT_CHUNK_OVERLAP = 200
 # SEQUENCE_CHUNKING_THRESHOLD = 0 so ALL sequences use 50KB chunks with 2KB overlap
 # regardless of sequence size (RAM-only processing)
 SEQUENCE_CHUNKING_THRESHOLD = 0  # Always chunk
+# Opt-in (NONBDNA_ADAPTIVE_CHUNKS=true): without an explicit chunk_size, sequences longer than DEFAULT_CHUNK_SIZE get chunk
+# size / overlap / workers from the calibrated cost model (Utilities.adaptive_chunk_planner). The first such call calibrates
+# the model, and chunk boundaries (so motifs straddling them) then depend on this machine's timings. Default: 50KB / 2KB
+ADAPTIVE_CHUNKING = os.environ.get('NONBDNA_ADAPTIVE_CHUNKS', str(CHUNKING_CONFIG.get('enable_adaptive', False))).lower() == 'true'
 
 # Parallel detector execution for maximum performance (enabled by default for sequences >50KB)
 # MAX_DETECTOR_WORKERS limited to 9 because there are exactly 9 detector types in the system
-USE_PARALLEL_DETECTORS = True; MAX_DETECTOR_WORKERS = min(9, os.cpu_count() or 4)  # Up to 9 detectors (one per detector type)
+USE_PARALLEL_DETECTORS = True; MAX_DETECTOR_WORKERS = min(9, DETECTOR_WORKERS)  # Up to 9 detectors (one per detector type); pool size from NONBDNA_DETECTOR_WORKERS
 
 # === MOTIF CLUSTERING & OVERLAP PARAMETERS ===
 HYBRID_MIN_OVERLAP = 0.50; HYBRID_MAX_OVERLAP = 0.99
@@ -144,7 +158,7 @@ def _get_cached_scanner() -> 'NonBScanner':
 
 class NonBScanner:
     def __init__(self, enable_all_detectors: bool = True):
-        self.detectors = {'curved_dna': CurvedDNADetector(), 'slipped_dna': SlippedDNADetector(), 'cruciform': CruciformDetector(), 'r_loop': RLoopDetector(), 'triplex': TriplexDetector(), 'g_quadruplex': GQuadruplexDetector(), 'i_motif': IMotifDetector(), 'z_dna': ZDNADetector(), 'a_philic': APhilicDetector()} if enable_all_detectors else {}
+        self.detectors = LazyDetectorMap() if enable_all_detectors else {}
     
     def analyze_sequence(self, sequence: str, sequence_name: str = "sequence", progress_callback: Optional[Callable[[str, int, int, float, int], None]] = None, enabled_classes: Optional[List[str]] = None, use_parallel_detectors: bool = None, use_preprocessing: bool = False) -> List[Dict[str, Any]]:
         """Optimized sequence analysis with optional parallel detector execution.
@@ -180,109 +194,118 @@ class NonBScanner:
             sequence = preprocessing_result.sequence
         else:
             # Original validation (backward compatibility)
-            sequence = sequence.upper().strip()
-            is_valid, msg = validate_sequence(sequence)
-            if not is_valid:
-                if "too short" in msg.lower():
-                    logger.warning(f"Skipping sequence '{sequence_name}': {msg}")
-                    return []
-                raise ValueError(f"Invalid sequence: {msg}")
+            sequence = self._clean_sequence(sequence, sequence_name)
+            if sequence is None: return []
         
         # Auto-enable parallel detectors for large sequences if not specified
         if use_parallel_detectors is None:
             use_parallel_detectors = len(sequence) >= CHUNK_THRESHOLD and USE_PARALLEL_DETECTORS
         
         all_motifs = []
-        if enabled_classes:
-            enabled_detectors = {CLASS_TO_DETECTOR.get(c) for c in enabled_classes if CLASS_TO_DETECTOR.get(c) in self.detectors}
-            detectors_to_run = {k: v for k, v in self.detectors.items() if k in enabled_detectors}
-        else: detectors_to_run = self.detectors
+        detectors_to_run = self._select_detectors(enabled_classes)
         total_detectors = len(detectors_to_run); _reset_detector_timings()
+        skipped = self._prefilter_skipped(sequence, detectors_to_run)
         
         if use_parallel_detectors and total_detectors > 1:
-            # Parallel detector execution using ThreadPoolExecutor
-            all_motifs = self._analyze_parallel_detectors(sequence, sequence_name, detectors_to_run, progress_callback)
+            # (chunk, detector) tasks on the shared detector process pool (Utilities.detector_scheduler)
+            all_motifs = self._analyze_parallel_detectors(sequence, sequence_name, detectors_to_run, progress_callback, skipped=skipped)
         else:
-            # Sequential detector execution (original implementation)
+            # Sequential detector execution (original implementation); under a RunBudget this call is one chunk with one deadline
+            budget = current_budget(); deadline = budget.task_deadline() if budget is not None else None
             for idx, (detector_name, detector) in enumerate(detectors_to_run.items()):
+                if detector_name in skipped:
+                    _update_detector_timing(detector_name, 0.0)
+                    if progress_callback is not None: progress_callback(detector_name, idx + 1, total_detectors, 0.0, 0)
+                    continue
                 try:
-                    start_time = time.time(); motifs = detector.detect_motifs(sequence, sequence_name); elapsed = time.time() - start_time; motif_count = len(motifs)
+                    start_time = time.time()
+                    with deadline_scope(deadline), stage_profiler.stage('detector', detector=detector_name, bp=len(sequence)) as event: motifs = detector.detect_motifs(sequence, sequence_name); event['candidates_out'] = len(motifs)
+                    elapsed = time.time() - start_time; motif_count = len(motifs)
                     _update_detector_timing(detector_name, elapsed); all_motifs.extend(motifs)
                     if progress_callback is not None: progress_callback(detector_name, idx + 1, total_detectors, elapsed, motif_count)
+                except DetectorCancelled:
+                    if budget is not None: budget.record_truncated(stage_profiler.current_chunk() or sequence_name, detector_name)
+                    if progress_callback is not None: progress_callback(detector_name, idx + 1, total_detectors, 0.0, 0)
                 except Exception as e:
                     warnings.warn(f"Error in {detector_name} detector: {e}")
                     if progress_callback is not None: progress_callback(detector_name, idx + 1, total_detectors, 0.0, 0)
         
+        final_motifs = self._postprocess(all_motifs, sequence)
+        if stage_profiler.is_enabled(): stage_profiler.flush()
+        return final_motifs
+    
+    def _clean_sequence(self, sequence: str, sequence_name: str) -> Optional[str]:
+        """Upper-cased, stripped and validated sequence; None (with a warning) if too short. Raises ValueError if invalid."""
+        sequence = sequence.upper().strip()
+        is_valid, msg = validate_sequence(sequence)
+        if not is_valid:
+            if "too short" in msg.lower():
+                logger.warning(f"Skipping sequence '{sequence_name}': {msg}")
+                return None
+            raise ValueError(f"Invalid sequence: {msg}")
+        return sequence
+    
+    def _select_detectors(self, enabled_classes: Optional[List[str]] = None) -> Dict:
+        """detector name -> detector for ``enabled_classes`` (None/empty = all), in registry order."""
+        if not enabled_classes: return self.detectors
+        enabled_detectors = {CLASS_TO_DETECTOR.get(c) for c in enabled_classes if CLASS_TO_DETECTOR.get(c) in self.detectors}
+        return {k: self.detectors[k] for k in self.detectors if k in enabled_detectors}
+    
+    def _postprocess(self, all_motifs: List[Dict[str, Any]], sequence: str) -> List[Dict[str, Any]]:
+        """Merge raw detector output of one sequence/chunk: overlap removal, hybrids and clusters, sorted by Start."""
         # Consolidated filtering - do overlap removal once on all motifs
-        filtered_motifs = self._remove_overlaps(all_motifs)
-        hybrid_motifs = self._detect_hybrid_motifs(filtered_motifs, sequence)
-        cluster_motifs = self._detect_clusters(filtered_motifs, sequence)
+        with stage_profiler.stage('overlaps', candidates_in=len(all_motifs)) as event: filtered_motifs = self._remove_overlaps(all_motifs); event['candidates_out'] = len(filtered_motifs)
+        if stage_profiler.is_enabled(): _record_filter_counts(all_motifs, filtered_motifs)
+        with stage_profiler.stage('hybrid', candidates_in=len(filtered_motifs)) as event: hybrid_motifs = self._detect_hybrid_motifs(filtered_motifs, sequence); event['candidates_out'] = len(hybrid_motifs)
+        with stage_profiler.stage('clusters', candidates_in=len(filtered_motifs)) as event: cluster_motifs = self._detect_clusters(filtered_motifs, sequence); event['candidates_out'] = len(cluster_motifs)
         # Combine and sort (normalization now handled by detectors)
         # NOTE: normalize_motif_scores() deprecated - detectors self-normalize scores
         final_motifs = filtered_motifs + hybrid_motifs + cluster_motifs
         final_motifs.sort(key=lambda x: x.get('Start', 0))
         return final_motifs
     
-    def _analyze_parallel_detectors(self, sequence: str, sequence_name: str, detectors_to_run: Dict, progress_callback: Optional[Callable] = None) -> List[Dict[str, Any]]:
-        """Execute detectors in parallel using ThreadPoolExecutor.
+    def _prefilter_skipped(self, sequence: str, detectors_to_run: Dict) -> set:
+        """Detectors with no seed anywhere in ``sequence`` (see Utilities.prefilter); empty when disabled or on error."""
+        if not PREFILTER_ENABLED or not detectors_to_run: return set()
+        try:
+            with stage_profiler.stage('prefilter', bp=len(sequence), candidates_in=len(detectors_to_run)) as event:
+                skipped = prefilter_sequence(sequence, detectors_to_run).skipped(detectors_to_run); event['candidates_out'] = len(detectors_to_run) - len(skipped)
+        except Exception as e:
+            logger.debug(f"Prefilter failed, running all detectors: {e}"); return set()
+        if skipped: logger.debug(f"Prefilter skipped {sorted(skipped)} ({len(sequence)} bp)")
+        return skipped
+    
+    def _analyze_parallel_detectors(self, sequence: str, sequence_name: str, detectors_to_run: Dict, progress_callback: Optional[Callable] = None, skipped: Optional[set] = None) -> List[Dict[str, Any]]:
+        """Execute detectors in parallel as tasks on the shared detector process pool.
         
-        Uses thread-based parallelism since detector operations are mostly computational
-        and NumPy operations release the GIL, allowing true parallel execution.
+        Each detector runs in a pool worker (Utilities.detector_scheduler), heavy detectors first, so
+        regex/Python-loop detectors do not serialize on the GIL. Runs inline when only one worker is
+        available or when called from inside a worker process.
         
         Args:
             sequence: DNA sequence to analyze
             sequence_name: Name identifier for the sequence
             detectors_to_run: Dictionary of detector_name -> detector_instance
             progress_callback: Optional callback for progress updates
+            skipped: Detector names the prefilter ruled out (reported as 0 motifs, not submitted)
         
         Returns:
-            List of all detected motifs from all detectors
+            List of all detected motifs from all detectors (in detector order)
         """
-        all_motifs = []
-        completed_count = 0  # Must be modified only within results_lock to prevent race conditions
-        total_detectors = len(detectors_to_run)
-        results_lock = threading.Lock()
-        
-        def run_detector(detector_name: str, detector):
-            """Worker function to run a single detector."""
-            nonlocal completed_count  # All modifications of completed_count must occur within results_lock
-            try:
-                start_time = time.time()
-                motifs = detector.detect_motifs(sequence, sequence_name)
-                elapsed = time.time() - start_time
-                motif_count = len(motifs)
-                
-                _update_detector_timing(detector_name, elapsed)
-                
-                with results_lock:
-                    completed_count += 1  # Thread-safe increment
-                    if progress_callback is not None:
-                        progress_callback(detector_name, completed_count, total_detectors, elapsed, motif_count)
-                
-                return motifs
-            except Exception as e:
-                warnings.warn(f"Error in {detector_name} detector: {e}")
-                with results_lock:
-                    completed_count += 1  # Thread-safe increment
-                    if progress_callback is not None:
-                        progress_callback(detector_name, completed_count, total_detectors, 0.0, 0)
-                return []
+        completed_count = 0; total_detectors = len(detectors_to_run); skipped = skipped or set()
+        for detector_name in detectors_to_run:
+            if detector_name in skipped:
+                completed_count += 1; _update_detector_timing(detector_name, 0.0)
+                if progress_callback is not None: progress_callback(detector_name, completed_count, total_detectors, 0.0, 0)
+        names = [k for k in detectors_to_run if k not in skipped]
+        if not names: return []
         
-        # Use ThreadPoolExecutor for parallel detector execution
-        max_workers = min(MAX_DETECTOR_WORKERS, total_detectors)
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            # Submit all detector jobs
-            future_to_detector = {
-                executor.submit(run_detector, detector_name, detector): detector_name
-                for detector_name, detector in detectors_to_run.items()
-            }
-            
-            # Collect results as they complete
-            for future in as_completed(future_to_detector):
-                motifs = future.result()
-                all_motifs.extend(motifs)
+        def on_detector(detector_name: str, elapsed: float, motif_count: int, error: Optional[str]):
+            nonlocal completed_count
+            completed_count += 1; _update_detector_timing(detector_name, elapsed if error is None else 0.0)
+            if progress_callback is not None: progress_callback(detector_name, completed_count, total_detectors, elapsed if error is None else 0.0, motif_count)
         
-        return all_motifs
+        return DetectorScheduler(self, max_workers=min(MAX_DETECTOR_WORKERS, len(names))).run_detectors(sequence, sequence_name, names, on_detector)
     
     def _remove_overlaps(self, motifs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """O(n log n) overlap removal using binary search on sorted non-overlapping intervals.
@@ -379,44 +402,119 @@ class NonBScanner:
         for name, detector in self.detectors.items(): stats = detector.get_statistics(); info['detectors'][name] = stats; info['total_patterns'] += stats['total_patterns']
         return info
 
-def analyze_sequence(sequence: str, sequence_name: str = "sequence", use_fast_mode: bool = True, use_chunking: bool = None, chunk_size: int = None, chunk_overlap: int = None, progress_callback: Optional[Callable[[int, int, int, float, float], None]] = None, use_parallel_chunks: bool = True, use_parallel_detectors: bool = None, enabled_classes: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+    def analyze_regions(self, fasta_source: Union[str, IndexedFasta], bed_path: str, flank: int = 0, enabled_classes: Optional[List[str]] = None, max_workers: Optional[int] = None) -> Dict[str, List[Dict[str, Any]]]:
+        """Scan only the BED target intervals of an indexed FASTA (see Utilities.region_scan).
+
+        Targets are padded by ``flank`` bp, overlapping windows are merged, windows are fetched via the
+        .fai/.gzi index and scanned in parallel, and calls are clipped to the targets. Returns
+        {record name: motifs} in genomic coordinates, each motif tagged with its ``Region``. Windows are
+        scanned with this instance; only the shared cached scanner is rebuilt in pool workers.
+        """
+        from Utilities.region_scan import analyze_regions
+        return analyze_regions(fasta_source, bed_path, flank=flank, enabled_classes=enabled_classes, max_workers=max_workers,
+                               scanner=None if self is _CACHED_SCANNER else self)
+
+def analyze_sequence(sequence: str, sequence_name: str = "sequence", use_fast_mode: bool = True, use_chunking: bool = None, chunk_size: int = None, chunk_overlap: int = None, progress_callback: Optional[Callable[[int, int, int, float, float], None]] = None, use_parallel_chunks: bool = True, use_parallel_detectors: bool = None, enabled_classes: Optional[List[str]] = None, budget: Optional[Union[RunBudget, Dict[str, Any]]] = None) -> List[Dict[str, Any]]:
     """
     Analyze DNA sequence for non-B DNA motifs with robust error handling.
     
     Args:
-        sequence: DNA sequence string to analyze
+        sequence: DNA sequence string to analyze, or a lazy ``FastaRecord`` view from ``IndexedFasta`` (chunks are fetched from disk on demand)
         sequence_name: Name/identifier for the sequence
         use_fast_mode: Whether to use parallel scanner if available
         use_chunking: Whether to use chunked analysis (auto-enabled for large sequences if None)
-        chunk_size: Size of chunks for chunked analysis (default: DEFAULT_CHUNK_SIZE)
-        chunk_overlap: Overlap between chunks (default: DEFAULT_CHUNK_OVERLAP)
+        chunk_size: Size of chunks for chunked analysis (default: cost-model plan when ADAPTIVE_CHUNKING, else DEFAULT_CHUNK_SIZE)
+        chunk_overlap: Overlap between chunks (default: cost-model plan when ADAPTIVE_CHUNKING, else DEFAULT_CHUNK_OVERLAP)
         progress_callback: Callback function for progress updates (chunk_num, total_chunks, bp_processed, elapsed, throughput)
         use_parallel_chunks: Whether to process chunks in parallel
         use_parallel_detectors: Whether to run detectors in parallel (auto-enabled for sequences >50KB if None)
         enabled_classes: List of motif classes to detect (None = all classes)
+        budget: RunBudget (or limits dict) bounding wall time, RSS and per-chunk time (None = enclosing budget, else
+                NONBDNA_MAX_WALL_S / NONBDNA_MAX_RSS_MB / NONBDNA_CHUNK_TIMEOUT_S). Skipped chunks and truncated
+                detectors are recorded in it (``budget.report()``); the motifs found so far are still returned.
     
     Returns:
         List of detected motif dictionaries
         Returns empty list if sequence is None, empty, or invalid
     
     Raises:
-        TypeError: If sequence is not a string or None
+        TypeError: If sequence is not a string, FastaRecord or None
     """
     # Validate input - check type first before attempting len()
     if sequence is None or not sequence or len(sequence) == 0:
         logger.warning(f"Empty or None sequence provided for {sequence_name}")
         return []
-    if not isinstance(sequence, str):
-        raise TypeError(f"Sequence must be string, got {type(sequence)}")
+    if not isinstance(sequence, (str, FastaRecord)):
+        raise TypeError(f"Sequence must be string or FastaRecord, got {type(sequence)}")
+    budget = RunBudget.coerce(budget)
+    if budget is not None and current_budget() is not budget:
+        with budget_scope(budget): motifs = analyze_sequence(sequence, sequence_name, use_fast_mode, use_chunking, chunk_size, chunk_overlap, progress_callback, use_parallel_chunks, use_parallel_detectors, enabled_classes, budget)
+        if budget.partial: logger.warning(f"Analysis of {sequence_name} is {budget.summary()}; returning {len(motifs)} motifs")
+        return motifs
     
-    seq_len = len(sequence); chunk_size = chunk_size or DEFAULT_CHUNK_SIZE; chunk_overlap = chunk_overlap or DEFAULT_CHUNK_OVERLAP
+    seq_len = len(sequence); max_workers = None
     if use_chunking is None: use_chunking = seq_len > SEQUENCE_CHUNKING_THRESHOLD
+    if use_chunking and not chunk_size and ADAPTIVE_CHUNKING and seq_len > DEFAULT_CHUNK_SIZE:
+        plan = _adaptive_chunk_plan(sequence, enabled_classes)
+        if plan: chunk_size = plan['chunk_size']; chunk_overlap = chunk_overlap or plan['overlap']; max_workers = plan['workers']
+    chunk_size = chunk_size or DEFAULT_CHUNK_SIZE; chunk_overlap = chunk_overlap or DEFAULT_CHUNK_OVERLAP
     if not use_chunking or seq_len <= chunk_size:
+        if isinstance(sequence, FastaRecord): sequence = str(sequence)
         if use_fast_mode:
             try: from parallel_scanner import analyze_sequence_parallel; return analyze_sequence_parallel(sequence, sequence_name, use_parallel=True, enabled_classes=enabled_classes)
             except ImportError: warnings.warn("Fast mode not available, falling back to standard mode")
         return _get_cached_scanner().analyze_sequence(sequence, sequence_name, enabled_classes=enabled_classes, use_parallel_detectors=use_parallel_detectors)
-    return _analyze_sequence_chunked(sequence, sequence_name, chunk_size, chunk_overlap, progress_callback, use_parallel_chunks, enabled_classes, use_parallel_detectors)
+    return _analyze_sequence_chunked(sequence, sequence_name, chunk_size, chunk_overlap, progress_callback, use_parallel_chunks, enabled_classes, use_parallel_detectors, max_workers)
+
+def _adaptive_chunk_plan(sequence: Union[str, FastaRecord], enabled_classes: Optional[List[str]]) -> Optional[Dict[str, Any]]:
+    """Cost-model chunk plan (chunk_size, overlap, workers); None if the cost model cannot be loaded or calibrated."""
+    try:
+        from Utilities.adaptive_chunk_planner import AdaptiveChunkPlanner
+        return AdaptiveChunkPlanner().plan_for_sequence(sequence, enabled_classes)
+    except Exception as e:
+        logger.warning(f"Adaptive chunk planning failed ({e}); using {DEFAULT_CHUNK_SIZE:,} bp chunks")
+        return None
+
+def analyze_sequence_incremental(sequence: str, previous_sequence: str, previous_motifs: List[Dict[str, Any]], sequence_name: str = "sequence", enabled_classes: Optional[List[str]] = None, margin: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Re-analyze an edited sequence from a previous result instead of rescanning it (see Utilities.incremental_scan).
+
+    The two sequences are diffed; only the changed spans plus a detector-specific context margin are rescanned
+    (hybrids/clusters recomputed there), and the previous calls elsewhere are kept with indel-shifted coordinates.
+    Falls back to a full ``analyze_sequence`` when more than half of the sequence would be rescanned.
+
+    Args:
+        sequence: New (edited) DNA sequence
+        previous_sequence: Sequence ``previous_motifs`` were called on
+        previous_motifs: Result of analyzing ``previous_sequence`` with the same ``enabled_classes``
+        sequence_name: Name/identifier for the new sequence
+        enabled_classes: List of motif classes to detect (None = all classes)
+        margin: Context margin in bp (default: widest reach of the enabled detectors + cluster window)
+
+    Returns:
+        List of detected motif dictionaries for ``sequence``
+    """
+    from Utilities.incremental_scan import rescan_edited
+    if not sequence or not previous_sequence: return analyze_sequence(sequence, sequence_name, enabled_classes=enabled_classes)
+    motifs, _ = rescan_edited(sequence, previous_sequence, previous_motifs, sequence_name, enabled_classes, margin, max_rescan_fraction=0.5)
+    return motifs if motifs is not None else analyze_sequence(sequence, sequence_name, enabled_classes=enabled_classes)
+
+def _scan_chunk(scanner: 'NonBScanner', chunk_seq: str, sequence_name: str, enabled_classes: Optional[List[str]], use_parallel_detectors: Optional[bool], chunk_start: int = 0) -> List[Dict[str, Any]]:
+    """Scan one chunk (chunk-local coordinates) through the content-addressed chunk cache when enabled (NONBDNA_CHUNK_CACHE); profiled as stage 'chunk' when NONBDNA_PROFILE is on."""
+    compute = lambda: scanner.analyze_sequence(chunk_seq, sequence_name, enabled_classes=enabled_classes, use_parallel_detectors=use_parallel_detectors)
+    if not stage_profiler.is_enabled():
+        with stage_profiler.chunk_scope(f"{sequence_name}:{chunk_start}"): return scan_chunk_cached(chunk_seq, sequence_name, enabled_classes, compute, variant=type(scanner).__name__)  # label for budget reports
+    with stage_profiler.chunk_scope(f"{sequence_name}:{chunk_start}"), stage_profiler.stage('chunk', bp=len(chunk_seq)) as event:
+        motifs = scan_chunk_cached(chunk_seq, sequence_name, enabled_classes, compute, variant=type(scanner).__name__); event['candidates_out'] = len(motifs)
+    stage_profiler.flush(); return motifs
+
+def _record_filter_counts(raw_motifs: List[Dict[str, Any]], filtered_motifs: List[Dict[str, Any]]) -> None:
+    """Profiler 'filter' events: per-detector candidates before / after overlap removal."""
+    raw = defaultdict(int); kept = defaultdict(int)
+    for m in raw_motifs: raw[CLASS_TO_DETECTOR.get(m.get('Class'), m.get('Class'))] += 1
+    for m in filtered_motifs: kept[CLASS_TO_DETECTOR.get(m.get('Class'), m.get('Class'))] += 1
+    chunk = stage_profiler.current_chunk()
+    for detector_name, count in raw.items(): stage_profiler.record_event({'stage': 'filter', 'detector': detector_name, 'chunk': chunk, 'bp': 0, 'candidates_in': count, 'candidates_out': kept[detector_name], 'pid': os.getpid(), 'wall_s': 0.0, 'cpu_s': 0.0})
 
 def _process_chunk_worker(chunk_info: Tuple[int, Tuple[int, int]], sequence: str, sequence_name: str, enabled_classes: Optional[List[str]], use_parallel_detectors: bool = True) -> Tuple[int, int, List[Dict[str, Any]]]:
     """
@@ -425,7 +523,7 @@ def _process_chunk_worker(chunk_info: Tuple[int, Tuple[int, int]], sequence: str
     
     Args:
         chunk_info: Tuple of (chunk_idx, (chunk_start, chunk_end))
-        sequence: Full DNA sequence string
+        sequence: Full DNA sequence string, or a ``FastaRecord`` view (pickled as path + index entry; the worker fetches only its slice)
         sequence_name: Name/identifier for the sequence
         enabled_classes: List of motif classes to detect
         use_parallel_detectors: Whether to run detectors in parallel within the chunk
@@ -436,54 +534,48 @@ def _process_chunk_worker(chunk_info: Tuple[int, Tuple[int, int]], sequence: str
     chunk_idx, (chunk_start, chunk_end) = chunk_info
     chunk_seq = sequence[chunk_start:chunk_end]
     scanner = _get_cached_scanner()
-    chunk_motifs = scanner.analyze_sequence(chunk_seq, sequence_name, enabled_classes=enabled_classes, use_parallel_detectors=use_parallel_detectors)
+    chunk_motifs = _scan_chunk(scanner, chunk_seq, sequence_name, enabled_classes, use_parallel_detectors, chunk_start)
     # Adjust positions relative to full sequence
     for motif in chunk_motifs:
         motif['Start'] += chunk_start
         motif['End'] += chunk_start
     return chunk_idx, chunk_end - chunk_start, chunk_motifs
 
-def _analyze_sequence_chunked(sequence: str, sequence_name: str, chunk_size: int, chunk_overlap: int, progress_callback: Optional[Callable[[int, int, int, float, float], None]] = None, use_parallel_chunks: bool = True, enabled_classes: Optional[List[str]] = None, use_parallel_detectors: bool = None) -> List[Dict[str, Any]]:
-    """Optimized chunked analysis with ProcessPoolExecutor for true CPU parallelism."""
+def _analyze_sequence_chunked(sequence: str, sequence_name: str, chunk_size: int, chunk_overlap: int, progress_callback: Optional[Callable[[int, int, int, float, float], None]] = None, use_parallel_chunks: bool = True, enabled_classes: Optional[List[str]] = None, use_parallel_detectors: bool = None, max_workers: Optional[int] = None) -> List[Dict[str, Any]]:
+    """Chunked analysis; with use_parallel_chunks, (chunk, detector) pairs run on the shared detector process pool (at most ``max_workers`` tasks in flight)."""
     # Validate input - check for None and empty sequences
     if sequence is None or not sequence or len(sequence) == 0:
         logger.warning(f"Empty or None sequence provided for chunked analysis: {sequence_name}")
         return []
     
     def _throughput(bp, elapsed): return bp / elapsed if elapsed > 0 else 0
-    seq_len = len(sequence); chunks = []; start = 0
-    while start < seq_len:
-        end = min(start + chunk_size, seq_len); chunks.append((start, end))
-        if end >= seq_len: break
-        start = end - chunk_overlap
-    total_chunks = len(chunks); all_motifs = []; start_time = time.time(); bp_processed = 0
+    def _budget_exhausted(remaining):  # records the chunks left unscanned once a job-wide limit has tripped
+        if budget is None or not budget.check(): return False
+        for chunk_start, chunk_end in remaining: budget.record_skipped(sequence_name, chunk_start, chunk_end)
+        return True
+    # Tile only the non-N islands (long assembly gaps are skipped; coordinates stay global)
+    chunks = [(start, end) for start, end, _ in plan_chunks(sequence, chunk_size, chunk_overlap)]
+    total_chunks = len(chunks); all_motifs = []; start_time = time.time(); bp_processed = 0; budget = current_budget()
     if use_parallel_chunks and total_chunks > 1:
-        max_workers = min(total_chunks, os.cpu_count() or 4)
-        
         try:
-            # Try true parallelism with ProcessPoolExecutor
-            with ProcessPoolExecutor(max_workers=max_workers) as executor:
-                futures = {
-                    executor.submit(_process_chunk_worker, (i, chunk), sequence, sequence_name, enabled_classes, use_parallel_detectors): i 
-                    for i, chunk in enumerate(chunks)
-                }
-                results_by_idx = {}
-                for future in as_completed(futures):
-                    chunk_idx, chunk_len, chunk_motifs = future.result()
-                    results_by_idx[chunk_idx] = chunk_motifs
-                    bp_processed += chunk_len
-                    if progress_callback:
-                        elapsed = time.time() - start_time
-                        progress_callback(chunk_idx + 1, total_chunks, bp_processed, elapsed, _throughput(bp_processed, elapsed))
-                for i in range(total_chunks):
-                    all_motifs.extend(results_by_idx.get(i, []))
+            # (chunk, detector) tasks on the shared detector pool; each chunk is merged as soon as its detectors finish
+            scheduler = DetectorScheduler(_get_cached_scanner(), max_workers=max_workers)
+            chunk_iter = ((chunk_start, sequence[chunk_start:chunk_end]) for chunk_start, chunk_end in chunks)
+            scanned = 0
+            for chunk_idx, (chunk_start, chunk_motifs) in enumerate(scheduler.scan_chunks(chunk_iter, sequence_name, enabled_classes)):
+                for motif in chunk_motifs: motif['Start'] += chunk_start; motif['End'] += chunk_start
+                all_motifs.extend(chunk_motifs); bp_processed += chunks[chunk_idx][1] - chunk_start; scanned = chunk_idx + 1
+                if progress_callback: elapsed = time.time() - start_time; progress_callback(chunk_idx + 1, total_chunks, bp_processed, elapsed, _throughput(bp_processed, elapsed))
+            if scanned < total_chunks: _budget_exhausted(chunks[scanned:])  # the scheduler stopped pulling chunks
         except (RuntimeError, OSError, AttributeError, BrokenProcessPool) as e:
             # Fallback to sequential if multiprocessing fails (e.g., restricted environments or pickle errors)
-            logger.warning(f"ProcessPoolExecutor failed ({e}), falling back to sequential processing")
+            logger.warning(f"Detector scheduler failed ({e}), falling back to sequential processing")
+            all_motifs = []; bp_processed = 0
             scanner = _get_cached_scanner()
             for chunk_idx, (chunk_start, chunk_end) in enumerate(chunks):
+                if _budget_exhausted(chunks[chunk_idx:]): break
                 chunk_seq = sequence[chunk_start:chunk_end]
-                chunk_motifs = scanner.analyze_sequence(chunk_seq, sequence_name, enabled_classes=enabled_classes, use_parallel_detectors=use_parallel_detectors)
+                chunk_motifs = _scan_chunk(scanner, chunk_seq, sequence_name, enabled_classes, use_parallel_detectors, chunk_start)
                 for motif in chunk_motifs: motif['Start'] += chunk_start; motif['End'] += chunk_start
                 all_motifs.extend(chunk_motifs); bp_processed += chunk_end - chunk_start
                 if progress_callback: elapsed = time.time() - start_time; progress_callback(chunk_idx + 1, total_chunks, bp_processed, elapsed, _throughput(bp_processed, elapsed))
@@ -491,12 +583,14 @@ def _analyze_sequence_chunked(sequence: str, sequence_name: str, chunk_size: int
         # Sequential processing
         scanner = _get_cached_scanner()
         for chunk_idx, (chunk_start, chunk_end) in enumerate(chunks):
+            if _budget_exhausted(chunks[chunk_idx:]): break
             chunk_seq = sequence[chunk_start:chunk_end]
-            chunk_motifs = scanner.analyze_sequence(chunk_seq, sequence_name, enabled_classes=enabled_classes, use_parallel_detectors=use_parallel_detectors)
+            chunk_motifs = _scan_chunk(scanner, chunk_seq, sequence_name, enabled_classes, use_parallel_detectors, chunk_start)
             for motif in chunk_motifs: motif['Start'] += chunk_start; motif['End'] += chunk_start
             all_motifs.extend(chunk_motifs); bp_processed += chunk_end - chunk_start
             if progress_callback: elapsed = time.time() - start_time; progress_callback(chunk_idx + 1, total_chunks, bp_processed, elapsed, _throughput(bp_processed, elapsed))
-    deduplicated_motifs = _deduplicate_motifs(all_motifs); deduplicated_motifs.sort(key=lambda x: x.get('Start', 0))
+    with stage_profiler.stage('deduplicate', candidates_in=len(all_motifs)) as event: deduplicated_motifs = _deduplicate_motifs(all_motifs); event['candidates_out'] = len(deduplicated_motifs)
+    deduplicated_motifs.sort(key=lambda x: x.get('Start', 0)); stage_profiler.flush()
     return deduplicated_motifs
 
 def _deduplicate_motifs(motifs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
@@ -628,12 +722,15 @@ def get_motif_info() -> Dict[str, Any]:
     classification_legacy = {motif_id: {'name': motif_data['class'], 'subclasses': motif_data['subclasses']} for motif_id, motif_data in MOTIF_CLASSIFICATION.items()}
     return {'version': __version__, 'author': __author__, 'total_classes': 11, 'total_subclasses': len(VALID_SUBCLASSES), 'classification': classification_legacy}
 
-def export_results(motifs: List[Dict[str, Any]], format: str = 'csv', filename: Optional[str] = None, **kwargs) -> str:
-    if format.lower() == 'csv': return export_to_csv(motifs, filename)
-    elif format.lower() == 'bed': return export_to_bed(motifs, kwargs.get('sequence_name', 'sequence'), filename)
-    elif format.lower() == 'json': return export_to_json(motifs, filename, kwargs.get('pretty', True))
-    elif format.lower() in ['excel', 'xlsx']: return export_to_excel(motifs, filename or 'nonbscanner_results.xlsx')
-    else: raise ValueError(f"Unsupported format: {format}. Use 'csv', 'bed', 'json', or 'excel'")
+def export_results(motifs: Iterable[Dict[str, Any]], format: str = 'csv', filename: Optional[str] = None, **kwargs) -> str:
+    """Export motifs (list or any iterable, e.g. ``UniversalResultsStorage.iter_results()``); with *filename* the output is streamed to disk and the path returned. ``bgzip=True`` compresses text formats on the fly."""
+    fmt = format.lower(); bgzip = kwargs.get('bgzip', False)
+    if fmt == 'csv': return export_to_csv(motifs, filename, bgzip=bgzip)
+    elif fmt == 'bed': return export_to_bed(motifs, kwargs.get('sequence_name', 'sequence'), filename, bgzip=bgzip)
+    elif fmt in ['gff', 'gff3']: return export_to_gff3(motifs, kwargs.get('sequence_name', 'sequence'), filename, bgzip=bgzip)
+    elif fmt == 'json': return export_to_json(motifs, filename, kwargs.get('pretty', True), bgzip=bgzip)
+    elif fmt in ['excel', 'xlsx']: return export_to_excel(motifs, filename or 'nonbscanner_results.xlsx')
+    else: raise ValueError(f"Unsupported format: {format}. Use 'csv', 'bed', 'gff3', 'json', or 'excel'")
 
 @overload
 def analyze_with_progress(sequence: str, sequence_name: str = ..., print_progress: bool = ..., return_progress: Literal[False] = ...) -> List[Dict[str, Any]]: ...
@@ -660,7 +757,8 @@ def analyze_multiple_sequences(sequences: Dict[str, str], use_multiprocessing: b
             return {future_to_name[f]: f.result() if not f.exception() else [] for f in as_completed(future_to_name)}
     return {name: scanner.analyze_sequence(seq, name) for name, seq in sequences.items()}
 
-def get_summary_statistics(results: Dict[str, List[Dict[str, Any]]]) -> pd.DataFrame:
+def get_summary_statistics(results: Dict[str, List[Dict[str, Any]]]) -> 'pd.DataFrame':
+    import pandas as pd
     summary_data = []
     for name, motifs in results.items():
         stats = calculate_motif_statistics(motifs, 0)
@@ -258,8 +258,8 @@ class NonBScannerOptimized(NonBScanner):
         }
         
         return {
-            name: detector
-            for name, detector in self.detectors.items()
+            name: self.detectors[name]
+            for name in self.detectors
             if name in enabled_detector_names
         }
 
@@ -44,8 +44,7 @@ def prepare_parallel_analysis(
     seqs: Optional[List[str]] = None,
     names: Optional[List[str]] = None,
     seq_storage: Optional[Any] = None,
-    enabled_classes: Optional[List[str]] = None,
-    chunk_threshold: int = 1_000_000
+    enabled_classes: Optional[List[str]] = None
 ) -> tuple:
     """
     Prepare data structures for parallel analysis.
@@ -58,7 +57,6 @@ def prepare_parallel_analysis(
         names: List of sequence names
         seq_storage: UniversalSequenceStorage instance (for disk storage)
         enabled_classes: List of enabled class names
-        chunk_threshold: Threshold for chunking large sequences
     
     Returns:
         Tuple of (sequences_data, analysis_params)
@@ -71,8 +69,7 @@ def prepare_parallel_analysis(
         analysis_params = {
             'use_disk_storage': True,
             'seq_storage': seq_storage,
-            'enabled_classes': enabled_classes,
-            'chunk_threshold': chunk_threshold
+            'enabled_classes': enabled_classes
         }
         
         sequences_data = [(seq_id, name, i) for i, (seq_id, name) in enumerate(zip(seq_ids, names))]
@@ -83,8 +80,7 @@ def prepare_parallel_analysis(
         
         analysis_params = {
             'use_disk_storage': False,
-            'enabled_classes': enabled_classes,
-            'chunk_threshold': chunk_threshold
+            'enabled_classes': enabled_classes
         }
         
         sequences_data = [(seq, name, i) for i, (seq, name) in enumerate(zip(seqs, names))]
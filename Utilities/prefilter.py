@@ -0,0 +1,222 @@
+"""
+┌──────────────────────────────────────────────────────────────────────────────┐
+│ Prefilter - Per-Chunk Seed Scan that Gates Detector Work                     │
+├──────────────────────────────────────────────────────────────────────────────┤
+│ Author: Dr. Venkata Rajesh Yella | License: MIT | Version: 2024.1            │
+└──────────────────────────────────────────────────────────────────────────────┘
+
+DESCRIPTION:
+    Every detector with a seed-driven pattern set has a *necessary* condition
+    that is far cheaper to test than the detector itself. If a chunk has no
+    seed for a detector, that detector cannot report anything there, and
+    NonBScanner.analyze_sequence skips it.
+
+        Detector       Seed (any occurrence)                  Why it is necessary
+        g_quadruplex   GGG                                    G4 seeds are G{3,} runs
+        r_loop         GGG | CCC                              RIZ needs G{3,} (either strand)
+        i_motif        CCC | GGG                              every pattern has C{3} (either strand)
+        curved_dna     A{t} | T{t}, t = MIN_AT_TRACT          phased and local tracts
+        triplex        [AG]{L} | [CT]{L}                      arm >= MIN_ARM at >= PURITY_THRESHOLD;
+                                                              L = min pure run (GAA/TTC repeats included)
+        z_dna          Z-DNA 10-mer | [CG]{12}                10-mer table or eGZ (CGG/GGC/CCG/GCC)x4
+        a_philic       A-philic 10-mer                        10-mer table
+        cruciform, slipped_dna                                no gate (always run)
+
+    Gates are derived from the detector instances (thresholds, pattern
+    lists). A detector whose patterns were overridden (motif_patterns
+    module) and no longer match the assumption is never gated. Seeds are
+    also recorded per PREFILTER_WINDOW-bp sub-window (seed start // window),
+    so callers can see where in a chunk each class could occur.
+
+    With Hyperscan, one compiled block database holds all seed patterns,
+    tagged by detector. Otherwise NumPy run-length and 10-mer hash passes
+    are used. Both give the same per-detector gating decisions.
+
+CONFIGURATION (environment):
+    NONBDNA_PREFILTER          'false' to disable gating (default: enabled)
+    NONBDNA_PREFILTER_WINDOW   Sub-window size in bp (default: 1000)
+"""
+
+import logging
+import math
+import os
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+
+from Utilities import hs_runtime
+
+logger = logging.getLogger(__name__)
+
+PREFILTER_ENABLED = os.environ.get('NONBDNA_PREFILTER', 'true').strip().lower() not in ('0', 'false', 'no', 'off')
+PREFILTER_WINDOW = int(os.environ.get('NONBDNA_PREFILTER_WINDOW', 1000))
+
+EGZ_PATTERNS = {r'(?:CGG){4,}', r'(?:GGC){4,}', r'(?:CCG){4,}', r'(?:GCC){4,}'}  # each implies a 12-bp [CG] run
+
+
+def _triplex_run_length(min_arm: int, max_arm: int, purity: float) -> int:
+    """Shortest pure purine/pyrimidine run guaranteed inside any arm of min_arm..max_arm bp at >= purity."""
+    def guaranteed(arm: int) -> int:
+        interruptions = int(math.floor(arm * (1.0 - purity) + 1e-9))
+        return math.ceil((arm - interruptions) / (interruptions + 1))
+    return max(1, min(guaranteed(arm) for arm in range(min_arm, max(min_arm, max_arm) + 1)))
+
+
+def _patterns_require(detector: Any, token: str) -> bool:
+    """True if every regex the detector exposes through get_patterns() contains ``token``."""
+    try:
+        patterns = detector.get_patterns()
+    except Exception:
+        return False
+    regexes = [p[0] for group in patterns.values() for p in group if p and p[0]]
+    return bool(regexes) and all(token in r for r in regexes)
+
+
+def seed_specs(detectors: Dict[str, Any]) -> Dict[str, List[Tuple[str, Any]]]:
+    """
+    Seed specification per gateable detector.
+
+    Returns:
+        detector name -> list of (kind, arg): ('run', (bases, length)) for a run of
+        ``length`` characters from ``bases``, or ('tenmers', table)
+    """
+    specs: Dict[str, List[Tuple[str, Any]]] = {}
+    for name, detector in detectors.items():
+        if name == 'g_quadruplex':
+            specs[name] = [('run', ('G', 3))]
+        elif name == 'r_loop':
+            specs[name] = [('run', ('G', 3)), ('run', ('C', 3))]
+        elif name == 'i_motif' and _patterns_require(detector, 'C{3'):
+            specs[name] = [('run', ('C', 3)), ('run', ('G', 3))]
+        elif name == 'curved_dna':
+            t = int(getattr(detector, 'MIN_AT_TRACT', 3))
+            specs[name] = [('run', ('A', t)), ('run', ('T', t))]
+        elif name == 'triplex' and hasattr(detector, 'MIN_ARM') and hasattr(detector, 'PURITY_THRESHOLD'):
+            # Sticky (GAA){4,} / (TTC){4,} repeats are 12-bp pure runs, so L <= MIN_ARM covers them
+            run = _triplex_run_length(int(detector.MIN_ARM), int(getattr(detector, 'MAX_ARM', detector.MIN_ARM)), float(detector.PURITY_THRESHOLD))
+            specs[name] = [('run', ('AG', run)), ('run', ('CT', run))]
+        elif name == 'z_dna':
+            from Detectors.zdna.tenmer_table import TENMER_SCORE
+            egz = [p[0] for p in detector.get_patterns().get('egz_motifs', [])]
+            if all(r in EGZ_PATTERNS for r in egz):
+                specs[name] = [('tenmers', TENMER_SCORE), ('run', ('CG', 12))]
+        elif name == 'a_philic':
+            from Detectors.aphilic.tenmer_table import TENMER_LOG2
+            specs[name] = [('tenmers', TENMER_LOG2)]
+    return specs
+
+
+class PrefilterResult:
+    """Seed presence per detector for one sequence/chunk, overall and per sub-window."""
+
+    def __init__(self, sequence_length: int, window_size: int, windows: Dict[str, np.ndarray]):
+        self.sequence_length = sequence_length
+        self.window_size = window_size
+        self.windows = windows          # detector -> bool array (one entry per sub-window)
+
+    def has_seed(self, detector_name: str) -> bool:
+        """False only for gated detectors without any seed (ungated detectors are always True)."""
+        w = self.windows.get(detector_name)
+        return True if w is None else bool(w.any())
+
+    def skipped(self, detector_names: Iterable[str]) -> Set[str]:
+        return {name for name in detector_names if not self.has_seed(name)}
+
+    def seed_windows(self, detector_name: str) -> List[Tuple[int, int]]:
+        """Merged 0-based half-open bp intervals of the sub-windows holding seeds for a gated detector."""
+        w = self.windows.get(detector_name)
+        if w is None:
+            return [(0, self.sequence_length)]
+        idx = np.flatnonzero(np.diff(np.concatenate(([0], w.astype(np.int8), [0]))))
+        return [(int(a) * self.window_size, min(int(b) * self.window_size, self.sequence_length)) for a, b in zip(idx[::2], idx[1::2])]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {'sequence_length': self.sequence_length, 'window_size': self.window_size,
+                'seeded_windows': {k: int(v.sum()) for k, v in self.windows.items()},
+                'total_windows': max(1, -(-self.sequence_length // self.window_size))}
+
+
+def _run_starts(codes: np.ndarray, bases: str, length: int) -> np.ndarray:
+    """Start positions of every ``length``-long run of characters from ``bases``."""
+    member = np.zeros(256, dtype=bool)
+    member[[ord(b) for b in bases]] = True
+    mask = member[codes]
+    n_starts = len(mask) - length + 1
+    if n_starts <= 0:
+        return np.zeros(0, dtype=np.int64)
+    run = mask[:n_starts].copy()
+    for k in range(1, length):           # shifted ANDs of a bool mask beat an int64 cumsum for short runs
+        run &= mask[k:k + n_starts]
+    return np.flatnonzero(run)
+
+
+def _scan_numpy(sequence: str, specs: Dict[str, List[Tuple[str, Any]]], n_windows: int, window: int) -> Dict[str, np.ndarray]:
+    from Detectors.zdna import hyperscan_backend
+    codes = np.frombuffer(sequence.encode('ascii', errors='replace'), dtype=np.uint8)
+    hashes = valid = None
+    runs: Dict[Tuple[str, int], np.ndarray] = {}
+    out: Dict[str, np.ndarray] = {}
+    for name, seeds in specs.items():
+        hit = np.zeros(n_windows, dtype=bool)
+        for kind, arg in seeds:
+            if kind == 'run':
+                if arg not in runs:
+                    runs[arg] = _run_starts(codes, *arg)
+                starts = runs[arg]
+            elif kind == 'tenmers':
+                if hashes is None:
+                    hashes, valid = hyperscan_backend.tenmer_hashes(sequence)
+                starts = np.flatnonzero((hyperscan_backend.get_tenmer_lookup(arg)[hashes] != 0) & valid)
+            hit[starts // window] = True
+        out[name] = hit
+    return out
+
+
+def _scan_hyperscan(sequence: str, specs: Dict[str, List[Tuple[str, Any]]], n_windows: int, window: int) -> Optional[Dict[str, np.ndarray]]:
+    expressions, owners = [], []
+    for name, seeds in specs.items():
+        for kind, arg in seeds:
+            if kind == 'run':
+                bases, length = arg
+                expressions.append((f'[{bases}]{{{length}}}' if len(bases) > 1 else f'{bases}{{{length}}}').encode())
+                owners.append(name)
+            else:
+                expressions.extend(t.encode() for t in arg)
+                owners.extend([name] * len(arg))
+    key = 'prefilter:' + ';'.join(f"{name}=" + ','.join(f"{kind}:{arg if kind != 'tenmers' else id(arg)}" for kind, arg in seeds) for name, seeds in sorted(specs.items()))
+    db = hs_runtime.get_database(key, expressions, range(len(expressions)))
+    if db is None:
+        return None
+    out = {name: np.zeros(n_windows, dtype=bool) for name in specs}
+
+    def on_match(pattern_id, start, end, flags, context):
+        out[owners[pattern_id]][(end - 1) // window] = True  # block mode without SOM: bucket by match end
+        return 0
+
+    hs_runtime.scan(db, sequence.encode(), on_match)
+    return out
+
+
+def prefilter_sequence(sequence: str, detectors: Dict[str, Any], window: int = PREFILTER_WINDOW) -> PrefilterResult:
+    """
+    Record which gateable detectors have any seed in ``sequence`` (uppercase), overall and per sub-window.
+
+    Args:
+        sequence: Uppercase DNA sequence (one chunk)
+        detectors: detector name -> detector instance (as in NonBScanner.detectors)
+        window: Sub-window size in bp
+
+    Returns:
+        PrefilterResult; ungated detectors are absent from ``windows`` and always reported as seeded
+    """
+    specs = seed_specs(detectors)
+    n_windows = max(1, -(-len(sequence) // window))
+    windows = None
+    if specs and hs_runtime.HYPERSCAN_AVAILABLE:
+        try:
+            windows = _scan_hyperscan(sequence, specs, n_windows, window)
+        except Exception as e:
+            logger.debug(f"Hyperscan prefilter failed, using NumPy seeds: {e}")
+    if windows is None:
+        windows = _scan_numpy(sequence, specs, n_windows, window) if specs else {}
+    return PrefilterResult(len(sequence), window, windows)
@@ -0,0 +1,229 @@
+"""
+┌──────────────────────────────────────────────────────────────────────────────┐
+│ Record Scheduler - One Global Task Queue for Multi-FASTA Inputs              │
+├──────────────────────────────────────────────────────────────────────────────┤
+│ Author: Dr. Venkata Rajesh Yella | License: MIT | Version: 2024.1            │
+└──────────────────────────────────────────────────────────────────────────────┘
+
+DESCRIPTION:
+    Every record of a multi-FASTA input is turned into tasks for a single
+    DetectorScheduler on the shared detector pool:
+
+        * Records longer than the chunk size are tiled with plan_chunks
+          (N gaps skipped). Each chunk is one task, and its detectors run as
+          separate (chunk, detector) pool tasks.
+        * Shorter records (contigs, scaffolds) are packed into batches of
+          about one chunk's worth of bp (at most BATCH_MAX_RECORDS records).
+          Each detector then processes the whole batch in a single pool task.
+
+    Long records are emitted first, longest first, and the small-record
+    batches last, so the many short batch tasks fill in the tail of the run.
+    The pool has one shared call queue that every worker pulls from. Whichever
+    worker is idle takes the next task, whatever record it belongs to. The
+    scheduler keeps only max_workers tasks in flight, so cores are neither
+    idle nor oversubscribed. No thread pool or per-record process pool is
+    layered on top.
+
+    Chunk results are shifted to record coordinates as they arrive. When the
+    last chunk of a record returns, that record is deduplicated across chunk
+    overlaps and sorted by Start, exactly as in
+    nonbscanner._analyze_sequence_chunked, and yielded at once. Memory then
+    holds only the records still in flight, not the whole file.
+
+    Under a RunBudget (Utilities.run_budget) the scheduler stops pulling tasks
+    once the wall time or RSS limit trips. Records it never finished are
+    still yielded, with the motifs found so far, and are listed in
+    ``partial`` and in the budget report.
+
+USAGE:
+    from Utilities.record_scheduler import RecordScheduler
+
+    scheduler = RecordScheduler(enabled_classes=['G-Quadruplex'])
+    for index, motifs in scheduler.run([(name, seq) for name, seq in records]):
+        ...   # records finish in completion order, not input order
+"""
+
+import logging
+import time
+from collections import defaultdict
+from typing import TYPE_CHECKING, Any, Callable, Dict, Hashable, Iterator, List, Optional, Sequence, Set, Tuple, Union
+
+if TYPE_CHECKING:
+    from Utilities.run_budget import RunBudget
+
+logger = logging.getLogger(__name__)
+
+BATCH_MAX_RECORDS = 1000     # records per batch task (bounds the pickled payload)
+
+
+class StoredSequence:
+    """Sliceable view of a UniversalSequenceStorage record (slices are read from disk on demand)."""
+
+    def __init__(self, storage: Any, seq_id: str):
+        self.storage = storage
+        self.seq_id = seq_id
+        self.length = storage.get_metadata(seq_id)['length']
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __getitem__(self, key) -> str:
+        start, stop, _ = key.indices(self.length)
+        return self.storage.get_sequence_chunk(self.seq_id, start, max(start, stop))
+
+
+class RecordScheduler:
+    """
+    Analyze many records on one DetectorScheduler.
+
+    Args:
+        enabled_classes: Motif classes to detect (None = all)
+        chunk_size:      Chunk length for long records (default: cost-model plan for the
+                         longest record when ADAPTIVE_CHUNKING, else DEFAULT_CHUNK_SIZE)
+        chunk_overlap:   Overlap between chunks (default: plan / DEFAULT_CHUNK_OVERLAP)
+        max_workers:     Cap on in-flight pool tasks (default: DETECTOR_WORKERS)
+        batch_bp:        Target bp per small-record batch (default: chunk size)
+        budget:          RunBudget or limits dict for the whole run (default: environment, see run_budget)
+    """
+
+    def __init__(self, enabled_classes: Optional[List[str]] = None, chunk_size: Optional[int] = None, chunk_overlap: Optional[int] = None,
+                 max_workers: Optional[int] = None, batch_bp: Optional[int] = None, budget: Optional[Union['RunBudget', Dict[str, Any]]] = None):
+        from Utilities.run_budget import RunBudget
+        self.enabled_classes = enabled_classes
+        self.chunk_size = chunk_size
+        self.chunk_overlap = chunk_overlap
+        self.max_workers = max_workers
+        self.batch_bp = batch_bp
+        self.budget = RunBudget.coerce(budget)
+        self.errors: Dict[int, str] = {}
+        self.started: Dict[int, float] = {}
+        self.finished: Dict[int, float] = {}
+        self.partial: Set[int] = set()      # records with skipped tasks or truncated detectors
+
+    def _resolve_chunking(self, records: Sequence[Tuple[str, Any]]) -> Tuple[int, int]:
+        from Utilities.nonbscanner import ADAPTIVE_CHUNKING, DEFAULT_CHUNK_OVERLAP, DEFAULT_CHUNK_SIZE, _adaptive_chunk_plan
+        chunk_size, overlap = self.chunk_size, self.chunk_overlap
+        longest = max(records, key=lambda record: len(record[1]))[1]
+        if not chunk_size and ADAPTIVE_CHUNKING and len(longest) > DEFAULT_CHUNK_SIZE:
+            plan = _adaptive_chunk_plan(longest, self.enabled_classes)
+            if plan:
+                chunk_size = plan['chunk_size']
+                overlap = overlap or plan['overlap']
+        return chunk_size or DEFAULT_CHUNK_SIZE, overlap or DEFAULT_CHUNK_OVERLAP
+
+    def plan(self, records: Sequence[Tuple[str, Any]]) -> List[Tuple[Hashable, List[Tuple[int, int, int]]]]:
+        """
+        Task list: (key, [(record index, start, end), ...]).
+
+        One entry per chunk of a long record (key ``(index, start)``), then
+        batches of short records (key ``('batch', n)``).
+        """
+        from Utilities.chunk_generator import plan_chunks
+        chunk_size, overlap = self._resolve_chunking(records)
+        batch_bp = self.batch_bp or chunk_size
+        long_records = sorted((i for i, (_, seq) in enumerate(records) if len(seq) > chunk_size), key=lambda i: -len(records[i][1]))
+        tasks: List[Tuple[Hashable, List[Tuple[int, int, int]]]] = []
+        for index in long_records:
+            tasks.extend(((index, start), [(index, start, end)]) for start, end, _ in plan_chunks(records[index][1], chunk_size, overlap))
+        batch: List[Tuple[int, int, int]] = []
+        batch_len = 0
+        for index, (_, seq) in enumerate(records):
+            if len(seq) > chunk_size or not len(seq):
+                continue
+            batch.append((index, 0, len(seq)))
+            batch_len += len(seq)
+            if batch_len >= batch_bp or len(batch) >= BATCH_MAX_RECORDS:
+                tasks.append((('batch', len(tasks)), batch))
+                batch = []
+                batch_len = 0
+        if batch:
+            tasks.append((('batch', len(tasks)), batch))
+        logger.info(f"Record scheduler: {len(records)} record(s) -> {len(tasks)} task(s) ({len(long_records)} chunked at {chunk_size:,} bp, "
+                    f"{sum(len(members) for key, members in tasks if key[0] == 'batch')} batched)")
+        return tasks
+
+    def run(self, records: Sequence[Tuple[str, Any]], progress_callback: Optional[Callable[[int, int], None]] = None) -> Iterator[Tuple[int, List[Dict[str, Any]]]]:
+        """
+        Analyze ``records`` ((name, sequence) with str, FastaRecord or StoredSequence values).
+
+        Args:
+            progress_callback: Called as (bp scanned, total bp to scan) after every task
+
+        Yields:
+            (record index, motifs in record coordinates) as each record completes. Records
+            that fail validation yield [] and their error is kept in ``self.errors``. Records
+            cut short by the budget are yielded last and are listed in ``self.partial``.
+        """
+        from Utilities.detector_scheduler import DetectorScheduler
+        from Utilities.nonbscanner import _deduplicate_motifs, _get_cached_scanner
+        if not records:
+            return
+        tasks = self.plan(records)
+        remaining: Dict[int, int] = defaultdict(int)
+        for _, members in tasks:
+            for index, _, _ in members:
+                remaining[index] += 1
+        partial: Dict[int, List[Dict[str, Any]]] = defaultdict(list)
+        task_members = dict(tasks)
+        chunked = {key[0] for key in task_members if key[0] != 'batch'}
+        total_bp = sum(end - start for _, members in tasks for _, start, end in members)
+        done_bp = 0
+
+        def materialise() -> Iterator[Tuple[Hashable, List[Tuple[str, str]]]]:
+            # Chunk text is read only when the scheduler pulls the task
+            for key, members in tasks:
+                now = time.time()
+                for index, _, _ in members:
+                    self.started.setdefault(index, now)
+                yield key, [(records[index][0], records[index][1][start:end]) for index, start, end in members]
+
+        def on_invalid(key: Hashable, member: int, error: ValueError) -> None:
+            index = task_members[key][member][0]
+            logger.error(f"Error analyzing sequence {records[index][0]}: {error}")
+            self.errors.setdefault(index, str(error))
+
+        def finish(index: int) -> Tuple[int, List[Dict[str, Any]]]:
+            motifs = partial.pop(index, [])
+            if index in chunked:     # same merge as _analyze_sequence_chunked; batched records are already final
+                motifs = _deduplicate_motifs(motifs)
+                motifs.sort(key=lambda m: m.get('Start', 0))
+            self.finished[index] = time.time()
+            self.started.setdefault(index, self.finished[index])
+            return index, motifs
+
+        for index, (_, seq) in enumerate(records):       # empty / all-N records have no tasks
+            if not remaining.get(index):
+                self.started[index] = time.time()
+                yield finish(index)
+        scheduler = DetectorScheduler(_get_cached_scanner(), max_workers=self.max_workers, budget=self.budget)
+        done_keys = set()
+        scan = scheduler.scan_tasks(materialise(), self.enabled_classes, ordered=False, on_invalid=on_invalid)
+        try:
+            for key, results in scan:
+                done_keys.add(key)
+                if key in scheduler.truncated_keys:
+                    self.partial.update(index for index, _, _ in task_members[key])
+                for (index, start, _), motifs in zip(task_members[key], results):
+                    if start:
+                        for motif in motifs:
+                            motif['Start'] += start
+                            motif['End'] += start
+                    partial[index].extend(motifs)
+                    remaining[index] -= 1
+                done_bp += sum(end - start for _, start, end in task_members[key])
+                if progress_callback is not None:
+                    progress_callback(done_bp, total_bp)
+                for index, _, _ in task_members[key]:
+                    if remaining[index] == 0:
+                        yield finish(index)
+        finally:
+            scan.close()     # e.g. JobCancelled from progress_callback: cancel this run's queued pool tasks now
+        for key, members in tasks:      # only left over when the budget stopped the scheduler
+            if key in done_keys:
+                continue
+            for index, start, end in members:
+                self.budget.record_skipped(records[index][0], start, end)
+                self.partial.add(index)
+                remaining[index] -= 1
+                if remaining[index] == 0:
+                    yield finish(index)
@@ -0,0 +1,324 @@
+"""
+┌──────────────────────────────────────────────────────────────────────────────┐
+│ Run Budget - Wall-Time, RSS and Per-Chunk Limits with Cooperative Cancel     │
+├──────────────────────────────────────────────────────────────────────────────┤
+│ Author: Dr. Venkata Rajesh Yella | License: MIT | Version: 2024.1            │
+└──────────────────────────────────────────────────────────────────────────────┘
+
+DESCRIPTION:
+    Bounds one analysis job so that a single bad input cannot monopolise a
+    shared server:
+
+        max_wall_s        Whole-job wall time. No new chunk starts after it,
+                          and running detectors are cancelled at their next
+                          checkpoint.
+        max_rss_mb        Resident memory of this process plus its children
+                          (the detector pool). Once exceeded, no new chunk
+                          starts.
+        chunk_timeout_s   Per-chunk deadline. Detectors still running on a
+                          chunk after it are cancelled, and the chunk is
+                          merged from the detectors that finished.
+
+    The limits are enforced by whoever schedules chunks (DetectorScheduler,
+    the chunk loops in nonbscanner, StreamlitSafeExecutor, genome_worker).
+    Schedulers check :meth:`RunBudget.check` before every chunk. They run
+    each detector under :class:`deadline_scope`. Long detector loops (slipped
+    DNA, cruciform, triplex, regex pattern scans) call :func:`checkpoint`,
+    which raises :class:`DetectorCancelled` once the deadline has passed.
+    A pool task that never reaches a checkpoint is abandoned
+    ABANDON_GRACE_S after its deadline, and its worker is terminated.
+
+    Every chunk that was never scanned is recorded as skipped, and every
+    cancelled (chunk, detector) pair as truncated. :meth:`RunBudget.report`
+    goes into the result metadata, and the motifs found so far are still
+    returned and stored, so partial results can be exported as usual.
+    Truncated chunks are never written to the chunk cache.
+
+CONFIGURATION (environment; unset or 0 = unlimited):
+    NONBDNA_MAX_WALL_S         Default wall-time limit in seconds
+    NONBDNA_MAX_RSS_MB         Default RSS ceiling in MB
+    NONBDNA_CHUNK_TIMEOUT_S    Default per-chunk timeout in seconds
+
+USAGE:
+    from Utilities.run_budget import RunBudget
+
+    budget = RunBudget(max_wall_s=600, max_rss_mb=4000, chunk_timeout_s=60)
+    motifs = analyze_sequence(genome, "chr1", budget=budget)
+    if budget.partial:
+        print(budget.report())   # status, stop_reason, skipped_chunks, truncated
+"""
+
+import contextvars
+import json
+import logging
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+MAX_WALL_S = float(os.environ.get('NONBDNA_MAX_WALL_S', 0) or 0)
+MAX_RSS_MB = float(os.environ.get('NONBDNA_MAX_RSS_MB', 0) or 0)
+CHUNK_TIMEOUT_S = float(os.environ.get('NONBDNA_CHUNK_TIMEOUT_S', 0) or 0)
+
+RSS_CHECK_INTERVAL = 0.5     # seconds between RSS samples in check()
+ABANDON_GRACE_S = 5.0        # pool tasks this long past their deadline are abandoned (no checkpoint reached)
+CANCELLED = 'cancelled'      # error value a cancelled detector task returns instead of a message
+
+_current_deadline: contextvars.ContextVar = contextvars.ContextVar('nonbdna_deadline', default=None)
+_current_budget: contextvars.ContextVar = contextvars.ContextVar('nonbdna_budget', default=None)
+
+
+class DetectorCancelled(Exception):
+    """Raised by :func:`checkpoint` once the enclosing deadline has passed."""
+
+
+# =============================================================================
+# COOPERATIVE CANCELLATION
+# =============================================================================
+
+def checkpoint() -> None:
+    """Raise DetectorCancelled if the enclosing :class:`deadline_scope` has expired (one ContextVar read otherwise)."""
+    deadline = _current_deadline.get()
+    if deadline is not None and time.time() > deadline:
+        raise DetectorCancelled(f"deadline passed {time.time() - deadline:.1f}s ago")
+
+
+class deadline_scope:
+    """Cancel :func:`checkpoint` callers in this context after *deadline* (epoch seconds; None = inherit)."""
+
+    __slots__ = ('deadline', '_token')
+
+    def __init__(self, deadline: Optional[float]):
+        self.deadline = deadline
+
+    def __enter__(self):
+        outer = _current_deadline.get()
+        deadline = self.deadline if outer is None else outer if self.deadline is None else min(outer, self.deadline)
+        if deadline is not None and time.time() > deadline:    # before set(): __exit__ does not run when __enter__ raises
+            raise DetectorCancelled(f"deadline passed {time.time() - deadline:.1f}s ago")
+        self._token = _current_deadline.set(deadline)
+        return deadline
+
+    def __exit__(self, *exc):
+        _current_deadline.reset(self._token)
+        return False
+
+
+# =============================================================================
+# BUDGET
+# =============================================================================
+
+def _rss_mb() -> Optional[float]:
+    """Resident memory of this process and its children in MB (peak RSS without psutil; None if unknown)."""
+    try:
+        import psutil
+        process = psutil.Process()
+        total = process.memory_info().rss
+        for child in process.children(recursive=True):
+            try:
+                total += child.memory_info().rss
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                pass
+        return total / 1e6
+    except ImportError:
+        pass
+    try:
+        import resource
+        return (resource.getrusage(resource.RUSAGE_SELF).ru_maxrss + resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss) / 1e3
+    except (ImportError, OSError):
+        return None
+
+
+class RunBudget:
+    """
+    Limits and bookkeeping for one analysis job.
+
+    Picklable, so it can be handed to pool workers. The wall-time deadline
+    is an absolute timestamp, so it stays shared. Workers return what they
+    record, and the parent adds it with :meth:`merge`.
+
+    Args:
+        max_wall_s:      Wall-time limit for the job in seconds (None/0 = unlimited)
+        max_rss_mb:      RSS ceiling for this process plus children in MB (None/0 = unlimited)
+        chunk_timeout_s: Per-chunk deadline in seconds (None/0 = unlimited)
+    """
+
+    def __init__(self, max_wall_s: Optional[float] = None, max_rss_mb: Optional[float] = None, chunk_timeout_s: Optional[float] = None):
+        self.max_wall_s = max_wall_s or None
+        self.max_rss_mb = max_rss_mb or None
+        self.chunk_timeout_s = chunk_timeout_s or None
+        self.started: Optional[float] = None
+        self.stop_reason: Optional[str] = None
+        self.peak_rss_mb = 0.0
+        self.skipped: List[Dict[str, Any]] = []
+        self.truncated: List[Dict[str, Any]] = []
+        self._rss_checked = 0.0
+        self._lock = threading.Lock()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> Optional['RunBudget']:
+        """Budget from NONBDNA_MAX_WALL_S / NONBDNA_MAX_RSS_MB / NONBDNA_CHUNK_TIMEOUT_S; None when none is set."""
+        if not (MAX_WALL_S or MAX_RSS_MB or CHUNK_TIMEOUT_S):
+            return None
+        return cls(MAX_WALL_S, MAX_RSS_MB, CHUNK_TIMEOUT_S)
+
+    @classmethod
+    def coerce(cls, value: Union['RunBudget', Dict[str, Any], None]) -> Optional['RunBudget']:
+        """A RunBudget from a budget, a limits dict (see :attr:`limits`), or None (enclosing budget, else environment)."""
+        if isinstance(value, RunBudget):
+            return value
+        if isinstance(value, dict):
+            return cls(**{k: value.get(k) for k in ('max_wall_s', 'max_rss_mb', 'chunk_timeout_s')}) if any(value.values()) else None
+        return current_budget() or cls.from_env()
+
+    @property
+    def limits(self) -> Dict[str, Optional[float]]:
+        return {'max_wall_s': self.max_wall_s, 'max_rss_mb': self.max_rss_mb, 'chunk_timeout_s': self.chunk_timeout_s}
+
+    # ------------------------------------------------------------------
+    # ENFORCEMENT
+    # ------------------------------------------------------------------
+
+    def start(self) -> 'RunBudget':
+        """Start the wall clock (idempotent; the first call wins)."""
+        if self.started is None:
+            self.started = time.time()
+        return self
+
+    @property
+    def deadline(self) -> Optional[float]:
+        """Absolute wall-time deadline, or None."""
+        return self.started + self.max_wall_s if self.max_wall_s and self.started is not None else None
+
+    def task_deadline(self) -> Optional[float]:
+        """Deadline for a chunk starting now: the chunk timeout, capped by the wall-time deadline."""
+        self.start()
+        deadlines = [d for d in (self.deadline, time.time() + self.chunk_timeout_s if self.chunk_timeout_s else None) if d is not None]
+        return min(deadlines) if deadlines else None
+
+    def check(self) -> Optional[str]:
+        """
+        'wall_time' or 'rss' once a job-wide limit is exceeded (sticky), else None.
+
+        Schedulers call this before starting each chunk. RSS is sampled at most
+        every RSS_CHECK_INTERVAL seconds.
+        """
+        if self.stop_reason is not None:
+            return self.stop_reason
+        now = time.time()
+        self.start()
+        if self.max_wall_s and now > self.started + self.max_wall_s:
+            self._stop('wall_time', f"wall time {now - self.started:.0f}s > {self.max_wall_s:g}s")
+        elif self.max_rss_mb and now - self._rss_checked >= RSS_CHECK_INTERVAL:
+            self._rss_checked = now
+            rss = _rss_mb()
+            if rss is not None:
+                self.peak_rss_mb = max(self.peak_rss_mb, rss)
+                if rss > self.max_rss_mb:
+                    self._stop('rss', f"RSS {rss:,.0f} MB > {self.max_rss_mb:,.0f} MB")
+        return self.stop_reason
+
+    def _stop(self, reason: str, detail: str) -> None:
+        self.stop_reason = reason
+        logger.warning(f"Run budget exceeded ({detail}); remaining chunks are skipped")
+
+    def expired_reason(self) -> str:
+        """Why a detector that hit its deadline was cancelled: 'wall_time' or 'chunk_timeout'."""
+        deadline = self.deadline
+        return 'wall_time' if deadline is not None and time.time() >= deadline else 'chunk_timeout'
+
+    # ------------------------------------------------------------------
+    # BOOKKEEPING
+    # ------------------------------------------------------------------
+
+    def record_skipped(self, sequence_name: str, start: int, end: int, reason: Optional[str] = None) -> None:
+        """A chunk ``[start, end)`` of ``sequence_name`` that was never scanned (overlapping chunks are coalesced)."""
+        reason = reason or self.stop_reason or 'budget'
+        with self._lock:
+            last = self.skipped[-1] if self.skipped else None
+            if last is not None and last['sequence'] == sequence_name and last['reason'] == reason and last['start'] <= start <= last['end']:
+                last['end'] = max(last['end'], int(end))
+            else:
+                self.skipped.append({'sequence': sequence_name, 'start': int(start), 'end': int(end), 'reason': reason})
+
+    def record_truncated(self, chunk: Optional[str], detector: str, reason: Optional[str] = None) -> None:
+        """A detector that was cancelled (or abandoned) on ``chunk``; its motifs for that chunk are missing."""
+        with self._lock:
+            self.truncated.append({'chunk': chunk, 'detector': detector, 'reason': reason or self.expired_reason()})
+
+    def merge(self, report: Dict[str, Any]) -> None:
+        """Add the skipped/truncated entries of a worker's :meth:`report` (or a copy of this budget)."""
+        with self._lock:
+            self.skipped.extend(report.get('skipped_chunks', ()))
+            self.truncated.extend(report.get('truncated', ()))
+            self.peak_rss_mb = max(self.peak_rss_mb, report.get('peak_rss_mb') or 0.0)
+        if report.get('stop_reason') and self.stop_reason is None:
+            self.stop_reason = report['stop_reason']
+
+    @property
+    def partial(self) -> bool:
+        """True when any chunk was skipped or any detector truncated."""
+        return bool(self.skipped or self.truncated)
+
+    def report(self) -> Dict[str, Any]:
+        """JSON-serialisable summary for result metadata."""
+        rss = _rss_mb() if self.max_rss_mb else None
+        return {
+            'status': 'partial' if self.partial else 'complete',
+            'stop_reason': self.stop_reason,
+            'limits': self.limits,
+            'elapsed_s': round(time.time() - self.started, 2) if self.started is not None else 0.0,
+            'peak_rss_mb': round(max(self.peak_rss_mb, rss or 0.0), 1),
+            'skipped_bp': sum(s['end'] - s['start'] for s in self.skipped),
+            'skipped_chunks': list(self.skipped),
+            'truncated': list(self.truncated),
+        }
+
+    def summary(self) -> str:
+        """One-line description for logs and progress messages."""
+        if not self.partial:
+            return 'complete'
+        parts = [f"{len(self.skipped)} chunk range(s) skipped"] if self.skipped else []
+        if self.truncated:
+            parts.append(f"{len(self.truncated)} detector run(s) truncated")
+        return f"partial ({self.stop_reason or 'chunk_timeout'}: {', '.join(parts)})"
+
+    def save(self, path: str) -> str:
+        """Write :meth:`report` to ``path`` as JSON."""
+        with open(path, 'w') as f:
+            json.dump(self.report(), f, indent=2)
+        return path
+
+
+class budget_scope:
+    """Make *budget* the current budget in this context and start its clock (no-op for None)."""
+
+    __slots__ = ('budget', '_token')
+
+    def __init__(self, budget: Optional[RunBudget]):
+        self.budget = budget
+
+    def __enter__(self) -> Optional[RunBudget]:
+        self._token = _current_budget.set(self.budget.start()) if self.budget is not None else None
+        return self.budget
+
+    def __exit__(self, *exc):
+        if self._token is not None:
+            _current_budget.reset(self._token)
+        return False
+
+
+def current_budget() -> Optional[RunBudget]:
+    """Budget of the enclosing :class:`budget_scope`, or None."""
+    return _current_budget.get()
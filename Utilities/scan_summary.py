@@ -0,0 +1,318 @@
+"""
+┌──────────────────────────────────────────────────────────────────────────────┐
+│ Scan Summary - Compact Per-Result-Set Statistics                             │
+├──────────────────────────────────────────────────────────────────────────────┤
+│ Author: Dr. Venkata Rajesh Yella | License: MIT | Version: 2024.1            │
+└──────────────────────────────────────────────────────────────────────────────┘
+
+DESCRIPTION:
+    A ScanSummary is fed finalized motifs once (in batches, as they become
+    available) and afterwards answers every count / coverage / density
+    question the Results and Download pages ask, without touching the motif
+    dicts again:
+
+        * motif counts, length and score sums per Class and Class:Subclass
+        * covered bp per group, per class and overall (interval union;
+          Hybrid and Non-B_DNA_Clusters excluded from the overall figure)
+        * length and score histograms per class
+        * motif-start density bins along the sequence, per class
+        * ``result_set_id``: short digest of the interval arrays, used as a
+          cache key instead of serializing the motif list
+
+    While open, a summary holds only three packed integer arrays (start,
+    end, group) and small per-group counters; ``finalize()`` reduces those
+    to fixed-size tables and releases them.
+
+USAGE:
+    from Utilities.scan_summary import ScanSummary
+
+    summary = ScanSummary('chr1', sequence_length)
+    for batch in batches:
+        summary.update(batch)
+    summary.finalize()
+
+    summary.genomic_density(by_class=True)      # == calculate_genomic_density(...)
+    summary.to_dict()                           # JSON-safe, ScanSummary.from_dict() restores
+"""
+
+import hashlib
+import logging
+from array import array
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Composite classes left out of overall coverage (they re-cover other motifs)
+DERIVED_CLASSES = ('Hybrid', 'Non-B_DNA_Clusters')
+
+LENGTH_BIN_EDGES = (0, 10, 20, 30, 50, 100, 200, 500, 1000, 5000)   # last bin open-ended
+SCORE_BIN_EDGES = tuple(round(1.0 + 0.2 * i, 1) for i in range(11))  # 1.0 .. 3.0 normalized scale
+DENSITY_BINS = 100
+
+
+def _union_bp(starts: np.ndarray, ends: np.ndarray) -> int:
+    """Covered bp of half-open intervals (touching intervals merge)."""
+    keep = ends > starts
+    if not keep.all():
+        starts, ends = starts[keep], ends[keep]
+    if starts.size == 0:
+        return 0
+    order = np.argsort(starts, kind='stable')
+    starts, ends = starts[order], ends[order]
+    reach = np.maximum.accumulate(ends)
+    new_block = np.empty(starts.size, dtype=bool)
+    new_block[0] = True
+    new_block[1:] = starts[1:] > reach[:-1]
+    first = np.flatnonzero(new_block)
+    last = np.append(first[1:] - 1, starts.size - 1)
+    return int((reach[last] - starts[first]).sum())
+
+
+class ScanSummary:
+    """
+    Incrementally built statistics for one sequence's result set.
+
+    Groups are (Class, Subclass) pairs; class-level figures are derived from
+    them.  Coordinates follow the motif convention (1-based inclusive Start
+    and End); intervals with End < Start are counted but cover nothing.
+    """
+
+    def __init__(self, sequence_name: str = 'sequence', sequence_length: int = 0):
+        self.sequence_name = sequence_name
+        self.sequence_length = int(sequence_length)
+        self.total_count = 0
+        self.groups: List[Tuple[str, str]] = []
+        self.group_count: List[int] = []
+        self.group_length_sum: List[float] = []
+        self.group_score_sum: List[float] = []
+        self.group_covered_bp: List[int] = []
+        self.class_covered_bp: Dict[str, int] = {}
+        self.covered_bp = 0
+        self.length_histogram: Dict[str, List[int]] = {}
+        self.score_histogram: Dict[str, List[int]] = {}
+        self.density_bins: Dict[str, List[int]] = {}
+        self.result_set_id: Optional[str] = None
+        self._group_index: Dict[Tuple[str, str], int] = {}
+        self._starts = array('q')
+        self._ends = array('q')
+        self._codes = array('l')
+        self._lengths = array('d')
+        self._scores = array('d')
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # BUILDING
+    # ─────────────────────────────────────────────────────────────────────────
+
+    @property
+    def finalized(self) -> bool:
+        return self.result_set_id is not None
+
+    def update(self, motifs: Iterable[Dict[str, Any]]) -> 'ScanSummary':
+        """Add a batch of finalized motifs."""
+        if self.finalized:
+            raise RuntimeError("ScanSummary is finalized; create a new one for another result set")
+        index = self._group_index
+        for m in motifs:
+            key = (m.get('Class', 'Unknown'), m.get('Subclass', 'Unknown'))
+            code = index.get(key)
+            if code is None:
+                code = index[key] = len(self.groups)
+                self.groups.append(key)
+                self.group_count.append(0)
+                self.group_length_sum.append(0.0)
+                self.group_score_sum.append(0.0)
+            start, end = m.get('Start', 0), m.get('End', 0)
+            length, score = m.get('Length', 0), m.get('Score', 0)
+            length = length if isinstance(length, (int, float)) else 0
+            score = score if isinstance(score, (int, float)) else 0
+            self.group_count[code] += 1
+            self.group_length_sum[code] += length
+            self.group_score_sum[code] += score
+            self._starts.append(int(start) - 1)
+            self._ends.append(int(end))
+            self._codes.append(code)
+            self._lengths.append(length)
+            self._scores.append(score)
+            self.total_count += 1
+        return self
+
+    def finalize(self, sequence_length: Optional[int] = None) -> 'ScanSummary':
+        """Compute coverage, histograms, density bins and the result-set id; release the buffers."""
+        if self.finalized:
+            return self
+        if sequence_length is not None:
+            self.sequence_length = int(sequence_length)
+        starts = np.frombuffer(self._starts, dtype=np.int64) if self._starts else np.zeros(0, dtype=np.int64)
+        ends = np.frombuffer(self._ends, dtype=np.int64) if self._ends else np.zeros(0, dtype=np.int64)
+        codes = np.asarray(self._codes, dtype=np.int64)
+        lengths = np.frombuffer(self._lengths, dtype=np.float64) if self._lengths else np.zeros(0)
+        scores = np.frombuffer(self._scores, dtype=np.float64) if self._scores else np.zeros(0)
+
+        self.group_covered_bp = [_union_bp(starts[codes == g], ends[codes == g]) for g in range(len(self.groups))]
+        classes = self.class_names
+        class_of = np.array([classes.index(c) for c, _ in self.groups], dtype=np.int64)
+        motif_class = class_of[codes] if codes.size else codes
+        for ci, cls in enumerate(classes):
+            sel = motif_class == ci
+            self.class_covered_bp[cls] = _union_bp(starts[sel], ends[sel])
+            self.length_histogram[cls] = self._histogram(lengths[sel], LENGTH_BIN_EDGES)
+            self.score_histogram[cls] = self._histogram(np.clip(scores[sel], SCORE_BIN_EDGES[0], SCORE_BIN_EDGES[-1]),
+                                                        SCORE_BIN_EDGES, closed=True)
+            if self.sequence_length > 0:
+                bins = np.clip((starts[sel] * DENSITY_BINS) // self.sequence_length, 0, DENSITY_BINS - 1)
+                self.density_bins[cls] = np.bincount(bins, minlength=DENSITY_BINS).tolist()
+        main = ~np.isin(motif_class, [ci for ci, c in enumerate(classes) if c in DERIVED_CLASSES])
+        self.covered_bp = _union_bp(starts[main], ends[main])
+
+        digest = hashlib.blake2b(digest_size=12)
+        digest.update(f"{self.sequence_name}\x00{self.sequence_length}\x00{self.groups!r}".encode())
+        for arr in (starts, ends, codes):
+            digest.update(arr.tobytes())
+        self.result_set_id = digest.hexdigest()
+
+        self._starts = self._ends = self._codes = self._lengths = self._scores = None
+        return self
+
+    @staticmethod
+    def _histogram(values: np.ndarray, edges: Tuple[float, ...], closed: bool = False) -> List[int]:
+        bounds = list(edges) if closed else list(edges) + [np.inf]
+        return np.histogram(values, bins=bounds)[0].tolist()
+
+    @classmethod
+    def from_motifs(cls, motifs: Iterable[Dict[str, Any]], sequence_length: int,
+                    sequence_name: str = 'sequence') -> 'ScanSummary':
+        """Build and finalize a summary from a complete motif list."""
+        return cls(sequence_name, sequence_length).update(motifs).finalize()
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # QUERIES
+    # ─────────────────────────────────────────────────────────────────────────
+
+    @property
+    def class_names(self) -> List[str]:
+        """Classes in first-seen order."""
+        return list(dict.fromkeys(c for c, _ in self.groups))
+
+    def class_counts(self, include_derived: bool = True) -> Dict[str, int]:
+        counts: Dict[str, int] = {}
+        for (cls, _), n in zip(self.groups, self.group_count):
+            if include_derived or cls not in DERIVED_CLASSES:
+                counts[cls] = counts.get(cls, 0) + n
+        return counts
+
+    def subclass_counts(self) -> Dict[str, int]:
+        """Counts keyed 'Class:Subclass'."""
+        return {f"{c}:{s}": n for (c, s), n in zip(self.groups, self.group_count)}
+
+    def group_rows(self) -> List[Dict[str, Any]]:
+        """One row per (Class, Subclass): count, covered bp, mean length and score."""
+        return [{'Class': c, 'Subclass': s, 'Count': n, 'Covered_bp': cov,
+                 'Mean_Length': (ls / n) if n else 0.0, 'Mean_Score': (ss / n) if n else 0.0}
+                for (c, s), n, cov, ls, ss in zip(self.groups, self.group_count, self.group_covered_bp,
+                                                  self.group_length_sum, self.group_score_sum)]
+
+    def class_rows(self) -> List[Dict[str, Any]]:
+        """One row per Class: count, covered bp, mean length and score."""
+        rows: Dict[str, Dict[str, Any]] = {}
+        for (c, _), n, ls, ss in zip(self.groups, self.group_count, self.group_length_sum, self.group_score_sum):
+            row = rows.setdefault(c, {'Class': c, 'Count': 0, 'Covered_bp': self.class_covered_bp.get(c, 0),
+                                      'Mean_Length': 0.0, 'Mean_Score': 0.0})
+            row['Count'] += n
+            row['Mean_Length'] += ls
+            row['Mean_Score'] += ss
+        for row in rows.values():
+            row['Mean_Length'] /= row['Count'] or 1
+            row['Mean_Score'] /= row['Count'] or 1
+        return list(rows.values())
+
+    def genomic_density(self, by_class: bool = True, by_subclass: bool = False) -> Dict[str, float]:
+        """Coverage percentages; same keys and values as ``calculate_genomic_density``."""
+        G = self.sequence_length
+        main = [(g, n) for g, n in zip(self.groups, self.group_count) if g[0] not in DERIVED_CLASSES]
+        if not self.total_count or G == 0 or not main:
+            return {'Overall': 0.0}
+        overall = round(min(self.covered_bp / G * 100, 100.0), 4)
+        if not by_class and not by_subclass:
+            return {'Overall': overall}
+        result: Dict[str, float] = {}
+        if by_subclass:
+            for (c, s), cov in zip(self.groups, self.group_covered_bp):
+                if c not in DERIVED_CLASSES and cov:
+                    result[f"{c}:{s}"] = round(min(cov / G * 100, 100.0), 4)
+        else:
+            for c in dict.fromkeys(c for (c, _), _ in main):
+                if self.class_covered_bp.get(c):
+                    result[c] = round(min(self.class_covered_bp[c] / G * 100, 100.0), 4)
+        result['Overall'] = overall
+        return result
+
+    def positional_density(self, unit: str = 'Mbp', by_class: bool = True,
+                           by_subclass: bool = False) -> Dict[str, float]:
+        """Motifs per unit length; same keys and values as ``calculate_positional_density``."""
+        if not self.total_count or self.sequence_length == 0:
+            return {'Overall': 0.0}
+        scale = {'kbp': 1000, 'Mbp': 1000000}.get(unit, 1)
+        length = self.sequence_length / scale
+        if not by_class and not by_subclass:
+            return {'Overall': round(self.total_count / length, 2)}
+        counts = self.subclass_counts() if by_subclass else self.class_counts()
+        result = {k: round(n / length, 2) for k, n in counts.items()}
+        result['Overall'] = round(self.total_count / length, 2)
+        return result
+
+    def motif_statistics(self) -> Dict[str, Any]:
+        """Headline figures (main motifs only), as in ``calculate_motif_statistics``."""
+        G = self.sequence_length
+        main_groups = [g for g in self.groups if g[0] not in DERIVED_CLASSES]
+        n = sum(self.class_counts(include_derived=False).values())
+        coverage = (self.covered_bp / G * 100) if G > 0 else 0.0
+        counts = self.class_counts()
+        return {
+            'Total_Motifs': n,
+            'Total_Motifs_All': self.total_count,
+            'Hybrid_Count': counts.get('Hybrid', 0),
+            'Cluster_Count': counts.get('Non-B_DNA_Clusters', 0),
+            'Coverage%': round(coverage, 2),
+            'Coverage_Fraction': round(coverage / 100, 6),
+            'Total_Covered_Bases': self.covered_bp,
+            'Density': round((n / G * 1000) if G > 0 else 0.0, 2),
+            'Classes_Detected': len({c for c, _ in main_groups}),
+            'Subclasses_Detected': len({s for _, s in main_groups}),
+            'Class_Distribution': self.class_counts(include_derived=False),
+            'Hybrid_Coverage_bp': self.class_covered_bp.get('Hybrid', 0),
+            'Cluster_Coverage_bp': self.class_covered_bp.get('Non-B_DNA_Clusters', 0),
+        }
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # SERIALIZATION
+    # ─────────────────────────────────────────────────────────────────────────
+
+    _FIELDS = ('sequence_name', 'sequence_length', 'total_count', 'group_count', 'group_length_sum',
+               'group_score_sum', 'group_covered_bp', 'class_covered_bp', 'covered_bp', 'length_histogram',
+               'score_histogram', 'density_bins', 'result_set_id')
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-safe representation of a finalized summary."""
+        if not self.finalized:
+            self.finalize()
+        data = {name: getattr(self, name) for name in self._FIELDS}
+        data['groups'] = [list(g) for g in self.groups]
+        data['length_bin_edges'] = list(LENGTH_BIN_EDGES)
+        data['score_bin_edges'] = list(SCORE_BIN_EDGES)
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'ScanSummary':
+        summary = cls(data['sequence_name'], data['sequence_length'])
+        for name in cls._FIELDS:
+            setattr(summary, name, data[name])
+        summary.groups = [tuple(g) for g in data['groups']]
+        summary._group_index = {g: i for i, g in enumerate(summary.groups)}
+        summary._starts = summary._ends = summary._codes = summary._lengths = summary._scores = None
+        return summary
+
+    def __repr__(self) -> str:
+        state = self.result_set_id or 'open'
+        return f"ScanSummary({self.sequence_name!r}, {self.total_count} motifs, {state})"
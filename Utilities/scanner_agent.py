@@ -31,12 +31,18 @@ ARCHITECTURE:
     - Chunks genome into overlapping segments (1000nt overlap)
     - Parallel processing using multiprocessing.Pool
     - Deduplication of overlapping matches
+    - Stream-mode Hyperscan databases (see Utilities.stream_scan) skip
+      chunking: consecutive chunks are fed into one stream, matches are
+      emitted once with global offsets, no overlap and no deduplication
     - No scoring logic (delegated to existing ScoringEngine)
 
 PERFORMANCE:
     - Chunk size: 50,000 bp (configurable)
     - Overlap: 1,000 bp (handles motifs at boundaries)
     - Worker processes: CPU count
+    - Genome in shared memory, Hyperscan DB deserialized once per worker
+      (pool initializer); tasks are (start, end) offsets only
+    - Matches returned as packed int64 arrays, deduplicated with np.unique
     - Progress reporting: Per-chunk completion
 
 USAGE:
@@ -46,11 +52,17 @@ USAGE:
     raw_motifs = scanner.run_scan()
 """
 
+import logging
 import multiprocessing as mp
+from array import array
+from contextlib import contextmanager
+from multiprocessing import shared_memory
 from typing import List, Dict, Tuple, Optional, Any, Callable
 import numpy as np
 from collections import defaultdict
 
+logger = logging.getLogger(__name__)
+
 # Try to import Hyperscan (optional dependency)
 try:
     import hyperscan
@@ -65,105 +77,130 @@ OVERLAP_SIZE = 1000  # 1kb overlap to catch motifs at chunk boundaries
 MIN_MOTIF_LENGTH = 4  # Minimum motif length to consider
 
 
-def hs_worker_task(args: Tuple[int, np.ndarray, Any]) -> List[Dict[str, Any]]:
+# Packed match record: 0-based half-open [start, end) + pattern id
+MATCH_DTYPE = np.dtype([('start', np.int64), ('end', np.int64), ('pattern_id', np.int64)])
+
+# Per-process worker state, set once by the pool initializer (_init_worker)
+_WORKER_GENOME: Optional[np.ndarray] = None
+_WORKER_SHM = None
+_WORKER_DB = None
+
+
+def _is_stream_database(hs_db: Any) -> bool:
+    """True for a database compiled with HS_MODE_STREAM (e.g. by Utilities.stream_scan)."""
+    return HYPERSCAN_AVAILABLE and hs_db is not None and bool(getattr(hs_db, 'mode', 0) & hyperscan.HS_MODE_STREAM)
+
+
+def _init_worker(shm_name: Optional[str], genome_length: int, genome_bytes: Optional[bytes], db_bytes: Optional[bytes]) -> None:
+    """
+    Pool initializer: map the genome and load the Hyperscan database once per worker.
+    
+    Args:
+        shm_name: Name of the shared-memory block holding the genome (None = use genome_bytes)
+        genome_length: Genome length in bytes
+        genome_bytes: Genome copy, only when shared memory is unavailable
+        db_bytes: Serialized Hyperscan database (None for the fallback scanner)
+    """
+    global _WORKER_GENOME, _WORKER_SHM, _WORKER_DB
+    if shm_name is not None:
+        _WORKER_SHM = shared_memory.SharedMemory(name=shm_name)
+        _WORKER_GENOME = np.ndarray((genome_length,), dtype=np.uint8, buffer=_WORKER_SHM.buf)
+    else:
+        _WORKER_GENOME = np.frombuffer(genome_bytes, dtype=np.uint8)
+    _WORKER_DB = hyperscan.loadb(db_bytes) if HYPERSCAN_AVAILABLE and db_bytes is not None else None
+
+
+def hs_worker_task(args: Tuple[int, int]) -> np.ndarray:
     """
     Worker function for parallel Hyperscan scanning.
     
     This is the core worker that:
-    1. Takes a chunk of the genome and its global offset
-    2. Runs Hyperscan database in Block Mode OR fallback scanner
+    1. Takes the bounds of one genome chunk (the genome itself is mapped once per worker)
+    2. Runs the worker's Hyperscan database in Block Mode
     3. Converts local coordinates to global coordinates
-    4. Returns full motif dictionaries
+    4. Returns the matches packed into an int64 array (no per-match dicts)
     
     Args:
-        args: Tuple of (offset, genome_chunk, hs_database)
-            - offset: Global starting position of this chunk (0-based)
-            - genome_chunk: NumPy byte array of sequence chunk
-            - hs_database: Compiled Hyperscan database (or None for fallback)
+        args: Tuple of (chunk_start, chunk_end), 0-based half-open global offsets
     
     Returns:
-        List of motif dictionaries with adjusted global coordinates
+        (n, 3) int64 array of (start, end, pattern_id) rows, 0-based half-open global coordinates
     """
-    offset, genome_chunk, hs_db = args
-    local_results = []
+    chunk_start, chunk_end = args
+    found = array('q')
+    
+    def match_handler(id, start, end, flags, context):
+        """Callback for Hyperscan matches"""
+        # Convert local match coordinates to global coordinates
+        found.extend((chunk_start + start, chunk_start + end, id))
+        return 0  # Continue scanning
+    
+    try:
+        _WORKER_DB.scan(_WORKER_GENOME[chunk_start:chunk_end].tobytes(), match_handler)
+    except Exception as e:
+        # If Hyperscan fails, log but don't crash
+        logger.warning(f"Hyperscan scan failed at offset {chunk_start}: {e}")
+    return np.frombuffer(found, dtype=np.int64).reshape(-1, 3)
+
+
+def fallback_worker_task(args: Tuple[int, int]) -> List[Dict[str, Any]]:
+    """
+    Worker function used when Hyperscan is not available.
     
-    # Convert numpy array to bytes
-    chunk_bytes = genome_chunk.tobytes()
+    Runs the existing regex-based detection pipeline on one chunk of the
+    worker's mapped genome and returns full motif dictionaries.
     
-    if HYPERSCAN_AVAILABLE and hs_db is not None:
-        # Hyperscan match handler (callback function)
-        # Note: This returns tuples for Hyperscan mode
-        raw_tuples = []
+    Args:
+        args: Tuple of (chunk_start, chunk_end), 0-based half-open global offsets
+    
+    Returns:
+        List of motif dictionaries with adjusted global coordinates
+    """
+    chunk_start, chunk_end = args
+    local_results = []
+    try:
+        # Import the existing analyze_sequence function
+        from Utilities.nonbscanner import analyze_sequence
         
-        def match_handler(id, start, end, flags, context):
-            """Callback for Hyperscan matches"""
-            # Convert local match coordinates to global coordinates
-            global_start = offset + start
-            global_end = offset + end
-            raw_tuples.append((global_start, global_end, id))
-            return 0  # Continue scanning
+        # Decode chunk to string
+        chunk_str = _WORKER_GENOME[chunk_start:chunk_end].tobytes().decode('utf-8', errors='ignore')
         
-        try:
-            # Execute Hyperscan in Block Mode
-            hs_db.scan(chunk_bytes, match_handler)
-            # Convert tuples to motif dicts (minimal format for Hyperscan)
-            for start, end, pattern_id in raw_tuples:
-                # Hyperscan returns 0-based half-open intervals [start, end)
-                # Convert to 1-based inclusive coordinates [Start, End]
-                # start (0-based) -> Start (1-based): add 1
-                # end (0-based exclusive) -> End (1-based inclusive): no change (end-1+1)
-                motif_start = start + 1  # Convert to 1-based
-                motif_end = end  # Already correct for 1-based inclusive (0-based exclusive = 1-based inclusive)
-                motif_length = motif_end - motif_start + 1  # 1-based inclusive length
-                
-                local_results.append({
-                    'Start': motif_start,
-                    'End': motif_end,
-                    'Length': motif_length,
-                    'Class': f'Pattern_{pattern_id}',
-                    'Subclass': 'Hyperscan',
-                    'Sequence_Name': f'chunk_{offset}',
-                    'Score': 1.0
-                })
-        except Exception as e:
-            # If Hyperscan fails, log but don't crash
-            print(f"Warning: Hyperscan scan failed at offset {offset}: {e}")
-            return local_results
-    else:
-        # Fallback: Use regex-based detection from existing scanner
-        # This maintains compatibility when Hyperscan is not available
-        try:
-            # Import the existing analyze_sequence function
-            from Utilities.nonbscanner import analyze_sequence
-            
-            # Decode chunk to string
-            chunk_str = chunk_bytes.decode('utf-8', errors='ignore')
-            
-            # Run detection on chunk (returns full motif dictionaries)
-            chunk_motifs = analyze_sequence(chunk_str, f"chunk_{offset}")
-            
-            # Adjust coordinates from chunk-local to global
-            # COORDINATE SYSTEM NOTE:
-            # - analyze_sequence returns 1-based INCLUSIVE coordinates
-            # - offset is 0-based position in full sequence
-            # - We need to add offset to convert local positions to global
-            for motif in chunk_motifs:
-                # Create adjusted copy of motif
-                adjusted_motif = motif.copy()
-                # Adjust start/end: add offset (which is 0-based)
-                # Since motif coords are 1-based, we add offset to translate them
-                adjusted_motif['Start'] = motif.get('Start', 1) + offset
-                adjusted_motif['End'] = motif.get('End', 1) + offset
-                local_results.append(adjusted_motif)
-        except Exception as e:
-            # Silently skip if detection fails - worker shouldn't crash the whole job
-            import traceback
-            print(f"Warning: Worker task failed at offset {offset}: {e}")
-            traceback.print_exc()
+        # Run detection on chunk (returns full motif dictionaries)
+        chunk_motifs = analyze_sequence(chunk_str, f"chunk_{chunk_start}")
+        
+        # Adjust coordinates from chunk-local to global
+        # COORDINATE SYSTEM NOTE:
+        # - analyze_sequence returns 1-based INCLUSIVE coordinates
+        # - chunk_start is 0-based position in full sequence
+        # - We need to add chunk_start to convert local positions to global
+        for motif in chunk_motifs:
+            adjusted_motif = motif.copy()
+            adjusted_motif['Start'] = motif.get('Start', 1) + chunk_start
+            adjusted_motif['End'] = motif.get('End', 1) + chunk_start
+            local_results.append(adjusted_motif)
+    except Exception:
+        # Skip the chunk if detection fails - worker shouldn't crash the whole job
+        logger.exception(f"Worker task failed at offset {chunk_start}")
     
     return local_results
 
 
+def matches_to_motifs(matches: np.ndarray, sequence_name: str = 'sequence') -> List[Dict[str, Any]]:
+    """
+    Convert packed Hyperscan matches (MATCH_DTYPE) to minimal motif dicts in bulk.
+    
+    Hyperscan reports 0-based half-open intervals [start, end); these become
+    1-based inclusive [Start, End]: Start = start + 1, End = end.
+    """
+    starts = (matches['start'] + 1).tolist()
+    ends = matches['end'].tolist()
+    return [
+        {'Start': s, 'End': e, 'Length': e - s + 1, 'Class': f'Pattern_{p}', 'Subclass': 'Hyperscan',
+         'Sequence_Name': sequence_name, 'Score': 1.0}
+        for s, e, p in zip(starts, ends, matches['pattern_id'].tolist())
+    ]
+
+
 class ParallelScanner:
     """
     Parallel scanning agent for high-performance motif detection.
@@ -174,6 +211,10 @@ class ParallelScanner:
     - Aggregates and deduplicates results
     - Reports progress dynamically
     
+    Workers are initialized once per pool: the genome is placed in shared
+    memory and the Hyperscan database is serialized once, so each task is
+    only a pair of offsets and each result a packed int64 array.
+    
     Attributes:
         genome: Full genome sequence as NumPy byte array
         hs_db: Compiled Hyperscan database (optional)
@@ -187,7 +228,8 @@ class ParallelScanner:
                  hs_db: Optional[Any] = None,
                  chunk_size: int = CHUNK_SIZE,
                  overlap_size: int = OVERLAP_SIZE,
-                 num_workers: Optional[int] = None):
+                 num_workers: Optional[int] = None,
+                 sequence_name: str = 'sequence'):
         """
         Initialize the parallel scanner.
         
@@ -197,6 +239,7 @@ class ParallelScanner:
             chunk_size: Size of each chunk (default: 50kb)
             overlap_size: Overlap between chunks (default: 1kb)
             num_workers: Number of worker processes (default: CPU count)
+            sequence_name: Sequence_Name reported on Hyperscan matches
         """
         # Convert genome to NumPy byte array for efficient chunking
         self.genome_array = np.frombuffer(genome.encode('utf-8'), dtype=np.uint8)
@@ -205,6 +248,7 @@ class ParallelScanner:
         self.chunk_size = chunk_size
         self.overlap_size = overlap_size
         self.num_workers = num_workers or mp.cpu_count()
+        self.sequence_name = sequence_name
         
         # Calculate number of chunks
         self.num_chunks = self._calculate_num_chunks()
@@ -218,32 +262,82 @@ class ParallelScanner:
         num_chunks = (self.genome_length + effective_chunk_size - 1) // effective_chunk_size
         return max(1, num_chunks)
     
-    def _create_tasks(self) -> List[Tuple[int, np.ndarray, Any]]:
+    def _create_tasks(self) -> List[Tuple[int, int]]:
         """
         Create task list for parallel processing.
         
-        Each task is a tuple of (offset, chunk_array, hs_db).
+        Each task is a (chunk_start, chunk_end) pair of 0-based offsets; the
+        chunk bytes are read by the worker from its mapped genome.
         Chunks overlap by OVERLAP_SIZE to ensure motifs at boundaries are found.
         
         Returns:
-            List of (offset, genome_chunk, hs_db) tuples for workers
+            List of (chunk_start, chunk_end) tuples for workers
         """
-        tasks = []
         effective_chunk_size = self.chunk_size - self.overlap_size
+        return [
+            (i * effective_chunk_size, min(i * effective_chunk_size + self.chunk_size, self.genome_length))
+            for i in range(self.num_chunks)
+        ]
+    
+    def _use_hyperscan(self) -> bool:
+        return HYPERSCAN_AVAILABLE and self.hs_db is not None
+    
+    @contextmanager
+    def _worker_pool(self):
+        """Pool whose workers map the genome from shared memory and load the database once."""
+        shm = None
+        genome_bytes = None
+        try:
+            shm = shared_memory.SharedMemory(create=True, size=max(1, self.genome_length))
+            shm.buf[:self.genome_length] = self.genome_array.tobytes()
+        except (OSError, ValueError) as e:
+            # No usable /dev/shm: ship one genome copy per worker via the initializer
+            logger.debug(f"Shared memory unavailable ({e}); copying genome to workers")
+            if shm is not None:
+                shm.close()
+                shm.unlink()
+                shm = None
+            genome_bytes = self.genome_array.tobytes()
+        db_bytes = hyperscan.dumpb(self.hs_db) if self._use_hyperscan() else None
+        try:
+            with mp.Pool(processes=self.num_workers, initializer=_init_worker,
+                         initargs=(shm.name if shm is not None else None, self.genome_length, genome_bytes, db_bytes)) as pool:
+                yield pool
+        finally:
+            if shm is not None:
+                shm.close()
+                shm.unlink()
+    
+    def _run_tasks(self, progress_callback: Optional[Callable[[int, int], None]] = None) -> list:
+        """Distribute chunk tasks to the worker pool and collect the per-chunk results in order."""
+        tasks = self._create_tasks()
+        worker = hs_worker_task if self._use_hyperscan() else fallback_worker_task
+        results = []
+        with self._worker_pool() as pool:
+            for i, result in enumerate(pool.imap(worker, tasks)):
+                results.append(result)
+                
+                # Report progress if callback provided
+                if progress_callback:
+                    progress_callback(i + 1, len(tasks))
+        return results
+    
+    def run_scan_arrays(self, progress_callback: Optional[Callable[[int, int], None]] = None) -> np.ndarray:
+        """
+        Execute the Hyperscan scan and return the unique matches as a MATCH_DTYPE
+        array sorted by (start, end, pattern_id), without building motif dicts.
         
-        for i in range(self.num_chunks):
-            # Calculate chunk boundaries
-            # IMPORTANT: offset is in 0-based coordinates for internal processing
-            chunk_start = i * effective_chunk_size
-            chunk_end = min(chunk_start + self.chunk_size, self.genome_length)
-            
-            # Extract chunk (includes overlap with next chunk)
-            chunk_array = self.genome_array[chunk_start:chunk_end]
-            
-            # Create task tuple (offset is 0-based for internal use)
-            tasks.append((chunk_start, chunk_array, self.hs_db))
+        Args:
+            progress_callback: Optional callback function(current, total) for progress
         
-        return tasks
+        Returns:
+            Structured array of 0-based half-open (start, end, pattern_id) matches
+        """
+        if not self._use_hyperscan():
+            raise RuntimeError("run_scan_arrays() requires a Hyperscan database")
+        if _is_stream_database(self.hs_db):
+            return self._run_stream_scan(progress_callback)
+        return self._deduplicate(self._run_tasks(progress_callback))
     
     def run_scan(self, progress_callback: Optional[Callable[[int, int], None]] = None) -> List[Dict[str, Any]]:
         """
@@ -262,27 +356,61 @@ class ParallelScanner:
         Returns:
             List of unique motif dictionaries sorted by position
         """
-        tasks = self._create_tasks()
-        all_raw_results = []
+        if self._use_hyperscan():
+            return matches_to_motifs(self.run_scan_arrays(progress_callback), self.sequence_name)
+        return self._deduplicate_motifs(self._run_tasks(progress_callback))
+    
+    def _run_stream_scan(self, progress_callback: Optional[Callable[[int, int], None]] = None) -> np.ndarray:
+        """
+        Scan the genome through one Hyperscan stream, chunk by chunk.
         
-        # Use multiprocessing.Pool for parallel execution
-        with mp.Pool(processes=self.num_workers) as pool:
-            # Process tasks and collect results
-            for i, result in enumerate(pool.imap(hs_worker_task, tasks)):
-                all_raw_results.append(result)
-                
-                # Report progress if callback provided
+        Chunks are consecutive (no overlap): the stream carries match state
+        across chunk boundaries and reports global offsets, so every match is
+        emitted exactly once and no deduplication pass is needed.
+        
+        Args:
+            progress_callback: Optional callback function(current, total) for progress
+        
+        Returns:
+            MATCH_DTYPE array sorted by (start, end, pattern_id)
+        """
+        found = array('q')
+        
+        def match_handler(id, start, end, flags, context):
+            found.extend((start, end, id))
+            return 0
+        
+        total = max(1, (self.genome_length + self.chunk_size - 1) // self.chunk_size)
+        with self.hs_db.stream(match_event_handler=match_handler) as stream:
+            for i, chunk_start in enumerate(range(0, self.genome_length, self.chunk_size)):
+                stream.scan(self.genome_array[chunk_start:chunk_start + self.chunk_size].tobytes())
                 if progress_callback:
-                    progress_callback(i + 1, len(tasks))
+                    progress_callback(i + 1, total)
         
-        # Deduplicate results from overlapping regions
-        unique_motifs = self._deduplicate(all_raw_results)
+        return np.sort(np.frombuffer(found, dtype=np.int64).view(MATCH_DTYPE))
+    
+    def _deduplicate(self, results_list: List[np.ndarray]) -> np.ndarray:
+        """
+        Deduplicate Hyperscan matches found in overlapping regions.
         
-        return unique_motifs
+        The packed (start, end, pattern_id) rows of all chunks are viewed as
+        one structured array and reduced with np.unique, which also sorts
+        them by position.
+        
+        Args:
+            results_list: List of (n, 3) int64 arrays from each worker
+        
+        Returns:
+            Unique MATCH_DTYPE array sorted by (start, end, pattern_id)
+        """
+        if not results_list:
+            return np.empty(0, dtype=MATCH_DTYPE)
+        packed = np.ascontiguousarray(np.concatenate(results_list), dtype=np.int64)
+        return np.unique(packed.view(MATCH_DTYPE).ravel())
     
-    def _deduplicate(self, results_list: List[List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    def _deduplicate_motifs(self, results_list: List[List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
         """
-        Deduplicate motifs found in overlapping regions.
+        Deduplicate fallback-scanner motifs found in overlapping regions.
         
         Uses a dictionary-based approach where duplicates are identified by 
         identical (Start, End, Class, Subclass) keys.
@@ -335,7 +463,8 @@ class ParallelScanner:
             'num_chunks': self.num_chunks,
             'num_workers': self.num_workers,
             'hyperscan_available': HYPERSCAN_AVAILABLE,
-            'using_hyperscan': HYPERSCAN_AVAILABLE and self.hs_db is not None
+            'using_hyperscan': HYPERSCAN_AVAILABLE and self.hs_db is not None,
+            'streaming': _is_stream_database(self.hs_db)
         }
 
 
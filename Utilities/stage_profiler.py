@@ -0,0 +1,381 @@
+"""
+┌──────────────────────────────────────────────────────────────────────────────┐
+│ Stage Profiler - Opt-in Per-Chunk / Per-Detector Pipeline Profiling          │
+├──────────────────────────────────────────────────────────────────────────────┤
+│ Author: Dr. Venkata Rajesh Yella | License: MIT | Version: 2024.1            │
+└──────────────────────────────────────────────────────────────────────────────┘
+
+DESCRIPTION:
+    Records one event per pipeline stage execution:
+
+        chunk         one chunk scan (_scan_chunk), incl. cache lookups
+        detector      one detector's detect_motifs() on one chunk
+        overlaps      NonBScanner._remove_overlaps()
+        filter        per-detector candidates before / after overlap removal
+        hybrid        NonBScanner._detect_hybrid_motifs()
+        clusters      NonBScanner._detect_clusters()
+        deduplicate   chunk-boundary _deduplicate_motifs()
+
+    Each event carries wall time, CPU time of the executing thread
+    (``time.thread_time``, so parallel detector threads are attributed
+    correctly), candidate counts in/out, bases scanned, the chunk label and
+    optionally the net bytes allocated while the stage ran (tracemalloc;
+    process-wide, so approximate when detectors run in parallel threads).
+
+    Events are buffered per process and appended to
+    ``<profile dir>/profile-<pid>.jsonl`` whenever a chunk or scan finishes,
+    so process-pool workers (which never run atexit handlers) contribute
+    too.  :func:`collect_profile` aggregates every file into a
+    :class:`ProfileReport` that exports JSON and Prometheus text format.
+
+    Profiling is off by default and costs one flag check per stage when off.
+    Enabling it through the environment (or :func:`enable_profiling`, which
+    sets the environment) also enables it in worker processes started later.
+
+CONFIGURATION (environment):
+    NONBDNA_PROFILE          'true' to enable (default: disabled)
+    NONBDNA_PROFILE_DIR      Event directory (default: <tmp>/nonbdna_profile)
+    NONBDNA_PROFILE_MEMORY   'true' to record tracemalloc deltas (slows scans ~8x)
+
+USAGE:
+    from Utilities.stage_profiler import enable_profiling, collect_profile
+
+    enable_profiling(reset=True)
+    analyze_sequence(genome, "chr1")
+    report = collect_profile()
+    report.write_json("profile.json")
+    report.write_prometheus("profile.prom")
+
+    # or from the shell, after a profiled run:
+    python -m Utilities.stage_profiler --json profile.json --prom profile.prom
+"""
+
+import atexit
+import contextvars
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+import tracemalloc
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+PROFILE_ENABLED = os.environ.get('NONBDNA_PROFILE', 'false').lower() == 'true'
+PROFILE_DIR = os.environ.get('NONBDNA_PROFILE_DIR', os.path.join(tempfile.gettempdir(), 'nonbdna_profile'))
+PROFILE_MEMORY = os.environ.get('NONBDNA_PROFILE_MEMORY', 'false').lower() == 'true'
+
+# Flush the in-process buffer once it holds this many events
+_FLUSH_EVENTS = 1000
+_FILE_PATTERN = 'profile-*.jsonl'
+_PROMETHEUS_PREFIX = 'nonbdna'
+
+_buffer: List[Dict[str, Any]] = []
+_buffer_lock = threading.Lock()
+_current_chunk: contextvars.ContextVar = contextvars.ContextVar('nonbdna_profile_chunk', default=None)
+
+
+def is_enabled() -> bool:
+    """True when stage events are being recorded in this process."""
+    return PROFILE_ENABLED
+
+
+def enable_profiling(profile_dir: Optional[str] = None, memory: bool = False, reset: bool = False) -> str:
+    """
+    Enable profiling in this process and in worker processes started afterwards.
+
+    Args:
+        profile_dir: Event directory (default: NONBDNA_PROFILE_DIR)
+        memory: Record tracemalloc allocation deltas (large slowdown)
+        reset: Delete events left by earlier runs
+
+    Returns:
+        The event directory
+    """
+    global PROFILE_ENABLED, PROFILE_DIR, PROFILE_MEMORY
+    PROFILE_DIR = profile_dir or PROFILE_DIR
+    PROFILE_MEMORY = memory
+    PROFILE_ENABLED = True
+    os.environ['NONBDNA_PROFILE'] = 'true'
+    os.environ['NONBDNA_PROFILE_DIR'] = PROFILE_DIR
+    os.environ['NONBDNA_PROFILE_MEMORY'] = 'true' if memory else 'false'
+    Path(PROFILE_DIR).mkdir(parents=True, exist_ok=True)
+    if reset:
+        reset_profile(PROFILE_DIR)
+    return PROFILE_DIR
+
+
+def disable_profiling() -> None:
+    """Flush pending events and stop recording (here and in new workers)."""
+    global PROFILE_ENABLED
+    flush()
+    PROFILE_ENABLED = False
+    os.environ['NONBDNA_PROFILE'] = 'false'
+    if tracemalloc.is_tracing():
+        tracemalloc.stop()
+
+
+def reset_profile(profile_dir: Optional[str] = None) -> None:
+    """Delete all event files in *profile_dir* and drop this process's buffer."""
+    with _buffer_lock:
+        _buffer.clear()
+    for path in Path(profile_dir or PROFILE_DIR).glob(_FILE_PATTERN):
+        path.unlink(missing_ok=True)
+
+
+# =============================================================================
+# RECORDING
+# =============================================================================
+
+class _Stage:
+    """Context manager timing one stage; the ``as`` target is the event dict (set ``candidates_out`` etc.)."""
+
+    __slots__ = ('event', '_wall', '_cpu', '_mem')
+
+    def __init__(self, event: Dict[str, Any]):
+        self.event = event
+
+    def __enter__(self) -> Dict[str, Any]:
+        if PROFILE_MEMORY:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+            self._mem = tracemalloc.get_traced_memory()[0]
+        self._cpu = time.thread_time()
+        self._wall = time.perf_counter()
+        return self.event
+
+    def __exit__(self, exc_type, exc, tb):
+        event = self.event
+        event['wall_s'] = time.perf_counter() - self._wall
+        event['cpu_s'] = time.thread_time() - self._cpu
+        if PROFILE_MEMORY and tracemalloc.is_tracing():
+            event['alloc_bytes'] = tracemalloc.get_traced_memory()[0] - self._mem
+        if exc_type is not None:
+            event['error'] = exc_type.__name__
+        record_event(event)
+        return False
+
+
+class _NullStage:
+    """Shared no-op stage used while profiling is disabled."""
+
+    def __enter__(self) -> Dict[str, Any]:
+        return {}
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_STAGE = _NullStage()
+
+
+def stage(name: str, detector: Optional[str] = None, chunk: Optional[str] = None, bp: int = 0,
+          candidates_in: Optional[int] = None):
+    """
+    Time a pipeline stage.
+
+    Args:
+        name: Stage name (see module docstring)
+        detector: Detector key for per-detector stages
+        chunk: Chunk label (default: the enclosing :func:`chunk_scope`)
+        bp: Bases processed by the stage
+        candidates_in: Candidate count entering the stage
+
+    Usage:
+        with stage('overlaps', candidates_in=len(motifs)) as event:
+            filtered = remove_overlaps(motifs)
+            event['candidates_out'] = len(filtered)
+    """
+    if not PROFILE_ENABLED:
+        return _NULL_STAGE
+    return _Stage({
+        'stage': name, 'detector': detector, 'chunk': chunk if chunk is not None else _current_chunk.get(),
+        'bp': bp, 'candidates_in': candidates_in, 'candidates_out': None, 'pid': os.getpid(),
+    })
+
+
+def record_event(event: Dict[str, Any]) -> None:
+    """Buffer a finished event (flushed by :func:`flush`)."""
+    with _buffer_lock:
+        _buffer.append(event)
+        full = len(_buffer) >= _FLUSH_EVENTS
+    if full:
+        flush()
+
+
+class chunk_scope:
+    """Label stages recorded in this context (same thread/task) with *label*."""
+
+    __slots__ = ('label', '_token')
+
+    def __init__(self, label: str):
+        self.label = label
+
+    def __enter__(self):
+        self._token = _current_chunk.set(self.label)
+        return self.label
+
+    def __exit__(self, *exc):
+        _current_chunk.reset(self._token)
+        return False
+
+
+def current_chunk() -> Optional[str]:
+    """Chunk label of the enclosing :class:`chunk_scope` (capture before handing work to threads)."""
+    return _current_chunk.get()
+
+
+def flush() -> None:
+    """Append buffered events of this process to its event file."""
+    with _buffer_lock:
+        if not _buffer:
+            return
+        events = list(_buffer)
+        _buffer.clear()
+    payload = ''.join(json.dumps(e, separators=(',', ':')) + '\n' for e in events).encode('utf-8')
+    try:
+        Path(PROFILE_DIR).mkdir(parents=True, exist_ok=True)
+        fd = os.open(os.path.join(PROFILE_DIR, f'profile-{os.getpid()}.jsonl'), os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        try:
+            os.write(fd, payload)
+        finally:
+            os.close(fd)
+    except OSError as e:
+        logger.warning(f"Stage profiler: could not write events ({e})")
+
+
+atexit.register(flush)
+
+
+# =============================================================================
+# AGGREGATION / EXPORT
+# =============================================================================
+
+def iter_events(profile_dir: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+    """Yield every recorded event from all processes."""
+    if PROFILE_ENABLED:
+        flush()
+    for path in sorted(Path(profile_dir or PROFILE_DIR).glob(_FILE_PATTERN)):
+        with open(path, encoding='utf-8') as fh:
+            for line in fh:
+                if line.strip():
+                    yield json.loads(line)
+
+
+class ProfileReport:
+    """Aggregated profile: totals per (stage, detector) and per chunk."""
+
+    def __init__(self, events: List[Dict[str, Any]]):
+        self.events = events
+        self.stages = self._aggregate(events, ('stage', 'detector'))
+        self.chunks = self._aggregate([e for e in events if e['stage'] == 'chunk'], ('chunk',))
+
+    @staticmethod
+    def _aggregate(events: List[Dict[str, Any]], keys) -> List[Dict[str, Any]]:
+        groups: Dict[tuple, Dict[str, Any]] = {}
+        pids = defaultdict(set)
+        for e in events:
+            key = tuple(e.get(k) for k in keys)
+            g = groups.get(key)
+            if g is None:
+                g = groups[key] = {**{k: e.get(k) for k in keys}, 'calls': 0, 'wall_s': 0.0, 'wall_max_s': 0.0,
+                                   'cpu_s': 0.0, 'bp': 0, 'candidates_in': 0, 'candidates_out': 0,
+                                   'alloc_bytes': 0, 'errors': 0}
+            g['calls'] += 1
+            g['wall_s'] += e.get('wall_s', 0.0)
+            g['wall_max_s'] = max(g['wall_max_s'], e.get('wall_s', 0.0))
+            g['cpu_s'] += e.get('cpu_s', 0.0)
+            g['bp'] += e.get('bp') or 0
+            g['candidates_in'] += e.get('candidates_in') or 0
+            g['candidates_out'] += e.get('candidates_out') or 0
+            g['alloc_bytes'] += e.get('alloc_bytes') or 0
+            g['errors'] += 'error' in e
+            pids[key].add(e.get('pid'))
+        for key, g in groups.items():
+            g['processes'] = len(pids[key])
+            g['bp_per_s'] = g['bp'] / g['wall_s'] if g['bp'] and g['wall_s'] > 0 else None
+        return sorted(groups.values(), key=lambda g: -g['wall_s'])
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'events': len(self.events),
+            'processes': len({e.get('pid') for e in self.events}),
+            'stages': self.stages,
+            'chunks': self.chunks,
+        }
+
+    def write_json(self, path: str) -> None:
+        with open(path, 'w', encoding='utf-8') as fh:
+            json.dump(self.to_dict(), fh, indent=2)
+
+    def to_prometheus(self) -> str:
+        """Prometheus text exposition format (counters per stage/detector)."""
+        metrics = (
+            ('stage_calls_total', 'calls', 'Stage executions'),
+            ('stage_wall_seconds_total', 'wall_s', 'Wall-clock time spent in stage'),
+            ('stage_cpu_seconds_total', 'cpu_s', 'Thread CPU time spent in stage'),
+            ('stage_bases_total', 'bp', 'Bases processed by stage'),
+            ('stage_candidates_in_total', 'candidates_in', 'Candidates entering stage'),
+            ('stage_candidates_out_total', 'candidates_out', 'Candidates leaving stage'),
+            ('stage_alloc_bytes_total', 'alloc_bytes', 'Net bytes allocated during stage (tracemalloc)'),
+            ('stage_errors_total', 'errors', 'Stage executions that raised'),
+        )
+        lines: List[str] = []
+        for metric, field, help_text in metrics:
+            name = f'{_PROMETHEUS_PREFIX}_{metric}'
+            lines.append(f'# HELP {name} {help_text}')
+            lines.append(f'# TYPE {name} counter')
+            for g in self.stages:
+                labels = f'stage="{_escape(g["stage"])}"'
+                if g['detector']:
+                    labels += f',detector="{_escape(g["detector"])}"'
+                lines.append(f'{name}{{{labels}}} {g[field]}')
+        return '\n'.join(lines) + '\n'
+
+    def write_prometheus(self, path: str) -> None:
+        with open(path, 'w', encoding='utf-8') as fh:
+            fh.write(self.to_prometheus())
+
+    def format_table(self, limit: int = 30) -> str:
+        """Human-readable top stages by wall time."""
+        lines = [f"{'stage':<12} {'detector':<14} {'calls':>7} {'wall s':>9} {'cpu s':>9} {'bp/s':>13} {'in':>9} {'out':>9} {'alloc MB':>9}"]
+        for g in self.stages[:limit]:
+            lines.append(f"{g['stage']:<12} {g['detector'] or '-':<14} {g['calls']:>7} {g['wall_s']:>9.3f} {g['cpu_s']:>9.3f} "
+                         f"{g['bp_per_s'] or 0:>13,.0f} {g['candidates_in']:>9} {g['candidates_out']:>9} "
+                         f"{g['alloc_bytes'] / 1024 / 1024:>9.1f}")
+        return '\n'.join(lines)
+
+
+def _escape(value: str) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def collect_profile(profile_dir: Optional[str] = None) -> ProfileReport:
+    """Aggregate events from every process that wrote to *profile_dir*."""
+    return ProfileReport(list(iter_events(profile_dir)))
+
+
+def main(argv=None) -> int:
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Aggregate NonBDNAFinder stage profiler events')
+    parser.add_argument('profile_dir', nargs='?', default=PROFILE_DIR)
+    parser.add_argument('--json', help='write aggregated JSON here')
+    parser.add_argument('--prom', help='write Prometheus text format here')
+    args = parser.parse_args(argv)
+
+    report = collect_profile(args.profile_dir)
+    print(report.format_table())
+    if args.json:
+        report.write_json(args.json)
+    if args.prom:
+        report.write_prometheus(args.prom)
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
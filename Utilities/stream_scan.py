@@ -0,0 +1,137 @@
+"""
+┌──────────────────────────────────────────────────────────────────────────────┐
+│ Stream Scan - Boundary-Free Pattern Matching over Consecutive Blocks         │
+├──────────────────────────────────────────────────────────────────────────────┤
+│ Author: Dr. Venkata Rajesh Yella | License: MIT | Version: 2024.1            │
+└──────────────────────────────────────────────────────────────────────────────┘
+
+DESCRIPTION:
+    Block-mode Hyperscan needs the whole buffer in memory, or overlapped
+    chunks whose boundary matches are found twice and deduplicated later.
+    Streaming mode (HS_MODE_STREAM) avoids both. Consecutive blocks are fed
+    into one stream per sequence per database, and each match is reported
+    exactly once with its global offset. No bytes are scanned twice.
+
+    * compile_stream_database(): stream-mode DB (start-of-match tracking
+      via HS_FLAG_SOM_LEFTMOST when requested), memoized by key in
+      Utilities.hs_runtime
+    * stream_scan(): feed a sequence through one stream, block by block,
+      using the calling thread's scratch (safe under threaded detectors)
+    * stream_find_literals(): fixed-width literal tables (Z-DNA / A-philic
+      10-mers). Hyperscan streams when available; otherwise the pure-Python
+      fallback scans each block together with the last (width - 1) bases
+      of the previous block, so every window is visited exactly once.
+    * stream_finditer(): regex fallback with the same (start, end, id)
+      contract as stream_scan()
+
+    Blocks are sliced lazily, so a FastaRecord view is read from disk one
+    block at a time.
+
+USAGE:
+    from Utilities.stream_scan import compile_stream_database, stream_scan
+
+    db = compile_stream_database('rloop', [rb'G{3,}[ATCG]{1,10}?G{3,}'], [1])
+    for start, end, pattern_id in stream_scan(db, sequence):
+        ...
+"""
+
+import logging
+import os
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from Utilities import hs_runtime
+from Utilities.hs_runtime import HYPERSCAN_AVAILABLE
+
+logger = logging.getLogger(__name__)
+
+STREAM_BLOCK_SIZE = int(os.environ.get('NONBDNA_STREAM_BLOCK', 1 << 20))  # bytes fed per stream.scan() call
+
+
+def iter_blocks(sequence, block_size: int = STREAM_BLOCK_SIZE) -> Iterator[Tuple[int, str]]:
+    """Yield (offset, block) for consecutive non-overlapping blocks of ``sequence`` (str or FastaRecord)."""
+    n = len(sequence)
+    for offset in range(0, n, block_size):
+        yield offset, str(sequence[offset:offset + block_size])
+
+
+def compile_stream_database(key: str, expressions: Sequence[bytes], ids: Sequence[int], flags: Optional[Sequence[int]] = None, som: bool = True) -> Optional[Any]:
+    """
+    Compile (once per ``key``) a stream-mode Hyperscan database via Utilities.hs_runtime.
+
+    Args:
+        key: Pattern-set key (one DB per key for the life of the process)
+        expressions: Pattern bytes
+        ids: Pattern ids reported to the match handler
+        flags: Per-pattern compile flags (default: none)
+        som: Track start of match (HS_FLAG_SOM_LEFTMOST); not needed for fixed-width literals
+
+    Returns:
+        hyperscan.Database in stream mode, or None when Hyperscan is unavailable or compilation fails
+    """
+    return hs_runtime.get_database(key, expressions, ids, flags=flags, mode='stream', som=som)
+
+
+def stream_scan(db: Any, sequence, block_size: int = STREAM_BLOCK_SIZE, on_match: Optional[Callable[[int, int, int], None]] = None) -> List[Tuple[int, int, int]]:
+    """
+    Scan ``sequence`` through one Hyperscan stream.
+
+    Returns (start, end, pattern_id) with 0-based half-open global offsets,
+    each match once, in report order. ``start`` is only meaningful for
+    databases compiled with ``som=True``. If ``on_match`` is given, it is
+    called instead of collecting the matches, and an empty list is returned.
+    """
+    matches: List[Tuple[int, int, int]] = []
+    emit = on_match or (lambda start, end, pattern_id: matches.append((start, end, pattern_id)))
+
+    def handler(pattern_id, start, end, flags, context):
+        emit(start, end, pattern_id)
+        return 0
+
+    scratch = hs_runtime.thread_scratch(db)
+    with db.stream(match_event_handler=handler) as stream:
+        for _, block in iter_blocks(sequence, block_size):
+            stream.scan(block.encode(), scratch=scratch)
+    return matches
+
+
+def stream_find_literals(sequence, table: Dict[str, float], width: int, block_finder: Callable[[str, Dict[str, float]], List[Tuple[int, str, float]]], key: Optional[str] = None, block_size: int = STREAM_BLOCK_SIZE) -> List[Tuple[int, str, float]]:
+    """
+    Find every occurrence of the fixed-width literals in ``table``.
+
+    Args:
+        sequence: DNA sequence (str or FastaRecord)
+        table: literal -> score
+        width: Literal length (all keys must have it)
+        block_finder: Pure-Python finder applied per block, returning (start, literal, score) in block coordinates
+        key: Memoization key for the stream DB (None = pure-Python path only)
+        block_size: Bases per block
+
+    Returns:
+        (start, literal, score) tuples with global 0-based starts, sorted by start
+    """
+    db = compile_stream_database(key, [t.encode() for t in table], range(len(table)), som=False) if key and HYPERSCAN_AVAILABLE else None
+    if db is not None:
+        literals = list(table)
+        scores = [float(table[t]) for t in literals]
+        found: List[Tuple[int, str, float]] = []
+        stream_scan(db, sequence, block_size, lambda start, end, i: found.append((end - width, literals[i], scores[i])))
+        found.sort(key=lambda x: x[0])
+        return found
+    matches: List[Tuple[int, str, float]] = []
+    carry = ''
+    for offset, block in iter_blocks(sequence, block_size):
+        window = carry + block
+        base = offset - len(carry)
+        matches.extend((base + i, lit, score) for i, lit, score in block_finder(window, table))
+        carry = window[-(width - 1):] if width > 1 else ''
+    return matches
+
+
+def stream_finditer(pattern, sequence, pattern_id: int = 0) -> List[Tuple[int, int, int]]:
+    """Pure-Python counterpart of ``stream_scan`` for one compiled regex: (start, end, pattern_id) per non-overlapping match."""
+    return [(m.start(), m.end(), pattern_id) for m in pattern.finditer(str(sequence))]
+
+
+def clear_stream_databases() -> None:
+    """Drop memoized databases and scratch (tests / pattern reloads)."""
+    hs_runtime.clear()
@@ -15,12 +15,22 @@ DESCRIPTION:
         - Chunk *indices* are passed to workers, not DataFrames
         - Workers write results to disk; only metadata is returned
         - No background threads/services that outlive the Streamlit request
+        - Chunk scans go through the content-addressed chunk cache
+          (``NONBDNA_CHUNK_CACHE``), so a refreshed/restarted run resumes
 
     Adaptive execution strategy based on sequence length:
         < 100 000 bp   → direct (no workers, no chunking)
         100 000 – 5 M  → 2-worker ProcessPoolExecutor with chunk indices
         > 5 000 000 bp → disk-backed streaming (chunks written by workers)
 
+    An optional RunBudget (Utilities.run_budget; default from the
+    NONBDNA_MAX_WALL_S / NONBDNA_MAX_RSS_MB / NONBDNA_CHUNK_TIMEOUT_S
+    environment) bounds the run. No chunk starts once the wall time or RSS
+    limit trips, and detectors stop at the per-chunk deadline. What was
+    found is still stored. The report (skipped chunks, truncated detectors)
+    is written to ``results/<seq_id>_budget.json`` and attached to the
+    results storage as ``budget_report``.
+
 MEMORY GUARANTEES:
     - Peak RAM scales with chunk_size, not genome size
     - Suitable for 1 GB RAM containers
@@ -35,6 +45,8 @@ import os
 from concurrent.futures import ProcessPoolExecutor, as_completed
 from typing import Any, Callable, Dict, List, Optional, Tuple
 
+from Utilities.run_budget import RunBudget, budget_scope, current_budget
+
 logger = logging.getLogger(__name__)
 
 # ──────────────────────────────────────────────────────────────────────────────
@@ -62,7 +74,7 @@ def _chunk_worker(
     args: Tuple[str, str, int, int, Optional[List[str]], str],
 ) -> Dict[str, Any]:
     """
-    Process a single chunk and write results to a CSV file on disk.
+    Process a single chunk and append results to the shared binary spill file.
 
     This is a *module-level* function so it is picklable by
     ``ProcessPoolExecutor`` without serialising any large objects.
@@ -70,7 +82,7 @@ def _chunk_worker(
     Args:
         args: Tuple of
             (chunk_seq, seq_name, chunk_start, chunk_end, enabled_classes,
-             tmp_dir)
+             tmp_dir, chunk_index[, budget])
 
     Returns:
         Lightweight metadata dict::
@@ -78,11 +90,16 @@ def _chunk_worker(
             {
                 "chunk_index": int,
                 "chunk_start": int,
-                "file_path":   str,
+                "file_path":   str,   # shared spill file
+                "offset":      int,
+                "nbytes":      int,
                 "motif_count": int,
+                "budget":      dict or None,  # truncations recorded in this worker
             }
     """
-    from Utilities.disk_chunk_manager import DiskChunkManager
+    from pathlib import Path
+    from Utilities.chunk_cache import scan_chunk_cached
+    from Utilities.disk_chunk_manager import SPILL_FILE_NAME, spill_chunk_records
     from Utilities.nonbscanner import analyze_sequence
 
     (
@@ -93,15 +110,25 @@ def _chunk_worker(
         enabled_classes,
         tmp_dir,
         chunk_index,
-    ) = args
-
-    # Analyse the chunk (no large objects returned across process boundary)
-    raw_motifs = analyze_sequence(
-        sequence=chunk_seq,
-        sequence_name=seq_name,
-        use_fast_mode=True,
-        enabled_classes=enabled_classes,
-    )
+    ) = args[:7]
+    budget: Optional[RunBudget] = args[7] if len(args) > 7 else None
+    truncated_before = len(budget.truncated) if budget is not None else 0
+
+    # Analyse the chunk (no large objects returned across process boundary);
+    # chunks already in the content-addressed cache are not rescanned
+    with budget_scope(budget):
+        raw_motifs = scan_chunk_cached(
+            chunk_seq,
+            seq_name,
+            enabled_classes,
+            lambda: analyze_sequence(
+                sequence=chunk_seq,
+                sequence_name=seq_name,
+                use_fast_mode=True,
+                enabled_classes=enabled_classes,
+            ),
+            variant="analyze_sequence",
+        )
 
     # Adjust positions to genome-global coordinates
     adjusted: List[Dict[str, Any]] = []
@@ -116,27 +143,22 @@ def _chunk_worker(
                 m["ID"] = "_".join(parts)
         adjusted.append(m)
 
-    # Write to disk; return only metadata
-    manager = DiskChunkManager(base_dir=tmp_dir)
-    # Override the auto-created subdir to use the shared tmp_dir directly
-    import tempfile
-    from pathlib import Path
-    import csv
-
-    file_path = Path(tmp_dir) / f"chunk_{chunk_index:04d}.csv"
-    _fields = ["Class", "Subclass", "Start", "End", "Length", "Score", "ID", "Strand"]
-    with open(file_path, "w", newline="") as fh:
-        writer = csv.DictWriter(fh, fieldnames=_fields, extrasaction="ignore")
-        writer.writeheader()
-        for m in adjusted:
-            writer.writerow(m)
+    # Append to the shared spill file; return only metadata
+    file_path = Path(tmp_dir) / SPILL_FILE_NAME
+    offset, nbytes = spill_chunk_records(str(file_path), adjusted)
 
     return {
         "chunk_index": chunk_index,
         "chunk_start": chunk_start,
         "chunk_end": chunk_end,
         "file_path": str(file_path),
+        "offset": offset,
+        "nbytes": nbytes,
         "motif_count": len(adjusted),
+        "budget": (
+            {"truncated": budget.truncated[truncated_before:]}
+            if budget is not None else None
+        ),
     }
 
 
@@ -159,7 +181,10 @@ class StreamlitSafeExecutor:
             seq_id=seq_id,
             progress_callback=lambda p: print(f"{p:.0f}%"),
             enabled_classes=["G-Quadruplex"],
+            budget=RunBudget(max_wall_s=300, chunk_timeout_s=30),
         )
+        if results_storage.budget_report["status"] == "partial":
+            ...
     """
 
     def __init__(
@@ -195,6 +220,7 @@ class StreamlitSafeExecutor:
         seq_id: str,
         progress_callback: Optional[Callable[[float], None]] = None,
         enabled_classes: Optional[List[str]] = None,
+        budget: Optional[RunBudget] = None,
     ):
         """
         Analyse a stored sequence using the adaptive strategy.
@@ -203,9 +229,11 @@ class StreamlitSafeExecutor:
             seq_id:            Sequence identifier from ``UniversalSequenceStorage``.
             progress_callback: Optional ``callback(progress_pct: float)``.
             enabled_classes:   Motif classes to analyse (None = all).
+            budget:            ``RunBudget`` or limits dict (None = environment defaults).
 
         Returns:
-            ``UniversalResultsStorage`` instance with results on disk.
+            ``UniversalResultsStorage`` instance with results on disk (partial
+            if the budget ran out; see its ``budget_report`` attribute).
         """
         meta = self.sequence_storage.get_metadata(seq_id)
         seq_length = meta["length"]
@@ -215,16 +243,28 @@ class StreamlitSafeExecutor:
             f"StreamlitSafeExecutor: seq_length={seq_length:,} → strategy='{strategy}'"
         )
 
-        if strategy == "direct":
-            return self._run_direct(seq_id, meta, progress_callback, enabled_classes)
-        elif strategy == "chunk_workers":
-            return self._run_chunk_workers(
-                seq_id, meta, progress_callback, enabled_classes
-            )
-        else:  # disk_streaming
-            return self._run_disk_streaming(
-                seq_id, meta, progress_callback, enabled_classes
-            )
+        budget = RunBudget.coerce(budget)
+        with budget_scope(budget):
+            if strategy == "direct":
+                results_storage = self._run_direct(seq_id, meta, progress_callback, enabled_classes)
+            elif strategy == "chunk_workers":
+                results_storage = self._run_chunk_workers(
+                    seq_id, meta, progress_callback, enabled_classes
+                )
+            else:  # disk_streaming
+                results_storage = self._run_disk_streaming(
+                    seq_id, meta, progress_callback, enabled_classes
+                )
+
+        results_storage.budget_report = budget.report() if budget is not None else None
+        if budget is not None:
+            budget.save(str(self.sequence_storage.base_dir / "results" / f"{seq_id}_budget.json"))
+            if budget.partial:
+                logger.warning(
+                    f"StreamlitSafeExecutor: '{meta['name']}' is {budget.summary()}; "
+                    f"partial results kept in storage"
+                )
+        return results_storage
 
     # ------------------------------------------------------------------
     # STRATEGY SELECTION
@@ -250,11 +290,11 @@ class StreamlitSafeExecutor:
         progress_callback: Optional[Callable[[float], None]],
         enabled_classes: Optional[List[str]],
     ):
-        from Utilities.disk_storage import UniversalResultsStorage
+        from Utilities.disk_storage import create_results_storage
         from Utilities.nonbscanner import analyze_sequence
 
         seq_name = meta["name"]
-        results_storage = UniversalResultsStorage(
+        results_storage = create_results_storage(
             base_dir=str(self.sequence_storage.base_dir / "results"),
             seq_id=seq_id,
         )
@@ -292,9 +332,11 @@ class StreamlitSafeExecutor:
         """2-worker ProcessPoolExecutor, workers write to disk."""
         import tempfile
         from pathlib import Path
-        from Utilities.disk_storage import UniversalResultsStorage
+        from Utilities.disk_storage import create_results_storage
+
+        budget = current_budget()
 
-        results_storage = UniversalResultsStorage(
+        results_storage = create_results_storage(
             base_dir=str(self.sequence_storage.base_dir / "results"),
             seq_id=seq_id,
         )
@@ -313,6 +355,7 @@ class StreamlitSafeExecutor:
                 enabled_classes,
                 str(self.sequence_storage.base_dir / "chunks"),
                 idx,
+                budget,
             ))
 
         # Ensure the shared chunk directory exists
@@ -336,9 +379,17 @@ class StreamlitSafeExecutor:
                 }
                 for future in as_completed(future_to_idx):
                     idx = future_to_idx[future]
+                    if future.cancelled():  # dropped after the budget ran out
+                        continue
                     result_meta = future.result()  # raises on worker error
                     chunk_metadata[idx] = result_meta
                     completed += 1
+                    if budget is not None:
+                        budget.merge(result_meta.pop("budget") or {})
+                        if budget.check():
+                            # Chunks already running finish (bounded by their deadline); queued ones never start
+                            for pending in future_to_idx:
+                                pending.cancel()
                     if progress_callback:
                         progress_callback(completed / total * 100.0)
                     logger.info(
@@ -357,6 +408,11 @@ class StreamlitSafeExecutor:
                 seq_id, meta, progress_callback, enabled_classes
             )
 
+        if budget is not None:
+            for args, cm in zip(chunk_args, chunk_metadata):
+                if cm is None:
+                    budget.record_skipped(meta["name"], args[2], args[3])
+
         # Annotate each chunk_metadata entry with core_end for deduplication.
         # core_end is the exclusive boundary of the authoritative region:
         #   non-last chunks: core_end = chunk_end - overlap
@@ -372,7 +428,7 @@ class StreamlitSafeExecutor:
         # Stream chunk files into results_storage, deduplicate at boundaries
         self._merge_chunk_files_to_storage(chunk_metadata, results_storage)
 
-        # Clean up chunk CSV files
+        # Clean up the chunk spill file
         for cm in chunk_metadata:
             if cm and Path(cm["file_path"]).exists():
                 Path(cm["file_path"]).unlink(missing_ok=True)
@@ -403,14 +459,15 @@ class StreamlitSafeExecutor:
         Only motifs with Start < core_end are kept per chunk, ensuring each
         motif is counted exactly once in its authoritative (core) region.
         """
-        from Utilities.disk_storage import UniversalResultsStorage
+        from Utilities.chunk_cache import scan_chunk_cached
+        from Utilities.disk_storage import create_results_storage
         from Utilities.nonbscanner import analyze_sequence
         from Utilities.overlap_deduplicator import OverlapDeduplicator
 
         seq_name = meta["name"]
         seq_length = meta["length"]
 
-        results_storage = UniversalResultsStorage(
+        results_storage = create_results_storage(
             base_dir=str(self.sequence_storage.base_dir / "results"),
             seq_id=seq_id,
         )
@@ -435,11 +492,16 @@ class StreamlitSafeExecutor:
         total_raw = 0
         total_kept = 0
         chunk_num = 0
+        budget = current_budget()
 
         # Second pass: process one chunk at a time (constant RAM, no list materialisation)
         for chunk_seq, chunk_start, chunk_end in self.sequence_storage.iter_chunks(
             seq_id, self.chunk_size, self.overlap
         ):
+            if budget is not None and budget.check():
+                # Everything from here to the end of the sequence stays unscanned
+                budget.record_skipped(seq_name, chunk_start, seq_length)
+                break
             chunk_num += 1
             is_last = (chunk_num == total_chunks)
             # core_end: authoritative region is [chunk_start, core_end)
@@ -447,11 +509,19 @@ class StreamlitSafeExecutor:
             # re-detected (and kept) by the next chunk's core region
             core_end = chunk_end if is_last else chunk_end - self.overlap
 
-            raw_motifs = analyze_sequence(
-                sequence=chunk_seq,
-                sequence_name=f"{seq_name}_chunk{chunk_num}",
-                use_fast_mode=True,
-                enabled_classes=enabled_classes,
+            chunk_name = f"{seq_name}_chunk{chunk_num}"
+            raw_motifs = scan_chunk_cached(
+                chunk_seq,
+                chunk_name,
+                enabled_classes,
+                # bound as defaults: chunk_seq is deleted further down this loop body
+                lambda seq=chunk_seq, name=chunk_name: analyze_sequence(
+                    sequence=seq,
+                    sequence_name=name,
+                    use_fast_mode=True,
+                    enabled_classes=enabled_classes,
+                ),
+                variant="analyze_sequence",
             )
 
             # Adjust positions to genome-global coordinates
@@ -504,7 +574,7 @@ class StreamlitSafeExecutor:
         results_storage,
     ) -> None:
         """
-        Read chunk CSV files in order and append unique motifs to results_storage.
+        Read chunk spill records in order and append unique motifs to results_storage.
 
         Performs rigorous core-region boundary deduplication using the pre-computed
         ``core_end`` value in each chunk's metadata entry (set by _run_chunk_workers):
@@ -515,8 +585,8 @@ class StreamlitSafeExecutor:
         exactly once in its authoritative (core) region without any cross-chunk
         seen-key bookkeeping.
         """
-        import csv
         from pathlib import Path
+        from Utilities.disk_chunk_manager import read_chunk_records
         from Utilities.overlap_deduplicator import OverlapDeduplicator
 
         dedup = OverlapDeduplicator()
@@ -536,22 +606,7 @@ class StreamlitSafeExecutor:
             # core_end was computed in _run_chunk_workers
             core_end = cm.get("core_end", cm.get("chunk_end", float("inf")))
 
-            chunk_motifs: list = []
-            with open(file_path, newline="") as fh:
-                reader = csv.DictReader(fh)
-                for row in reader:
-                    for int_field in ("Start", "End", "Length"):
-                        if row.get(int_field):
-                            try:
-                                row[int_field] = int(row[int_field])
-                            except ValueError:
-                                pass
-                    if row.get("Score"):
-                        try:
-                            row["Score"] = float(row["Score"])
-                        except ValueError:
-                            pass
-                    chunk_motifs.append(dict(row))
+            chunk_motifs = read_chunk_records(str(file_path), cm["offset"], cm["nbytes"])
 
             # Rigorous core-region filtering via OverlapDeduplicator
             unique_motifs = dedup.filter_core(chunk_motifs, int(core_end))
@@ -565,4 +620,3 @@ class StreamlitSafeExecutor:
             )
 
             results_storage.append_batch(unique_motifs)
-            gc.collect()
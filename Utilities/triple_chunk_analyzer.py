@@ -13,6 +13,8 @@ ARCHITECTURE:
     - Tier 1 (Macro): 50KB chunks - Distributed across CPU cores
     - Tier 2 (Meso): 50KB chunks - Memory management layer
     - Tier 3 (Micro): 50KB chunks - Fast analysis with 2KB overlap
+    - Detectors: micro chunks stream through Utilities.detector_scheduler as
+      (chunk, detector) tasks on one long-lived process pool
     
 ADAPTIVE STRATEGY:
     - <50KB: Direct analysis (no chunking)
@@ -34,9 +36,8 @@ PERFORMANCE TARGETS:
 import gc
 import logging
 import multiprocessing
-from concurrent.futures import ProcessPoolExecutor, as_completed
-from typing import Dict, Any, List, Optional, Callable, Set, Tuple
-from collections import defaultdict
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Callable, Set, Tuple
+from collections import defaultdict, deque
 
 from Utilities.config.analysis import CHUNKING_CONFIG
 
@@ -107,6 +108,7 @@ class TripleAdaptiveChunkAnalyzer:
         
         # Parallelization settings
         self.max_workers = max_workers or max(1, multiprocessing.cpu_count() - 1)
+        self._scheduler = None
         
         logger.info(
             f"TripleAdaptiveChunkAnalyzer initialized:\n"
@@ -255,7 +257,7 @@ class TripleAdaptiveChunkAnalyzer:
         Returns:
             UniversalResultsStorage with results
         """
-        from Utilities.disk_storage import UniversalResultsStorage
+        from Utilities.disk_storage import create_results_storage
         from Utilities.nonbscanner import analyze_sequence
         
         metadata = self.storage.get_metadata(seq_id)
@@ -276,7 +278,7 @@ class TripleAdaptiveChunkAnalyzer:
         )
         
         # Save results
-        results_storage = UniversalResultsStorage(
+        results_storage = create_results_storage(
             base_dir=str(self.storage.base_dir / "results"),
             seq_id=seq_id
         )
@@ -288,6 +290,43 @@ class TripleAdaptiveChunkAnalyzer:
         logger.info(f"Direct analysis complete: {len(motifs)} motifs")
         return results_storage
     
+    def _get_scheduler(self):
+        """Lazily created DetectorScheduler sharing the process-wide detector pool."""
+        if self._scheduler is None:
+            from Utilities.detector_scheduler import DetectorScheduler
+            self._scheduler = DetectorScheduler(max_workers=self.max_workers)
+        return self._scheduler
+    
+    def _scan_micro_chunks(
+        self,
+        chunks: Iterable[Tuple[int, str]],
+        seq_name: str,
+        enabled_classes: Optional[List[str]]
+    ) -> Iterator[Tuple[int, List[Dict[str, Any]]]]:
+        """
+        Scan micro chunks with (chunk, detector) tasks on the shared detector pool.
+        
+        Args:
+            chunks: Iterable of (global_start, chunk_seq), consumed lazily
+            seq_name: Sequence name recorded on the motifs
+            enabled_classes: Optional list of motif classes to analyze
+            
+        Yields:
+            (global_start, chunk-local motifs) in input order; each chunk is
+            merged (overlaps, hybrids, clusters) as soon as its detectors finish
+        """
+        if not CHUNKING_CONFIG.get('enable_parallel_detectors', True):
+            from Utilities.nonbscanner import analyze_sequence
+            for global_start, chunk_seq in chunks:
+                yield global_start, analyze_sequence(
+                    sequence=chunk_seq,
+                    sequence_name=seq_name,
+                    use_fast_mode=True,
+                    enabled_classes=enabled_classes
+                )
+            return
+        yield from self._get_scheduler().scan_chunks(chunks, seq_name, enabled_classes)
+    
     def _analyze_chunk_with_parallel_detectors(
         self,
         chunk_seq: str,
@@ -295,8 +334,8 @@ class TripleAdaptiveChunkAnalyzer:
         enabled_classes: Optional[List[str]] = None
     ) -> List[Dict[str, Any]]:
         """
-        Analyze chunk with all detectors running in parallel.
-        Falls back to sequential execution if parallel execution fails.
+        Analyze one chunk with its detectors running in parallel on the shared
+        detector pool (see _scan_micro_chunks).
         
         Args:
             chunk_seq: DNA sequence chunk
@@ -304,94 +343,11 @@ class TripleAdaptiveChunkAnalyzer:
             enabled_classes: List of motif classes to analyze (None = all)
         
         Returns:
-            List of detected motifs
+            List of detected motifs (chunk-local coordinates)
         """
-        # Check if parallel execution is enabled in config
-        config = CHUNKING_CONFIG
-        use_parallel = config.get('enable_parallel_detectors', True)
-        
-        # If parallel disabled or not possible, use sequential execution
-        if not use_parallel:
-            from Utilities.nonbscanner import analyze_sequence
-            return analyze_sequence(
-                sequence=chunk_seq,
-                sequence_name=chunk_name,
-                use_fast_mode=True,
-                enabled_classes=enabled_classes
-            )
-        
-        # Try parallel execution with fallback to sequential
-        try:
-            from Detectors import (
-                CurvedDNADetector, SlippedDNADetector, CruciformDetector,
-                RLoopDetector, TriplexDetector, GQuadruplexDetector,
-                IMotifDetector, ZDNADetector, APhilicDetector
-            )
-            
-            # Detector map
-            DETECTOR_MAP = {
-                'Curved_DNA': CurvedDNADetector,
-                'Slipped_DNA': SlippedDNADetector,
-                'Cruciform': CruciformDetector,
-                'R-Loop': RLoopDetector,
-                'Triplex': TriplexDetector,
-                'G-Quadruplex': GQuadruplexDetector,
-                'i-Motif': IMotifDetector,
-                'Z-DNA': ZDNADetector,
-                'A-philic_DNA': APhilicDetector
-            }
-            
-            # Determine detectors to run
-            if enabled_classes:
-                detectors_to_run = [
-                    (cls, DETECTOR_MAP[cls]) 
-                    for cls in enabled_classes 
-                    if cls in DETECTOR_MAP
-                ]
-            else:
-                detectors_to_run = list(DETECTOR_MAP.items())
-            
-            # Worker function for parallel execution
-            def run_detector(detector_info):
-                """Execute single detector on chunk"""
-                cls_name, detector_cls = detector_info
-                try:
-                    detector = detector_cls()
-                    motifs = detector.detect_motifs(chunk_seq, chunk_name)
-                    return cls_name, motifs
-                except Exception as e:
-                    logger.error(f"Detector {cls_name} failed: {e}")
-                    return cls_name, []
-            
-            # Run detectors in parallel
-            chunk_motifs = []
-            max_workers = min(len(detectors_to_run), multiprocessing.cpu_count())
-            
-            with ProcessPoolExecutor(max_workers=max_workers) as executor:
-                futures = {
-                    executor.submit(run_detector, det_info): det_info 
-                    for det_info in detectors_to_run
-                }
-                
-                for future in as_completed(futures):
-                    try:
-                        cls_name, motifs = future.result()
-                        chunk_motifs.extend(motifs)
-                    except Exception as e:
-                        logger.error(f"Detector execution failed: {e}")
-            
-            return chunk_motifs
-            
-        except Exception as e:
-            # Fallback to sequential execution if parallel fails
-            logger.warning(f"Parallel detector execution failed, falling back to sequential: {e}")
-            from Utilities.nonbscanner import analyze_sequence
-            return analyze_sequence(
-                sequence=chunk_seq,
-                sequence_name=chunk_name,
-                use_fast_mode=True,
-                enabled_classes=enabled_classes
-            )
+        for _, motifs in self._scan_micro_chunks([(0, chunk_seq)], chunk_name, enabled_classes):
+            return motifs
+        return []
     
     def _single_tier_analyze(
         self,
@@ -410,8 +366,7 @@ class TripleAdaptiveChunkAnalyzer:
         Returns:
             UniversalResultsStorage with results
         """
-        from Utilities.disk_storage import UniversalResultsStorage
-        from Utilities.nonbscanner import analyze_sequence
+        from Utilities.disk_storage import create_results_storage
         
         metadata = self.storage.get_metadata(seq_id)
         seq_name = metadata['name']
@@ -419,7 +374,7 @@ class TripleAdaptiveChunkAnalyzer:
         
         logger.info(f"Single-tier analysis for {seq_name} ({seq_length:,} bp)")
         
-        results_storage = UniversalResultsStorage(
+        results_storage = create_results_storage(
             base_dir=str(self.storage.base_dir / "results"),
             seq_id=seq_id
         )
@@ -432,19 +387,20 @@ class TripleAdaptiveChunkAnalyzer:
         for _ in self.storage.iter_chunks(seq_id, self.MICRO_CHUNK_SIZE, self.MICRO_OVERLAP):
             total_chunks += 1
         
+        # Chunk ends, queued as chunks are read (results come back in the same order)
+        chunk_ends = deque()
+        
+        def micro_chunks():
+            for chunk_seq, chunk_start, chunk_end in self.storage.iter_chunks(
+                seq_id, self.MICRO_CHUNK_SIZE, self.MICRO_OVERLAP
+            ):
+                chunk_ends.append(chunk_end)
+                yield chunk_start, chunk_seq
+        
         chunk_num = 0
-        for chunk_seq, chunk_start, chunk_end in self.storage.iter_chunks(
-            seq_id, self.MICRO_CHUNK_SIZE, self.MICRO_OVERLAP
-        ):
+        for chunk_start, chunk_motifs in self._scan_micro_chunks(micro_chunks(), seq_name, enabled_classes):
             chunk_num += 1
-            
-            # Analyze chunk
-            chunk_motifs = analyze_sequence(
-                sequence=chunk_seq,
-                sequence_name=f"{seq_name}_micro_{chunk_num}",
-                use_fast_mode=True,
-                enabled_classes=enabled_classes
-            )
+            chunk_end = chunk_ends.popleft()
             
             # Adjust positions
             adjusted_motifs = self._adjust_motif_positions(chunk_motifs, chunk_start)
@@ -471,7 +427,7 @@ class TripleAdaptiveChunkAnalyzer:
                 progress_callback(progress_pct)
             
             # Garbage collection
-            del chunk_seq, chunk_motifs, adjusted_motifs, unique_motifs
+            del chunk_motifs, adjusted_motifs, unique_motifs
             gc.collect()
         
         stats = results_storage.get_summary_stats()
@@ -488,6 +444,9 @@ class TripleAdaptiveChunkAnalyzer:
         """
         Double-tier analysis (meso + micro chunks) for 10-100MB sequences.
         
+        Micro chunks of all meso chunks stream through one detector scheduler,
+        so the pool never drains at meso boundaries.
+        
         Args:
             seq_id: Sequence identifier
             progress_callback: Optional progress callback
@@ -496,8 +455,7 @@ class TripleAdaptiveChunkAnalyzer:
         Returns:
             UniversalResultsStorage with results
         """
-        from Utilities.disk_storage import UniversalResultsStorage
-        from Utilities.nonbscanner import analyze_sequence
+        from Utilities.disk_storage import create_results_storage
         
         metadata = self.storage.get_metadata(seq_id)
         seq_name = metadata['name']
@@ -505,7 +463,7 @@ class TripleAdaptiveChunkAnalyzer:
         
         logger.info(f"Double-tier analysis for {seq_name} ({seq_length:,} bp)")
         
-        results_storage = UniversalResultsStorage(
+        results_storage = create_results_storage(
             base_dir=str(self.storage.base_dir / "results"),
             seq_id=seq_id
         )
@@ -518,84 +476,80 @@ class TripleAdaptiveChunkAnalyzer:
         for _ in self.storage.iter_chunks(seq_id, self.MESO_CHUNK_SIZE, self.MESO_OVERLAP):
             total_meso_chunks += 1
         
-        meso_chunk_num = 0
-        
-        # Process each meso chunk
-        for meso_seq, meso_start, meso_end in self.storage.iter_chunks(
-            seq_id, self.MESO_CHUNK_SIZE, self.MESO_OVERLAP
-        ):
-            meso_chunk_num += 1
-            logger.info(
-                f"Processing meso chunk {meso_chunk_num}/{total_meso_chunks} "
-                f"[{meso_start:,}-{meso_end:,}]"
-            )
-            
-            # Track overlap motifs at micro level within this meso chunk
-            micro_overlap_motifs: Set[Tuple] = set()
-            
-            # Split meso chunk into micro chunks
-            meso_length = len(meso_seq)
-            micro_chunk_num = 0
-            
-            for micro_offset in range(0, meso_length, self.MICRO_CHUNK_SIZE - self.MICRO_OVERLAP):
-                micro_chunk_num += 1
-                micro_end_offset = min(micro_offset + self.MICRO_CHUNK_SIZE, meso_length)
-                micro_seq = meso_seq[micro_offset:micro_end_offset]
-                
-                # Global position
-                global_start = meso_start + micro_offset
-                global_end = meso_start + micro_end_offset
-                
-                # Analyze micro chunk with parallel detectors
-                chunk_motifs = self._analyze_chunk_with_parallel_detectors(
-                    chunk_seq=micro_seq,
-                    chunk_name=f"{seq_name}_meso{meso_chunk_num}_micro{micro_chunk_num}",
-                    enabled_classes=enabled_classes
+        # (meso_chunk_num, meso_start, meso_end, global_end) per queued micro chunk
+        micro_info = deque()
+        
+        def micro_chunks():
+            meso_chunk_num = 0
+            for meso_seq, meso_start, meso_end in self.storage.iter_chunks(
+                seq_id, self.MESO_CHUNK_SIZE, self.MESO_OVERLAP
+            ):
+                meso_chunk_num += 1
+                logger.info(
+                    f"Processing meso chunk {meso_chunk_num}/{total_meso_chunks} "
+                    f"[{meso_start:,}-{meso_end:,}]"
                 )
                 
-                # Adjust to global coordinates
-                adjusted_motifs = self._adjust_motif_positions(chunk_motifs, global_start)
+                # Split meso chunk into micro chunks
+                meso_length = len(meso_seq)
+                for micro_offset in range(0, meso_length, self.MICRO_CHUNK_SIZE - self.MICRO_OVERLAP):
+                    micro_end_offset = min(micro_offset + self.MICRO_CHUNK_SIZE, meso_length)
+                    micro_info.append((meso_chunk_num, meso_start, meso_end, meso_start + micro_end_offset))
+                    yield meso_start + micro_offset, meso_seq[micro_offset:micro_end_offset]
                 
-                # Deduplicate at micro level
-                unique_motifs = []
-                for motif in adjusted_motifs:
-                    motif_key = self._create_motif_key(motif)
-                    
-                    if motif_key not in micro_overlap_motifs:
-                        unique_motifs.append(motif)
-                        
-                        # Track if in micro overlap region
-                        if self._is_in_overlap_region(
-                            motif, global_start, global_end, self.MICRO_OVERLAP
-                        ):
-                            micro_overlap_motifs.add(motif_key)
+                del meso_seq
+        
+        current_meso = 0
+        micro_overlap_motifs: Set[Tuple] = set()
+        
+        for global_start, chunk_motifs in self._scan_micro_chunks(micro_chunks(), seq_name, enabled_classes):
+            meso_chunk_num, meso_start, meso_end, global_end = micro_info.popleft()
+            if meso_chunk_num != current_meso:
+                # First micro chunk of a new meso chunk: the previous one is complete
+                if current_meso and progress_callback:
+                    progress_callback((current_meso / total_meso_chunks) * 100)
+                current_meso = meso_chunk_num
+                micro_overlap_motifs = set()
+                gc.collect()
+            
+            # Adjust to global coordinates
+            adjusted_motifs = self._adjust_motif_positions(chunk_motifs, global_start)
+            
+            # Deduplicate at micro level
+            unique_motifs = []
+            for motif in adjusted_motifs:
+                motif_key = self._create_motif_key(motif)
                 
-                # Further deduplicate at meso level
-                final_motifs = []
-                for motif in unique_motifs:
-                    motif_key = self._create_motif_key(motif)
+                if motif_key not in micro_overlap_motifs:
+                    unique_motifs.append(motif)
                     
-                    if motif_key not in meso_overlap_motifs:
-                        final_motifs.append(motif)
-                        
-                        # Track if in meso overlap region
-                        if self._is_in_overlap_region(
-                            motif, meso_start, meso_end, self.MESO_OVERLAP
-                        ):
-                            meso_overlap_motifs.add(motif_key)
-                
-                results_storage.append_batch(final_motifs)
+                    # Track if in micro overlap region
+                    if self._is_in_overlap_region(
+                        motif, global_start, global_end, self.MICRO_OVERLAP
+                    ):
+                        micro_overlap_motifs.add(motif_key)
+            
+            # Further deduplicate at meso level
+            final_motifs = []
+            for motif in unique_motifs:
+                motif_key = self._create_motif_key(motif)
                 
-                del micro_seq, chunk_motifs, adjusted_motifs, unique_motifs, final_motifs
-                gc.collect()
+                if motif_key not in meso_overlap_motifs:
+                    final_motifs.append(motif)
+                    
+                    # Track if in meso overlap region
+                    if self._is_in_overlap_region(
+                        motif, meso_start, meso_end, self.MESO_OVERLAP
+                    ):
+                        meso_overlap_motifs.add(motif_key)
             
-            # Update progress
-            if progress_callback:
-                progress_pct = (meso_chunk_num / total_meso_chunks) * 100
-                progress_callback(progress_pct)
+            results_storage.append_batch(final_motifs)
             
-            del meso_seq
-            gc.collect()
+            del chunk_motifs, adjusted_motifs, unique_motifs, final_motifs
+        
+        if current_meso and progress_callback:
+            progress_callback((current_meso / total_meso_chunks) * 100)
+        gc.collect()
         
         stats = results_storage.get_summary_stats()
         logger.info(f"Double-tier complete: {stats['total_count']} motifs")
@@ -611,7 +565,8 @@ class TripleAdaptiveChunkAnalyzer:
         """
         Triple-tier analysis (macro + meso + micro) for >100MB sequences.
         
-        Uses parallel processing at macro level for maximum performance.
+        Macro chunks are read lazily and all their micro chunks stream through
+        one detector scheduler ((chunk, detector) tasks on the shared pool).
         
         Args:
             seq_id: Sequence identifier
@@ -621,8 +576,7 @@ class TripleAdaptiveChunkAnalyzer:
         Returns:
             UniversalResultsStorage with results
         """
-        from Utilities.disk_storage import UniversalResultsStorage
-        from Utilities.nonbscanner import analyze_sequence
+        from Utilities.disk_storage import create_results_storage
         
         metadata = self.storage.get_metadata(seq_id)
         seq_name = metadata['name']
@@ -633,7 +587,7 @@ class TripleAdaptiveChunkAnalyzer:
             f"with {self.max_workers} workers"
         )
         
-        results_storage = UniversalResultsStorage(
+        results_storage = create_results_storage(
             base_dir=str(self.storage.base_dir / "results"),
             seq_id=seq_id
         )
@@ -646,118 +600,106 @@ class TripleAdaptiveChunkAnalyzer:
         for _ in self.storage.iter_chunks(seq_id, self.MACRO_CHUNK_SIZE, self.MACRO_OVERLAP):
             total_macro_chunks += 1
         
-        logger.info(f"Processing {total_macro_chunks} macro chunks in parallel")
-        
-        # Collect macro chunk data for parallel processing
-        macro_chunks = []
-        for macro_seq, macro_start, macro_end in self.storage.iter_chunks(
-            seq_id, self.MACRO_CHUNK_SIZE, self.MACRO_OVERLAP
-        ):
-            macro_chunks.append((macro_seq, macro_start, macro_end))
-        
-        # Process macro chunks sequentially (to avoid memory issues with massive parallelization)
-        # Each macro chunk is internally parallelized at meso level
-        for macro_idx, (macro_seq, macro_start, macro_end) in enumerate(macro_chunks):
-            logger.info(
-                f"Processing macro chunk {macro_idx + 1}/{total_macro_chunks} "
-                f"[{macro_start:,}-{macro_end:,}]"
-            )
-            
-            # Track overlap motifs at meso level within this macro chunk
-            meso_overlap_motifs: Set[Tuple] = set()
-            
-            # Split macro chunk into meso chunks
-            macro_length = len(macro_seq)
-            meso_chunks = []
-            
-            for meso_offset in range(0, macro_length, self.MESO_CHUNK_SIZE - self.MESO_OVERLAP):
-                meso_end_offset = min(meso_offset + self.MESO_CHUNK_SIZE, macro_length)
-                meso_seq = macro_seq[meso_offset:meso_end_offset]
-                meso_global_start = macro_start + meso_offset
-                meso_global_end = macro_start + meso_end_offset
-                meso_chunks.append((meso_seq, meso_global_start, meso_global_end))
-            
-            # Process meso chunks within macro chunk
-            for meso_idx, (meso_seq, meso_start, meso_end) in enumerate(meso_chunks):
-                # Track overlap motifs at micro level
-                micro_overlap_motifs: Set[Tuple] = set()
-                
-                # Split meso chunk into micro chunks
-                meso_length = len(meso_seq)
+        logger.info(f"Processing {total_macro_chunks} macro chunks")
+        
+        # (macro_idx, macro_start, macro_end, meso_idx, meso_start, meso_end, global_end) per queued micro chunk
+        micro_info = deque()
+        
+        def micro_chunks():
+            for macro_idx, (macro_seq, macro_start, macro_end) in enumerate(self.storage.iter_chunks(
+                seq_id, self.MACRO_CHUNK_SIZE, self.MACRO_OVERLAP
+            )):
+                logger.info(
+                    f"Processing macro chunk {macro_idx + 1}/{total_macro_chunks} "
+                    f"[{macro_start:,}-{macro_end:,}]"
+                )
                 
-                for micro_offset in range(0, meso_length, self.MICRO_CHUNK_SIZE - self.MICRO_OVERLAP):
-                    micro_end_offset = min(micro_offset + self.MICRO_CHUNK_SIZE, meso_length)
-                    micro_seq = meso_seq[micro_offset:micro_end_offset]
-                    
-                    global_start = meso_start + micro_offset
-                    global_end = meso_start + micro_end_offset
-                    
-                    # Analyze micro chunk
-                    chunk_motifs = analyze_sequence(
-                        sequence=micro_seq,
-                        sequence_name=f"{seq_name}_macro{macro_idx+1}_meso{meso_idx+1}",
-                        use_fast_mode=True,
-                        enabled_classes=enabled_classes
-                    )
-                    
-                    # Adjust to global coordinates
-                    adjusted_motifs = self._adjust_motif_positions(chunk_motifs, global_start)
+                # Split macro chunk into meso chunks, and each meso chunk into micro chunks
+                macro_length = len(macro_seq)
+                for meso_idx, meso_offset in enumerate(range(0, macro_length, self.MESO_CHUNK_SIZE - self.MESO_OVERLAP)):
+                    meso_end_offset = min(meso_offset + self.MESO_CHUNK_SIZE, macro_length)
+                    meso_seq = macro_seq[meso_offset:meso_end_offset]
+                    meso_start = macro_start + meso_offset
+                    meso_end = macro_start + meso_end_offset
                     
-                    # Deduplicate at micro level
-                    unique_motifs = []
-                    for motif in adjusted_motifs:
-                        motif_key = self._create_motif_key(motif)
-                        
-                        if motif_key not in micro_overlap_motifs:
-                            unique_motifs.append(motif)
-                            
-                            if self._is_in_overlap_region(
-                                motif, global_start, global_end, self.MICRO_OVERLAP
-                            ):
-                                micro_overlap_motifs.add(motif_key)
+                    meso_length = len(meso_seq)
+                    for micro_offset in range(0, meso_length, self.MICRO_CHUNK_SIZE - self.MICRO_OVERLAP):
+                        micro_end_offset = min(micro_offset + self.MICRO_CHUNK_SIZE, meso_length)
+                        micro_info.append((macro_idx, macro_start, macro_end, meso_idx, meso_start, meso_end, meso_start + micro_end_offset))
+                        yield meso_start + micro_offset, meso_seq[micro_offset:micro_end_offset]
                     
-                    # Deduplicate at meso level
-                    meso_unique = []
-                    for motif in unique_motifs:
-                        motif_key = self._create_motif_key(motif)
-                        
-                        if motif_key not in meso_overlap_motifs:
-                            meso_unique.append(motif)
-                            
-                            if self._is_in_overlap_region(
-                                motif, meso_start, meso_end, self.MESO_OVERLAP
-                            ):
-                                meso_overlap_motifs.add(motif_key)
-                    
-                    # Deduplicate at macro level
-                    final_motifs = []
-                    for motif in meso_unique:
-                        motif_key = self._create_motif_key(motif)
-                        
-                        if motif_key not in macro_overlap_motifs:
-                            final_motifs.append(motif)
-                            
-                            if self._is_in_overlap_region(
-                                motif, macro_start, macro_end, self.MACRO_OVERLAP
-                            ):
-                                macro_overlap_motifs.add(motif_key)
+                    del meso_seq
+                
+                del macro_seq
+        
+        current_macro = current_meso = None
+        meso_overlap_motifs: Set[Tuple] = set()
+        micro_overlap_motifs: Set[Tuple] = set()
+        
+        for global_start, chunk_motifs in self._scan_micro_chunks(micro_chunks(), seq_name, enabled_classes):
+            macro_idx, macro_start, macro_end, meso_idx, meso_start, meso_end, global_end = micro_info.popleft()
+            if macro_idx != current_macro:
+                # First micro chunk of a new macro chunk: the previous one is complete
+                if current_macro is not None and progress_callback:
+                    progress_callback(((current_macro + 1) / total_macro_chunks) * 100)
+                current_macro = macro_idx
+                current_meso = None
+                meso_overlap_motifs = set()
+                gc.collect()
+            if meso_idx != current_meso:
+                current_meso = meso_idx
+                micro_overlap_motifs = set()
+            
+            # Adjust to global coordinates
+            adjusted_motifs = self._adjust_motif_positions(chunk_motifs, global_start)
+            
+            # Deduplicate at micro level
+            unique_motifs = []
+            for motif in adjusted_motifs:
+                motif_key = self._create_motif_key(motif)
+                
+                if motif_key not in micro_overlap_motifs:
+                    unique_motifs.append(motif)
                     
-                    results_storage.append_batch(final_motifs)
+                    if self._is_in_overlap_region(
+                        motif, global_start, global_end, self.MICRO_OVERLAP
+                    ):
+                        micro_overlap_motifs.add(motif_key)
+            
+            # Deduplicate at meso level
+            meso_unique = []
+            for motif in unique_motifs:
+                motif_key = self._create_motif_key(motif)
+                
+                if motif_key not in meso_overlap_motifs:
+                    meso_unique.append(motif)
                     
-                    del micro_seq, chunk_motifs, adjusted_motifs, unique_motifs
-                    del meso_unique, final_motifs
-                    gc.collect()
+                    if self._is_in_overlap_region(
+                        motif, meso_start, meso_end, self.MESO_OVERLAP
+                    ):
+                        meso_overlap_motifs.add(motif_key)
+            
+            # Deduplicate at macro level
+            final_motifs = []
+            for motif in meso_unique:
+                motif_key = self._create_motif_key(motif)
                 
-                del meso_seq
-                gc.collect()
+                if motif_key not in macro_overlap_motifs:
+                    final_motifs.append(motif)
+                    
+                    if self._is_in_overlap_region(
+                        motif, macro_start, macro_end, self.MACRO_OVERLAP
+                    ):
+                        macro_overlap_motifs.add(motif_key)
             
-            # Update progress after each macro chunk
-            if progress_callback:
-                progress_pct = ((macro_idx + 1) / total_macro_chunks) * 100
-                progress_callback(progress_pct)
+            results_storage.append_batch(final_motifs)
             
-            del macro_seq
-            gc.collect()
+            del chunk_motifs, adjusted_motifs, unique_motifs
+            del meso_unique, final_motifs
+        
+        if current_macro is not None and progress_callback:
+            progress_callback(((current_macro + 1) / total_macro_chunks) * 100)
+        gc.collect()
         
         stats = results_storage.get_summary_stats()
         logger.info(f"Triple-tier complete: {stats['total_count']} motifs")
@@ -47,16 +47,22 @@ MAIN FUNCTIONS:
 """
 
 from __future__ import annotations
-from typing import Dict, Any, List, Optional, Tuple, Union
+from typing import Dict, Any, List, Optional, Tuple, Union, Iterable, Iterator
 import json
 import re
 import os
 import io
 import hashlib
+import importlib
+import importlib.util
+import bisect
+import itertools
+import textwrap
 import time
 import tempfile
 import zipfile
 import logging
+import sys
 from datetime import datetime
 
 # Set up logging
@@ -117,10 +123,42 @@ def _ensure_matplotlib():
     
     return _plt, _sns, _patches, _PdfPages
 
-try:
-    import pandas as pd
-except ImportError as e:
-    raise ImportError(f"Failed to import pandas. Please ensure pandas>=1.3.0 is installed. Error: {e}")
+# ============================================================================
+# LAZY PANDAS/PLOTLY IMPORTS - COLD-START OPTIMIZATION
+# ============================================================================
+# pandas alone costs ~0.5s to import and most scan paths never touch it;
+# `pd` / `go` are proxies that import the real module on first attribute
+# access, so only export/plot/summary functions pay for them.
+# ============================================================================
+
+class _LazyModule:
+    """Module proxy importing *name* on first attribute access."""
+
+    def __init__(self, name: str, requirement: str):
+        self._name = name
+        self._requirement = requirement
+        self._module = None
+
+    def __getattr__(self, attr: str):
+        if self._module is None:
+            try:
+                self._module = importlib.import_module(self._name)
+            except ImportError as e:
+                raise ImportError(f"Failed to import {self._name}. Please ensure {self._requirement} is installed. Error: {e}")
+            logger.debug(f"{self._name} loaded on-demand")
+        return getattr(self._module, attr)
+
+    def __repr__(self) -> str:
+        return f"<lazy module '{self._name}'{' (loaded)' if self._module is not None else ''}>"
+
+
+def _is_dataframe(obj: Any) -> bool:
+    """isinstance(obj, pd.DataFrame) without importing pandas (no DataFrame can exist before it is)."""
+    pandas = sys.modules.get('pandas')
+    return pandas is not None and isinstance(obj, pandas.DataFrame)
+
+
+pd = _LazyModule('pandas', 'pandas>=1.3.0')
 
 try:
     import numpy as np
@@ -142,18 +180,23 @@ from Utilities.config.motif_taxonomy import (
 )
 
 # Import standardized GC content calculation and base counting
-from Utilities.detectors_utils import calc_gc_content, _count_bases
+from Utilities.detectors_utils import calc_gc_content, _count_bases, byte_composition
 
 # Pre-compiled regex to strip characters that are not valid IUPAC nucleotide codes
 # Keeps: A T G C N R Y S W K M B D H V (standard IUPAC, upper and lower case)
 _NON_IUPAC_RE = re.compile(r'[^ATGCNRYSWKMBDHVatgcnryswkmbdhv]')
 
-# Try to import plotly for interactive plots
-try:
-    import plotly.graph_objects as go
-    PLOTLY_AVAILABLE = True
-except ImportError:
-    PLOTLY_AVAILABLE = False
+# Bytes-level equivalent used by the FASTA parsers: one bytes.translate call
+# uppercases and deletes newlines and every non-IUPAC byte
+_IUPAC_BYTES = b'ATGCNRYSWKMBDHVatgcnryswkmbdhv'
+_FASTA_UPPER_TABLE = bytes.maketrans(b'atgcnryswkmbdhv', b'ATGCNRYSWKMBDHV')
+_FASTA_DELETE_BYTES = bytes(b for b in range(256) if b not in _IUPAC_BYTES)
+# Header lines may be indented with spaces/tabs (the line-based parser stripped them)
+_FASTA_HEADER_RE = re.compile(rb'\n[ \t]*>')
+
+# plotly is imported lazily as well; availability is checked without importing it
+go = _LazyModule('plotly.graph_objects', 'plotly>=5.17.0')
+PLOTLY_AVAILABLE = importlib.util.find_spec('plotly') is not None
 
 # Import standard library modules
 import gc  # Garbage collection (standard library, always available)
@@ -1039,20 +1082,28 @@ def scan_with_registry(class_name: str, sequence: str, registry_dir: str = "regi
     Returns list of (start, end, pattern_id, subclass) matches.
     Falls back to pure-Python regex matching if Hyperscan not available.
     
-    Improved error handling and logging.
+    The registry patterns are compiled once into a stream-mode database with
+    start-of-match tracking; the sequence is fed through one stream in
+    consecutive blocks, so matches come back once with global offsets.
     """
+    from Utilities.stream_scan import compile_stream_database, stream_scan
     db, id_to_pattern, id_to_subclass, id_to_score = get_cached_registry(class_name, registry_dir)
     matches = []
     
     if db is not None and _HYPERSCAN_AVAILABLE:
-        # Use Hyperscan for fast matching
-        def on_match(pattern_id, start, end, flags, context):
+        ids = sorted(id_to_pattern.keys())
+        stream_db = compile_stream_database(f"registry:{registry_dir}/{class_name}", [id_to_pattern[i].encode("ascii") for i in ids], ids,
+                                            flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_DOTALL] * len(ids))
+        
+        def on_match(start, end, pattern_id):
             subclass = id_to_subclass.get(pattern_id, "unknown")
             matches.append((start, end, pattern_id, subclass))
         
         try:
-            db.scan(sequence.encode(), match_event_handler=on_match)
-            logger.debug(f"Hyperscan scan completed for {class_name}: {len(matches)} matches")
+            if stream_db is None:
+                raise RuntimeError("stream-mode database unavailable")
+            stream_scan(stream_db, sequence, on_match=on_match)
+            logger.debug(f"Hyperscan stream scan completed for {class_name}: {len(matches)} matches")
             # Successfully completed Hyperscan scan - sort and return results
             matches.sort(key=lambda x: x[0])
             return matches
@@ -1613,7 +1664,7 @@ class MotifScoring:
 # =============================================================================
 
 class HyperscanManager:
-    """Hyperscan database management for high-performance pattern matching"""
+    """Hyperscan database management for high-performance pattern matching (stream mode)"""
     
     def __init__(self):
         self.compiled_db = None
@@ -1622,7 +1673,7 @@ class HyperscanManager:
     
     def compile_database(self, patterns: List[Tuple[str, str]]) -> bool:
         """
-        Compile Hyperscan database from patterns
+        Compile stream-mode Hyperscan database (with start-of-match tracking) from patterns
         
         Args:
             patterns: List of (pattern, identifier) tuples
@@ -1633,25 +1684,21 @@ class HyperscanManager:
         if not self.hyperscan_available:
             return False
         
-        try:
-            # Prepare patterns for Hyperscan
-            hyperscan_patterns = []
-            for i, (pattern, pattern_id) in enumerate(patterns):
-                hyperscan_patterns.append((pattern.encode(), i, hyperscan.HS_FLAG_CASELESS))
-                self.pattern_info[i] = pattern_id
-            
-            # Compile database
-            self.compiled_db = hyperscan.hs_compile_multi(hyperscan_patterns)
-            return True
-            
-        except Exception as e:
-            logger.warning(f"Hyperscan compilation failed: {e}")
-            return False
+        from Utilities.stream_scan import compile_stream_database
+        self.pattern_info = {i: pattern_id for i, (_, pattern_id) in enumerate(patterns)}
+        key = 'manager:' + hashlib.blake2b('\x00'.join(p for p, _ in patterns).encode(), digest_size=8).hexdigest()
+        self.compiled_db = compile_stream_database(key, [p.encode() for p, _ in patterns], range(len(patterns)),
+                                                   flags=[hyperscan.HS_FLAG_CASELESS] * len(patterns))
+        return self.compiled_db is not None
     
     def scan_sequence(self, sequence: str) -> List[Tuple[int, int, str]]:
         """
         Scan sequence with compiled Hyperscan database
         
+        The sequence is fed through a single stream in consecutive blocks, so
+        each match is reported once with its global offset (no overlapped
+        chunks, no boundary deduplication).
+        
         Args:
             sequence: DNA sequence to scan
             
@@ -1661,14 +1708,15 @@ class HyperscanManager:
         if not self.compiled_db:
             return []
         
+        from Utilities.stream_scan import stream_scan
         matches = []
         
-        def match_handler(pattern_id: int, start: int, end: int, flags: int, context=None):
+        def match_handler(start: int, end: int, pattern_id: int):
             pattern_info = self.pattern_info.get(pattern_id, f'pattern_{pattern_id}')
             matches.append((start, end, pattern_info))
         
         try:
-            hyperscan.hs_scan(self.compiled_db, sequence.encode(), match_handler, None)
+            stream_scan(self.compiled_db, sequence, on_match=match_handler)
         except Exception as e:
             logger.warning(f"Hyperscan scanning failed: {e}")
         
@@ -1788,7 +1836,6 @@ try:
 except ImportError:
     try:
         # Fallback: direct import
-        import sys
         import os as _os
         sys.path.insert(0, _os.path.dirname(__file__))
         from load_hsdb import load_db_for_class
@@ -1932,7 +1979,6 @@ import os
 import json
 import csv
 import random
-import pandas as pd
 import numpy as np
 from typing import Dict, List, Any, Optional, Tuple
 from collections import Counter, defaultdict
@@ -1944,6 +1990,97 @@ warnings.filterwarnings("ignore")
 # SEQUENCE I/O OPERATIONS
 # =============================================================================
 
+class _FastaBytesParser:
+    """
+    Incremental bytes-level FASTA parser shared by the ``parse_fasta*`` functions.
+
+    Header lines (``>`` after optional spaces/tabs) are located with one
+    regex search and each run of sequence lines is cleaned by a single
+    ``bytes.translate`` (uppercase + delete newlines/non-IUPAC bytes), so
+    there is no per-line Python work.  Blocks
+    can be fed in arbitrary pieces; a header split across pieces is carried
+    over.  Unnamed headers become ``sequence_<n>``; records without any
+    valid bases are skipped.
+    """
+
+    def __init__(self):
+        self._name: Optional[str] = None
+        self._parts: List[str] = []
+        self._pending = b''
+        self._at_line_start = True
+        self._unnamed = 0
+
+    def feed(self, data: bytes) -> Iterator[Tuple[str, str]]:
+        """Consume the next block of FASTA bytes, yielding completed records."""
+        if self._pending:
+            data = self._pending + data
+            self._pending = b''
+        pos = 0
+        size = len(data)
+        while pos < size:
+            if self._at_line_start:
+                start = pos
+                while start < size and data[start] in b' \t':
+                    start += 1
+                if start == size:
+                    self._pending = data[pos:]
+                    return
+                if data[start] == 0x3E:  # '>'
+                    eol = data.find(b'\n', start)
+                    if eol == -1:
+                        self._pending = data[pos:]
+                        return
+                    yield from self._finish_record()
+                    self._start_record(data[start + 1:eol])
+                    pos = eol + 1
+                    continue
+            match = _FASTA_HEADER_RE.search(data, pos)
+            header = -1 if match is None else match.start()
+            end = size if header == -1 else header
+            if self._name is not None:
+                cleaned = data[pos:end].translate(_FASTA_UPPER_TABLE, _FASTA_DELETE_BYTES)
+                if cleaned:
+                    self._parts.append(cleaned.decode('ascii'))
+            if header == -1:
+                # the indentation of a header split across blocks may end this one
+                tail = size
+                while tail > pos and data[tail - 1] in b' \t':
+                    tail -= 1
+                self._at_line_start = tail > pos and data[tail - 1] == 0x0A
+                return
+            pos = header + 1
+            self._at_line_start = True
+
+    def close(self) -> Iterator[Tuple[str, str]]:
+        """Flush the final record."""
+        if self._pending:
+            yield from self._finish_record()
+            self._start_record(self._pending)
+            self._pending = b''
+        yield from self._finish_record()
+
+    def _start_record(self, header: bytes):
+        name = header.decode('utf-8', errors='ignore').strip()
+        if not name:
+            self._unnamed += 1
+            name = f"sequence_{self._unnamed}"
+        self._name = name
+        self._parts = []
+
+    def _finish_record(self) -> Iterator[Tuple[str, str]]:
+        if self._name is not None and self._parts:
+            sequence = ''.join(self._parts)
+            self._parts = []
+            yield self._name, sequence
+
+
+def _iter_fasta_bytes(data: bytes) -> Iterator[Tuple[str, str]]:
+    """Parse an in-memory FASTA byte buffer into (name, sequence) records."""
+    parser = _FastaBytesParser()
+    yield from parser.feed(data)
+    yield from parser.close()
+
+
 def parse_fasta(fasta_content: str, streaming: bool = False) -> Union[Dict[str, str], 'Generator']:
     """
     Parse FASTA format content into sequences dictionary or generator.
@@ -1952,7 +2089,7 @@ def parse_fasta(fasta_content: str, streaming: bool = False) -> Union[Dict[str,
     to reduce memory usage by 50-90% through lazy evaluation.
     
     Args:
-        fasta_content: FASTA format string content
+        fasta_content: FASTA format string (or bytes) content
         streaming: If True, return generator instead of dict (default: False)
                   Use streaming=True for large files to save memory.
         
@@ -1970,40 +2107,7 @@ def parse_fasta(fasta_content: str, streaming: bool = False) -> Union[Dict[str,
     """
     if streaming:
         return parse_fasta_streaming(fasta_content)
-    
-    # Original implementation for backward compatibility
-    sequences = {}
-    current_name = None
-    current_seq = []
-    
-    lines = fasta_content.strip().split('\n')
-    
-    for line in lines:
-        line = line.strip()
-        if not line:
-            continue
-            
-        if line.startswith('>'):
-            # Save previous sequence
-            if current_name and current_seq:
-                sequences[current_name] = ''.join(current_seq)
-            
-            # Start new sequence
-            current_name = line[1:].strip()
-            if not current_name:
-                current_name = f"sequence_{len(sequences) + 1}"
-            current_seq = []
-        else:
-            # Add to current sequence, filtering non-IUPAC characters
-            filtered = _NON_IUPAC_RE.sub('', line.upper())
-            if filtered:
-                current_seq.append(filtered)
-    
-    # Save last sequence
-    if current_name and current_seq:
-        sequences[current_name] = ''.join(current_seq)
-    
-    return sequences
+    return dict(parse_fasta_streaming(fasta_content))
 
 
 def parse_fasta_streaming(fasta_content: str):
@@ -2016,11 +2120,11 @@ def parse_fasta_streaming(fasta_content: str):
     
     Performance:
         - Memory usage: O(max_sequence_length) instead of O(total_file_size)
-        - Parsing logic identical to parse_fasta() - ensures exact same output
+        - Bytes-level parsing (find + translate), no per-line string work
         - Best for files >10MB or when processing sequences individually
     
     Args:
-        fasta_content: FASTA format string content
+        fasta_content: FASTA format string (or bytes) content
         
     Yields:
         Tuple of (sequence_name, sequence_string)
@@ -2030,48 +2134,19 @@ def parse_fasta_streaming(fasta_content: str):
         ...     motifs = analyze_sequence(seq, name)
         ...     save_results(name, motifs)
     """
-    current_name = None
-    current_seq = []
-    sequence_counter = 0  # Use counter for unnamed sequences
-    
-    lines = fasta_content.strip().split('\n')
-    
-    for line in lines:
-        line = line.strip()
-        if not line:
-            continue
-            
-        if line.startswith('>'):
-            # Yield previous sequence
-            if current_name and current_seq:
-                yield (current_name, ''.join(current_seq))
-                current_seq.clear()  # Free memory immediately
-            
-            # Start new sequence
-            current_name = line[1:].strip()
-            if not current_name:
-                # Use sequential counter for unnamed sequences (reproducible)
-                sequence_counter += 1
-                current_name = f"sequence_{sequence_counter}"
-            current_seq = []
-        else:
-            # Add to current sequence, filtering non-IUPAC characters
-            filtered = _NON_IUPAC_RE.sub('', line.upper())
-            if filtered:
-                current_seq.append(filtered)
-    
-    # Yield last sequence
-    if current_name and current_seq:
-        yield (current_name, ''.join(current_seq))
-        current_seq.clear()
+    if isinstance(fasta_content, str):
+        fasta_content = fasta_content.encode('utf-8')
+    yield from _iter_fasta_bytes(fasta_content)
 
 def parse_fasta_chunked(file_object, chunk_size_mb: int = 2):
     """
     Memory-efficient FASTA parser using chunked reading for large files.
     Yields (name, sequence) tuples one at a time to avoid loading entire file in memory.
     
-    This version is optimized to use less memory than loading the entire file at once
-    by processing sequences one at a time and yielding them immediately.
+    Blocks are parsed as bytes (text-mode blocks are encoded first): record
+    boundaries come from ``find(b'\\n>')`` and sequence lines are cleaned
+    with one ``bytes.translate`` per block, so only the current record's
+    cleaned bases are held in memory.
     
     Args:
         file_object: File-like object (from st.file_uploader or open())
@@ -2081,64 +2156,15 @@ def parse_fasta_chunked(file_object, chunk_size_mb: int = 2):
         Tuple of (sequence_name, sequence_string)
     """
     chunk_size = chunk_size_mb * 1024 * 1024  # Convert to bytes
-    current_name = None
-    current_seq_parts = []  # Use list to accumulate, join only when yielding
-    
-    # Read file in smaller chunks to avoid memory overflow
-    buffer = ""
+    parser = _FastaBytesParser()
     while True:
         chunk = file_object.read(chunk_size)
         if not chunk:
             break
-        
-        # Decode if bytes
-        if isinstance(chunk, bytes):
-            chunk = chunk.decode('utf-8', errors='ignore')
-        
-        buffer += chunk
-        lines = buffer.split('\n')
-        
-        # Keep the last incomplete line in buffer
-        buffer = lines[-1]
-        lines = lines[:-1]
-        
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-            
-            if line.startswith('>'):
-                # Yield previous sequence
-                if current_name and current_seq_parts:
-                    # Join and yield, then clear parts to free memory immediately
-                    full_seq = ''.join(current_seq_parts)
-                    current_seq_parts.clear()  # Free memory immediately
-                    yield (current_name, full_seq)
-                    del full_seq  # Help garbage collector
-                
-                # Start new sequence
-                current_name = line[1:].strip()
-                if not current_name:
-                    current_name = f"sequence_{id(line)}"
-                current_seq_parts = []
-            else:
-                # Add to current sequence, filtering non-IUPAC characters
-                filtered = _NON_IUPAC_RE.sub('', line.upper())
-                if filtered:
-                    current_seq_parts.append(filtered)
-    
-    # Process remaining buffer
-    if buffer.strip() and not buffer.startswith('>'):
-        filtered = _NON_IUPAC_RE.sub('', buffer.strip().upper())
-        if filtered:
-            current_seq_parts.append(filtered)
-    
-    # Yield last sequence
-    if current_name and current_seq_parts:
-        full_seq = ''.join(current_seq_parts)
-        current_seq_parts.clear()
-        yield (current_name, full_seq)
-        del full_seq
+        if isinstance(chunk, str):
+            chunk = chunk.encode('utf-8')
+        yield from parser.feed(chunk)
+    yield from parser.close()
 
 
 def open_compressed_file(file_path_or_object):
@@ -2207,7 +2233,17 @@ def parse_fasta_chunked_compressed(file_path_or_object, chunk_size_mb: int = 2):
         >>> for name, seq in parse_fasta_chunked_compressed('sequences.fasta'):
         ...     print(f"{name}: {len(seq)} bp")
     """
-    with open_compressed_file(file_path_or_object) as f:
+    import gzip
+    
+    if isinstance(file_path_or_object, str):
+        # Open paths in binary mode so the parser never decodes sequence data
+        if file_path_or_object.endswith(('.gz', '.bgz')):
+            handle = gzip.open(file_path_or_object, 'rb')
+        else:
+            handle = open(file_path_or_object, 'rb')
+    else:
+        handle = open_compressed_file(file_path_or_object)
+    with handle as f:
         yield from parse_fasta_chunked(f, chunk_size_mb=chunk_size_mb)
 
 
@@ -2331,7 +2367,12 @@ def validate_sequence(sequence: str) -> Tuple[bool, str]:
     
     # Check for valid DNA characters
     valid_chars = set('ATGCRYSWKMBDHVN-')  # Include ambiguous bases
-    invalid_chars = set(sequence.upper()) - valid_chars
+    if sequence.isascii():
+        # One bincount pass over the bytes instead of building set(sequence.upper())
+        counts = byte_composition(sequence.encode('ascii'))
+        invalid_chars = {chr(b).upper() for b in np.flatnonzero(counts)} - valid_chars
+    else:
+        invalid_chars = set(sequence.upper()) - valid_chars
     
     if invalid_chars:
         return False, f"Invalid characters found: {invalid_chars}"
@@ -2583,13 +2624,7 @@ def calculate_motif_statistics(motifs: List[Dict[str, Any]], sequence_length: in
     # Total Coverage (bp): union of all main motif intervals (set-based, no double counting)
     # COORDINATE SYSTEM: Motifs use 1-based INCLUSIVE coordinates
     # Convert to 0-based half-open for Python range(): range(start-1, end)
-    covered_positions = set()
-    for motif in main_motifs:
-        start = motif.get('Start', 0) - 1  # Convert 1-based to 0-based
-        end = motif.get('End', 0)           # Inclusive end becomes exclusive in range()
-        if end > start:
-            covered_positions.update(range(start, end))
-    total_covered_bases = len(covered_positions)
+    total_covered_bases = _motif_coverage_bp(main_motifs)
     coverage_fraction = (total_covered_bases / G) if G > 0 else 0.0
     coverage_percent = coverage_fraction * 100
 
@@ -2606,14 +2641,7 @@ def calculate_motif_statistics(motifs: List[Dict[str, Any]], sequence_length: in
     class_coverage = {}      # fraction of genome covered by each class
     class_covered_bases = {} # absolute covered bases per class
     for cls in class_counts:
-        cls_positions = set()
-        for m in main_motifs:
-            if m.get('Class') == cls:
-                s = m.get('Start', 0) - 1
-                e = m.get('End', 0)
-                if e > s:
-                    cls_positions.update(range(s, e))
-        cls_bases = len(cls_positions)
+        cls_bases = _motif_coverage_bp([m for m in main_motifs if m.get('Class') == cls])
         class_covered_bases[cls] = cls_bases
         class_coverage[cls] = round((cls_bases / G * 100) if G > 0 else 0.0, 4)
 
@@ -2674,23 +2702,11 @@ def calculate_motif_statistics(motifs: List[Dict[str, Any]], sequence_length: in
     dominance_ratio = round(max(class_counts.values()) / n, 4) if n > 0 else 0.0
 
     # ── Hybrid & Cluster Individual Metrics ──────────────────────────────────
-    hybrid_covered = set()
-    for m in hybrid_motifs:
-        s = m.get('Start', 0) - 1
-        e = m.get('End', 0)
-        if e > s:
-            hybrid_covered.update(range(s, e))
-    hybrid_coverage_bases = len(hybrid_covered)
+    hybrid_coverage_bases = _motif_coverage_bp(hybrid_motifs)
     hybrid_coverage_pct = round((hybrid_coverage_bases / G * 100) if G > 0 else 0.0, 4)
     hybrid_density = round((len(hybrid_motifs) / G) if G > 0 else 0.0, 8)
 
-    cluster_covered = set()
-    for m in cluster_motifs:
-        s = m.get('Start', 0) - 1
-        e = m.get('End', 0)
-        if e > s:
-            cluster_covered.update(range(s, e))
-    cluster_coverage_bases = len(cluster_covered)
+    cluster_coverage_bases = _motif_coverage_bp(cluster_motifs)
     cluster_coverage_pct = round((cluster_coverage_bases / G * 100) if G > 0 else 0.0, 4)
 
     stats = {
@@ -2819,17 +2835,7 @@ def compute_comprehensive_genome_stats(
     density_per_kb = (n / G * 1000) if G > 0 else 0.0
 
     # ── III. Structural Coverage ──────────────────────────────────────────────
-    def _covered(mlist):
-        pos = set()
-        for m in mlist:
-            s = m.get('Start', 0) - 1
-            e = m.get('End', 0)
-            if e > s:
-                pos.update(range(s, e))
-        return pos
-
-    covered_main = _covered(main_motifs)
-    total_covered_bases = len(covered_main)
+    total_covered_bases = _motif_coverage_bp(main_motifs)
     coverage_fraction   = (total_covered_bases / G) if G > 0 else 0.0
     coverage_pct        = coverage_fraction * 100
 
@@ -2845,8 +2851,7 @@ def compute_comprehensive_genome_stats(
     class_coverage_pct  = {}
     class_contribution  = {}
     for cls in class_counts:
-        cls_pos = _covered([m for m in main_motifs if m.get('Class') == cls])
-        cls_bases = len(cls_pos)
+        cls_bases = _motif_coverage_bp([m for m in main_motifs if m.get('Class') == cls])
         class_covered_bases[cls] = cls_bases
         class_coverage_pct[cls]  = round((cls_bases / G * 100) if G > 0 else 0.0, 4)
         class_contribution[cls]  = round((cls_bases / total_covered_bases) if total_covered_bases > 0 else 0.0, 4)
@@ -2887,8 +2892,8 @@ def compute_comprehensive_genome_stats(
         for i, m in enumerate(sorted_main):
             win_start = m.get('Start', 0)
             win_end   = win_start + W
-            window_motifs = [sm for sm in sorted_main
-                             if sm.get('Start', 0) >= win_start and sm.get('Start', 0) < win_end]
+            # Sorted starts: the window is a contiguous slice
+            window_motifs = sorted_main[bisect.bisect_left(starts, win_start):bisect.bisect_left(starts, win_end)]
             wcount     = len(window_motifs)
             wclasses   = len(set(wm.get('Class') for wm in window_motifs))
             local_d    = wcount / W
@@ -2898,10 +2903,10 @@ def compute_comprehensive_genome_stats(
             if clu_score > max_cluster_score:    max_cluster_score   = clu_score
 
     # ── IX. Hybridization Metrics ─────────────────────────────────────────────
-    hybrid_covered_bases  = len(_covered(hybrid_motifs))
+    hybrid_covered_bases  = _motif_coverage_bp(hybrid_motifs)
     hybrid_coverage_pct   = round((hybrid_covered_bases / G * 100) if G > 0 else 0.0, 4)
     hybrid_density        = round((len(hybrid_motifs) / G) if G > 0 else 0.0, 8)
-    cluster_covered_bases = len(_covered(cluster_motifs))
+    cluster_covered_bases = _motif_coverage_bp(cluster_motifs)
     cluster_coverage_pct  = round((cluster_covered_bases / G * 100) if G > 0 else 0.0, 4)
 
     # Overlap fractions between adjacent main motifs (metric #19)
@@ -3198,69 +3203,170 @@ def create_summary_table(sequences: Dict[str, str], results: Dict[str, List[Dict
 # DATA EXPORT FUNCTIONS
 # =============================================================================
 
-def export_to_bed(motifs: List[Dict[str, Any]], sequence_name: str = "sequence", 
-                  filename: Optional[str] = None) -> str:
+# Formatted records accumulated before each write() in the streaming exporters
+EXPORT_WRITE_BATCH = 10_000
+
+# BED itemRgb colour per motif class
+BED_CLASS_COLORS = {
+    'Curved_DNA': '255,182,193',      # Light pink
+    'Slipped_DNA': '255,218,185',     # Peach
+    'Cruciform': '173,216,230',       # Light blue
+    'R-Loop': '144,238,144',          # Light green
+    'Triplex': '221,160,221',         # Plum
+    'G-Quadruplex': '255,215,0',      # Gold
+    'i-Motif': '255,165,0',           # Orange
+    'Z-DNA': '138,43,226',            # Blue violet
+    'A-philic_DNA': '230,230,250',    # Lavender
+    'Hybrid': '192,192,192',          # Silver
+    'Non-B_DNA_Clusters': '128,128,128'  # Gray
+}
+
+
+class _BatchedTextWriter:
+    """
+    Join formatted records with ``separator`` and write them in fixed-size batches.
+
+    Keeps at most ``batch_size`` formatted records in memory, so exporters can
+    stream arbitrarily many motifs into a file handle (plain, gzip or BGZF).
+    """
+
+    def __init__(self, handle, separator: str = '\n', batch_size: int = EXPORT_WRITE_BATCH):
+        self.handle = handle
+        self.separator = separator
+        self.batch_size = batch_size
+        self.count = 0
+        self._batch: List[str] = []
+
+    def write(self, record: str) -> None:
+        self._batch.append(record)
+        if len(self._batch) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self._batch:
+            return
+        prefix = self.separator if self.count else ''
+        self.handle.write(prefix + self.separator.join(self._batch))
+        self.count += len(self._batch)
+        self._batch.clear()
+
+
+class _BgzfTextHandle:
+    """Text facade over ``Bio.bgzf.BgzfWriter`` (which only accepts latin-1 text)."""
+
+    def __init__(self, filename: str):
+        from Bio import bgzf
+        self._writer = bgzf.BgzfWriter(filename, 'wb')
+
+    def write(self, text: str) -> None:
+        self._writer.write(text.encode('utf-8'))
+
+    def close(self) -> None:
+        self._writer.close()
+
+
+def _open_export_handle(filename: str, bgzip: bool = False):
+    """
+    Open *filename* for streaming text export.
+
+    With ``bgzip=True`` the output is BGZF-compressed on the fly (indexable by
+    tabix/samtools).  Falls back to plain gzip when Biopython is unavailable.
+    """
+    if not bgzip:
+        return open(filename, 'w', newline='', encoding='utf-8', buffering=1 << 20)
+    try:
+        return _BgzfTextHandle(filename)
+    except ImportError:
+        import gzip
+        logger.warning("Biopython not available - writing plain gzip instead of BGZF")
+        return gzip.open(filename, 'wt', newline='', encoding='utf-8')
+
+
+def _run_text_export(emit, filename: Optional[str], bgzip: bool, label: str) -> str:
+    """
+    Run *emit(handle)* against an in-memory buffer or a streamed output file.
+
+    Returns the exported text when *filename* is None, otherwise the path
+    written (the content is never materialised in that case). If the motif
+    iterator or the writer fails, the partial file is removed and the error
+    re-raised, so a truncated export is never reported as written.
+    """
+    if filename is None:
+        buffer = StringIO()
+        emit(buffer)
+        return buffer.getvalue()
+    
+    handle = None
+    try:
+        handle = _open_export_handle(filename, bgzip)
+        emit(handle)
+    except Exception as e:
+        logger.error(f"Error writing {label} file {filename}: {e}")
+        if handle is not None:
+            handle.close(); handle = None
+            try:
+                os.remove(filename)
+            except OSError:
+                pass
+        raise
+    finally:
+        if handle is not None:
+            handle.close()
+    return filename
+
+
+def _peek_motifs(motifs):
+    """Return ``(first_motif, iterator_over_all)``; *first_motif* is None when empty."""
+    iterator = iter(_iter_motif_records(motifs))
+    first = next(iterator, None)
+    if first is None:
+        return None, iterator
+    return first, itertools.chain([first], iterator)
+
+
+def _iter_export_motifs(motifs):
+    """Lazily validate and normalize motifs before export (non-strict)."""
+    from Utilities.export.export_validator import iter_validated_motifs
+    return iter_validated_motifs(_iter_motif_records(motifs), auto_normalize=True, strict=False)
+
+
+def export_to_bed(motifs: Iterable[Dict[str, Any]], sequence_name: str = "sequence", 
+                  filename: Optional[str] = None, bgzip: bool = False) -> str:
     """
     Export motifs to BED format
     
+    Motifs are validated and formatted one at a time and written in batches
+    of :data:`EXPORT_WRITE_BATCH` lines, so any iterable (generators,
+    ``UniversalResultsStorage.iter_results()``, ``FinalExporter.assemble()``)
+    is exported with constant memory.
+    
     Args:
-        motifs: List of motif dictionaries
+        motifs: Motif dicts (list, iterable, or columnar table)
         sequence_name: Name of the sequence
         filename: Optional output filename
+        bgzip: BGZF-compress the output file on the fly
         
     Returns:
-        BED format string
+        BED format string, or the output path when *filename* is given
     """
-    # Validate and normalize motifs before export
-    from Utilities.export.export_validator import validate_export_data
-    try:
-        motifs = validate_export_data(motifs, auto_normalize=True, strict=False)
-    except Exception as e:
-        logger.warning(f"Export validation warning: {e}")
-    
-    bed_lines = []
-    bed_lines.append("track name=NBDScanner_motifs description=\"Non-B DNA motifs\" itemRgb=On")
-    
-    # Color mapping for different classes
-    class_colors = {
-        'Curved_DNA': '255,182,193',      # Light pink
-        'Slipped_DNA': '255,218,185',     # Peach
-        'Cruciform': '173,216,230',       # Light blue
-        'R-Loop': '144,238,144',          # Light green
-        'Triplex': '221,160,221',         # Plum
-        'G-Quadruplex': '255,215,0',      # Gold
-        'i-Motif': '255,165,0',           # Orange
-        'Z-DNA': '138,43,226',            # Blue violet
-        'A-philic_DNA': '230,230,250',    # Lavender
-        'Hybrid': '192,192,192',          # Silver
-        'Non-B_DNA_Clusters': '128,128,128'  # Gray
-    }
-    
-    for motif in motifs:
-        chrom = sequence_name
-        start = max(0, motif.get('Start', 1) - 1)  # Convert to 0-based
-        end = motif.get('End', start + 1)
-        name = f"{motif.get('Class', 'Unknown')}_{motif.get('Subclass', 'Unknown')}"
-        score = int(min(1000, max(0, motif.get('Score', 0) * 1000)))  # Scale to 0-1000
-        strand = motif.get('Strand', '+')
-        color = class_colors.get(motif.get('Class'), '128,128,128')
-        
-        bed_line = f"{chrom}\t{start}\t{end}\t{name}\t{score}\t{strand}\t{start}\t{end}\t{color}"
-        bed_lines.append(bed_line)
-    
-    bed_content = '\n'.join(bed_lines)
-    
-    if filename:
-        try:
-            with open(filename, 'w') as f:
-                f.write(bed_content)
-        except Exception as e:
-            logger.error(f"Error writing BED file {filename}: {e}")
+    def emit(handle):
+        writer = _BatchedTextWriter(handle)
+        writer.write("track name=NBDScanner_motifs description=\"Non-B DNA motifs\" itemRgb=On")
+        for motif in _iter_export_motifs(motifs):
+            start = max(0, motif.get('Start', 1) - 1)  # Convert to 0-based
+            end = motif.get('End', start + 1)
+            name = f"{motif.get('Class', 'Unknown')}_{motif.get('Subclass', 'Unknown')}"
+            score = int(min(1000, max(0, motif.get('Score', 0) * 1000)))  # Scale to 0-1000
+            strand = motif.get('Strand', '+')
+            color = BED_CLASS_COLORS.get(motif.get('Class'), '128,128,128')
+            writer.write(f"{sequence_name}\t{start}\t{end}\t{name}\t{score}\t{strand}\t{start}\t{end}\t{color}")
+        writer.flush()
     
-    return bed_content
+    return _run_text_export(emit, filename, bgzip, "BED")
 
-def export_to_csv(motifs: List[Dict[str, Any]], filename: Optional[str] = None, 
-                 non_overlapping_only: bool = False, include_all_fields: bool = True) -> str:
+def export_to_csv(motifs: Iterable[Dict[str, Any]], filename: Optional[str] = None, 
+                 non_overlapping_only: bool = False, include_all_fields: bool = True,
+                 bgzip: bool = False) -> str:
     """
     Export motifs to CSV format with comprehensive fields for meticulous analysis.
     
@@ -3271,122 +3377,301 @@ def export_to_csv(motifs: List[Dict[str, Any]], filename: Optional[str] = None,
     
     This comprehensive export enables meticulous analysis as requested in the problem statement.
     
+    Rows are written in batches of :data:`EXPORT_WRITE_BATCH`.  When
+    *include_all_fields* needs the union of all keys, validated motifs are
+    spooled to a temporary JSONL file during the key scan so that one-shot
+    iterators can be exported with constant memory.
+    
     Args:
-        motifs: List of motif dictionaries
+        motifs: Motif dicts (list, iterable, or columnar table)
         filename: Optional output filename
         non_overlapping_only: If True, exclude Hybrid and Cluster motifs (default: False)
         include_all_fields: If True, include all available fields; if False, only core columns (default: True)
+        bgzip: BGZF-compress the output file on the fly
         
     Returns:
-        CSV format string
+        CSV format string, or the output path when *filename* is given
     """
-    if not motifs:
+    first, motifs = _peek_motifs(motifs)
+    if first is None:
         return "No motifs to export"
     
-    # Validate and normalize motifs before export
-    from Utilities.export.export_validator import validate_export_data
-    try:
-        motifs = validate_export_data(motifs, auto_normalize=True, strict=False)
-    except Exception as e:
-        logger.warning(f"Export validation warning: {e}")
-    
-    # Filter motifs if requested
-    if non_overlapping_only:
-        motifs = [m for m in motifs if m.get('Class') not in EXCLUDED_FROM_CONSOLIDATED]
+    def selected(source):
+        for motif in _iter_export_motifs(source):
+            if non_overlapping_only and motif.get('Class') in EXCLUDED_FROM_CONSOLIDATED:
+                continue
+            yield motif
     
-    # Determine which columns to export
+    spool_path = None
+    rows = selected(motifs)
     if include_all_fields:
-        # Collect ALL unique fields from all motifs for comprehensive export
+        # Collect ALL unique fields: core columns first, then sorted additional fields
         all_fields = set()
-        for motif in motifs:
-            all_fields.update(motif.keys())
-        
-        # Order fields: core columns first, then alphabetically sorted additional fields
-        core_columns = CORE_OUTPUT_COLUMNS
-        additional_fields = sorted(all_fields - set(core_columns))
-        columns = core_columns + additional_fields
+        with tempfile.NamedTemporaryFile('w', suffix='.jsonl', delete=False, encoding='utf-8') as spool:
+            spool_path = spool.name
+            for motif in rows:
+                all_fields.update(motif.keys())
+                spool.write(json.dumps(motif, default=str) + '\n')
+        columns = CORE_OUTPUT_COLUMNS + sorted(all_fields - set(CORE_OUTPUT_COLUMNS))
+        
+        def spooled_rows():
+            with open(spool_path, encoding='utf-8') as fh:
+                for line in fh:
+                    yield json.loads(line)
+        rows = spooled_rows()
     else:
         # Use only core columns for minimal export
         columns = CORE_OUTPUT_COLUMNS
     
-    output = StringIO()
-    writer = csv.DictWriter(output, fieldnames=columns)
-    writer.writeheader()
-    
-    for motif in motifs:
-        # Create row with all requested fields
-        row = {}
-        for col in columns:
-            value = motif.get(col, None)
-            
-            # Set appropriate defaults for missing columns
-            if value == '' or value is None:
-                value = DEFAULT_COLUMN_VALUES.get(col, 'NA')
-            
-            # Handle list/dict values - convert to string representation
-            if isinstance(value, (list, dict)):
-                value = str(value)
-            
-            row[col] = value
-        
-        writer.writerow(row)
-    
-    csv_content = output.getvalue()
-    output.close()
-    
-    if filename:
-        try:
-            with open(filename, 'w', newline='') as f:
-                f.write(csv_content)
-        except Exception as e:
-            logger.error(f"Error writing CSV file {filename}: {e}")
+    defaults = [DEFAULT_COLUMN_VALUES.get(col, 'NA') for col in columns]
+    
+    def emit(handle):
+        writer = csv.writer(handle)
+        writer.writerow(columns)
+        batch = []
+        for motif in rows:
+            row = []
+            for col, default in zip(columns, defaults):
+                value = motif.get(col, None)
+                # Set appropriate defaults for missing columns
+                if value == '' or value is None:
+                    value = default
+                # Handle list/dict values - convert to string representation
+                if isinstance(value, (list, dict)):
+                    value = str(value)
+                row.append(value)
+            batch.append(row)
+            if len(batch) >= EXPORT_WRITE_BATCH:
+                writer.writerows(batch)
+                batch.clear()
+        writer.writerows(batch)
     
-    return csv_content
+    try:
+        return _run_text_export(emit, filename, bgzip, "CSV")
+    finally:
+        if spool_path is not None and os.path.exists(spool_path):
+            os.remove(spool_path)
 
-def export_to_json(motifs: List[Dict[str, Any]], filename: Optional[str] = None, 
-                   pretty: bool = True) -> str:
+def export_to_json(motifs: Iterable[Dict[str, Any]], filename: Optional[str] = None, 
+                   pretty: bool = True, bgzip: bool = False) -> str:
     """
     Export motifs to JSON format
     
+    The document is streamed motif by motif; ``total_motifs`` is therefore
+    written after the ``motifs`` array.
+    
     Args:
-        motifs: List of motif dictionaries
+        motifs: Motif dicts (list, iterable, or columnar table)
         filename: Optional output filename
         pretty: Whether to format JSON prettily
+        bgzip: BGZF-compress the output file on the fly
         
     Returns:
-        JSON format string
+        JSON format string, or the output path when *filename* is given
     """
-    # Validate and normalize motifs before export
-    from Utilities.export.export_validator import validate_export_data
-    try:
-        motifs = validate_export_data(motifs, auto_normalize=True, strict=False)
-    except Exception as e:
-        logger.warning(f"Export validation warning: {e}")
-    
-    json_data = {
-        'version': '2024.1',
-        'analysis_type': 'NBDScanner_Non-B_DNA_Analysis',
-        'total_motifs': len(motifs),
-        'motifs': motifs
-    }
-    
-    if pretty:
-        json_content = json.dumps(json_data, indent=2, ensure_ascii=False)
-    else:
-        json_content = json.dumps(json_data, ensure_ascii=False)
+    header = '"version": "2024.1", "analysis_type": "NBDScanner_Non-B_DNA_Analysis", "motifs": ['
     
-    if filename:
-        try:
-            with open(filename, 'w') as f:
-                f.write(json_content)
-        except Exception as e:
-            logger.error(f"Error writing JSON file {filename}: {e}")
-    
-    return json_content
+    def emit(handle):
+        if pretty:
+            handle.write('{\n  ' + header.replace(', "', ',\n  "'))
+        else:
+            handle.write('{' + header)
+        writer = _BatchedTextWriter(handle, separator=',\n' if pretty else ', ')
+        for i, motif in enumerate(_iter_export_motifs(motifs)):
+            if pretty:
+                record = textwrap.indent(json.dumps(motif, indent=2, ensure_ascii=False), '    ')
+                writer.write('\n' + record if i == 0 else record)
+            else:
+                writer.write(json.dumps(motif, ensure_ascii=False))
+        writer.flush()
+        if pretty:
+            handle.write(('\n  ]' if writer.count else ']') + f',\n  "total_motifs": {writer.count}\n}}')
+        else:
+            handle.write(f'], "total_motifs": {writer.count}}}')
+    
+    return _run_text_export(emit, filename, bgzip, "JSON")
+
+
+# Excel worksheet hard limit (including the header row)
+EXCEL_MAX_ROWS = 1_048_576
+# Rows buffered per sheet before they are flushed to the write-only worksheet
+EXCEL_STREAM_BATCH_ROWS = 5_000
+# Rows pulled at a time from columnar inputs (DataFrame / Arrow table)
+COLUMNAR_BATCH_ROWS = 50_000
+
+
+def _iter_motif_records(motifs, batch_size: int = COLUMNAR_BATCH_ROWS):
+    """
+    Yield motif dicts from any supported motif source without materialising it.
+
+    Accepts an iterable of motif dicts (list, generator,
+    ``UniversalResultsStorage.iter_results()``), a list-of-lists stream such as
+    ``FinalExporter.assemble()``, or a columnar table (pandas DataFrame,
+    pyarrow Table/RecordBatch, or a dict of equal-length column lists).
+    Columnar tables are converted in batches of *batch_size* rows.
+    """
+    if motifs is None:
+        return
+    if _is_dataframe(motifs):
+        for offset in range(0, len(motifs), batch_size):
+            batch = motifs.iloc[offset:offset + batch_size]
+            batch = batch.astype(object).where(batch.notna(), None)
+            yield from batch.to_dict('records')
+        return
+    if hasattr(motifs, 'to_batches') or hasattr(motifs, 'to_pylist'):
+        # pyarrow Table / RecordBatch
+        batches = motifs.to_batches(max_chunksize=batch_size) if hasattr(motifs, 'to_batches') else [motifs]
+        for batch in batches:
+            yield from batch.to_pylist()
+        return
+    if isinstance(motifs, dict):
+        columns = list(motifs.keys())
+        for values in zip(*(motifs[c] for c in columns)):
+            yield dict(zip(columns, values))
+        return
+    for item in motifs:
+        if isinstance(item, list):
+            yield from item
+        else:
+            yield item
+
+
+class _ExcelSheetStream:
+    """
+    Buffered row writer for one logical sheet of a write-only workbook.
+
+    Rows are buffered and flushed in batches.  When a worksheet reaches
+    Excel's row limit the writer rolls over to a continuation sheet named
+    ``<name>_2``, ``<name>_3``, ... so arbitrarily large exports stay valid.
+    """
+
+    def __init__(self, workbook, name: str, columns: List[str],
+                 max_rows: int = EXCEL_MAX_ROWS, batch_rows: int = EXCEL_STREAM_BATCH_ROWS):
+        self.workbook = workbook
+        self.name = name
+        self.columns = columns
+        self.max_data_rows = max(1, max_rows - 1)  # one row reserved for the header
+        self.batch_rows = batch_rows
+        self.sheet_titles: List[str] = []
+        self.total_rows = 0
+        self._ws = None
+        self._rows_in_sheet = 0
+        self._buffer: List[List[Any]] = []
+
+    def append(self, values: List[Any]) -> None:
+        self._buffer.append(values)
+        if len(self._buffer) >= self.batch_rows:
+            self.flush()
+
+    def flush(self) -> None:
+        for values in self._buffer:
+            if self._ws is None or self._rows_in_sheet >= self.max_data_rows:
+                self._open_sheet()
+            self._ws.append(values)
+            self._rows_in_sheet += 1
+        self.total_rows += len(self._buffer)
+        self._buffer.clear()
+
+    def _open_sheet(self) -> None:
+        from openpyxl.cell import WriteOnlyCell
+        from openpyxl.styles import Font
+
+        part = len(self.sheet_titles) + 1
+        suffix = '' if part == 1 else f"_{part}"
+        title = self.name[:31 - len(suffix)] + suffix
+        ws = self.workbook.create_sheet(title)
+        header = []
+        for col in self.columns:
+            cell = WriteOnlyCell(ws, value=col)
+            cell.font = Font(bold=True)
+            header.append(cell)
+        ws.append(header)
+        self.sheet_titles.append(title)
+        self._ws = ws
+        self._rows_in_sheet = 0
+
+
+def _excel_cell_value(value: Any, default: Any) -> Any:
+    """Map a motif field to a value openpyxl can write."""
+    if value == '' or value is None:
+        return default
+    if isinstance(value, (list, dict, tuple, set)):
+        return str(value)
+    return value
+
+
+def _stream_motifs_to_workbook(workbook, motifs, simple_format: bool = False,
+                               max_rows_per_sheet: int = EXCEL_MAX_ROWS) -> Dict[str, Any]:
+    """
+    Write motifs into a write-only openpyxl workbook in a single pass.
+
+    Produces the same sheet layout as the in-memory export (core sheet,
+    class-specific sheets, Hybrid/Cluster sheets, or the 2-tab simple
+    format) while holding only one buffered batch per sheet in memory.
 
+    Returns:
+        Dict with ``total_motifs``, ``classes``, ``subclasses`` and the
+        ordered list of ``sheet_titles`` that were written.
+    """
+    from Utilities.export.export_validator import iter_validated_motifs
+
+    core_columns = CORE_OUTPUT_COLUMNS
+    core_defaults = [DEFAULT_COLUMN_VALUES.get(col, 'NA') for col in core_columns]
+    streams: Dict[str, _ExcelSheetStream] = {}
+
+    def stream_for(name: str, columns: List[str]) -> _ExcelSheetStream:
+        stream = streams.get(name)
+        if stream is None:
+            stream = streams[name] = _ExcelSheetStream(workbook, name, columns, max_rows=max_rows_per_sheet)
+        return stream
+
+    total = 0
+    classes = set()
+    subclasses = set()
+    for motif in iter_validated_motifs(_iter_motif_records(motifs), auto_normalize=True, strict=False):
+        total += 1
+        cls = motif.get('Class', 'Unknown')
+        classes.add(cls)
+        subclasses.add(motif.get('Subclass', 'Unknown'))
+        core_row = [_excel_cell_value(motif.get(col), default)
+                    for col, default in zip(core_columns, core_defaults)]
+        primary = cls not in EXCLUDED_FROM_CONSOLIDATED
+
+        if simple_format:
+            if primary:
+                stream_for('NonOverlappingConsolidated', core_columns).append(core_row)
+            stream_for('OverlappingAll', core_columns).append(core_row)
+        elif primary:
+            stream_for('Core_Results', core_columns).append(core_row)
+            specific_cols = MOTIF_SPECIFIC_COLUMNS.get(cls, [])
+            sheet_name = cls.replace('/', '_').replace(' ', '_').replace('-', '_')[:31]
+            detailed_row = core_row + [_excel_cell_value(motif.get(col), 'NA') for col in specific_cols]
+            stream_for(sheet_name, core_columns + specific_cols).append(detailed_row)
+        elif cls == 'Hybrid':
+            stream_for('Hybrid_Motifs', core_columns).append(core_row)
+        else:
+            stream_for('Cluster_Motifs', core_columns).append(core_row)
+
+    for stream in streams.values():
+        stream.flush()
+
+    # Sheets were created in first-seen order; restore the canonical layout
+    fixed_first = ['NonOverlappingConsolidated', 'OverlappingAll', 'Core_Results']
+    fixed_last = ['Hybrid_Motifs', 'Cluster_Motifs']
+    ordered_names = ([n for n in fixed_first if n in streams]
+                     + sorted(n for n in streams if n not in fixed_first and n not in fixed_last)
+                     + [n for n in fixed_last if n in streams])
+    sheet_titles = [title for n in ordered_names for title in streams[n].sheet_titles]
+    offset = len(workbook.sheetnames) - len(sheet_titles)
+    for target, title in enumerate(sheet_titles, start=offset):
+        workbook.move_sheet(title, target - workbook.sheetnames.index(title))
+
+    return {'total_motifs': total, 'classes': classes, 'subclasses': subclasses,
+            'sheet_titles': sheet_titles}
 
-def export_to_excel(motifs: List[Dict[str, Any]], filename: str = "nonbscanner_results.xlsx", 
-                   simple_format: bool = False) -> str:
+
+def export_to_excel(motifs: Iterable[Dict[str, Any]], filename: str = "nonbscanner_results.xlsx", 
+                   simple_format: bool = False, max_rows_per_sheet: int = EXCEL_MAX_ROWS) -> str:
     """
     Export motifs to Excel format with Task 1 & 2 requirements:
     - Main sheet: Core columns only (minimal, standard)
@@ -3406,116 +3691,34 @@ def export_to_excel(motifs: List[Dict[str, Any]], filename: str = "nonbscanner_r
         i-Motif: Num_C_Tracts, Loop_Length, Motif_Type
         Curved DNA: Tract_Type, Tract_Length, Num_Tracts
     
+    The workbook is written in openpyxl write-only (streaming) mode in a
+    single pass over *motifs*, so memory stays constant regardless of the
+    number of motifs.  Sheets exceeding Excel's 1,048,576-row limit are
+    continued on ``<sheet>_2``, ``<sheet>_3``, ...
+    
     Args:
-        motifs: List of motif dictionaries
+        motifs: Motif dicts as a list or any iterable (generators,
+                ``UniversalResultsStorage.iter_results()``), or a columnar
+                table (pandas DataFrame / pyarrow Table)
         filename: Output Excel filename (default: "nonbscanner_results.xlsx")
         simple_format: If True, use 2-tab format; if False, use class-specific format
+        max_rows_per_sheet: Row limit per worksheet including header (default: Excel maximum)
         
     Returns:
         Success message string
     """
     try:
-        import openpyxl
+        from openpyxl import Workbook
     except ImportError:
         raise ImportError("openpyxl is required for Excel export. Install with: pip install openpyxl")
     
-    if not motifs:
+    workbook = Workbook(write_only=True)
+    summary = _stream_motifs_to_workbook(workbook, motifs, simple_format=simple_format,
+                                         max_rows_per_sheet=max_rows_per_sheet)
+    if summary['total_motifs'] == 0:
         return "No motifs to export"
     
-    # Validate and normalize motifs before export
-    from Utilities.export.export_validator import validate_export_data
-    try:
-        motifs = validate_export_data(motifs, auto_normalize=True, strict=False)
-    except Exception as e:
-        logger.warning(f"Export validation warning: {e}")
-    
-    # Core columns for all sheets (Task 1 & 2 requirements)
-    core_columns = CORE_OUTPUT_COLUMNS
-    
-    # Prepare row with core columns only
-    def prepare_core_row(motif):
-        row = {}
-        for col in core_columns:
-            value = motif.get(col, None)
-            if value == '' or value is None:
-                value = DEFAULT_COLUMN_VALUES.get(col, 'NA')
-            row[col] = value
-        return row
-    
-    # Prepare row with motif-specific columns
-    def prepare_detailed_row(motif, motif_class):
-        row = prepare_core_row(motif)
-        
-        # Add motif-specific columns based on class
-        specific_cols = MOTIF_SPECIFIC_COLUMNS.get(motif_class, [])
-        for col in specific_cols:
-            value = motif.get(col, 'NA')
-            if value == '' or value is None:
-                value = 'NA'
-            row[col] = value
-        
-        return row
-    
-    # Create Excel writer
-    with pd.ExcelWriter(filename, engine='openpyxl') as writer:
-        if simple_format:
-            # Simple 2-tab format for user downloads
-            # Tab 1: Core columns only (NonOverlappingConsolidated)
-            consolidated_motifs = [m for m in motifs 
-                                 if m.get('Class') not in EXCLUDED_FROM_CONSOLIDATED]
-            
-            if consolidated_motifs:
-                consolidated_data = [prepare_core_row(m) for m in consolidated_motifs]
-                df_consolidated = pd.DataFrame(consolidated_data, columns=core_columns)
-                df_consolidated.to_excel(writer, sheet_name='NonOverlappingConsolidated', index=False)
-            
-            # Tab 2: Core columns only (OverlappingAll)
-            all_data = [prepare_core_row(m) for m in motifs]
-            df_all = pd.DataFrame(all_data, columns=core_columns)
-            df_all.to_excel(writer, sheet_name='OverlappingAll', index=False)
-        else:
-            # Structured format with motif-specific sheets
-            # Sheet 1: Core columns only (all non-overlapping motifs)
-            consolidated_motifs = [m for m in motifs 
-                                 if m.get('Class') not in EXCLUDED_FROM_CONSOLIDATED]
-            
-            if consolidated_motifs:
-                consolidated_data = [prepare_core_row(m) for m in consolidated_motifs]
-                df_consolidated = pd.DataFrame(consolidated_data, columns=core_columns)
-                df_consolidated.to_excel(writer, sheet_name='Core_Results', index=False)
-            
-            # Group motifs by class for detailed sheets
-            class_groups = defaultdict(list)
-            for motif in motifs:
-                cls = motif.get('Class', 'Unknown')
-                if cls not in EXCLUDED_FROM_CONSOLIDATED:  # Skip these for detailed sheets
-                    class_groups[cls].append(motif)
-            
-            # Create class-specific sheets with motif-specific columns
-            for cls, class_motifs in sorted(class_groups.items()):
-                # Sanitize sheet name (Excel has 31 character limit)
-                sheet_name = cls.replace('/', '_').replace(' ', '_').replace('-', '_')[:31]
-                
-                # Get columns for this class: core + motif-specific
-                class_columns = core_columns + MOTIF_SPECIFIC_COLUMNS.get(cls, [])
-                
-                class_data = [prepare_detailed_row(m, cls) for m in class_motifs]
-                df_class = pd.DataFrame(class_data, columns=class_columns)
-                df_class.to_excel(writer, sheet_name=sheet_name, index=False)
-            
-            # Separate sheets for Hybrid and Cluster motifs (if present)
-            hybrid_motifs = [m for m in motifs if m.get('Class') == 'Hybrid']
-            if hybrid_motifs:
-                hybrid_data = [prepare_core_row(m) for m in hybrid_motifs]
-                df_hybrid = pd.DataFrame(hybrid_data, columns=core_columns)
-                df_hybrid.to_excel(writer, sheet_name='Hybrid_Motifs', index=False)
-            
-            cluster_motifs = [m for m in motifs if m.get('Class') == 'Non-B_DNA_Clusters']
-            if cluster_motifs:
-                cluster_data = [prepare_core_row(m) for m in cluster_motifs]
-                df_cluster = pd.DataFrame(cluster_data, columns=core_columns)
-                df_cluster.to_excel(writer, sheet_name='Cluster_Motifs', index=False)
-    
+    workbook.save(filename)
     return f"Excel file exported successfully to {filename}"
 
 
@@ -3597,7 +3800,7 @@ def export_multifasta_to_excel(
 
 
 def export_statistics_to_excel(motifs: List[Dict[str, Any]], sequence_length: int, 
-                               filename: str = "statistics.xlsx") -> str:
+                               filename: str = "statistics.xlsx", summary=None) -> str:
     """
     Export comprehensive statistical analysis to Excel format.
     
@@ -3612,6 +3815,8 @@ def export_statistics_to_excel(motifs: List[Dict[str, Any]], sequence_length: in
         motifs: List of motif dictionaries
         sequence_length: Length of analyzed sequence in base pairs
         filename: Output Excel filename
+        summary: Optional finalized ScanSummary of *motifs* (coverage figures
+                 are read from it; built here when omitted)
         
     Returns:
         Success message string
@@ -3634,36 +3839,19 @@ def export_statistics_to_excel(motifs: List[Dict[str, Any]], sequence_length: in
         hybrid_count = len([m for m in motifs if m.get('Class') == 'Hybrid'])
         cluster_count = len([m for m in motifs if m.get('Class') == 'Non-B_DNA_Clusters'])
 
-        # Set-based coverage for main motifs (no double counting)
-        covered_pos = set()
-        for m in main_motifs:
-            s = m.get('Start', 0) - 1
-            e = m.get('End', 0)
-            if e > s:
-                covered_pos.update(range(s, e))
-        total_covered = len(covered_pos)
+        # Interval-union coverage from the scan summary (no double counting)
+        if summary is None:
+            from Utilities.scan_summary import ScanSummary
+            summary = ScanSummary.from_motifs(motifs, sequence_length)
+        total_covered = summary.covered_bp
         coverage_pct = (total_covered / sequence_length * 100) if sequence_length > 0 else 0
         density = (len(main_motifs) / sequence_length * 1000) if sequence_length > 0 else 0
 
-        # Set-based coverage for hybrid and cluster (individually)
-        hybrid_pos = set()
-        for m in motifs:
-            if m.get('Class') == 'Hybrid':
-                s = m.get('Start', 0) - 1
-                e = m.get('End', 0)
-                if e > s:
-                    hybrid_pos.update(range(s, e))
-        hybrid_covered = len(hybrid_pos)
+        # Hybrid and cluster coverage (individually)
+        hybrid_covered = summary.class_covered_bp.get('Hybrid', 0)
         hybrid_coverage_pct = (hybrid_covered / sequence_length * 100) if sequence_length > 0 else 0
 
-        cluster_pos = set()
-        for m in motifs:
-            if m.get('Class') == 'Non-B_DNA_Clusters':
-                s = m.get('Start', 0) - 1
-                e = m.get('End', 0)
-                if e > s:
-                    cluster_pos.update(range(s, e))
-        cluster_covered = len(cluster_pos)
+        cluster_covered = summary.class_covered_bp.get('Non-B_DNA_Clusters', 0)
         cluster_coverage_pct = (cluster_covered / sequence_length * 100) if sequence_length > 0 else 0
 
         # Occupancy metrics
@@ -3770,17 +3958,13 @@ def export_statistics_to_excel(motifs: List[Dict[str, Any]], sequence_length: in
         df_summary = pd.DataFrame(summary_data)
         df_summary.to_excel(writer, sheet_name='Summary', index=False)
         
-        # Sheet 2: Class-Level Density Analysis (set-based coverage per class)
+        # Sheet 2: Class-Level Density Analysis (union coverage per class)
         class_stats = {}
         for motif in main_motifs:
             cls = motif.get('Class', 'Unknown')
             if cls not in class_stats:
-                class_stats[cls] = {'count': 0, 'positions': set(), 'scores': []}
+                class_stats[cls] = {'count': 0, 'covered': summary.class_covered_bp.get(cls, 0), 'scores': []}
             class_stats[cls]['count'] += 1
-            s = motif.get('Start', 0) - 1
-            e = motif.get('End', 0)
-            if e > s:
-                class_stats[cls]['positions'].update(range(s, e))
             class_stats[cls]['scores'].append(motif.get('Score', 0))
 
         class_data = {
@@ -3794,7 +3978,7 @@ def export_statistics_to_excel(motifs: List[Dict[str, Any]], sequence_length: in
         }
 
         for cls, cstats in sorted(class_stats.items()):
-            cls_covered = len(cstats['positions'])
+            cls_covered = cstats['covered']
             class_data['Motif Class'].append(cls)
             class_data['Count'].append(cstats['count'])
             class_data['Covered Bases (bp)'].append(cls_covered)
@@ -3810,19 +3994,16 @@ def export_statistics_to_excel(motifs: List[Dict[str, Any]], sequence_length: in
         df_class = pd.DataFrame(class_data)
         df_class.to_excel(writer, sheet_name='Class_Level_Analysis', index=False)
         
-        # Sheet 3: Subclass-Level Density Analysis (set-based coverage per subclass)
+        # Sheet 3: Subclass-Level Density Analysis (union coverage per subclass)
+        group_covered = {f"{c}:{sc}": bp for (c, sc), bp in zip(summary.groups, summary.group_covered_bp)}
         subclass_stats = {}
         for motif in main_motifs:
             cls = motif.get('Class', 'Unknown')
             subcls = motif.get('Subclass', 'Unknown')
             key = f"{cls}:{subcls}"
             if key not in subclass_stats:
-                subclass_stats[key] = {'count': 0, 'positions': set(), 'scores': []}
+                subclass_stats[key] = {'count': 0, 'covered': group_covered.get(key, 0), 'scores': []}
             subclass_stats[key]['count'] += 1
-            s = motif.get('Start', 0) - 1
-            e = motif.get('End', 0)
-            if e > s:
-                subclass_stats[key]['positions'].update(range(s, e))
             subclass_stats[key]['scores'].append(motif.get('Score', 0))
 
         subclass_data = {
@@ -3837,7 +4018,7 @@ def export_statistics_to_excel(motifs: List[Dict[str, Any]], sequence_length: in
 
         for key, sstats in sorted(subclass_stats.items()):
             cls, subcls = key.split(':', 1)
-            sub_covered = len(sstats['positions'])
+            sub_covered = sstats['covered']
             subclass_data['Motif Class'].append(cls)
             subclass_data['Motif Subclass'].append(subcls)
             subclass_data['Count'].append(sstats['count'])
@@ -3939,58 +4120,48 @@ def export_statistics_to_excel(motifs: List[Dict[str, Any]], sequence_length: in
     return f"Statistics exported successfully to {filename}"
 
 
-def export_to_gff3(motifs: List[Dict[str, Any]], sequence_name: str = "sequence", 
-                   filename: Optional[str] = None) -> str:
+def export_to_gff3(motifs: Iterable[Dict[str, Any]], sequence_name: str = "sequence", 
+                   filename: Optional[str] = None, bgzip: bool = False) -> str:
     """
     Export motifs to GFF3 format
     
+    Lines are written in batches of :data:`EXPORT_WRITE_BATCH`, so any
+    iterable of motifs is exported with constant memory.
+    
     Args:
-        motifs: List of motif dictionaries
+        motifs: Motif dicts (list, iterable, or columnar table)
         sequence_name: Name of the sequence
         filename: Optional output filename
+        bgzip: BGZF-compress the output file on the fly
         
     Returns:
-        GFF3 format string
-    """
-    gff_lines = []
-    gff_lines.append("##gff-version 3")
-    gff_lines.append(f"##sequence-region {sequence_name} 1 {len(sequence_name)}")
-    
-    for i, motif in enumerate(motifs, 1):
-        seqid = sequence_name
-        source = "NBDScanner"
-        feature_type = "Non_B_DNA_motif"
-        start = motif.get('Start', 1)
-        end = motif.get('End', start)
-        score = motif.get('Score', '.')
-        strand = motif.get('Strand', '+')
-        phase = "."
-        
-        # Attributes
-        attributes = [
-            f"ID=motif_{i}",
-            f"Name={motif.get('Class', 'Unknown')}_{motif.get('Subclass', 'Unknown')}",
-            f"motif_class={motif.get('Class', 'Unknown')}",
-            f"motif_subclass={motif.get('Subclass', 'Unknown')}",
-            f"length={motif.get('Length', 0)}",
-            f"method={motif.get('Method', 'NBDScanner')}"
-        ]
-        
-        attributes_str = ';'.join(attributes)
-        
-        gff_line = f"{seqid}\t{source}\t{feature_type}\t{start}\t{end}\t{score}\t{strand}\t{phase}\t{attributes_str}"
-        gff_lines.append(gff_line)
-    
-    gff_content = '\n'.join(gff_lines)
-    
-    if filename:
-        try:
-            with open(filename, 'w') as f:
-                f.write(gff_content)
-        except Exception as e:
-            logger.error(f"Error writing GFF3 file {filename}: {e}")
+        GFF3 format string, or the output path when *filename* is given
+    """
+    def emit(handle):
+        writer = _BatchedTextWriter(handle)
+        writer.write("##gff-version 3")
+        writer.write(f"##sequence-region {sequence_name} 1 {len(sequence_name)}")
+        
+        for i, motif in enumerate(_iter_motif_records(motifs), 1):
+            start = motif.get('Start', 1)
+            end = motif.get('End', start)
+            score = motif.get('Score', '.')
+            strand = motif.get('Strand', '+')
+            
+            # Attributes
+            attributes = [
+                f"ID=motif_{i}",
+                f"Name={motif.get('Class', 'Unknown')}_{motif.get('Subclass', 'Unknown')}",
+                f"motif_class={motif.get('Class', 'Unknown')}",
+                f"motif_subclass={motif.get('Subclass', 'Unknown')}",
+                f"length={motif.get('Length', 0)}",
+                f"method={motif.get('Method', 'NBDScanner')}"
+            ]
+            
+            writer.write(f"{sequence_name}\tNBDScanner\tNon_B_DNA_motif\t{start}\t{end}\t{score}\t{strand}\t.\t{';'.join(attributes)}")
+        writer.flush()
     
-    return gff_content
+    return _run_text_export(emit, filename, bgzip, "GFF3")
 
 # =============================================================================
 # QUALITY CONTROL & FILTERING
@@ -4394,6 +4565,12 @@ DEFAULT_FOLD_ENRICHMENT_WHEN_ZERO_BACKGROUND = 1.0  # When background is zero
 
 
 
+def _motif_coverage_bp(motifs: List[Dict[str, Any]]) -> int:
+    """Unique bp covered by motifs (1-based inclusive Start/End), via interval union."""
+    return _compute_coverage_bp([(m.get('Start', 0) - 1, m.get('End', 0)) for m in motifs
+                                 if m.get('End', 0) > m.get('Start', 0) - 1])
+
+
 def _compute_coverage_bp(intervals: List[Tuple[int, int]]) -> int:
     """
     Compute total covered base pairs from (start, end) interval tuples using
@@ -4578,6 +4755,63 @@ def calculate_positional_density(motifs: List[Dict[str, Any]],
     return density_by_class
 
 
+def calculate_overlap_matrix(motifs: List[Dict[str, Any]],
+                             by: str = 'Class') -> Tuple[List[str], np.ndarray]:
+    """
+    Count pairwise overlaps between motif groups as a symmetric matrix.
+
+    Motifs are sorted by Start once; for each motif, ``searchsorted`` on the
+    sorted starts gives the run of later motifs starting before its End, and
+    per-group prefix counts turn that run into group counts.  Cost is
+    O(n log n + n·k) for k groups instead of the former pairwise scan, which
+    went quadratic for long Hybrid/Cluster calls and dense repeats.
+
+    A pair (a, b), a sorted before b, is counted when b.Start < a.End and the
+    two belong to different groups (same semantics as the former scan).
+
+    Args:
+        motifs: List of motif dictionaries
+        by: Motif key to group by ('Class' or 'Subclass')
+
+    Returns:
+        (labels, matrix): sorted group labels and a k×k int64 matrix with
+        matrix[i, j] = overlaps between labels[i] and labels[j] (zero diagonal)
+    """
+    if not motifs:
+        return [], np.zeros((0, 0), dtype=np.int64)
+
+    keys = [m.get(by, 'Unknown') for m in motifs]
+    labels = sorted(set(keys))
+    index = {label: i for i, label in enumerate(labels)}
+    n, k = len(motifs), len(labels)
+
+    starts = np.fromiter((m.get('Start', 0) for m in motifs), dtype=np.int64, count=n)
+    ends = np.fromiter((m.get('End', 0) for m in motifs), dtype=np.int64, count=n)
+    codes = np.fromiter((index[key] for key in keys), dtype=np.int64, count=n)
+
+    order = np.argsort(starts, kind='stable')
+    starts, ends, codes = starts[order], ends[order], codes[order]
+
+    # Partners of motif i are the motifs at sorted positions lo..hi-1
+    lo = np.arange(1, n + 1, dtype=np.int64)
+    hi = np.maximum(np.searchsorted(starts, ends, side='left'), lo)
+
+    directed = np.zeros((k, k), dtype=np.int64)
+    for j in range(k):
+        prefix = np.concatenate(([0], np.cumsum(codes == j)))
+        directed[:, j] = np.bincount(codes, weights=prefix[hi] - prefix[lo], minlength=k).astype(np.int64)
+
+    matrix = directed + directed.T
+    np.fill_diagonal(matrix, 0)
+    return labels, matrix
+
+
+def overlap_matrix_to_pairs(labels: List[str], matrix: np.ndarray) -> Dict[Tuple[str, str], int]:
+    """Flatten an overlap matrix into {(label_a, label_b): count} for non-zero pairs (a < b)."""
+    rows, cols = np.nonzero(np.triu(matrix, k=1))
+    return {(labels[i], labels[j]): int(matrix[i, j]) for i, j in zip(rows, cols)}
+
+
 def calculate_enrichment_with_shuffling(motifs: List[Dict[str, Any]], 
                                        sequence: str,
                                        n_shuffles: int = 100,
@@ -9749,7 +9983,7 @@ def export_to_pdf(motifs: List[Dict[str, Any]],
 
 
 def create_enhanced_excel(
-    motifs: List[Dict[str, Any]],
+    motifs: Iterable[Dict[str, Any]],
     job_id: str,
     sequence_name: str,
     run_time: float,
@@ -9757,10 +9991,14 @@ def create_enhanced_excel(
     simple_format: bool = True
 ) -> str:
     """
-    Create enhanced Excel file with 2-tab format.
+    Create enhanced Excel file with 2-tab format and a leading Metadata sheet.
+    
+    The workbook is streamed in write-only mode (see :func:`export_to_excel`);
+    the Metadata sheet is created first and filled once the single pass over
+    *motifs* has produced the totals.
     
     Args:
-        motifs: List of motif dictionaries
+        motifs: List or iterable of motif dictionaries
         job_id: Job ID for filename
         sequence_name: Name of analyzed sequence
         run_time: Analysis runtime in seconds
@@ -9770,48 +10008,36 @@ def create_enhanced_excel(
     Returns:
         Path to created Excel file
     """
-    excel_path = os.path.join(output_dir, f"{job_id}.xlsx")
+    from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Font
     
-    # Create the Excel export with simple format (2 tabs)
-    export_to_excel(motifs, excel_path, simple_format=simple_format)
+    excel_path = os.path.join(output_dir, f"{job_id}.xlsx")
     
-    # Now add metadata sheet
-    try:
-        from openpyxl import load_workbook
-        
-        wb = load_workbook(excel_path)
-        
-        # Create metadata sheet at the beginning
-        ws_meta = wb.create_sheet("Metadata", 0)
-        
-        # Add metadata
-        metadata_rows = [
-            ["Job ID", job_id],
-            ["Sequence Name", sequence_name],
-            ["Analysis Date", datetime.now().strftime("%Y-%m-%d %H:%M:%S")],
-            ["Run Time (seconds)", f"{run_time:.2f}"],
-            ["Total Motifs", len(motifs)],
-            ["Unique Classes", len(set(m.get('Class', 'Unknown') for m in motifs))],
-            ["Unique Subclasses", len(set(m.get('Subclass', 'Unknown') for m in motifs))],
-            ["Tool", APP_NAME],
-            ["Version", APP_VERSION],
-        ]
-        
-        for row_idx, (key, value) in enumerate(metadata_rows, start=1):
-            key_cell = ws_meta.cell(row=row_idx, column=1, value=key)
-            # Make key column bold
-            key_cell.font = key_cell.font.copy(bold=True)
-            ws_meta.cell(row=row_idx, column=2, value=value)
-        
-        ws_meta.column_dimensions['A'].width = 25
-        ws_meta.column_dimensions['B'].width = 40
-        
-        wb.save(excel_path)
-        
-    except Exception as e:
-        # If metadata addition fails, log but don't fail entire operation
-        logger.warning(f"Could not add metadata sheet: {str(e)}")
+    workbook = Workbook(write_only=True)
+    ws_meta = workbook.create_sheet("Metadata")
+    ws_meta.column_dimensions['A'].width = 25
+    ws_meta.column_dimensions['B'].width = 40
+    
+    summary = _stream_motifs_to_workbook(workbook, motifs, simple_format=simple_format)
+    
+    metadata_rows = [
+        ["Job ID", job_id],
+        ["Sequence Name", sequence_name],
+        ["Analysis Date", datetime.now().strftime("%Y-%m-%d %H:%M:%S")],
+        ["Run Time (seconds)", f"{run_time:.2f}"],
+        ["Total Motifs", summary['total_motifs']],
+        ["Unique Classes", len(summary['classes'])],
+        ["Unique Subclasses", len(summary['subclasses'])],
+        ["Tool", APP_NAME],
+        ["Version", APP_VERSION],
+    ]
+    for key, value in metadata_rows:
+        key_cell = WriteOnlyCell(ws_meta, value=key)
+        key_cell.font = Font(bold=True)
+        ws_meta.append([key_cell, value])
     
+    workbook.save(excel_path)
     return excel_path
 
 
@@ -23,7 +23,7 @@ from Utilities.config.text import UI_TEXT
 from Utilities.config.layout import LAYOUT_CONFIG
 from Utilities.config.themes import TAB_THEMES
 from UI.css import load_css
-from UI import home, upload, results, download, documentation
+from UI import home, upload, jobs, results, download, documentation
 from Utilities.nonbscanner import get_motif_info as get_motif_classification_info
 
 # BioPython availability check
@@ -58,7 +58,7 @@ ENTREZ_API_KEY = None
 DEFAULT_THEME_MODE = 'light'
 DEFAULT_TABLE_DENSITY = 'relaxed'
 DEFAULT_COLOR_THEME = 'scientific_blue'
-PAGES = {"Home": "Overview", "Upload & Analyze": "Sequence Upload and Motif Analysis", "Results": "Analysis Results and Visualization", "Download": "Export Data", "Documentation": "Scientific Documentation & References"}
+PAGES = {"Home": "Overview", "Upload & Analyze": "Sequence Upload and Motif Analysis", "Jobs": "Background Analysis Jobs", "Results": "Analysis Results and Visualization", "Download": "Export Data", "Documentation": "Scientific Documentation & References"}
 SESSION_DEFAULTS = {
     'seqs': [],  # Legacy: kept for backward compatibility
     'names': [],  # Legacy: kept for backward compatibility
@@ -105,6 +105,7 @@ tabs = st.tabs(list(PAGES.keys()))
 tab_pages = dict(zip(PAGES.keys(), tabs))
 with tab_pages["Home"]: home.render()
 with tab_pages["Upload & Analyze"]: upload.render()
+with tab_pages["Jobs"]: jobs.render()
 with tab_pages["Results"]: results.render()
 with tab_pages["Download"]: download.render()
 with tab_pages["Documentation"]: documentation.render()
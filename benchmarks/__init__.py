@@ -0,0 +1,31 @@
+"""
+Benchmark suite for NonBDNAFinder.
+
+Contains:
+- synthetic.py   – Deterministic synthetic genome workloads
+- harness.py     – Per-detector / post-processing throughput and peak RSS
+- regression.py  – Compare two result documents against a threshold
+- startup.py     – Cold-import budget and lazy-import check for the scanner
+
+Usage:
+    python -m benchmarks run --workloads random,g4_dense --sizes 100000 --out base.json
+    python -m benchmarks run --out new.json
+    python -m benchmarks compare base.json new.json --threshold 0.10
+    python -m benchmarks startup --budget-ms 300
+"""
+
+from benchmarks.synthetic import WORKLOADS, generate_sequence, sequence_checksum
+from benchmarks.harness import run_suite
+from benchmarks.regression import compare_results, format_report, load_results
+from benchmarks.startup import check_startup
+
+__all__ = [
+    'WORKLOADS',
+    'generate_sequence',
+    'sequence_checksum',
+    'run_suite',
+    'compare_results',
+    'format_report',
+    'load_results',
+    'check_startup',
+]
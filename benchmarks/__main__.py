@@ -0,0 +1,80 @@
+"""
+Command-line entry point: ``python -m benchmarks {run,compare,startup}``.
+
+    run       Run the suite and write a JSON result document
+    compare   Compare two documents; exit status 1 on any regression
+    startup   Check the scanner's cold import time; exit status 1 over budget
+"""
+
+import argparse
+import json
+import logging
+import sys
+
+from benchmarks.harness import DEFAULT_REPEATS, DEFAULT_SIZES, run_suite
+from benchmarks.regression import DEFAULT_RSS_THRESHOLD, DEFAULT_THRESHOLD, compare_results, format_report, load_results
+from benchmarks.startup import DEFAULT_MODULE, DEFAULT_RUNS, IMPORT_BUDGET_MS, check_startup
+from benchmarks.synthetic import DEFAULT_SEED, WORKLOADS
+
+
+def _csv(value: str):
+    return [v.strip() for v in value.split(',') if v.strip()]
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks', description='NonBDNAFinder benchmark suite')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    run = sub.add_parser('run', help='run the suite and write JSON results')
+    run.add_argument('--workloads', type=_csv, default=list(WORKLOADS), help=f"comma list of: {', '.join(WORKLOADS)}")
+    run.add_argument('--sizes', type=lambda v: [int(s.replace('_', '')) for s in _csv(v)], default=list(DEFAULT_SIZES),
+                     help='comma list of sequence lengths in bp')
+    run.add_argument('--repeats', type=int, default=DEFAULT_REPEATS)
+    run.add_argument('--seed', type=int, default=DEFAULT_SEED)
+    run.add_argument('--stage', default=None, help='only run stages containing this substring (e.g. detector:)')
+    run.add_argument('--out', default='-', help='output JSON path (default: stdout)')
+
+    cmp = sub.add_parser('compare', help='compare two result documents')
+    cmp.add_argument('baseline')
+    cmp.add_argument('candidate')
+    cmp.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD, help='allowed relative bp/s drop')
+    cmp.add_argument('--rss-threshold', type=float, default=DEFAULT_RSS_THRESHOLD, help='allowed relative RSS growth')
+
+    startup = sub.add_parser('startup', help='check cold import time and lazy imports')
+    startup.add_argument('--module', default=DEFAULT_MODULE)
+    startup.add_argument('--runs', type=int, default=DEFAULT_RUNS)
+    startup.add_argument('--budget-ms', type=float, default=IMPORT_BUDGET_MS)
+
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.WARNING)
+
+    if args.command == 'run':
+        unknown = [w for w in args.workloads if w not in WORKLOADS]
+        if unknown:
+            parser.error(f"unknown workload(s): {', '.join(unknown)}")
+        document = run_suite(args.workloads, args.sizes, args.repeats, args.seed, args.stage,
+                             progress=lambda line: print(line, file=sys.stderr))
+        payload = json.dumps(document, indent=2)
+        if args.out == '-':
+            print(payload)
+        else:
+            with open(args.out, 'w') as fh:
+                fh.write(payload + '\n')
+        return 0
+
+    if args.command == 'startup':
+        result = check_startup(args.module, args.runs, args.budget_ms)
+        print(f"import {result['module']}: best {result['best_ms']:.0f} ms, median {result['median_ms']:.0f} ms "
+              f"(budget {result['budget_ms']:.0f} ms)")
+        for failure in result['failures']:
+            print(f"FAIL: {failure}")
+        return 0 if result['passed'] else 1
+
+    comparisons = compare_results(load_results(args.baseline), load_results(args.candidate),
+                                  args.threshold, args.rss_threshold)
+    print(format_report(comparisons))
+    return 1 if any(c.issues for c in comparisons) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,223 @@
+"""
+┌──────────────────────────────────────────────────────────────────────────────┐
+│ Benchmark Harness - Per-Detector Throughput and Peak RSS                     │
+├──────────────────────────────────────────────────────────────────────────────┤
+│ Author: Dr. Venkata Rajesh Yella | License: MIT | Version: 2024.1            │
+└──────────────────────────────────────────────────────────────────────────────┘
+
+DESCRIPTION:
+    Times every stage of the NonBScanner pipeline on synthetic workloads:
+
+        detector:<name>          each detector's detect_motifs() on its own
+        postprocess:overlaps     NonBScanner._remove_overlaps()
+        postprocess:hybrid       NonBScanner._detect_hybrid_motifs()
+        postprocess:clusters     NonBScanner._detect_clusters()
+        pipeline:standard        NonBScanner.analyze_sequence() end to end
+        pipeline:optimized       NonBScannerOptimized.analyze_sequence()
+
+    Each stage runs ``repeats`` times after one warm-up; the median wall time
+    is reported as bp/s.  Peak RSS is sampled by a background thread while a
+    stage runs (psutil, else /proc/self/statm) and reported both as the
+    absolute peak and as the growth over the RSS at stage start.
+
+    Results are a JSON document with the environment (commit, versions,
+    CPU count) and one record per (workload, length, stage); see
+    :mod:`benchmarks.regression` for comparing two documents.
+"""
+
+import logging
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from benchmarks.synthetic import DEFAULT_SEED, generate_sequence, sequence_checksum
+
+logger = logging.getLogger(__name__)
+
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+SCHEMA_VERSION = 1
+DEFAULT_SIZES = (100_000,)
+DEFAULT_REPEATS = 3
+RSS_SAMPLE_INTERVAL = 0.005
+
+_PAGE_SIZE = os.sysconf('SC_PAGE_SIZE') if hasattr(os, 'sysconf') else 4096
+
+
+def current_rss() -> Optional[int]:
+    """Resident set size of this process in bytes, or None when unavailable."""
+    if PSUTIL_AVAILABLE:
+        return psutil.Process().memory_info().rss
+    try:
+        with open('/proc/self/statm') as fh:
+            return int(fh.read().split()[1]) * _PAGE_SIZE
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+class RssSampler:
+    """Context manager sampling RSS in a background thread; exposes ``baseline`` and ``peak`` bytes."""
+
+    def __init__(self, interval: float = RSS_SAMPLE_INTERVAL):
+        self.interval = interval
+        self.baseline: Optional[int] = None
+        self.peak: Optional[int] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _sample(self):
+        rss = current_rss()
+        if rss is not None and (self.peak is None or rss > self.peak):
+            self.peak = rss
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self._sample()
+
+    def __enter__(self):
+        self.baseline = current_rss()
+        self.peak = self.baseline
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+        self._sample()
+
+
+def measure(func: Callable[[], Any], length: int, repeats: int = DEFAULT_REPEATS) -> Dict[str, Any]:
+    """
+    Time *func* (one warm-up call, then *repeats* timed calls).
+
+    Returns:
+        Dict with median/min seconds, bp/s, peak/delta RSS in MB and the
+        size of the last result (motif count for list results)
+    """
+    func()
+    times: List[float] = []
+    result = None
+    with RssSampler() as rss:
+        for _ in range(repeats):
+            start = time.perf_counter()
+            result = func()
+            times.append(time.perf_counter() - start)
+    median = statistics.median(times)
+    to_mb = lambda b: round(b / 1024 / 1024, 2) if b is not None else None
+    return {
+        'seconds_median': round(median, 6),
+        'seconds_min': round(min(times), 6),
+        'bp_per_sec': round(length / median, 1) if median > 0 else None,
+        'peak_rss_mb': to_mb(rss.peak),
+        'rss_delta_mb': to_mb(rss.peak - rss.baseline) if rss.peak is not None else None,
+        'motifs': len(result) if isinstance(result, list) else None,
+    }
+
+
+def _stages(sequence: str) -> Dict[str, Callable[[], Any]]:
+    from Utilities.nonbscanner import NonBScanner
+
+    scanner = NonBScanner(enable_all_detectors=True)
+    name = 'bench'
+    stages: Dict[str, Callable[[], Any]] = {
+        f'detector:{det_name}': (lambda d=detector: d.detect_motifs(sequence, name))
+        for det_name, detector in scanner.detectors.items()
+    }
+
+    raw = [m for detector in scanner.detectors.values() for m in detector.detect_motifs(sequence, name)]
+    filtered = scanner._remove_overlaps(raw)
+    stages['postprocess:overlaps'] = lambda: scanner._remove_overlaps(raw)
+    stages['postprocess:hybrid'] = lambda: scanner._detect_hybrid_motifs(filtered, sequence)
+    stages['postprocess:clusters'] = lambda: scanner._detect_clusters(filtered, sequence)
+    stages['pipeline:standard'] = lambda: scanner.analyze_sequence(sequence, name, use_parallel_detectors=False)
+
+    try:
+        from Utilities.nonbscanner_optimized import NonBScannerOptimized
+        optimized = NonBScannerOptimized(enable_all_detectors=True)
+        stages['pipeline:optimized'] = lambda: optimized.analyze_sequence(sequence, name, use_parallel_detectors=False)
+    except ImportError as e:
+        logger.warning(f"Optimized scanner unavailable ({e}); skipping pipeline:optimized")
+    return stages
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        out = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, timeout=10,
+                             cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        return out.stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def environment_info() -> Dict[str, Any]:
+    """Provenance recorded with every result document."""
+    from Utilities.nonbscanner import __version__
+    import numpy as np
+
+    return {
+        'git_commit': _git_commit(),
+        'nonbdna_version': __version__,
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'cpu_count': os.cpu_count(),
+        'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+    }
+
+
+def run_suite(
+    workloads: Sequence[str],
+    sizes: Sequence[int] = DEFAULT_SIZES,
+    repeats: int = DEFAULT_REPEATS,
+    seed: int = DEFAULT_SEED,
+    stage_filter: Optional[str] = None,
+    progress: Optional[Callable[[str], None]] = None,
+) -> Dict[str, Any]:
+    """
+    Run every stage on every (workload, size) combination.
+
+    Args:
+        workloads: Workload names from :data:`benchmarks.synthetic.WORKLOADS`
+        sizes: Sequence lengths in bp
+        repeats: Timed repetitions per stage (median is reported)
+        seed: Workload seed
+        stage_filter: Only run stages whose name contains this substring
+        progress: Optional callback receiving one line per finished stage
+
+    Returns:
+        Result document (JSON-serialisable)
+    """
+    results: List[Dict[str, Any]] = []
+    for kind in workloads:
+        for length in sizes:
+            sequence = generate_sequence(kind, length, seed)
+            checksum = sequence_checksum(sequence)
+            for stage, func in _stages(sequence).items():
+                if stage_filter and stage_filter not in stage:
+                    continue
+                record = {'workload': kind, 'length': length, 'stage': stage, 'checksum': checksum}
+                record.update(measure(func, length, repeats))
+                results.append(record)
+                if progress:
+                    progress(f"{kind:>16} {length:>10,} {stage:<28} {record['bp_per_sec'] or 0:>14,.0f} bp/s"
+                             f"  {record['rss_delta_mb'] or 0:>8.1f} MB")
+
+    return {
+        'schema': SCHEMA_VERSION,
+        'environment': environment_info(),
+        'config': {'workloads': list(workloads), 'sizes': list(sizes), 'repeats': repeats, 'seed': seed,
+                   'stage_filter': stage_filter, 'argv': sys.argv[1:]},
+        'results': results,
+    }
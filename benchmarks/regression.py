@@ -0,0 +1,102 @@
+"""
+┌──────────────────────────────────────────────────────────────────────────────┐
+│ Benchmark Regression Check - Compare Two Result Documents                    │
+├──────────────────────────────────────────────────────────────────────────────┤
+│ Author: Dr. Venkata Rajesh Yella | License: MIT | Version: 2024.1            │
+└──────────────────────────────────────────────────────────────────────────────┘
+
+DESCRIPTION:
+    Matches records of a baseline and a candidate result document by
+    (workload, length, stage) and flags:
+
+        throughput regression   candidate bp/s < baseline bp/s × (1 − threshold)
+        memory regression       candidate RSS growth exceeds baseline growth by
+                                more than rss_threshold and RSS_MIN_DELTA_MB
+        output change           motif count differs (optimizations must not
+                                change results)
+
+    Records whose workload checksum differs are reported as incomparable
+    rather than compared.
+"""
+
+import json
+from dataclasses import dataclass
+from typing import Any, Dict, List, Tuple
+
+DEFAULT_THRESHOLD = 0.10
+DEFAULT_RSS_THRESHOLD = 0.25
+# Ignore RSS growth differences below this (allocator noise)
+RSS_MIN_DELTA_MB = 5.0
+
+
+@dataclass
+class Comparison:
+    """Outcome for one (workload, length, stage) record."""
+    workload: str
+    length: int
+    stage: str
+    baseline_bps: float
+    candidate_bps: float
+    issues: List[str]
+
+    @property
+    def speedup(self) -> float:
+        return self.candidate_bps / self.baseline_bps if self.baseline_bps else 0.0
+
+
+def load_results(path: str) -> Dict[str, Any]:
+    """Load a result document written by ``python -m benchmarks run``."""
+    with open(path) as fh:
+        return json.load(fh)
+
+
+def _index(document: Dict[str, Any]) -> Dict[Tuple[str, int, str], Dict[str, Any]]:
+    return {(r['workload'], r['length'], r['stage']): r for r in document.get('results', [])}
+
+
+def compare_results(
+    baseline: Dict[str, Any],
+    candidate: Dict[str, Any],
+    threshold: float = DEFAULT_THRESHOLD,
+    rss_threshold: float = DEFAULT_RSS_THRESHOLD,
+) -> List[Comparison]:
+    """
+    Compare the records both documents have in common.
+
+    Returns:
+        One Comparison per shared record; ``issues`` is empty when it passes
+    """
+    base = _index(baseline)
+    comparisons: List[Comparison] = []
+    for key, cand in _index(candidate).items():
+        ref = base.get(key)
+        if ref is None:
+            continue
+        issues: List[str] = []
+        ref_bps = ref.get('bp_per_sec') or 0.0
+        cand_bps = cand.get('bp_per_sec') or 0.0
+        if ref.get('checksum') != cand.get('checksum'):
+            issues.append('incomparable workload (checksum differs)')
+        else:
+            if ref_bps and cand_bps < ref_bps * (1 - threshold):
+                issues.append(f'throughput -{(1 - cand_bps / ref_bps) * 100:.1f}%')
+            ref_rss, cand_rss = ref.get('rss_delta_mb'), cand.get('rss_delta_mb')
+            if ref_rss is not None and cand_rss is not None:
+                if cand_rss - ref_rss > max(RSS_MIN_DELTA_MB, ref_rss * rss_threshold):
+                    issues.append(f'RSS growth {ref_rss:.1f} -> {cand_rss:.1f} MB')
+            if ref.get('motifs') is not None and ref.get('motifs') != cand.get('motifs'):
+                issues.append(f"motif count {ref['motifs']} -> {cand['motifs']}")
+        comparisons.append(Comparison(key[0], key[1], key[2], ref_bps, cand_bps, issues))
+    return comparisons
+
+
+def format_report(comparisons: List[Comparison]) -> str:
+    """Plain-text table of all comparisons, regressions marked."""
+    lines = [f"{'workload':>16} {'length':>10} {'stage':<28} {'baseline bp/s':>14} {'candidate bp/s':>15} {'speedup':>8}  status"]
+    for c in sorted(comparisons, key=lambda c: (c.workload, c.length, c.stage)):
+        status = 'REGRESSION: ' + '; '.join(c.issues) if c.issues else 'ok'
+        lines.append(f"{c.workload:>16} {c.length:>10,} {c.stage:<28} {c.baseline_bps:>14,.0f} "
+                     f"{c.candidate_bps:>15,.0f} {c.speedup:>7.2f}x  {status}")
+    regressions = sum(1 for c in comparisons if c.issues)
+    lines.append(f"\n{len(comparisons)} stage(s) compared, {regressions} regression(s)")
+    return '\n'.join(lines)
@@ -0,0 +1,88 @@
+"""
+┌──────────────────────────────────────────────────────────────────────────────┐
+│ Startup Budget - Cold Import Time of the Scanner                             │
+├──────────────────────────────────────────────────────────────────────────────┤
+│ Author: Dr. Venkata Rajesh Yella | License: MIT | Version: 2024.1            │
+└──────────────────────────────────────────────────────────────────────────────┘
+
+DESCRIPTION:
+    Every batch invocation and every spawned worker process pays the import
+    cost of ``Utilities.nonbscanner``.  This check times the import statement
+    in fresh interpreters (interpreter startup excluded) and fails when
+
+        * the best-of-N import time exceeds the budget, or
+        * a stack that must stay lazy (pandas, plotly, matplotlib, seaborn,
+          openpyxl, individual detector modules) was imported eagerly.
+
+    The second check is deterministic and catches regressions even on
+    machines too fast or too noisy for the timing budget.
+
+CONFIGURATION (environment):
+    NONBDNA_IMPORT_BUDGET_MS    Import-time budget in ms (default: 300)
+"""
+
+import json
+import os
+import subprocess
+import sys
+from typing import Any, Dict, List
+
+DEFAULT_MODULE = 'Utilities.nonbscanner'
+DEFAULT_RUNS = 5
+IMPORT_BUDGET_MS = float(os.environ.get('NONBDNA_IMPORT_BUDGET_MS', '300'))
+
+# Modules that importing the scanner must not load
+LAZY_MODULES = ('pandas', 'plotly', 'matplotlib', 'seaborn', 'openpyxl')
+LAZY_PREFIXES = ('Detectors.curved.', 'Detectors.slipped.', 'Detectors.cruciform.', 'Detectors.rloop.',
+                 'Detectors.triplex.', 'Detectors.gquad.', 'Detectors.imotif.', 'Detectors.zdna.',
+                 'Detectors.aphilic.')
+
+_PACKAGE_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+{import_stmt}
+elapsed = time.perf_counter() - start
+print(json.dumps({{'seconds': elapsed, 'modules': sorted(sys.modules)}}))
+"""
+
+
+def _probe(module: str) -> Dict[str, Any]:
+    out = subprocess.run([sys.executable, '-c', _PROBE.format(import_stmt=f'import {module}')], capture_output=True,
+                         text=True, cwd=_PACKAGE_ROOT, check=True, timeout=120)
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def check_startup(module: str = DEFAULT_MODULE, runs: int = DEFAULT_RUNS,
+                  budget_ms: float = IMPORT_BUDGET_MS) -> Dict[str, Any]:
+    """
+    Import *module* in *runs* fresh interpreters and check the budget.
+
+    Returns:
+        Dict with best/median import ms, eagerly loaded lazy modules,
+        ``passed`` and a list of ``failures``
+    """
+    samples: List[float] = []
+    modules: List[str] = []
+    for _ in range(runs):
+        result = _probe(module)
+        samples.append(result['seconds'] * 1000)
+        modules = result['modules']
+    samples.sort()
+
+    eager = [m for m in modules if m in LAZY_MODULES or m.startswith(LAZY_PREFIXES)]
+    failures = []
+    if samples[0] > budget_ms:
+        failures.append(f"import {module} took {samples[0]:.0f} ms (budget {budget_ms:.0f} ms)")
+    if eager:
+        failures.append(f"eagerly imported: {', '.join(eager)}")
+    return {
+        'module': module,
+        'best_ms': round(samples[0], 1),
+        'median_ms': round(samples[len(samples) // 2], 1),
+        'budget_ms': budget_ms,
+        'eager_modules': eager,
+        'passed': not failures,
+        'failures': failures,
+    }
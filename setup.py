@@ -9,6 +9,9 @@ This provides optional Cython compilation for 2-5x speedup in critical paths:
 Usage:
     python setup.py build_ext --inplace
 
+Installing the package (pip install -e .) also provides the ``nonbdna-worker``
+console script that runs queued analysis jobs (Utilities/job_worker.py).
+
 If Cython is not available, the package will fall back to pure Python implementations.
 """
 
@@ -88,6 +91,7 @@ setup(
     description='High-performance Non-B DNA motif detection system',
     author='Dr. Venkata Rajesh Yella',
     ext_modules=extensions,
+    entry_points={'console_scripts': ['nonbdna-worker=Utilities.job_worker:main']},
     cmdclass={'build_ext': BuildExtWithFallback},
     zip_safe=False,
 )
@@ -0,0 +1,22 @@
+"""Shared fixtures for the NonBDNAFinder test suite (run from the repository root: ``python -m pytest``)."""
+
+import os
+import random
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+G4 = 'GGGTTAGGGTTAGGGTTAGGG'
+
+
+def random_dna(length: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    return ''.join(rng.choice('ACGT') for _ in range(length))
+
+
+@pytest.fixture
+def motif_key():
+    """Order-independent identity of a motif set."""
+    return lambda motifs: sorted((m['Class'], m['Subclass'], m['Start'], m['End']) for m in motifs)
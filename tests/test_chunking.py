@@ -0,0 +1,32 @@
+"""N-gap aware chunk planning (Utilities.chunk_generator)."""
+
+from Utilities.chunk_generator import find_n_runs, plan_chunks
+
+
+def test_find_n_runs_reports_long_runs_only():
+    seq = 'ACGT' * 10 + 'N' * 50 + 'ACGT' * 10 + 'n' * 5 + 'ACGT'
+    assert find_n_runs(seq, min_length=10) == [(40, 90)]
+    assert find_n_runs(seq, min_length=1) == [(40, 90), (130, 135)]
+    assert find_n_runs(seq.encode(), min_length=10) == [(40, 90)]
+    assert find_n_runs('ACGT' * 100) == []
+
+
+def test_plan_chunks_tiles_with_overlap():
+    chunks = plan_chunks('A' * 1000, chunk_size=300, overlap=50)
+    assert chunks[0] == (0, 300, 250)
+    assert chunks[-1][1] == 1000 and chunks[-1][2] == 1000
+    for (_, end, core_end), (next_start, _, _) in zip(chunks, chunks[1:]):
+        assert next_start == end - 50 == core_end
+    assert plan_chunks('A' * 100, chunk_size=300, overlap=50) == [(0, 100, 100)]
+
+
+def test_plan_chunks_skips_n_gaps():
+    seq = 'A' * 500 + 'N' * 3000 + 'C' * 500
+    chunks = plan_chunks(seq, chunk_size=300, overlap=50)
+    covered = [(start, end) for start, end, _ in chunks]
+    assert all(end <= 500 or start >= 3500 for start, end in covered)
+    assert covered[0][0] == 0 and covered[-1][1] == len(seq)
+    # Each island ends with an authoritative last chunk
+    assert (500 in [end for _, end, core in chunks if end == core])
+    assert plan_chunks(seq, chunk_size=300, overlap=50, skip_n_gaps=False)[-1][1] == len(seq)
+    assert len(plan_chunks(seq, 300, 50, skip_n_gaps=False)) > len(chunks)
@@ -0,0 +1,39 @@
+"""(Chunk, detector) scheduling on the shared pool (Utilities.detector_scheduler)."""
+
+from concurrent.futures import Future
+
+from Utilities import detector_scheduler
+from Utilities.detector_scheduler import DetectorScheduler, _detector_task
+
+from conftest import G4, random_dna
+
+CHUNK = random_dna(4000, seed=3) + G4 + 'CA' * 20 + 'AAAAATTTTT' * 6 + 'CAG' * 30
+
+
+class _HeldPool:
+    """Runs the tasks of chunk 0 at once and holds every other task in the queue."""
+
+    def __init__(self):
+        self.futures = []
+
+    def submit(self, fn, *args):
+        future = Future()
+        if fn is _detector_task and args[3].endswith(':0'):
+            future.set_result(fn(*args))
+        self.futures.append(future)
+        return future
+
+
+def test_closing_scan_early_cancels_queued_tasks(monkeypatch):
+    pool = _HeldPool()
+    monkeypatch.setattr(detector_scheduler, 'DETECTOR_WORKERS', 4)
+    monkeypatch.setattr(detector_scheduler, 'get_detector_pool', lambda: pool)
+    scheduler = DetectorScheduler(max_workers=4)
+    assert scheduler.parallel
+    tasks = scheduler.scan_tasks(((key, [('chr1', CHUNK)]) for key in range(4)), ordered=True)
+    key, results = next(tasks)
+    assert key == 0 and results[0]
+    held = [future for future in pool.futures if not future.done()]
+    assert held
+    tasks.close()
+    assert all(future.cancelled() for future in held)
@@ -0,0 +1,24 @@
+"""Bytes-level FASTA parsing (Utilities.utilities.parse_fasta)."""
+
+import pytest
+
+from Utilities.utilities import _FastaBytesParser, parse_fasta
+
+FASTA = '>x\nACGT\n  >y\nGGGG\n\t>z desc\r\nac gt\n'
+EXPECTED = {'x': 'ACGT', 'y': 'GGGG', 'z desc': 'ACGT'}
+
+
+def test_indented_headers_start_new_records():
+    assert parse_fasta(FASTA) == EXPECTED
+    assert parse_fasta('>x\nACGT\n  >y\nGGGG\n') == {'x': 'ACGT', 'y': 'GGGG'}
+
+
+@pytest.mark.parametrize('step', [1, 2, 3, 5, 8])
+def test_block_boundaries_do_not_change_records(step):
+    data = FASTA.encode('ascii')
+    parser = _FastaBytesParser()
+    records = []
+    for i in range(0, len(data), step):
+        records.extend(parser.feed(data[i:i + step]))
+    records.extend(parser.close())
+    assert dict(records) == EXPECTED
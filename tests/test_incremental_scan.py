@@ -0,0 +1,40 @@
+"""Diff-aware re-scan of edited sequences (Utilities.incremental_scan)."""
+
+from Utilities.incremental_scan import diff_sequences, rescan_edited
+from Utilities.nonbscanner import analyze_sequence
+
+from conftest import G4, random_dna
+
+
+def _patched(old, new, edits):
+    """Rebuild *new* from *old* plus the edits' new spans."""
+    parts, pos = [], 0
+    for edit in edits:
+        parts.append(old[pos:edit.old_start]); parts.append(new[edit.new_start:edit.new_end]); pos = edit.old_end
+    return ''.join(parts) + old[pos:]
+
+
+def test_diff_sequences_reconstructs_new():
+    old = random_dna(5000, seed=1)
+    cases = [
+        old,                                                # unchanged
+        old[:100] + 'T' + old[101:],                        # substitution
+        old[:2000] + 'ACGTACGT' + old[2000:],               # insertion
+        old[:1000] + old[1500:4000] + 'GG' + old[4010:],    # deletion + indel
+    ]
+    for new in cases:
+        edits = diff_sequences(old, new)
+        assert _patched(old, new, edits) == new
+        assert all(a.old_end <= b.old_start for a, b in zip(edits, edits[1:]))
+    assert diff_sequences(old, old) == []
+
+
+def test_incremental_rescan_matches_full_scan(motif_key):
+    old = random_dna(20000, seed=7)
+    old = old[:5000] + G4 + old[5021:12000] + 'CG' * 8 + old[12016:]
+    new = old[:8000] + 'GGGAGGGAGGGAGGG' + old[8000:15000] + old[15010:]
+    old_motifs = analyze_sequence(old, 's')
+    motifs, info = rescan_edited(new, old, old_motifs, 's')
+    assert motifs is not None and info['edits'] == 2
+    assert info['rescanned_bp'] < len(new)
+    assert motif_key(motifs) == motif_key(analyze_sequence(new, 's'))
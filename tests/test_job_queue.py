@@ -0,0 +1,46 @@
+"""SQLite job queue claim / cancel semantics (Utilities.job_queue)."""
+
+import pytest
+
+from Utilities.job_queue import JobCancelled, JobQueue
+
+
+@pytest.fixture
+def queue(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)                 # job directories resolve under ./results
+    return JobQueue(str(tmp_path / 'jobs.sqlite'))
+
+
+def test_claim_is_fifo_and_exclusive(queue, tmp_path):
+    first = queue.submit(str(tmp_path / 'a.fa'), {'enabled_classes': ['Z-DNA']})
+    second = queue.submit(str(tmp_path / 'b.fa'))
+    job = queue.claim('w1')
+    assert job['job_id'] == first and job['status'] == 'running' and job['worker'] == 'w1'
+    assert job['params'] == {'enabled_classes': ['Z-DNA']}
+    assert queue.claim('w2')['job_id'] == second
+    assert queue.claim('w3') is None
+
+    queue.update_progress(first, 0.5, 'half')
+    queue.complete(first, job['result_path'], 'done')
+    assert queue.get(first)['status'] == 'done' and queue.get(first)['progress'] == 1.0
+
+
+def test_cancel_queued_and_running(queue, tmp_path):
+    queued = queue.submit(str(tmp_path / 'a.fa'))
+    running = queue.submit(str(tmp_path / 'b.fa'))
+    assert queue.cancel(queued)
+    assert queue.claim('w1')['job_id'] == running         # cancelled jobs are never claimed
+    assert queue.cancel(running)
+    with pytest.raises(JobCancelled):
+        queue.update_progress(running, 0.1)               # the worker stops at its next progress update
+    queue.complete(running, 'ignored')
+    assert queue.get(running)['status'] == 'cancelled'
+    assert not queue.cancel(running)                      # finished jobs stay as they are
+
+
+def test_requeue_returns_job_to_queue(queue, tmp_path):
+    job_id = queue.submit(str(tmp_path / 'a.fa'))
+    queue.claim('w1')
+    queue.requeue(job_id)
+    assert queue.get(job_id)['status'] == 'queued'
+    assert queue.claim('w2')['worker'] == 'w2'
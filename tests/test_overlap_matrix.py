@@ -0,0 +1,41 @@
+"""Vectorized overlap matrix (Utilities.utilities.calculate_overlap_matrix)."""
+
+import random
+
+import numpy as np
+
+from Utilities.utilities import calculate_overlap_matrix
+
+
+def _pairwise(motifs, by):
+    labels = sorted({m[by] for m in motifs})
+    index = {label: i for i, label in enumerate(labels)}
+    matrix = np.zeros((len(labels), len(labels)), dtype=np.int64)
+    ordered = sorted(motifs, key=lambda m: m['Start'])
+    for i, a in enumerate(ordered):
+        for b in ordered[i + 1:]:
+            if b['Start'] < a['End'] and a[by] != b[by]:
+                matrix[index[a[by]], index[b[by]]] += 1
+                matrix[index[b[by]], index[a[by]]] += 1
+    return labels, matrix
+
+
+def test_matches_pairwise_scan():
+    rng = random.Random(11)
+    motifs = []
+    for _ in range(300):
+        start = rng.randint(1, 5000)
+        motifs.append({'Class': rng.choice('ABCD'), 'Subclass': rng.choice('wxyz'), 'Start': start, 'End': start + rng.randint(5, 400)})
+    for by in ('Class', 'Subclass'):
+        labels, matrix = calculate_overlap_matrix(motifs, by=by)
+        expected_labels, expected = _pairwise(motifs, by)
+        assert labels == expected_labels
+        assert (matrix == expected).all()
+        assert (matrix == matrix.T).all() and not matrix.diagonal().any()
+
+
+def test_empty_and_disjoint():
+    labels, matrix = calculate_overlap_matrix([])
+    assert labels == [] and matrix.shape == (0, 0)
+    labels, matrix = calculate_overlap_matrix([{'Class': 'A', 'Start': 1, 'End': 10}, {'Class': 'B', 'Start': 10, 'End': 20}])
+    assert labels == ['A', 'B'] and not matrix.any()
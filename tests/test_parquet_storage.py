@@ -0,0 +1,43 @@
+"""Parquet results backend round trip and region queries (Utilities.disk_storage)."""
+
+import pytest
+
+pytest.importorskip('pyarrow')
+
+from Utilities.disk_storage import ParquetResultsStorage
+
+
+def _motifs():
+    return [
+        {'Class': 'G-Quadruplex', 'Subclass': 'Canonical G4', 'Start': 100, 'End': 120, 'Length': 21, 'Score': 2},
+        {'Class': 'Z-DNA', 'Subclass': 'Z-DNA', 'Start': 500.0, 'End': 540.0, 'Length': 41, 'Score': 0.5},
+        {'Class': 'G-Quadruplex', 'Subclass': 'Canonical G4', 'Start': 900, 'End': 930, 'Length': 31, 'Score': 2},
+        {'Class': 'Curved DNA', 'Subclass': 'Local Curvature', 'Start': 1500, 'End': 1520, 'Length': 21, 'Score': 1.5,
+         'Arms': [3, 4]},
+        {'Class': 'Cruciform', 'Subclass': 'Inverted Repeats', 'Start': 2000, 'End': 2040, 'Length': 41, 'Score': 3.25},
+    ]
+
+
+@pytest.fixture
+def storage(tmp_path):
+    results = ParquetResultsStorage(str(tmp_path), 'seq1', row_group_size=2)
+    results.append_batch(_motifs())
+    results.flush()
+    return results
+
+
+def test_int_scores_and_float_positions_are_queryable(storage):
+    assert len(list(storage.query(min_score=1.0))) == 4
+    assert len(list(storage.query(min_score=1.0))) == sum(
+        1 for m in storage.iter_results() if m['Score'] >= 1.0)
+    assert sorted(m['Start'] for m in storage.query(start=450, end=1000)) == [500, 900]
+    assert [m['Start'] for m in storage.query(start=450, end=1000, min_score=1.0)] == [900]
+    assert storage.get_summary_stats()['total_count'] == 5
+
+
+def test_round_trip(storage):
+    results = list(storage.iter_results())
+    assert [m['Start'] for m in results] == [100, 500, 900, 1500, 2000]
+    assert [m['Score'] for m in results] == [2.0, 0.5, 2.0, 1.5, 3.25]
+    assert results[3]['Arms'] == [3, 4]                     # non-column fields survive via 'Extra'
+    assert storage.count_by_class() == {'G-Quadruplex': 2, 'Z-DNA': 1, 'Curved DNA': 1, 'Cruciform': 1}
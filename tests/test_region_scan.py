@@ -0,0 +1,52 @@
+"""BED-restricted scanning (Utilities.region_scan)."""
+
+import pytest
+
+from Utilities.indexed_fasta import IndexedFasta
+from Utilities.region_scan import merge_regions, read_bed, scan_regions
+
+from conftest import G4, random_dna
+
+
+@pytest.fixture
+def fasta(tmp_path):
+    seq = random_dna(3000, seed=3)
+    # G4s inside target A (500) and in the gap between targets A and B (1500)
+    seq = seq[:500] + G4 + seq[521:1500] + G4 + seq[1521:]
+    path = tmp_path / 'ref.fa'
+    path.write_text('>chr1\n' + seq + '\n>chr2\n' + random_dna(400, seed=4) + '\n')
+    return IndexedFasta(str(path))
+
+
+def _bed(tmp_path, lines):
+    path = tmp_path / 'targets.bed'
+    path.write_text('track name=t\n' + ''.join('\t'.join(map(str, line)) + '\n' for line in lines))
+    return read_bed(str(path))
+
+
+def test_merge_regions_pads_clips_and_merges(tmp_path, fasta):
+    intervals = _bed(tmp_path, [('chr1', 480, 560, 'A'), ('chr1', 1600, 1700, 'B'), ('chr2', 10, 20, 'C'), ('chrX', 0, 10, 'X')])
+    regions = merge_regions(intervals, fasta, flank=600)
+    assert [(r.chrom, r.start, r.end) for r in regions] == [('chr1', 0, 2300), ('chr2', 0, 400)]
+    assert regions[0].targets == ((480, 560, 'A'), (1600, 1700, 'B'))
+    assert regions[0].label == 'A,B'
+    assert [(r.start, r.end) for r in merge_regions(intervals, fasta, flank=0)][:2] == [(480, 560), (1600, 1700)]
+
+
+def test_gap_between_merged_targets_is_not_reported(tmp_path, fasta):
+    intervals = _bed(tmp_path, [('chr1', 480, 560, 'A'), ('chr1', 1600, 1700, 'B')])
+    regions = merge_regions(intervals, fasta, flank=600)
+    assert len(regions) == 1
+    motifs = scan_regions(fasta, regions, enabled_classes=['G-Quadruplex'], max_workers=1)['chr1']
+    assert motifs and all(m['Region'] == 'A' for m in motifs)
+    assert not any(m['Start'] > 560 and m['End'] <= 1600 for m in motifs)
+
+
+def test_scanner_instance_is_used(tmp_path, fasta):
+    class _StubScanner:
+        def analyze_sequence(self, sequence, sequence_name, enabled_classes=None):
+            return [{'Class': 'Stub', 'Subclass': 'Stub', 'Sequence_Name': sequence_name, 'Start': 1, 'End': 10}]
+
+    regions = merge_regions(_bed(tmp_path, [('chr1', 480, 560, 'A')]), fasta, flank=0)
+    motifs = scan_regions(fasta, regions, max_workers=4, scanner=_StubScanner())['chr1']
+    assert [(m['Class'], m['Start'], m['Region']) for m in motifs] == [('Stub', 481, 'A')]
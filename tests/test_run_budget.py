@@ -0,0 +1,71 @@
+"""Run budgets and cooperative cancellation (Utilities.run_budget)."""
+
+import pickle
+import time
+
+import pytest
+
+from Utilities.nonbscanner import analyze_sequence
+from Utilities.run_budget import DetectorCancelled, RunBudget, budget_scope, checkpoint, current_budget, deadline_scope
+
+from conftest import random_dna
+
+SEQ = random_dna(60_000, seed=5) + 'CAG' * 4000 + random_dna(40_000, seed=6)
+
+
+def test_checkpoint_raises_after_deadline():
+    checkpoint()                                            # no deadline: no-op
+    with deadline_scope(time.time() + 60):
+        checkpoint()
+        with deadline_scope(time.time() + 0.01):
+            time.sleep(0.02)
+            with pytest.raises(DetectorCancelled):
+                checkpoint()
+        checkpoint()                                        # outer deadline restored
+    with pytest.raises(DetectorCancelled):
+        with deadline_scope(time.time() - 1):
+            pass
+    checkpoint()                                            # an expired scope never leaks its deadline
+
+
+def test_wall_time_check_is_sticky():
+    budget = RunBudget(max_wall_s=0.05).start()
+    assert budget.check() is None
+    time.sleep(0.06)
+    assert budget.check() == 'wall_time' and budget.check() == 'wall_time'
+    budget.record_skipped('chr1', 0, 100); budget.record_skipped('chr1', 50, 300)
+    report = budget.report()
+    assert report['status'] == 'partial' and report['stop_reason'] == 'wall_time'
+    assert report['skipped_chunks'] == [{'sequence': 'chr1', 'start': 0, 'end': 300, 'reason': 'wall_time'}]
+    assert pickle.loads(pickle.dumps(budget)).report()['skipped_bp'] == 300
+
+
+def test_coerce_and_scope():
+    assert RunBudget.coerce({'max_wall_s': None, 'max_rss_mb': 0}) is None
+    budget = RunBudget.coerce({'chunk_timeout_s': 5})
+    assert budget.limits == {'max_wall_s': None, 'max_rss_mb': None, 'chunk_timeout_s': 5}
+    with budget_scope(budget):
+        assert current_budget() is budget and RunBudget.coerce(None) is budget
+    assert current_budget() is None
+
+
+@pytest.mark.parametrize('parallel', [True, False])
+def test_wall_time_skips_chunks_and_returns_partial_results(parallel):
+    budget = RunBudget(max_wall_s=1e-9)
+    motifs = analyze_sequence(SEQ, 'chrB', budget=budget, use_parallel_chunks=parallel)
+    report = budget.report()
+    assert isinstance(motifs, list)
+    assert report['status'] == 'partial' and report['stop_reason'] == 'wall_time'
+    assert 0 < report['skipped_bp'] <= len(SEQ)
+    assert all(s['sequence'] == 'chrB' for s in report['skipped_chunks'])
+
+
+def test_chunk_timeout_truncates_detectors_without_leaking(motif_key):
+    full = analyze_sequence(SEQ, 'chrB')
+    budget = RunBudget(chunk_timeout_s=1e-9)
+    partial = analyze_sequence(SEQ, 'chrB', budget=budget)
+    report = budget.report()
+    assert report['status'] == 'partial' and report['stop_reason'] is None
+    assert report['truncated'] and all(t['reason'] == 'chunk_timeout' for t in report['truncated'])
+    assert len(partial) < len(full)
+    assert motif_key(analyze_sequence(SEQ, 'chrB')) == motif_key(full)   # later unbudgeted runs are complete
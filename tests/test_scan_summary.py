@@ -0,0 +1,45 @@
+"""ScanSummary agrees with the dict-based statistics (Utilities.scan_summary)."""
+
+import pytest
+
+from Utilities.nonbscanner import analyze_sequence
+from Utilities.scan_summary import ScanSummary
+from Utilities.utilities import calculate_genomic_density, calculate_motif_statistics, calculate_positional_density
+
+from conftest import G4, random_dna
+
+
+@pytest.fixture(scope='module')
+def scan():
+    seq = random_dna(6000, seed=21)
+    seq = seq[:1000] + G4 + 'CA' * 20 + seq[1061:3000] + 'AAAAATTTTT' * 6 + seq[3060:]
+    return seq, analyze_sequence(seq, 'summary')
+
+
+def test_density_matches_dict_stats(scan):
+    seq, motifs = scan
+    summary = ScanSummary('summary', len(seq))
+    for i in range(0, len(motifs), 7):            # fed in batches, as the pipeline does
+        summary.update(motifs[i:i + 7])
+    summary.finalize()
+    assert summary.total_count == len(motifs)
+    for by_class, by_subclass in ((False, False), (True, False), (False, True)):
+        assert summary.genomic_density(by_class, by_subclass) == calculate_genomic_density(motifs, len(seq), by_class, by_subclass)
+        assert summary.positional_density('kbp', by_class, by_subclass) == calculate_positional_density(motifs, len(seq), 'kbp', by_class, by_subclass)
+
+
+def test_motif_statistics_match(scan):
+    seq, motifs = scan
+    summary = ScanSummary.from_motifs(motifs, len(seq))
+    expected = calculate_motif_statistics(motifs, len(seq))
+    for key, value in summary.motif_statistics().items():
+        assert expected[key] == value, key
+
+
+def test_round_trip_and_result_set_id(scan):
+    seq, motifs = scan
+    summary = ScanSummary.from_motifs(motifs, len(seq))
+    restored = ScanSummary.from_dict(summary.to_dict())
+    assert restored.result_set_id == summary.result_set_id
+    assert restored.genomic_density() == summary.genomic_density()
+    assert ScanSummary.from_motifs(motifs[:-1], len(seq)).result_set_id != summary.result_set_id